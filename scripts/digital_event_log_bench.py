@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Micro-benchmark SDRTrunk call-event log parsing (per-line vs compiled).
+
+By default the per-line side is this tree's legacy path, which shares the
+row helpers with the compiled one. ``--baseline REV`` loads ``ui/digital.py``
+from a git revision instead (e.g. the commit before the compiled parser) so
+the comparison is against the code that actually ran before.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import types
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from ui import digital  # noqa: E402
+
+_SAMPLE_HEADER = (
+    "TIMESTAMP,DURATION_MS,PROTOCOL,EVENT,FROM,TO,TIMESLOT,FREQUENCY,DETAILS,EVENT_ID"
+)
+
+
+def _write_sample_log(path: str, rows: int) -> None:
+    """Write a P25-style call-event log shaped like SDRTrunk's CSV output."""
+    rng = random.Random(7)
+    start = time.time() - rows
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(_SAMPLE_HEADER + "\n")
+        for i in range(rows):
+            ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(start + i))
+            tgid = rng.choice((1201, 1203, 3207, 3209, 47152, 10350))
+            event = rng.choice(("Group Call", "Group Call", "Group Call", "Encrypted Group Call", "Register"))
+            details = "CHANNEL GRANT" if i % 5 == 0 else ("ENCRYPTED" if "Encrypted" in event else "")
+            f.write(
+                f"{ts},{rng.randint(200, 9000)},APCO-25,{event},{rng.randint(100000, 999999)},"
+                f"\"Dispatch, Ops ({tgid})\",0,851.{rng.randint(1000, 9999)},{details},{i}\n"
+            )
+
+
+def _load_baseline(rev: str) -> types.ModuleType:
+    """``ui/digital.py`` as of ``rev``, imported under a separate module name."""
+    source = subprocess.run(
+        ["git", "-C", REPO_ROOT, "show", f"{rev}:ui/digital.py"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    module = types.ModuleType("digital_baseline")
+    module.__file__ = os.path.join(REPO_ROOT, "ui", "digital.py")
+    sys.modules[module.__name__] = module
+    # No parent package, so its relative imports fall back to ``ui.*``.
+    exec(compile(source, f"{rev}:ui/digital.py", "exec"), module.__dict__)
+    return module
+
+
+def _legacy_pass(adapter, path: str, lines: list[str], fallback_ms: int) -> int:
+    count = 0
+    for line in lines:
+        adapter._event_log_line_encryption_hint(line, path)
+        if adapter._parse_event_log_line(line, path, fallback_ms):
+            count += 1
+    return count
+
+
+def _compiled_pass(adapter, path: str, lines: list[str], fallback_ms: int) -> int:
+    parser = adapter._event_log_parser(path)
+    count = 0
+    for text, fields in parser.rows(lines):
+        if fields is None:
+            continue
+        digital._event_fields_encryption_hint(fields)
+        if digital._ignored_event_text(text):
+            continue
+        if digital._fields_to_event(fields, text, fallback_ms):
+            count += 1
+    return count
+
+
+def _best_of(fn, repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    result = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--log", default="", help="Recorded *_call_events.log to replay (default: synthetic sample)")
+    parser.add_argument("--rows", type=int, default=20000, help="Rows for the synthetic sample")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per variant; best time is reported")
+    parser.add_argument("--baseline", default="", help="Git revision whose ui/digital.py runs the per-line side")
+    args = parser.parse_args()
+    legacy_module = _load_baseline(args.baseline) if args.baseline else digital
+
+    tmp_dir = None
+    path = args.log
+    if not path:
+        tmp_dir = tempfile.TemporaryDirectory()
+        path = os.path.join(tmp_dir.name, "bench_call_events.log")
+        _write_sample_log(path, max(1, args.rows))
+    try:
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            lines = f.read().splitlines()
+        adapter = digital.SdrtrunkAdapter()
+        adapter._ensure_event_log_header(path)
+        if adapter._event_log_parser(path) is None:
+            print(f"{path}: no CSV header recognised; nothing to compare", file=sys.stderr)
+            return 1
+        legacy_adapter = legacy_module.SdrtrunkAdapter()
+        legacy_adapter._ensure_event_log_header(path)
+        body = lines[1:]
+        fallback_ms = int(time.time() * 1000)
+        repeat = max(1, args.repeat)
+        legacy_sec, legacy_events = _best_of(
+            lambda: _legacy_pass(legacy_adapter, path, body, fallback_ms), repeat
+        )
+        compiled_sec, compiled_events = _best_of(lambda: _compiled_pass(adapter, path, body, fallback_ms), repeat)
+    finally:
+        if tmp_dir is not None:
+            tmp_dir.cleanup()
+
+    rows = len(body)
+    print(f"legacy side: {args.baseline + ':ui/digital.py' if args.baseline else 'in-tree per-line path'}")
+    print(f"rows={rows} events legacy={legacy_events} compiled={compiled_events}")
+    print(f"legacy   {legacy_sec * 1000:8.1f} ms  {rows / max(legacy_sec, 1e-9):10.0f} rows/s")
+    print(f"compiled {compiled_sec * 1000:8.1f} ms  {rows / max(compiled_sec, 1e-9):10.0f} rows/s")
+    print(f"speedup  {legacy_sec / max(compiled_sec, 1e-9):.1f}x")
+    return 0 if legacy_events == compiled_events else 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
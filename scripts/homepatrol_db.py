@@ -5,12 +5,40 @@ from __future__ import annotations
 import argparse
 import csv
 import datetime as dt
+import hashlib
+import json
+import math
+import multiprocessing
+import os
 import sqlite3
+import sys
+import time
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable, Iterator, Sequence
+
+REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+# FTS5 table read by ui/hp_search.py; see that module for the row layout.
+# Queries here go through the same match_expression the UI uses.
+from ui.hp_search import SEARCH_TABLE, match_expression  # noqa: E402
 
 
 DEFAULT_DB_PATH = Path("data/homepatrol.db")
+EARTH_RADIUS_MILES = 3958.7613
+
+# Spatial R*Tree tables read by ui/hp_scan_pool.spatial_filter_join.
+# table -> (rtree table, id column)
+SPATIAL_INDEXES = {
+    "trunk_sites": ("trunk_sites_rtree", "site_id"),
+    "conventional_groups": ("conventional_groups_rtree", "cgroup_id"),
+}
+
+# Favorites-wizard system catalogs read by ui/hp_favorites_wizard.py.
+TRUNK_CATALOG_TABLE = "hp_trunk_catalog"
+CONVENTIONAL_CATALOG_TABLE = "hp_conventional_catalog"
+_MULTISTATE_FILE = "_multiplestates.hpd"
 
 
 def _field(parts: Sequence[str], idx: int) -> str:
@@ -183,6 +211,33 @@ def _connect(db_path: Path) -> sqlite3.Connection:
     return conn
 
 
+_SIDE_FILE_SUFFIXES = ("-wal", "-shm", "-journal")
+
+
+def _remove_side_files(db_path: Path) -> None:
+    for suffix in _SIDE_FILE_SUFFIXES:
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+
+
+def _swap_in_database(build_path: Path, db_path: Path) -> None:
+    """Atomically replace ``db_path`` with the finished ``build_path``.
+
+    The live database is checkpointed and its ``-wal``/``-shm`` removed
+    first, so no frame written for the old file is replayed onto the new
+    one. Readers that still hold the old file keep reading it until they
+    reopen.
+    """
+    if db_path.is_file():
+        live = sqlite3.connect(str(db_path))
+        try:
+            live.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            live.close()
+    _remove_side_files(db_path)
+    os.replace(build_path, db_path)
+    _remove_side_files(build_path)
+
+
 SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS meta (
     key TEXT PRIMARY KEY,
@@ -298,7 +353,11 @@ CREATE TABLE IF NOT EXISTS talkgroups (
     mode TEXT,
     service_tag INTEGER
 );
+"""
+
 
+# Secondary indexes; the fast import creates them after the data is loaded.
+INDEX_SQL = """
 CREATE INDEX IF NOT EXISTS idx_trunk_systems_name ON trunk_systems(system_name);
 CREATE INDEX IF NOT EXISTS idx_trunk_sites_trunk ON trunk_sites(trunk_id);
 CREATE INDEX IF NOT EXISTS idx_trunk_groups_trunk ON trunk_groups(trunk_id);
@@ -309,6 +368,11 @@ CREATE INDEX IF NOT EXISTS idx_conv_groups_parent ON conventional_groups(parent_
 
 
 DROP_SQL = """
+DROP TABLE IF EXISTS hp_conventional_catalog;
+DROP TABLE IF EXISTS hp_trunk_catalog;
+DROP TABLE IF EXISTS hp_search;
+DROP TABLE IF EXISTS trunk_sites_rtree;
+DROP TABLE IF EXISTS conventional_groups_rtree;
 DROP TABLE IF EXISTS talkgroups;
 DROP TABLE IF EXISTS trunk_groups;
 DROP TABLE IF EXISTS trunk_freqs;
@@ -324,10 +388,308 @@ DROP TABLE IF EXISTS meta;
 """
 
 
-def _create_schema(conn: sqlite3.Connection, reset: bool) -> None:
+def _create_schema(conn: sqlite3.Connection, reset: bool, indexes: bool = True) -> None:
     if reset:
         conn.executescript(DROP_SQL)
     conn.executescript(SCHEMA_SQL)
+    if indexes:
+        conn.executescript(INDEX_SQL)
+
+
+def _spatial_box(lat: float, lon: float, radius_miles: float) -> tuple[float, ...]:
+    """Unit-sphere bounding box of a point padded by the chord of its radius."""
+    latr = math.radians(lat)
+    lonr = math.radians(lon)
+    center = (math.cos(latr) * math.cos(lonr), math.cos(latr) * math.sin(lonr), math.sin(latr))
+    pad = 2.0 * math.sin(min(math.pi, max(0.0, radius_miles) / EARTH_RADIUS_MILES) / 2.0)
+    box: list[float] = []
+    for axis in center:
+        box.extend((axis - pad, axis + pad))
+    return tuple(box)
+
+
+def _build_spatial_index(conn: sqlite3.Connection) -> dict[str, int]:
+    """Rebuild the site/group R*Tree tables; empty if SQLite lacks R*Tree support."""
+    counts: dict[str, int] = {}
+    for table, (rtree, id_col) in SPATIAL_INDEXES.items():
+        try:
+            conn.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {rtree} "
+                f"USING rtree({id_col}, min_x, max_x, min_y, max_y, min_z, max_z)"
+            )
+        except sqlite3.OperationalError as e:
+            print(f"warning: spatial index unavailable ({e}); location queries will scan full tables")
+            return {}
+        conn.execute(f"DELETE FROM {rtree}")
+        rows = conn.execute(
+            f"""
+            SELECT {id_col}, latitude, longitude, radius
+            FROM {table}
+            WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+            """
+        ).fetchall()
+        boxes = []
+        for row_id, lat, lon, radius in rows:
+            lat_f = _to_float(lat)
+            lon_f = _to_float(lon)
+            if row_id is None or lat_f is None or lon_f is None:
+                continue
+            if not (math.isfinite(lat_f) and math.isfinite(lon_f)):
+                continue
+            radius_f = _to_float(radius)
+            if radius_f is None or not math.isfinite(radius_f):
+                radius_f = 0.0
+            boxes.append((int(row_id), *_spatial_box(lat_f, lon_f, radius_f)))
+        conn.executemany(f"INSERT INTO {rtree} VALUES (?, ?, ?, ?, ?, ?, ?)", boxes)
+        counts[rtree] = len(boxes)
+    return counts
+
+
+def _build_search_index(conn: sqlite3.Connection) -> int:
+    """Rebuild the FTS5 search table; 0 (and LIKE fallbacks) if SQLite lacks FTS5."""
+    try:
+        conn.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+        conn.execute(
+            f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+            "kind UNINDEXED, ref UNINDEXED, scope, name, extra, "
+            "prefix='2 3', tokenize='unicode61 remove_diacritics 2')"
+        )
+    except sqlite3.OperationalError as e:
+        print(f"warning: search index unavailable ({e}); text filters will scan full tables")
+        return 0
+    conn.execute(
+        f"""
+        INSERT INTO {SEARCH_TABLE}(kind, ref, scope, name, extra)
+        SELECT 'trunk_system', ts.trunk_id, '', ts.system_name,
+               COALESCE((SELECT group_concat(site_name, ' ') FROM trunk_sites s WHERE s.trunk_id = ts.trunk_id), '')
+        FROM trunk_systems ts
+        """
+    )
+    conn.execute(
+        f"""
+        INSERT INTO {SEARCH_TABLE}(kind, ref, scope, name, extra)
+        SELECT 'conventional_system', system_key, '', system_name, COALESCE(category, '')
+        FROM conventional_systems
+        """
+    )
+    conn.execute(
+        f"""
+        INSERT INTO {SEARCH_TABLE}(kind, ref, scope, name, extra)
+        SELECT 'talkgroup', t.tid, 'trunk' || tg.trunk_id, t.alpha_tag,
+               COALESCE(tg.group_name, '') || ' ' || COALESCE(t.dec_tgid, '')
+        FROM talkgroups t
+        JOIN trunk_groups tg ON tg.tgroup_id = t.tgroup_id
+        WHERE tg.trunk_id IS NOT NULL
+        """
+    )
+    conn.execute(
+        f"""
+        INSERT INTO {SEARCH_TABLE}(kind, ref, scope, name, extra)
+        SELECT 'conventional_freq', cf.cfreq_id, lower(cg.parent_key) || cg.parent_id, cf.alpha_tag,
+               COALESCE(cg.group_name, '') || ' ' || COALESCE(cf.freq_hz, '')
+               || ' ' || COALESCE(printf('%.4f', cf.freq_hz / 1000000.0), '')
+        FROM conventional_freqs cf
+        JOIN conventional_groups cg ON cg.cgroup_id = cf.cgroup_id
+        WHERE cg.parent_key IS NOT NULL AND cg.parent_id IS NOT NULL
+        """
+    )
+    conn.execute(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('optimize')")
+    return int(conn.execute(f"SELECT count(*) FROM {SEARCH_TABLE}").fetchone()[0])
+
+
+CATALOG_SQL = (
+    f"DROP TABLE IF EXISTS {TRUNK_CATALOG_TABLE}",
+    f"""
+    CREATE TABLE {TRUNK_CATALOG_TABLE} (
+        scope TEXT NOT NULL,
+        county_id INTEGER NOT NULL,
+        state_id INTEGER NOT NULL,
+        trunk_id INTEGER NOT NULL,
+        state_link INTEGER NOT NULL,
+        system_name TEXT NOT NULL,
+        protocol TEXT,
+        site_count INTEGER NOT NULL,
+        talkgroup_count INTEGER NOT NULL,
+        PRIMARY KEY (scope, county_id, state_id, trunk_id)
+    ) WITHOUT ROWID
+    """,
+    f"DROP TABLE IF EXISTS {CONVENTIONAL_CATALOG_TABLE}",
+    f"""
+    CREATE TABLE {CONVENTIONAL_CATALOG_TABLE} (
+        state_id INTEGER NOT NULL,
+        scope TEXT NOT NULL,
+        county_id INTEGER,
+        system_key TEXT NOT NULL,
+        system_name TEXT NOT NULL,
+        category TEXT,
+        group_count INTEGER NOT NULL,
+        channel_count INTEGER NOT NULL
+    )
+    """,
+    f"CREATE INDEX hp_conventional_catalog_lookup ON {CONVENTIONAL_CATALOG_TABLE}(state_id, scope, county_id)",
+)
+
+
+def _build_trunk_catalog(conn: sqlite3.Connection) -> int:
+    """Materialize the wizard's state/county/scope -> trunk system rows.
+
+    ``county`` rows are keyed by county (``county_id > 0``) and, with
+    ``county_id = 0``, by every state one of the system's area counties is in.
+    ``statewide`` and ``nationwide`` rows use ``county_id = 0``; ``state_link``
+    marks systems that belong to the state directly (system state, AreaState,
+    nationwide state 0 or AreaCounty 0) rather than only through a county, so a
+    county-filtered lookup keeps them without consulting the county rows.
+    """
+    county_state = {
+        int(county_id): int(state_id or 0)
+        for county_id, state_id in conn.execute("SELECT county_id, state_id FROM counties")
+        if county_id is not None and int(county_id) > 0
+    }
+    all_states = {
+        int(row[0])
+        for row in conn.execute(
+            """
+            SELECT state_id FROM states
+            UNION SELECT state_id FROM counties
+            UNION SELECT state_id FROM trunk_systems
+            UNION SELECT state_id FROM entity_areas WHERE record_type = 'AreaState'
+            """
+        )
+        if row[0] is not None and int(row[0]) > 0
+    }
+    area_states: dict[int, set[int]] = {}
+    area_counties: dict[int, set[int]] = {}
+    global_county: set[int] = set()
+    for record_type, trunk_id, state_id, county_id in conn.execute(
+        """
+        SELECT record_type, entity_id, state_id, county_id
+        FROM entity_areas
+        WHERE entity_kind = 'TrunkId' AND entity_id IS NOT NULL
+        """
+    ):
+        trunk_id = int(trunk_id)
+        if record_type == "AreaState" and state_id is not None and int(state_id) > 0:
+            area_states.setdefault(trunk_id, set()).add(int(state_id))
+        elif record_type == "AreaCounty" and county_id is not None:
+            if int(county_id) == 0:
+                global_county.add(trunk_id)
+            elif int(county_id) > 0:
+                area_counties.setdefault(trunk_id, set()).add(int(county_id))
+    site_counts = dict(
+        conn.execute("SELECT trunk_id, count(*) FROM trunk_sites GROUP BY trunk_id").fetchall()
+    )
+    talkgroup_counts = dict(
+        conn.execute(
+            """
+            SELECT tg.trunk_id, count(*)
+            FROM talkgroups t
+            JOIN trunk_groups tg ON tg.tgroup_id = t.tgroup_id
+            GROUP BY tg.trunk_id
+            """
+        ).fetchall()
+    )
+
+    rows: list[tuple] = []
+    for trunk_id, source_file, ts_state, system_name, protocol in conn.execute(
+        """
+        SELECT trunk_id, source_file, state_id, system_name, protocol
+        FROM trunk_systems
+        WHERE trunk_id > 0
+        """
+    ):
+        ts_state = _to_int(ts_state)
+        states = area_states.get(trunk_id, set())
+        counties = area_counties.get(trunk_id, set())
+        county_states = {county_state[c] for c in counties if county_state.get(c, 0) > 0}
+        anywhere = ts_state == 0 or trunk_id in global_county
+        tail = (
+            system_name or "",
+            protocol,
+            int(site_counts.get(trunk_id, 0)),
+            int(talkgroup_counts.get(trunk_id, 0)),
+        )
+
+        def _link(state_id: int) -> int:
+            return int(anywhere or ts_state == state_id or state_id in states)
+
+        for county_id in counties:
+            rows.append(("county", county_id, county_state.get(county_id, 0), trunk_id, 1, *tail))
+        for state_id in county_states:
+            rows.append(("county", 0, state_id, trunk_id, 1, *tail))
+        home_states = states | county_states
+        if ts_state is not None and ts_state > 0:
+            home_states = home_states | {ts_state}
+        for state_id in home_states:
+            rows.append(("statewide", 0, state_id, trunk_id, _link(state_id), *tail))
+        if anywhere or str(source_file or "").strip().lower() == _MULTISTATE_FILE:
+            for state_id in all_states if anywhere else home_states:
+                rows.append(("nationwide", 0, state_id, trunk_id, _link(state_id), *tail))
+    conn.executemany(
+        f"INSERT INTO {TRUNK_CATALOG_TABLE} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    return len(rows)
+
+
+def _build_conventional_catalog(conn: sqlite3.Connection) -> int:
+    """Materialize conventional systems with their wizard scope and group/channel counts."""
+    counts: dict[str, tuple[int, int]] = {}
+    for parent_key, parent_id, groups, channels in conn.execute(
+        """
+        SELECT cg.parent_key, cg.parent_id, count(DISTINCT cg.cgroup_id), count(cf.cfreq_id)
+        FROM conventional_groups cg
+        LEFT JOIN conventional_freqs cf ON cf.cgroup_id = cg.cgroup_id
+        WHERE cg.parent_key IS NOT NULL AND cg.parent_id IS NOT NULL
+        GROUP BY cg.parent_key, cg.parent_id
+        """
+    ):
+        counts[f"{parent_key}:{parent_id}"] = (int(groups), int(channels))
+    rows: list[tuple] = []
+    for system_key, source_file, system_name, state_id, county_id, category in conn.execute(
+        """
+        SELECT system_key, source_file, system_name, state_id, county_id, category
+        FROM conventional_systems
+        WHERE state_id IS NOT NULL
+        """
+    ):
+        if county_id is not None and int(county_id) > 0:
+            scope = "county"
+        elif str(source_file or "").strip().lower() == _MULTISTATE_FILE:
+            scope = "nationwide"
+        else:
+            scope = "statewide"
+        rows.append(
+            (int(state_id), scope, county_id, system_key, system_name or "", category, *counts.get(system_key, (0, 0)))
+        )
+    conn.executemany(
+        f"INSERT INTO {CONVENTIONAL_CATALOG_TABLE} VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    return len(rows)
+
+
+def _build_catalogs(conn: sqlite3.Connection) -> dict[str, int]:
+    # Statement by statement: executescript() would commit the import transaction.
+    for statement in CATALOG_SQL:
+        conn.execute(statement)
+    return {
+        TRUNK_CATALOG_TABLE: _build_trunk_catalog(conn),
+        CONVENTIONAL_CATALOG_TABLE: _build_conventional_catalog(conn),
+    }
+
+
+def _search_expression(conn: sqlite3.Connection, text: str) -> str | None:
+    """Prefix-match FTS5 query for ``text`` when the search table exists."""
+    expression = match_expression(text)
+    if expression is None:
+        return None
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (SEARCH_TABLE,),
+    ).fetchone()
+    if not exists:
+        return None
+    return expression
 
 
 def _import_config(conn: sqlite3.Connection, config_path: Path) -> dict[str, int]:
@@ -410,19 +772,76 @@ def _extract_area_mapping(
     return entity_kind, entity_id, state_id, county_id
 
 
-def _import_hpd_file(conn: sqlite3.Connection, hpd_path: Path) -> dict[str, int]:
+HPD_TABLES = (
+    "conventional_systems",
+    "conventional_groups",
+    "conventional_freqs",
+    "trunk_systems",
+    "trunk_sites",
+    "trunk_freqs",
+    "trunk_groups",
+    "talkgroups",
+    "entity_areas",
+)
+
+INSERT_SQL = {
+    "conventional_systems": """
+        INSERT OR REPLACE INTO conventional_systems(
+            system_key, source_file, system_name, state_id, county_id, agency_id, category
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    """,
+    "conventional_groups": """
+        INSERT OR REPLACE INTO conventional_groups(
+            cgroup_id, source_file, parent_key, parent_id, group_name,
+            latitude, longitude, radius, shape
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+    "conventional_freqs": """
+        INSERT OR REPLACE INTO conventional_freqs(
+            cfreq_id, source_file, cgroup_id, alpha_tag, freq_hz, mode, tone, service_tag
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+    "trunk_systems": """
+        INSERT OR REPLACE INTO trunk_systems(
+            trunk_id, source_file, state_id, system_name, system_type, protocol
+        ) VALUES (?, ?, ?, ?, ?, ?)
+    """,
+    "trunk_sites": """
+        INSERT OR REPLACE INTO trunk_sites(
+            site_id, source_file, trunk_id, site_name, latitude, longitude, radius,
+            site_mode, bandplan, width, shape
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+    "trunk_freqs": """
+        INSERT OR IGNORE INTO trunk_freqs(source_file, site_id, tfreq_id, freq_hz, lcn)
+        VALUES (?, ?, ?, ?, ?)
+    """,
+    "trunk_groups": """
+        INSERT OR REPLACE INTO trunk_groups(
+            tgroup_id, source_file, trunk_id, group_name, latitude, longitude, radius, shape
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+    "talkgroups": """
+        INSERT OR REPLACE INTO talkgroups(
+            tid, source_file, tgroup_id, alpha_tag, dec_tgid, mode, service_tag
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    """,
+    "entity_areas": """
+        INSERT INTO entity_areas(
+            source_file, record_type, entity_kind, entity_id, state_id, county_id
+        ) VALUES (?, ?, ?, ?, ?, ?)
+    """,
+}
+
+BATCH_ROWS = 5000
+_HPD_RECORDS = frozenset(
+    {"Conventional", "C-Group", "C-Freq", "Trunk", "Site", "T-Freq", "T-Group", "TGID", "AreaState", "AreaCounty"}
+)
+
+
+def _iter_hpd_rows(hpd_path: Path) -> Iterator[tuple[str, tuple]]:
+    """Yield ``(table, row)`` for every importable HPD record, in file order."""
     source = hpd_path.name
-    counts = {
-        "conventional_systems": 0,
-        "conventional_groups": 0,
-        "conventional_freqs": 0,
-        "trunk_systems": 0,
-        "trunk_sites": 0,
-        "trunk_freqs": 0,
-        "trunk_groups": 0,
-        "talkgroups": 0,
-        "entity_areas": 0,
-    }
     with hpd_path.open("r", encoding="utf-8", errors="ignore", newline="") as handle:
         for raw in handle:
             line = raw.rstrip("\r\n")
@@ -430,37 +849,34 @@ def _import_hpd_file(conn: sqlite3.Connection, hpd_path: Path) -> dict[str, int]
                 continue
             parts = line.split("\t")
             rec = _field(parts, 0)
+            if rec not in _HPD_RECORDS:
+                continue
             pairs = _kv_pairs(parts[1:])
-            kv = _kv_first(pairs)
+            # First occurrence of each key wins.
+            kv = dict(reversed(pairs))
 
             if rec == "Conventional":
-                state_id = _to_int(kv.get("StateId"))
-                county_id = _to_int(kv.get("CountyId"))
-                agency_id = _to_int(kv.get("AgencyId"))
                 system_name = _field(parts, 3)
-                category = _field(parts, 6)
+                if not system_name:
+                    continue
                 parent_kind, parent_id = _detect_parent(
                     pairs,
                     ignore={"StateId"},
                 )
-                if not system_name:
-                    continue
                 if parent_kind and parent_id is not None:
                     system_key = f"{parent_kind}:{parent_id}"
                 else:
                     system_key = f"{source}:{system_name}"
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO conventional_systems(
-                        system_key, source_file, system_name, state_id, county_id, agency_id, category
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (system_key, source, system_name, state_id, county_id, agency_id, category or None),
+                yield "conventional_systems", (
+                    system_key,
+                    source,
+                    system_name,
+                    _to_int(kv.get("StateId")),
+                    _to_int(kv.get("CountyId")),
+                    _to_int(kv.get("AgencyId")),
+                    _field(parts, 6) or None,
                 )
-                counts["conventional_systems"] += 1
-                continue
-
-            if rec == "C-Group":
+            elif rec == "C-Group":
                 cgroup_id = _to_int(kv.get("CGroupId"))
                 if cgroup_id is None:
                     continue
@@ -468,185 +884,241 @@ def _import_hpd_file(conn: sqlite3.Connection, hpd_path: Path) -> dict[str, int]
                     pairs,
                     ignore={"CGroupId"},
                 )
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO conventional_groups(
-                        cgroup_id, source_file, parent_key, parent_id, group_name,
-                        latitude, longitude, radius, shape
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        cgroup_id,
-                        source,
-                        parent_kind,
-                        parent_id,
-                        _field(parts, 3),
-                        _to_float(_field(parts, 5)),
-                        _to_float(_field(parts, 6)),
-                        _to_float(_field(parts, 7)),
-                        _field(parts, 8) or None,
-                    ),
+                yield "conventional_groups", (
+                    cgroup_id,
+                    source,
+                    parent_kind,
+                    parent_id,
+                    _field(parts, 3),
+                    _to_float(_field(parts, 5)),
+                    _to_float(_field(parts, 6)),
+                    _to_float(_field(parts, 7)),
+                    _field(parts, 8) or None,
                 )
-                counts["conventional_groups"] += 1
-                continue
-
-            if rec == "C-Freq":
+            elif rec == "C-Freq":
                 cfreq_id = _to_int(kv.get("CFreqId"))
-                cgroup_id = _to_int(kv.get("CGroupId"))
                 if cfreq_id is None:
                     continue
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO conventional_freqs(
-                        cfreq_id, source_file, cgroup_id, alpha_tag, freq_hz, mode, tone, service_tag
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        cfreq_id,
-                        source,
-                        cgroup_id,
-                        _field(parts, 3),
-                        _to_int(_field(parts, 5)),
-                        _field(parts, 6) or None,
-                        _field(parts, 7) or None,
-                        _to_int(_field(parts, 8)),
-                    ),
+                yield "conventional_freqs", (
+                    cfreq_id,
+                    source,
+                    _to_int(kv.get("CGroupId")),
+                    _field(parts, 3),
+                    _to_int(_field(parts, 5)),
+                    _field(parts, 6) or None,
+                    _field(parts, 7) or None,
+                    _to_int(_field(parts, 8)),
                 )
-                counts["conventional_freqs"] += 1
-                continue
-
-            if rec == "Trunk":
+            elif rec == "Trunk":
                 trunk_id = _to_int(kv.get("TrunkId"))
                 if trunk_id is None:
                     continue
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO trunk_systems(
-                        trunk_id, source_file, state_id, system_name, system_type, protocol
-                    ) VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        trunk_id,
-                        source,
-                        _to_int(kv.get("StateId")),
-                        _field(parts, 3),
-                        _field(parts, 5) or None,
-                        _field(parts, 6) or None,
-                    ),
+                yield "trunk_systems", (
+                    trunk_id,
+                    source,
+                    _to_int(kv.get("StateId")),
+                    _field(parts, 3),
+                    _field(parts, 5) or None,
+                    _field(parts, 6) or None,
                 )
-                counts["trunk_systems"] += 1
-                continue
-
-            if rec == "Site":
+            elif rec == "Site":
                 site_id = _to_int(kv.get("SiteId"))
                 if site_id is None:
                     continue
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO trunk_sites(
-                        site_id, source_file, trunk_id, site_name, latitude, longitude, radius,
-                        site_mode, bandplan, width, shape
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        site_id,
-                        source,
-                        _to_int(kv.get("TrunkId")),
-                        _field(parts, 3),
-                        _to_float(_field(parts, 5)),
-                        _to_float(_field(parts, 6)),
-                        _to_float(_field(parts, 7)),
-                        _field(parts, 8) or None,
-                        _field(parts, 9) or None,
-                        _field(parts, 10) or None,
-                        _field(parts, 11) or None,
-                    ),
+                yield "trunk_sites", (
+                    site_id,
+                    source,
+                    _to_int(kv.get("TrunkId")),
+                    _field(parts, 3),
+                    _to_float(_field(parts, 5)),
+                    _to_float(_field(parts, 6)),
+                    _to_float(_field(parts, 7)),
+                    _field(parts, 8) or None,
+                    _field(parts, 9) or None,
+                    _field(parts, 10) or None,
+                    _field(parts, 11) or None,
                 )
-                counts["trunk_sites"] += 1
-                continue
-
-            if rec == "T-Freq":
+            elif rec == "T-Freq":
                 site_id = _to_int(kv.get("SiteId"))
                 if site_id is None:
                     continue
-                conn.execute(
-                    """
-                    INSERT OR IGNORE INTO trunk_freqs(source_file, site_id, tfreq_id, freq_hz, lcn)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (
-                        source,
-                        site_id,
-                        kv.get("TFreqId"),
-                        _to_int(_field(parts, 5)),
-                        _field(parts, 6) or None,
-                    ),
+                yield "trunk_freqs", (
+                    source,
+                    site_id,
+                    kv.get("TFreqId"),
+                    _to_int(_field(parts, 5)),
+                    _field(parts, 6) or None,
                 )
-                counts["trunk_freqs"] += 1
-                continue
-
-            if rec == "T-Group":
+            elif rec == "T-Group":
                 tgroup_id = _to_int(kv.get("TGroupId"))
                 if tgroup_id is None:
                     continue
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO trunk_groups(
-                        tgroup_id, source_file, trunk_id, group_name, latitude, longitude, radius, shape
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        tgroup_id,
-                        source,
-                        _to_int(kv.get("TrunkId")),
-                        _field(parts, 3),
-                        _to_float(_field(parts, 5)),
-                        _to_float(_field(parts, 6)),
-                        _to_float(_field(parts, 7)),
-                        _field(parts, 8) or None,
-                    ),
+                yield "trunk_groups", (
+                    tgroup_id,
+                    source,
+                    _to_int(kv.get("TrunkId")),
+                    _field(parts, 3),
+                    _to_float(_field(parts, 5)),
+                    _to_float(_field(parts, 6)),
+                    _to_float(_field(parts, 7)),
+                    _field(parts, 8) or None,
                 )
-                counts["trunk_groups"] += 1
-                continue
-
-            if rec == "TGID":
+            elif rec == "TGID":
                 tid = _to_int(kv.get("Tid"))
                 if tid is None:
                     continue
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO talkgroups(
-                        tid, source_file, tgroup_id, alpha_tag, dec_tgid, mode, service_tag
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        tid,
-                        source,
-                        _to_int(kv.get("TGroupId")),
-                        _field(parts, 3),
-                        _field(parts, 5),
-                        _field(parts, 6) or None,
-                        _to_int(_field(parts, 7)),
-                    ),
+                yield "talkgroups", (
+                    tid,
+                    source,
+                    _to_int(kv.get("TGroupId")),
+                    _field(parts, 3),
+                    _field(parts, 5),
+                    _field(parts, 6) or None,
+                    _to_int(_field(parts, 7)),
                 )
-                counts["talkgroups"] += 1
-                continue
-
-            if rec in {"AreaState", "AreaCounty"}:
+            else:
                 entity_kind, entity_id, state_id, county_id = _extract_area_mapping(rec, pairs)
                 if not entity_kind:
                     continue
-                conn.execute(
-                    """
-                    INSERT INTO entity_areas(
-                        source_file, record_type, entity_kind, entity_id, state_id, county_id
-                    ) VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (source, rec, entity_kind, entity_id, state_id, county_id),
-                )
-                counts["entity_areas"] += 1
-                continue
-    return counts
+                yield "entity_areas", (source, rec, entity_kind, entity_id, state_id, county_id)
+
+
+def _parse_hpd_batches(hpd_path: str, batch_rows: int = BATCH_ROWS) -> list[tuple[str, list[tuple]]]:
+    """Parse one HPD file into per-table row batches (runs in --jobs workers)."""
+    batches: list[tuple[str, list[tuple]]] = []
+    pending: dict[str, list[tuple]] = {}
+    for table, row in _iter_hpd_rows(Path(hpd_path)):
+        rows = pending.setdefault(table, [])
+        rows.append(row)
+        if len(rows) >= batch_rows:
+            batches.append((table, rows))
+            pending[table] = []
+    batches.extend((table, rows) for table, rows in pending.items() if rows)
+    return batches
+
+
+class _BulkWriter:
+    """Buffers rows per table and writes them with ``executemany``."""
+
+    def __init__(self, conn: sqlite3.Connection, batch_rows: int = BATCH_ROWS):
+        self.conn = conn
+        self.batch_rows = max(1, int(batch_rows))
+        self.counts = {table: 0 for table in HPD_TABLES}
+        self.seconds = {table: 0.0 for table in HPD_TABLES}
+        self._pending: dict[str, list[tuple]] = {table: [] for table in HPD_TABLES}
+
+    def add(self, table: str, row: tuple) -> None:
+        rows = self._pending[table]
+        rows.append(row)
+        if len(rows) >= self.batch_rows:
+            self.write(table, rows)
+            self._pending[table] = []
+
+    def write(self, table: str, rows: Sequence[tuple]) -> None:
+        started = time.perf_counter()
+        self.conn.executemany(INSERT_SQL[table], rows)
+        self.seconds[table] += time.perf_counter() - started
+        self.counts[table] += len(rows)
+
+    def flush(self) -> None:
+        for table, rows in self._pending.items():
+            if rows:
+                self.write(table, rows)
+                self._pending[table] = []
+
+
+def _import_hpd_file(conn: sqlite3.Connection, hpd_path: Path) -> dict[str, int]:
+    writer = _BulkWriter(conn)
+    for table, row in _iter_hpd_rows(hpd_path):
+        writer.add(table, row)
+    writer.flush()
+    return writer.counts
+
+
+def _load_hpd_files(writer: _BulkWriter, hpd_files: Sequence[Path], jobs: int, verbose: bool) -> None:
+    if jobs <= 1 or len(hpd_files) <= 1:
+        for hpd_file in hpd_files:
+            for table, row in _iter_hpd_rows(hpd_file):
+                writer.add(table, row)
+            writer.flush()
+            if verbose:
+                print(f"imported {hpd_file.name}")
+        return
+    # Workers only parse; this process is the single writer. imap keeps file
+    # order so INSERT OR REPLACE resolves duplicates exactly like a serial run.
+    with multiprocessing.Pool(processes=jobs) as pool:
+        for hpd_file, batches in zip(hpd_files, pool.imap(_parse_hpd_batches, [str(p) for p in hpd_files])):
+            for table, rows in batches:
+                writer.write(table, rows)
+            if verbose:
+                print(f"imported {hpd_file.name}")
+
+
+_FILE_META_PREFIX = "file:"
+_CONFIG_FILE_NAME = "HPDB.config"
+
+
+def _file_signature(path: Path) -> dict[str, object]:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    st = path.stat()
+    return {"sha256": digest.hexdigest(), "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def _stored_signatures(conn: sqlite3.Connection) -> dict[str, dict]:
+    out: dict[str, dict] = {}
+    rows = conn.execute(
+        "SELECT key, value FROM meta WHERE key LIKE ?",
+        (_FILE_META_PREFIX + "%",),
+    ).fetchall()
+    for key, value in rows:
+        try:
+            parsed = json.loads(value)
+        except ValueError:
+            continue
+        if isinstance(parsed, dict):
+            out[str(key)[len(_FILE_META_PREFIX):]] = parsed
+    return out
+
+
+def _store_signature(conn: sqlite3.Connection, name: str, signature: dict[str, object]) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO meta(key, value) VALUES(?, ?)",
+        (_FILE_META_PREFIX + name, json.dumps(signature, sort_keys=True)),
+    )
+
+
+def _changed_files(
+    paths: Sequence[Path],
+    stored: dict[str, dict],
+) -> tuple[list[Path], dict[str, dict[str, object]]]:
+    """Files whose content differs from ``stored``, plus fresh signatures to record.
+
+    Matching size and mtime skips hashing; a touched but identical file only
+    has its recorded mtime refreshed.
+    """
+    changed: list[Path] = []
+    signatures: dict[str, dict[str, object]] = {}
+    for path in paths:
+        previous = stored.get(path.name) or {}
+        st = path.stat()
+        if previous.get("mtime_ns") == st.st_mtime_ns and previous.get("size") == st.st_size:
+            continue
+        signature = _file_signature(path)
+        signatures[path.name] = signature
+        if previous.get("sha256") != signature["sha256"]:
+            changed.append(path)
+    return changed, signatures
+
+
+def _delete_source_rows(conn: sqlite3.Connection, source_files: Sequence[str]) -> None:
+    if not source_files:
+        return
+    placeholders = ",".join("?" for _ in source_files)
+    for table in HPD_TABLES:
+        conn.execute(f"DELETE FROM {table} WHERE source_file IN ({placeholders})", list(source_files))
 
 
 def cmd_import(args: argparse.Namespace) -> int:
@@ -661,33 +1133,70 @@ def cmd_import(args: argparse.Namespace) -> int:
         print(f"error: no .hpd files found in {hpdb_root}")
         return 2
 
-    conn = _connect(db_path)
+    fast = bool(getattr(args, "fast", False))
+    incremental = bool(getattr(args, "incremental", False))
+    jobs = max(1, int(getattr(args, "jobs", 1) or 1))
+    config_path = hpdb_root / _CONFIG_FILE_NAME
+    config_paths = [config_path] if config_path.is_file() else []
+    started = time.perf_counter()
+    build_path = db_path
+    if fast:
+        # No rollback journal or fsyncs while loading, so a crash can leave
+        # the file being written corrupt. Load into a scratch file next to
+        # the database and swap it in only once the import has committed.
+        build_path = db_path.with_name(db_path.name + ".import")
+        build_path.unlink(missing_ok=True)
+        _remove_side_files(build_path)
+    conn = _connect(build_path)
     try:
-        _create_schema(conn, reset=not args.no_reset)
+        if fast and args.no_reset and db_path.is_file():
+            live = sqlite3.connect(str(db_path))
+            try:
+                live.backup(conn)
+            finally:
+                live.close()
+        if fast:
+            conn.execute("PRAGMA journal_mode = OFF")
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.execute("PRAGMA cache_size = -262144")
+        _create_schema(conn, reset=not (args.no_reset or incremental), indexes=not fast)
         now = dt.datetime.now().isoformat(timespec="seconds")
         conn.execute(
             "INSERT OR REPLACE INTO meta(key, value) VALUES(?, ?)",
             ("last_import_started", now),
         )
-        cfg_counts = _import_config(conn, hpdb_root / "HPDB.config")
-        totals = {
-            "conventional_systems": 0,
-            "conventional_groups": 0,
-            "conventional_freqs": 0,
-            "trunk_systems": 0,
-            "trunk_sites": 0,
-            "trunk_freqs": 0,
-            "trunk_groups": 0,
-            "talkgroups": 0,
-            "entity_areas": 0,
-        }
-        for hpd_file in hpd_files:
-            file_counts = _import_hpd_file(conn, hpd_file)
-            for key in totals:
-                totals[key] += file_counts.get(key, 0)
-            if args.verbose:
-                print(f"imported {hpd_file.name}")
 
+        stored = _stored_signatures(conn) if incremental else {}
+        load_files, signatures = _changed_files(hpd_files, stored)
+        changed_config, config_signatures = _changed_files(config_paths, stored)
+        signatures.update(config_signatures)
+        present = {path.name for path in hpd_files} | {_CONFIG_FILE_NAME}
+        removed = sorted(name for name in stored if name not in present)
+        if incremental:
+            # Rows of changed or vanished files are replaced in this same
+            # transaction; untouched files and the indexes stay as they are.
+            _delete_source_rows(conn, [path.name for path in load_files] + removed)
+            if changed_config:
+                conn.execute("DELETE FROM counties")
+                conn.execute("DELETE FROM states")
+        cfg_counts = _import_config(conn, config_path) if changed_config else {"states": 0, "counties": 0}
+        writer = _BulkWriter(conn)
+        _load_hpd_files(writer, load_files, jobs, bool(args.verbose))
+        totals = writer.counts
+        load_seconds = time.perf_counter() - started
+
+        if fast:
+            conn.commit()
+            conn.executescript(INDEX_SQL)
+        index_counts: dict[str, int] = {}
+        if load_files or removed or changed_config or not incremental:
+            index_counts = _build_spatial_index(conn)
+            index_counts[SEARCH_TABLE] = _build_search_index(conn)
+            index_counts.update(_build_catalogs(conn))
+        for name, signature in signatures.items():
+            _store_signature(conn, name, signature)
+        for name in removed:
+            conn.execute("DELETE FROM meta WHERE key = ?", (_FILE_META_PREFIX + name,))
         finished = dt.datetime.now().isoformat(timespec="seconds")
         conn.execute(
             "INSERT OR REPLACE INTO meta(key, value) VALUES(?, ?)",
@@ -698,24 +1207,47 @@ def cmd_import(args: argparse.Namespace) -> int:
             ("last_import_source", str(hpdb_root)),
         )
         conn.commit()
-    finally:
+        if fast:
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA journal_mode = WAL")
+        # Fold the -wal file back into hp.db so the main file's stat changes
+        # with every import and readers keyed on it see the new rows.
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    except BaseException:
         conn.close()
+        if fast:
+            build_path.unlink(missing_ok=True)
+            _remove_side_files(build_path)
+        raise
+    conn.close()
+    if fast:
+        _swap_in_database(build_path, db_path)
+    total_seconds = time.perf_counter() - started
 
     print(f"Database: {db_path}")
     print(f"Imported from: {hpdb_root}")
+    if incremental:
+        print(
+            f"Changed files: {len(load_files) + len(changed_config)}, "
+            f"unchanged: {len(hpd_files) + len(config_paths) - len(load_files) - len(changed_config)}, "
+            f"removed: {len(removed)}"
+        )
+        for path in [*changed_config, *load_files]:
+            print(f"  changed {path.name}")
+        for name in removed:
+            print(f"  removed {name}")
     print(f"States: {cfg_counts['states']}, Counties: {cfg_counts['counties']}")
-    for key in (
-        "conventional_systems",
-        "conventional_groups",
-        "conventional_freqs",
-        "trunk_systems",
-        "trunk_sites",
-        "trunk_freqs",
-        "trunk_groups",
-        "talkgroups",
-        "entity_areas",
-    ):
-        print(f"{key}: {totals[key]}")
+    for key in HPD_TABLES:
+        seconds = writer.seconds[key]
+        rate = f" ({totals[key] / seconds:,.0f} rows/s)" if totals[key] and seconds > 0 else ""
+        print(f"{key}: {totals[key]}{rate}")
+    for key, count in index_counts.items():
+        print(f"{key}: {count}")
+    rows = sum(totals.values())
+    print(
+        f"Loaded {rows} rows in {load_seconds:.1f}s ({rows / max(load_seconds, 1e-9):,.0f} rows/s), "
+        f"total {total_seconds:.1f}s"
+    )
     return 0
 
 
@@ -730,11 +1262,30 @@ def cmd_find_system(args: argparse.Namespace) -> int:
     conn = _connect(Path(args.db).expanduser())
     try:
         needle = f"%{args.query.lower()}%"
+        match = _search_expression(conn, args.query)
         rows: list[tuple[object, ...]] = []
         if args.kind in {"all", "trunk"}:
-            rows.extend(
-                conn.execute(
-                    """
+            if match is not None:
+                sql = f"""
+                    SELECT
+                        'trunk' AS kind,
+                        ts.trunk_id AS id,
+                        ts.system_name AS name,
+                        COALESCE(st.abbr, '') AS state,
+                        COALESCE(ts.protocol, '') AS extra
+                    FROM (
+                        SELECT ref, rank FROM {SEARCH_TABLE}
+                        WHERE {SEARCH_TABLE} MATCH ? AND kind = 'trunk_system'
+                        ORDER BY rank
+                    ) hit
+                    JOIN trunk_systems ts ON ts.trunk_id = hit.ref
+                    LEFT JOIN states st ON st.state_id = ts.state_id
+                    ORDER BY hit.rank, ts.system_name
+                    LIMIT ?
+                """
+                params: tuple[object, ...] = (match, args.limit)
+            else:
+                sql = """
                     SELECT
                         'trunk' AS kind,
                         ts.trunk_id AS id,
@@ -746,14 +1297,31 @@ def cmd_find_system(args: argparse.Namespace) -> int:
                     WHERE lower(ts.system_name) LIKE ?
                     ORDER BY ts.system_name
                     LIMIT ?
-                    """,
-                    (needle, args.limit),
-                ).fetchall()
-            )
+                """
+                params = (needle, args.limit)
+            rows.extend(conn.execute(sql, params).fetchall())
         if args.kind in {"all", "conventional"}:
-            rows.extend(
-                conn.execute(
-                    """
+            if match is not None:
+                sql = f"""
+                    SELECT
+                        'conventional' AS kind,
+                        cs.system_key AS id,
+                        cs.system_name AS name,
+                        COALESCE(st.abbr, '') AS state,
+                        COALESCE(cs.category, '') AS extra
+                    FROM (
+                        SELECT ref, rank FROM {SEARCH_TABLE}
+                        WHERE {SEARCH_TABLE} MATCH ? AND kind = 'conventional_system'
+                        ORDER BY rank
+                    ) hit
+                    JOIN conventional_systems cs ON cs.system_key = hit.ref
+                    LEFT JOIN states st ON st.state_id = cs.state_id
+                    ORDER BY hit.rank, cs.system_name
+                    LIMIT ?
+                """
+                params = (match, args.limit)
+            else:
+                sql = """
                     SELECT
                         'conventional' AS kind,
                         cs.system_key AS id,
@@ -765,10 +1333,9 @@ def cmd_find_system(args: argparse.Namespace) -> int:
                     WHERE lower(cs.system_name) LIKE ?
                     ORDER BY cs.system_name
                     LIMIT ?
-                    """,
-                    (needle, args.limit),
-                ).fetchall()
-            )
+                """
+                params = (needle, args.limit)
+            rows.extend(conn.execute(sql, params).fetchall())
     finally:
         conn.close()
 
@@ -779,19 +1346,44 @@ def cmd_find_system(args: argparse.Namespace) -> int:
 def cmd_find_talkgroup(args: argparse.Namespace) -> int:
     conn = _connect(Path(args.db).expanduser())
     try:
-        where = """
-            (
-                lower(t.alpha_tag) LIKE :needle
-                OR lower(t.dec_tgid) LIKE :needle
-                OR lower(tg.group_name) LIKE :needle
-                OR lower(ts.system_name) LIKE :needle
-            )
-            AND t.dec_tgid GLOB '[0-9]*'
-        """
+        match = _search_expression(conn, args.query)
         params: dict[str, object] = {"needle": f"%{args.query.lower()}%", "limit": args.limit}
+        where = "t.dec_tgid GLOB '[0-9]*'"
         if args.system:
             where += " AND lower(ts.system_name) LIKE :system"
             params["system"] = f"%{args.system.lower()}%"
+        if match is not None:
+            # Talkgroups matching by their own text rank first (bm25 scores are
+            # negative), then every talkgroup of a system whose name matched.
+            params["match"] = match
+            source = f"""
+                (
+                    SELECT tid, MIN(score) AS score FROM (
+                        SELECT ref AS tid, rank AS score FROM {SEARCH_TABLE}
+                        WHERE {SEARCH_TABLE} MATCH :match AND kind = 'talkgroup'
+                        UNION ALL
+                        SELECT t2.tid, 0.0
+                        FROM {SEARCH_TABLE} s
+                        JOIN trunk_groups tg2 ON tg2.trunk_id = s.ref
+                        JOIN talkgroups t2 ON t2.tgroup_id = tg2.tgroup_id
+                        WHERE {SEARCH_TABLE} MATCH :match AND s.kind = 'trunk_system'
+                    )
+                    GROUP BY tid
+                ) hit
+                JOIN talkgroups t ON t.tid = hit.tid
+            """
+            order = "hit.score, ts.system_name, CAST(t.dec_tgid AS INTEGER), t.alpha_tag"
+        else:
+            source = "talkgroups t"
+            where += """
+                AND (
+                    lower(t.alpha_tag) LIKE :needle
+                    OR lower(t.dec_tgid) LIKE :needle
+                    OR lower(tg.group_name) LIKE :needle
+                    OR lower(ts.system_name) LIKE :needle
+                )
+            """
+            order = "ts.system_name, CAST(t.dec_tgid AS INTEGER), t.alpha_tag"
         rows = conn.execute(
             f"""
             SELECT
@@ -801,13 +1393,11 @@ def cmd_find_talkgroup(args: argparse.Namespace) -> int:
                 t.alpha_tag,
                 COALESCE(t.mode, ''),
                 COALESCE(t.service_tag, '')
-            FROM talkgroups t
+            FROM {source}
             JOIN trunk_groups tg ON tg.tgroup_id = t.tgroup_id
             JOIN trunk_systems ts ON ts.trunk_id = tg.trunk_id
             WHERE {where}
-            ORDER BY ts.system_name,
-                     CAST(t.dec_tgid AS INTEGER),
-                     t.alpha_tag
+            ORDER BY {order}
             LIMIT :limit
             """,
             params,
@@ -1274,6 +1864,24 @@ def build_parser() -> argparse.ArgumentParser:
         help="Do not drop/recreate tables before import",
     )
     p_import.add_argument("--verbose", action="store_true", help="Print each imported file")
+    refresh = p_import.add_mutually_exclusive_group()
+    refresh.add_argument(
+        "--fast",
+        action="store_true",
+        help="Bulk-load into a scratch file with journaling and fsync off, build indexes "
+        "after the data, then swap it over --db",
+    )
+    refresh.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Re-import only HPD files whose content changed since the last import",
+    )
+    p_import.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Parse HPD files in this many worker processes (default: 1)",
+    )
     p_import.set_defaults(func=cmd_import)
 
     p_find = sub.add_parser("find-system", help="Find systems by name")
@@ -0,0 +1,144 @@
+import unittest
+from unittest import mock
+
+from ui import hit_sessions
+from ui import journal_follower
+from ui import scanner
+
+
+def _record(ts_sec: int, message: str, cursor: str = "") -> dict:
+    return {
+        "__REALTIME_TIMESTAMP": str(ts_sec * 1_000_000 + 250_000),
+        "MESSAGE": message,
+        "__CURSOR": cursor or f"c{ts_sec}",
+    }
+
+
+class AnalogJournalFollowerTests(unittest.TestCase):
+    def _ready_follower(self, unit: str) -> journal_follower.JournalFollower:
+        follower = journal_follower.JournalFollower(unit, ring_size=50, backfill_lines=0)
+        follower._ready = True
+        return follower
+
+    def test_ingest_record_tracks_activity_and_last_hits(self):
+        follower = self._ready_follower("rtl-airband")
+        follower.ingest_record(_record(1000, "Activity on 118.600"))
+        follower.ingest_record(_record(1001, "some unrelated line", cursor="c-x"))
+        follower.ingest_record(_record(1002, "Activity on 155.7300"))
+
+        self.assertEqual(follower.activity(), [(1000.0, "118.600"), (1002.0, "155.7300")])
+        self.assertEqual(follower.last_freq(), "155.7300")
+        self.assertEqual(follower.last_in_range(True), 118.6)
+        self.assertEqual(follower.last_in_range(False), 155.73)
+        self.assertEqual(follower._cursor, "c1002")
+        self.assertEqual(follower.version, 2)
+
+    def test_byte_array_message_is_decoded(self):
+        follower = self._ready_follower("rtl-airband")
+        follower.ingest_record(_record(1000, list(b"Activity on 119.100")))
+        self.assertEqual(follower.last_freq(), "119.100")
+
+    def test_follow_cmd_resumes_from_cursor(self):
+        follower = self._ready_follower("rtl-airband")
+        self.assertIn("-n", follower._follow_cmd())
+        follower.ingest_record(_record(1000, "Activity on 118.600", cursor="abc"))
+        cmd = follower._follow_cmd()
+        self.assertEqual(cmd[-2:], ["--after-cursor", "abc"])
+
+    def test_hit_list_reads_follower_without_subprocess(self):
+        index = hit_sessions.HitSessionIndex(gap_sec=10)
+        follower = self._ready_follower("rtl-airband")
+        follower.add_listener(index.ingest)
+        for ts in (1000, 1001, 1002):
+            follower.ingest_record(_record(ts, "Activity on 118.600"))
+        follower.ingest_record(_record(1030, "Activity on 118.600"))
+        follower.ingest_record(_record(1031, "Activity on 119.100"))
+
+        with mock.patch.dict(journal_follower._FOLLOWERS, {"rtl-airband": follower}, clear=True), mock.patch.object(
+            scanner.subprocess, "run", side_effect=AssertionError("journalctl should not be forked")
+        ), mock.patch.object(scanner, "_HIT_INDEX", index):
+            entries = scanner.read_hit_list_for_unit("rtl-airband", limit=10)
+            last_air = scanner.read_last_hit_for_range("rtl-airband", True)
+            last_raw = scanner.read_last_hit_from_journal_unit("rtl-airband")
+
+        self.assertEqual([row["freq"] for row in entries], ["119.1000", "118.6000", "118.6000"])
+        self.assertEqual([row["duration"] for row in entries], [0, 0, 2])
+        self.assertEqual(entries[-1]["ts"], 1002.0)
+        self.assertEqual(last_air, "119.1000")
+        self.assertEqual(last_raw, "119.100")
+
+    def test_last_in_range_ages_out_like_the_scanned_window(self):
+        follower = self._ready_follower("rtl-airband")
+        follower.ingest_record(_record(1000, "Activity on 118.600"))
+        for ts in range(1001, 1300):
+            follower.ingest_record(_record(ts, "Activity on 155.7300"))
+        for ts in range(1300, 1401):
+            follower.ingest_record(_record(ts, "squelch closed"))
+
+        with mock.patch.dict(journal_follower._FOLLOWERS, {"rtl-airband": follower}, clear=True), mock.patch.object(
+            scanner.subprocess, "run", side_effect=AssertionError("journalctl should not be forked")
+        ):
+            self.assertEqual("118.6000", scanner.read_last_hit_for_range("rtl-airband", True, scan_lines=401))
+            self.assertEqual("", scanner.read_last_hit_for_range("rtl-airband", True))
+            self.assertEqual("155.7300", scanner.read_last_hit_for_range("rtl-airband", False))
+        self.assertEqual(118.6, follower.last_in_range(True))
+
+    def test_cached_hit_list_reuses_rows_across_later_floors(self):
+        rows = [{"freq": "119.1000", "ts": 130.0}, {"freq": "118.6000", "ts": 110.0}]
+        with mock.patch.object(scanner, "read_hit_list", return_value=list(rows)) as read, mock.patch.object(
+            scanner, "_hit_index_live", return_value=False
+        ), mock.patch.object(scanner.time, "time", return_value=1000.0):
+            scanner.read_hit_list_cached._cache = {"value": [], "ts": 0.0}
+            self.assertEqual(rows, scanner.read_hit_list_cached(limit=10, since_ts=100.0))
+            self.assertEqual(rows[:1], scanner.read_hit_list_cached(limit=10, since_ts=120.0))
+            self.assertEqual(1, read.call_count)
+            # An earlier floor than the cached one needs a fresh read.
+            scanner.read_hit_list_cached(limit=10, since_ts=50.0)
+            self.assertEqual(2, read.call_count)
+            read.assert_called_with(limit=10, since_ts=50.0)
+        scanner.read_hit_list_cached._cache = {"value": [], "ts": 0.0}
+
+    def test_unready_follower_falls_back_to_journalctl(self):
+        follower = journal_follower.JournalFollower("rtl-airband", backfill_lines=0)
+        with mock.patch.dict(journal_follower._FOLLOWERS, {"rtl-airband": follower}, clear=True):
+            self.assertIsNone(journal_follower.get_journal_follower("rtl-airband"))
+
+
+class HitSessionIndexTests(unittest.TestCase):
+    def test_sessions_split_on_freq_change_and_gap(self):
+        index = hit_sessions.HitSessionIndex(gap_sec=10)
+        index.ingest_many("u", [(100.0, "118.600"), (105.0, "118.600"), (120.0, "118.600"), (121.0, "119.100")])
+        rows = index.hits(["u"], limit=10)
+        self.assertEqual([(r["freq"], r["ts"], r["duration"]) for r in rows], [
+            ("119.1000", 121.0, 0),
+            ("118.6000", 120.0, 0),
+            ("118.6000", 105.0, 5),
+        ])
+
+    def test_limit_and_since_ts_merge_units_newest_first(self):
+        index = hit_sessions.HitSessionIndex(gap_sec=10)
+        index.ingest_many("rtl", [(100.0, "118.600"), (110.0, "119.100"), (130.0, "120.000")])
+        index.ingest_many("ground", [(105.0, "155.000"), (125.0, "156.000")])
+        self.assertEqual([r["ts"] for r in index.hits(["rtl", "ground"], limit=3)], [130.0, 125.0, 110.0])
+        self.assertEqual([r["ts"] for r in index.hits(["rtl", "ground"], limit=10, since_ts=110.0)], [130.0, 125.0, 110.0])
+
+    def test_cutoff_drops_older_sessions_for_source_only(self):
+        index = hit_sessions.HitSessionIndex(gap_sec=10)
+        index.ingest_many("rtl", [(100.0, "118.600"), (101.0, "155.000")])
+        index.apply_cutoff("airband", 150.0)
+        index.ingest("rtl", 140.0, "119.100")
+        self.assertEqual([r["freq"] for r in index.hits(["rtl"], limit=10)], ["155.0000"])
+
+    def test_index_matches_fallback_session_builder(self):
+        lines = [(100.0, "118.600"), (101.0, "118.600"), (103.0, "121.500"), (140.0, "121.500")]
+        index = hit_sessions.HitSessionIndex(gap_sec=10)
+        index.ingest_many("rtl-airband", lines)
+        with mock.patch.dict(journal_follower._FOLLOWERS, {}, clear=True), mock.patch.object(
+            scanner, "_read_journal_activity", return_value=lines
+        ), mock.patch.object(scanner, "_analog_hit_cutoff_snapshot", return_value={"airband": 0.0, "ground": 0.0}):
+            fallback = scanner.read_hit_list_for_unit("rtl-airband", limit=10)
+        self.assertEqual(fallback, index.hits(["rtl-airband"], limit=10))
+
+
+if __name__ == "__main__":
+    unittest.main()
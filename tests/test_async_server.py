@@ -0,0 +1,100 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from ui import async_server
+from ui import handlers
+from ui import sse_hub
+
+
+async def _request(port: int, raw: bytes, read_until: bytes = b"") -> bytes:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(raw)
+    await writer.drain()
+    if read_until:
+        data = await asyncio.wait_for(reader.readuntil(read_until), 5)
+    else:
+        data = await asyncio.wait_for(reader.read(), 5)
+    writer.close()
+    return data
+
+
+class AsyncUiServerTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        ui = async_server.AsyncUiServer("127.0.0.1", 0, worker_threads=2)
+        self.server = await asyncio.start_server(ui._handle_client, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_plain_routes_reuse_handler(self):
+        data = await _request(self.port, b"GET / HTTP/1.1\r\nHost: x\r\n\r\n")
+        self.assertTrue(data.startswith(b"HTTP/1.0 302"))
+        self.assertIn(b"Location: /sb3", data)
+
+        body = b'{"x": 1}'
+        data = await _request(
+            self.port,
+            b"POST /api/unknown HTTP/1.1\r\nContent-Type: application/json\r\n"
+            + f"Content-Length: {len(body)}\r\n\r\n".encode() + body,
+        )
+        self.assertTrue(data.startswith(b"HTTP/1.0 404"))
+
+    async def test_metrics_route_serves_openmetrics_text(self):
+        handlers._METRIC_STATUS_REQUESTS.labels(cache="hit").inc()
+        data = await _request(self.port, b"GET /metrics HTTP/1.1\r\nHost: x\r\n\r\n")
+        self.assertTrue(data.startswith(b"HTTP/1.0 200"))
+        self.assertIn(b"application/openmetrics-text", data)
+        self.assertIn(b'scanner_ui_status_requests_total{cache="hit"}', data)
+        self.assertIn(b"# TYPE scanner_digital_retune_seconds histogram", data)
+        self.assertTrue(data.endswith(b"# EOF\n"))
+
+    async def test_debug_profile_returns_collapsed_stacks(self):
+        data = await _request(
+            self.port,
+            b"POST /api/debug/profile?seconds=0.05 HTTP/1.1\r\nContent-Length: 0\r\n\r\n",
+        )
+        self.assertTrue(data.startswith(b"HTTP/1.0 200"))
+        self.assertIn(b"text/plain", data)
+        self.assertIn(b"MainThread;", data)
+
+        data = await _request(
+            self.port,
+            b"POST /api/debug/profile?seconds=abc HTTP/1.1\r\nContent-Length: 0\r\n\r\n",
+        )
+        self.assertTrue(data.startswith(b"HTTP/1.0 400"))
+
+    async def test_sse_runs_as_coroutine(self):
+        hub = sse_hub.SseHub(lambda: [("status", {"ok": True})], interval_sec=0.1)
+        with mock.patch.object(async_server, "_SSE_HUB", hub):
+            data = await _request(self.port, b"GET /api/stream HTTP/1.1\r\n\r\n", read_until=b"}\n\n")
+        self.assertIn(b"text/event-stream", data)
+        self.assertIn(b'event: status\ndata: {"ok": true}', data)
+
+    async def test_stream_proxy_relays_upstream(self):
+        async def icecast(reader, writer):
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(b"HTTP/1.0 200 OK\r\nContent-Type: audio/mpeg\r\nicy-name: test\r\n\r\nAUDIO")
+            await writer.drain()
+            writer.close()
+
+        upstream = await asyncio.start_server(icecast, "127.0.0.1", 0)
+        up_port = upstream.sockets[0].getsockname()[1]
+        try:
+            with mock.patch.object(handlers, "ICECAST_PORT", up_port), mock.patch.object(
+                handlers, "STREAM_FANOUT_LINGER_SEC", 0
+            ):
+                data = await _request(self.port, b"GET /stream/GND.mp3?transcode=0 HTTP/1.1\r\n\r\n")
+                bad = await _request(self.port, b"GET /stream/..%2Fx HTTP/1.1\r\n\r\n")
+        finally:
+            upstream.close()
+        self.assertTrue(data.startswith(b"HTTP/1.0 200"))
+        self.assertIn(b"icy-name: test", data)
+        self.assertTrue(data.endswith(b"\r\n\r\nAUDIO"))
+        self.assertTrue(bad.startswith(b"HTTP/1.0 400"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,11 @@
-import unittest
+import os
+import tempfile
 import threading
+import unittest
 from unittest import mock
 
 from ui import digital
+from ui.scan_mode_controller import ScanPoolSnapshot
 
 
 def _make_manager() -> digital.DigitalManager:
@@ -65,6 +68,16 @@ def _make_manager() -> digital.DigitalManager:
     mgr._scheduler_pool_site_to_system = {}
     mgr._scheduler_pool_talkgroup_labels = {}
     mgr._scheduler_pool_talkgroup_groups = {}
+    mgr._scheduler_pool_lookup = None
+    mgr._scheduler_pool_version = None
+    mgr._scheduler_pool_systems = []
+    mgr._scheduler_lock_predictor = digital._LockPredictor()
+    mgr._scheduler_visit_control_hz = 0
+    mgr._scheduler_stop = threading.Event()
+    mgr._scheduler_wake = threading.Event()
+    mgr._scheduler_next_deadline_ms = 0
+    mgr._scheduler_sleep_until_ms = 0
+    mgr._scheduler_wake_reason = ""
     mgr._scheduler_lock = threading.Lock()
     mgr._scheduler_health_entry = digital.DigitalManager._scheduler_health_entry.__get__(
         mgr, digital.DigitalManager
@@ -359,6 +372,282 @@ class SchedulerFastSwitchTests(unittest.TestCase):
         self.assertEqual({}, snapshot)
         mgr._write_scheduler_state.assert_not_called()
 
+    def test_playlist_apply_labels_the_path_it_took(self):
+        mgr = _make_manager()
+        mgr._adapter = digital.SdrtrunkAdapter()
+        mgr._resolve_scheduler_system_control_channels = mock.Mock(return_value=[851_012_500])
+        with tempfile.TemporaryDirectory() as tmp:
+            playlist_path = os.path.join(tmp, "playlist.xml")
+            with open(playlist_path, "w", encoding="utf-8") as f:
+                f.write(
+                    "<playlist><channel>"
+                    "<source_configuration type=\"sourceConfigTuner\" source_type=\"TUNER\" frequency=\"162400000\"/>"
+                    "</channel></playlist>"
+                )
+            with mock.patch.object(digital, "DIGITAL_PLAYLIST_PATH", playlist_path), mock.patch.object(
+                digital, "DIGITAL_USE_MULTI_FREQ_SOURCE", False
+            ):
+                methods = []
+                for force in (True, True, False):
+                    mgr._apply_scheduler_target_timed("p1", "alpha", force=force)
+                    methods.append(mgr._scheduler_last_apply_method)
+                mgr._adapter = digital.SdrtrunkAdapter()
+                mgr._apply_scheduler_system("p1", "alpha", force=True)
+                methods.append(mgr._scheduler_last_apply_method)
+
+        self.assertEqual(
+            ["playlist_write", "playlist_cached", "playlist_skipped", "playlist_unchanged"],
+            methods,
+        )
+        recorded = {values[0] for values, _child in digital._METRIC_SCHEDULER_APPLY_SECONDS.children()}
+        self.assertLessEqual({"playlist_write", "playlist_cached", "playlist_skipped"}, recorded)
+
+    def test_pool_tgid_metadata_reads_the_pool_snapshot_index(self):
+        mgr = _make_manager()
+        pool = {
+            "trunked_sites": [
+                {
+                    "system_id": 100,
+                    "site_id": 10,
+                    "control_channels": [851.0125],
+                    "talkgroups": [1001, 1002],
+                    "talkgroup_labels": {"1001": "Fire Dispatch", "1002": "Police"},
+                    "talkgroup_groups": {"1001": "Metro Fire", "1002": "Metro PD"},
+                },
+                {
+                    "system_id": 200,
+                    "site_id": 20,
+                    "control_channels": [852.0125],
+                    "talkgroups": [1002, 3003],
+                    "talkgroup_labels": {"1002": "Troopers", "3003": "Ops"},
+                    "talkgroup_groups": {"1002": "Highway Patrol"},
+                },
+            ],
+        }
+        systems = mgr._discover_scheduler_pool_systems(
+            pool_snapshot=pool,
+            pool_lookup=ScanPoolSnapshot.from_pool("k1", pool),
+        )
+        self.assertEqual(["100:10", "200:20"], systems)
+        self.assertEqual(("Metro Fire", "Fire Dispatch"), mgr._pool_tgid_metadata("1001"))
+        self.assertEqual(("Metro Fire", "Fire Dispatch"), mgr._pool_tgid_metadata("1001", site_id="20"))
+        self.assertEqual(("Highway Patrol", "Troopers"), mgr._pool_tgid_metadata("1002", site_id="20"))
+        self.assertEqual(("", ""), mgr._pool_tgid_metadata("1002"))
+        self.assertEqual(("", "Ops"), mgr._pool_tgid_metadata("3003", site_id="99"))
+        self.assertEqual(("", ""), mgr._pool_tgid_metadata("abc"))
+
+        mgr._discover_scheduler_pool_systems(pool_snapshot={})
+        self.assertEqual(("", ""), mgr._pool_tgid_metadata("1001"))
+
+    def test_discover_rebuilds_pool_systems_only_when_version_moves(self):
+        mgr = _make_manager()
+        pool = {
+            "trunked_sites": [
+                {"system_id": 100, "site_id": 10, "control_channels": [851.0125], "talkgroups": [1001]},
+            ],
+        }
+        version = {"value": 7}
+        with mock.patch.object(digital, "get_current_scan_mode", return_value="expert"), mock.patch.object(
+            digital, "get_scan_pool_version", side_effect=lambda: version["value"]
+        ), mock.patch.object(
+            digital, "get_active_scan_pool_snapshot", return_value=pool
+        ) as snapshot, mock.patch.object(
+            digital, "get_active_scan_pool_lookup", return_value=ScanPoolSnapshot.from_pool("k1", pool)
+        ):
+            self.assertEqual(["100:10"], mgr._discover_scheduler_systems("p1"))
+            self.assertEqual(["100:10"], mgr._discover_scheduler_systems("p1"))
+            self.assertEqual(1, snapshot.call_count)
+            self.assertEqual({"1001"}, mgr._scheduler_pool_system_talkgroups["100:10"])
+
+            version["value"] = 8
+            self.assertEqual(["100:10"], mgr._discover_scheduler_systems("p1"))
+            self.assertEqual(2, snapshot.call_count)
+
+            version["value"] = None
+            mgr._discover_scheduler_systems("p1")
+            self.assertEqual(3, snapshot.call_count)
+
+    def test_next_deadline_follows_dwell_hang_and_lock_timeout(self):
+        mgr = _make_manager()
+        mgr._status_snapshot_enabled = True
+        mgr._scheduler_fast_switch_enabled = True
+        mgr._scheduler_mode = "timeslice_multi_system"
+        mgr._scheduler_systems = ["alpha", "bravo"]
+        mgr._scheduler_active_system = "alpha"
+        mgr._scheduler_last_switch_time_ms = 10_000
+        mgr._scheduler_dwell_ms = 900
+        mgr._scheduler_hang_ms = 4000
+        timeslice = dict(
+            now_ms=10_100,
+            mode="timeslice_multi_system",
+            systems=["alpha", "bravo"],
+            event_time_ms=0,
+            metric_ready=True,
+            control_locked=True,
+            lock_timeout_ms=2500,
+            fast_switch_active=False,
+        )
+        self.assertEqual(10_900, mgr._scheduler_next_deadline_ms_locked(**timeslice))
+        self.assertEqual(
+            12_500,
+            mgr._scheduler_next_deadline_ms_locked(**{**timeslice, "control_locked": False}),
+        )
+        self.assertEqual(
+            10_100 + 250,
+            mgr._scheduler_next_deadline_ms_locked(
+                **{**timeslice, "control_locked": False, "fast_switch_active": True}
+            ),
+        )
+        self.assertEqual(
+            13_051,
+            mgr._scheduler_next_deadline_ms_locked(**{**timeslice, "event_time_ms": 9_050}),
+        )
+        self.assertEqual(
+            0,
+            mgr._scheduler_next_deadline_ms_locked(**{**timeslice, "mode": "single_system"}),
+        )
+
+        # Without the preflight sampler nothing pushes lock changes, so the
+        # tick interval caps the deadline.
+        mgr._status_snapshot_enabled = False
+        self.assertEqual(
+            10_100 + 250,
+            mgr._scheduler_next_deadline_ms_locked(**{**timeslice, "control_locked": False}),
+        )
+
+        mgr._scheduler_next_deadline_ms = 0
+        self.assertGreaterEqual(mgr._scheduler_wait_sec_locked(10_100), digital._DIGITAL_SCHEDULER_IDLE_WAKE_SEC)
+        mgr._scheduler_next_deadline_ms = 10_400
+        self.assertAlmostEqual(0.3, mgr._scheduler_wait_sec_locked(10_100))
+
+    def test_scheduler_loop_sleeps_until_woken(self):
+        mgr = _make_manager()
+        ticked = threading.Event()
+        mgr._scheduler_tick = mock.Mock(side_effect=lambda: ticked.set())
+        thread = threading.Thread(target=mgr._scheduler_loop, daemon=True)
+        thread.start()
+        try:
+            self.assertFalse(ticked.wait(0.2))
+            mgr.wake_scheduler("event")
+            self.assertTrue(ticked.wait(1.0))
+            self.assertEqual("event", mgr._scheduler_wake_reason)
+        finally:
+            mgr._scheduler_stop.set()
+            mgr._scheduler_wake.set()
+            thread.join(1.0)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(1, mgr._scheduler_tick.call_count)
+
+    def test_lock_predictor_backs_off_failing_system_and_orders_channels(self):
+        predictor = digital._LockPredictor()
+        systems = ["alpha", "bravo", "charlie"]
+        now = 0
+        for name in systems:
+            predictor.start_visit(name, 851_000_000, now)
+            predictor.observe(control_time_ms=0 if name == "bravo" else now + 300)
+            now += 1000
+        predictor.end_visit(now)
+
+        predictor.start_visit("bravo", 852_000_000, now)
+        now += 1000
+        predictor.end_visit(now)
+        # Two consecutive failures: bravo sits out the next rotation pass.
+        self.assertEqual(1, predictor.snapshot(systems, 900)[1]["backoff_skips"])
+        # Reporting the next system does not use up the skip.
+        self.assertEqual("charlie", predictor.pick_next(systems, "alpha", now, consume_skips=False))
+        self.assertEqual(1, predictor.snapshot(systems, 900)[1]["backoff_skips"])
+        self.assertEqual("charlie", predictor.pick_next(systems, "alpha", now))
+        self.assertEqual(0, predictor.snapshot(systems, 900)[1]["backoff_skips"])
+        # With every other system backed off the rotation still moves on.
+        predictor.start_visit("bravo", 852_000_000, now)
+        predictor.end_visit(now + 1000)
+        self.assertEqual("bravo", predictor.pick_next(["alpha", "bravo"], "alpha", now + 1000))
+
+        channels = digital._LockPredictor()
+        channels.start_visit("bravo", 851_000_000, 0)
+        channels.end_visit(1000)
+        channels.start_visit("bravo", 852_000_000, 1000)
+        channels.observe(control_time_ms=1200)
+        channels.end_visit(2000)
+        self.assertEqual(
+            [852_000_000, 853_000_000, 851_000_000],
+            channels.order_channels("bravo", [851_000_000, 852_000_000, 853_000_000]),
+        )
+
+        predictor.start_visit("alpha", 851_000_000, now)
+        # Calls are counted per buffered event, not per tick.
+        predictor.observe(control_time_ms=now + 100, event_times_ms=[now - 50, now + 100, now + 200])
+        predictor.observe(control_time_ms=now + 300, event_times_ms=[now + 100, now + 200, now + 300])
+        self.assertEqual(3, predictor._visit["calls"])
+        predictor.end_visit(now + 1000)
+        self.assertGreater(predictor.dwell_ms("alpha", 900), 900)
+        self.assertLessEqual(predictor.dwell_ms("alpha", 900), 1800)
+        self.assertEqual(900, predictor.dwell_ms("charlie", 900))
+
+        # A lock counts only from a control message stamped during the visit,
+        # and time to lock is measured from that message, not from the tick.
+        fresh = digital._LockPredictor()
+        fresh.start_visit("delta", 851_000_000, 10_000)
+        self.assertEqual(0, fresh.observe(control_time_ms=9_500))
+        self.assertEqual(700, fresh.observe(control_time_ms=10_700))
+        self.assertEqual(0, fresh.observe(control_time_ms=12_000))
+        fresh.end_visit(20_000)
+        self.assertEqual(
+            {"lock_rate": 1.0, "avg_time_to_lock_ms": 700},
+            {key: fresh.snapshot(["delta"], 900)[0][key] for key in ("lock_rate", "avg_time_to_lock_ms")},
+        )
+
+    def test_scheduler_payload_rotates_by_lock_history(self):
+        mgr = _make_manager()
+        mgr._scheduler_mode = "timeslice_multi_system"
+        mgr._scheduler_systems = ["alpha", "bravo", "charlie"]
+        mgr._scheduler_profile = "p1"
+        mgr._scheduler_active_system = "alpha"
+        mgr._scheduler_pause_on_hit = False
+        mgr._scheduler_last_applied_system = "alpha"
+        mgr._scheduler_last_switch_time_ms = 0
+        mgr.getProfile = mock.Mock(return_value="p1")
+        mgr._discover_scheduler_systems = mock.Mock(return_value=["alpha", "bravo", "charlie"])
+        mgr._apply_scheduler_target_timed = mock.Mock(
+            side_effect=lambda _pid, sysname, force=True: (
+                setattr(mgr, "_scheduler_last_applied_system", sysname) or True,
+                "",
+                True,
+            )
+        )
+        predictor = mgr._scheduler_lock_predictor
+        for _ in range(2):
+            predictor.start_visit("bravo", 0, 0)
+            predictor.end_visit(1000)
+        predictor.start_visit("charlie", 0, 0)
+        predictor.observe(control_time_ms=100)
+        predictor.end_visit(1000)
+        predictor.start_visit("alpha", 0, 1000)
+
+        # Still inside the decode window, but stamped before alpha's visit began.
+        locked = {
+            "control_decode_available": True,
+            "control_channel_locked": True,
+            "control_last_time_ms": 900,
+            "tuner_busy": False,
+        }
+        with mock.patch.object(digital.time, "time", return_value=5.0), mock.patch.object(
+            digital, "get_current_scan_mode", return_value="profile"
+        ):
+            payload = mgr._scheduler_payload({}, locked)
+            snapshot = mgr._scheduler_snapshot_payload_locked({}, locked, payload)
+
+        self.assertEqual("charlie", payload["digital_scheduler_active_system"])
+        self.assertEqual("charlie", predictor.visit_system())
+        # Round robin would name alpha; bravo has waited longest since its visit.
+        self.assertEqual("bravo", payload["digital_scheduler_next_system"])
+        stats = {row["name"]: row for row in snapshot["digital_scheduler_lock_stats"]}
+        self.assertEqual(1, stats["alpha"]["visits"])
+        self.assertEqual(0.0, stats["alpha"]["lock_rate"])
+        self.assertEqual(1, stats["alpha"]["consecutive_failures"])
+        self.assertEqual(2, stats["bravo"]["consecutive_failures"])
+        self.assertEqual(0, stats["bravo"]["backoff_skips"])
+
     def test_perf_profile_respects_explicit_env_overrides(self):
         mgr = _make_manager()
         mgr._scheduler_env_overrides = {
@@ -1,9 +1,12 @@
 import json
 import os
+import socket
 import sqlite3
 import tempfile
+import threading
 import time
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import xml.etree.ElementTree as ET
 from unittest import mock
 
@@ -14,6 +17,7 @@ from ui import handlers
 from ui.hp_state import HPState
 from ui import profile_config
 from ui import scan_mode_controller
+from ui import scan_pool_adapter
 
 
 def _write_profile(path, *, airband, ui_disabled=False, with_devices=True):
@@ -332,7 +336,13 @@ class RecentRegressionTests(unittest.TestCase):
             "source": "airband",
         }
         fake_digital = mock.Mock()
-        fake_digital.getRecentEvents.return_value = []
+        fake_digital.getRecentEvents.return_value = [
+            {"label": "Old Dispatch", "tgid": "1001", "timeMs": int((now - 4000) * 1000), "durationMs": 2000},
+        ]
+
+        def _read_hits(limit=20, since_ts=None):
+            # The hit index applies the age floor itself.
+            return [hit for hit in (recent_hit, stale_hit) if since_ts is None or hit["ts"] >= since_ts][:limit]
 
         with mock.patch.object(handlers, "read_active_config_path", return_value="/tmp/active.conf"), mock.patch.object(
             handlers, "split_profiles", return_value=([], [], [])
@@ -341,12 +351,16 @@ class RecentRegressionTests(unittest.TestCase):
         ), mock.patch.object(
             handlers, "_resolve_analog_label_map", return_value={}
         ), mock.patch.object(
-            handlers, "read_hit_list_cached", return_value=[recent_hit, stale_hit]
-        ), mock.patch.object(
+            handlers, "read_hit_list_cached", side_effect=_read_hits
+        ) as read_hits, mock.patch.object(
             handlers, "get_digital_manager", return_value=fake_digital
+        ), mock.patch.object(
+            handlers, "DIGITAL_HITS_REQUIRE_AUDIO_EVENT", False
         ):
             payload = handlers._build_hits_payload(limit=50)
 
+        since_ts = read_hits.call_args.kwargs["since_ts"]
+        self.assertAlmostEqual(now - handlers.HIT_LIST_MAX_AGE_SEC, since_ts, delta=5)
         items = payload.get("items") or []
         self.assertEqual(1, len(items))
         self.assertEqual("118.6000", str(items[0].get("freq") or ""))
@@ -721,7 +735,7 @@ class RecentRegressionTests(unittest.TestCase):
         ) as build_pool:
             filtered = controller.get_scan_pool()
 
-        self.assertIs(filtered, base_pool)
+        self.assertEqual(base_pool, filtered)
         resolve_zip.assert_called_once_with("37221", "US")
         self.assertEqual(1, build_pool.call_count)
         kwargs = build_pool.call_args.kwargs
@@ -752,7 +766,7 @@ class RecentRegressionTests(unittest.TestCase):
         ) as build_pool:
             filtered = controller.get_scan_pool()
 
-        self.assertIs(filtered, base_pool)
+        self.assertEqual(base_pool, filtered)
         self.assertEqual(1, build_pool.call_count)
         kwargs = build_pool.call_args.kwargs
         self.assertTrue(bool(kwargs.get("strict_location")))
@@ -807,6 +821,113 @@ class RecentRegressionTests(unittest.TestCase):
         site_ids = sorted(int(row.get("site_id") or 0) for row in trunked)
         self.assertEqual([11, 20], site_ids)
 
+    def test_scan_pool_is_memoized_until_an_input_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            controller = scan_mode_controller.ScanModeController(
+                db_path="/tmp/hpdb-test.db",
+                avoids_path=os.path.join(tmp, "avoids.json"),
+            )
+            state = HPState.default()
+            state.mode = "full_database"
+            state.use_location = True
+            state.lat = 36.12
+            state.lon = -86.54
+            state.range_miles = 15.0
+            state.enabled_service_tags = [2]
+
+            def _build(**_kwargs):
+                return {
+                    "trunked_sites": [
+                        {
+                            "system_id": 100,
+                            "site_id": 10,
+                            "system_name": "Metro",
+                            "control_channels": [851.1],
+                            "talkgroups": [1001, 1002],
+                            "talkgroup_labels": {"1001": "Fire Dispatch", "1002": "Police"},
+                            "talkgroup_groups": {"1001": "Fire", "1002": "Police"},
+                        },
+                        {
+                            "system_id": 200,
+                            "site_id": 20,
+                            "system_name": "State",
+                            "control_channels": [853.1],
+                            "talkgroups": [1002],
+                            "talkgroup_labels": {"1002": "Troopers"},
+                            "talkgroup_groups": {"1002": "Highway Patrol"},
+                        },
+                    ],
+                    "conventional": [],
+                }
+
+            with mock.patch("ui.hp_state.HPState.load", return_value=state), mock.patch.object(
+                controller, "_resolve_effective_service_tags", return_value=[2]
+            ), mock.patch.object(
+                controller._hp_builder, "build_full_database_pool", side_effect=_build
+            ) as build_pool:
+                first = controller.get_scan_pool_snapshot()
+                self.assertIs(first, controller.get_scan_pool_snapshot())
+                handed_out = controller.get_scan_pool()
+                self.assertEqual(first.pool, handed_out)
+                handed_out["trunked_sites"][0]["talkgroups"].append(9999)
+                handed_out["trunked_sites"][0]["talkgroup_labels"]["1001"] = "Edited"
+                with mock.patch.multiple(
+                    scan_pool_adapter,
+                    get_scan_mode_controller=mock.Mock(return_value=controller),
+                    _POOL_SNAPSHOT={"trunked_sites": [], "conventional": []},
+                    _POOL_SNAPSHOT_TS_MONOTONIC=0.0,
+                    _POOL_LOOKUP=None,
+                ):
+                    adapted = scan_pool_adapter.get_active_scan_pool_snapshot(force_refresh=True)
+                    adapted["trunked_sites"][0]["control_channels"].clear()
+                    again = scan_pool_adapter.get_active_scan_pool_snapshot()
+                self.assertEqual([1001, 1002], first.pool["trunked_sites"][0]["talkgroups"])
+                self.assertEqual("Fire Dispatch", first.pool["trunked_sites"][0]["talkgroup_labels"]["1001"])
+                self.assertEqual([851.1], first.pool["trunked_sites"][0]["control_channels"])
+                self.assertEqual([851.1], again["trunked_sites"][0]["control_channels"])
+                self.assertEqual(1, build_pool.call_count)
+                self.assertEqual({10: 100, 20: 200}, first.site_to_system)
+                self.assertEqual(("Fire Dispatch", "Fire"), first.lookup_tgid("1001"))
+                self.assertEqual(("Troopers", "Highway Patrol"), first.lookup_tgid(1002, site_id="20"))
+                self.assertEqual(("", ""), first.lookup_tgid(1002))
+                self.assertEqual(("", ""), first.lookup_tgid(9999, site_id=10))
+
+                state.range_miles = 25.0
+                second = controller.get_scan_pool_snapshot()
+                self.assertIsNot(first, second)
+                self.assertEqual(2, build_pool.call_count)
+
+                controller.add_hp_avoid_system("200")
+                third = controller.get_scan_pool_snapshot()
+                self.assertEqual(3, build_pool.call_count)
+                self.assertEqual([10], [row["site_id"] for row in third.pool["trunked_sites"]])
+                self.assertEqual(("Police", "Police"), third.lookup_tgid(1002))
+
+    def test_pool_version_moves_on_state_avoid_and_database_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "hp.db")
+            sqlite3.connect(db_path).close()
+            controller = scan_mode_controller.ScanModeController(
+                db_path=db_path,
+                avoids_path=os.path.join(tmp, "avoids.json"),
+            )
+            version = controller.pool_version()
+            self.assertEqual(version, controller.pool_version())
+
+            controller.add_hp_avoid_system("200")
+            self.assertEqual(version + 1, controller.pool_version())
+            self.assertFalse(controller.remove_hp_avoid_system("300"))
+            self.assertEqual(version + 1, controller.pool_version())
+
+            with mock.patch.object(scan_mode_controller, "_SCAN_MODE_CONTROLLER", controller):
+                HPState.default().save(os.path.join(tmp, "hp_state.json"))
+            self.assertEqual(version + 2, controller.pool_version())
+
+            st = os.stat(db_path)
+            os.utime(db_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            self.assertEqual(version + 3, controller.pool_version())
+            self.assertEqual(version + 3, controller.pool_version())
+
     def test_scan_pool_favorites_location_trims_controls_to_nearest_sites(self):
         with tempfile.TemporaryDirectory() as tmp:
             db_path = os.path.join(tmp, "hp.db")
@@ -1399,6 +1520,31 @@ class DigitalListenConsistencyTests(unittest.TestCase):
         self.assertTrue(bool(mapped.get("muted")))
         self.assertEqual("10350", str(mapped.get("tgid") or ""))
 
+    def test_map_event_label_caches_resolution_until_generation_bump(self):
+        adapter = digital.SdrtrunkAdapter()
+        adapter._listen_default = True
+        adapter._tg_group_map = {"3207": "Police"}
+        tg_map = {"3207": "Police Dispatch"}
+        listen_map = {"3207": True}
+        event = {"tgid": "3207", "label": "TG 3207", "raw": ""}
+        with mock.patch.object(digital, "get_current_scan_mode", return_value="profile"), mock.patch.object(
+            adapter, "_load_talkgroup_map", return_value=tg_map
+        ) as load_tg, mock.patch.object(
+            adapter, "_load_listen_map", return_value=listen_map
+        ):
+            first = adapter._map_event_label(event)
+            for _ in range(50):
+                adapter._map_event_label(event)
+            self.assertEqual(1, load_tg.call_count)
+            self.assertEqual("Police Dispatch", first["label"])
+            self.assertEqual("Police", first["agency"])
+
+            listen_map["3207"] = False
+            self.assertFalse(adapter._map_event_label(event).get("muted"))
+            digital.invalidate_digital_label_cache()
+            self.assertTrue(adapter._map_event_label(event).get("muted"))
+            self.assertEqual(2, load_tg.call_count)
+
 
 class DigitalRetuneCacheTests(unittest.TestCase):
     @staticmethod
@@ -1452,6 +1598,252 @@ class DigitalRetuneCacheTests(unittest.TestCase):
             self.assertEqual("", err)
             write_atomic.assert_called_once()
 
+    def test_playlist_retunes_reuse_parsed_tree_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            playlist_path = os.path.join(tmp, "playlist.xml")
+            self._write_playlist(playlist_path, 162_400_000)
+            adapter = digital.SdrtrunkAdapter()
+            with mock.patch.object(digital, "DIGITAL_PLAYLIST_PATH", playlist_path), mock.patch.object(
+                adapter, "_runtime_retune_control_frequency", return_value=(False, False, "")
+            ), mock.patch.object(digital.ET, "parse", wraps=digital.ET.parse) as parse:
+                self.assertEqual((True, ""), adapter.retune_control_frequency(162.55))
+                self.assertEqual((True, ""), adapter.retune_control_frequency(162.475))
+                self.assertEqual(1, parse.call_count)
+
+                self._write_playlist(playlist_path, 46_000_000)
+                self.assertEqual((True, ""), adapter.retune_control_frequency(162.55))
+                self.assertEqual(2, parse.call_count)
+
+            source_conf = ET.parse(playlist_path).getroot().find("channel/source_configuration")
+            self.assertEqual("162550000", source_conf.get("frequency"))
+
+    def test_playlist_model_writes_only_changed_sections(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            playlist_path = os.path.join(tmp, "playlist.xml")
+            with open(playlist_path, "w", encoding="utf-8") as f:
+                f.write(
+                    "<playlist><channel><alias_list_name>A</alias_list_name></channel>"
+                    "<alias list=\"A\" name=\"one\"><id type=\"talkgroup\" value=\"1\"/></alias>"
+                    "<alias list=\"B\" name=\"two\"><id type=\"talkgroup\" value=\"2\"/></alias>"
+                    "</playlist>"
+                )
+            with mock.patch.object(digital, "_write_playlist_tree_atomic", wraps=digital._write_playlist_tree_atomic) as write:
+                with digital._PLAYLIST_MODEL_LOCK:
+                    model = digital._load_playlist_model(playlist_path)
+                    self.assertEqual(["A", "B"], sorted(model.alias_lists()))
+                    before = model.sections(aliases=True)
+                    model.alias_lists()["A"][0].set("name", "one")
+                    self.assertEqual((True, False, ""), model.save(before))
+
+                    before = model.sections(aliases=True)
+                    model.alias_lists()["B"][0].set("name", "renamed")
+                    self.assertEqual((True, True, ""), model.save(before))
+                    self.assertIs(model, digital._load_playlist_model(playlist_path))
+            write.assert_called_once()
+            self.assertEqual("renamed", ET.parse(playlist_path).getroot().findall("alias")[1].get("name"))
+
+    def test_runtime_retune_http_reuses_connection_and_records_latency(self):
+        peers = []
+        connections = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                peers.append((self.client_address, payload.get("frequency_hz")))
+                connections.append(self.connection)
+                body = b'{"ok": true}'
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        adapter = digital.SdrtrunkAdapter()
+        url = f"http://127.0.0.1:{server.server_address[1]}/retune"
+        try:
+            self.assertEqual((True, ""), adapter._runtime_retune_http(url, 851.0125, 851_012_500))
+            self.assertEqual((True, ""), adapter._runtime_retune_http(url, 852.0125, 852_012_500))
+            self.assertEqual(1, len({peer for peer, _hz in peers}))
+
+            # An idle keep-alive connection the server dropped is replaced transparently.
+            connections[-1].shutdown(socket.SHUT_RDWR)
+            self.assertEqual((True, ""), adapter._runtime_retune_http(url, 853.0125, 853_012_500))
+            self.assertEqual(2, len({peer for peer, _hz in peers}))
+            self.assertEqual([851_012_500, 852_012_500, 853_012_500], [hz for _peer, hz in peers])
+        finally:
+            adapter._runtime_retune_client.close()
+            server.shutdown()
+            server.server_close()
+
+        latency = adapter.runtime_metrics()["retune_http_latency_ms"]
+        self.assertGreaterEqual(latency["count"], 3)
+        self.assertEqual(["+Inf", latency["count"]], latency["buckets"][-1])
+
+
+    def test_keep_alive_client_does_not_retry_a_timed_out_retune(self):
+        received = []
+        release = threading.Event()
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                received.append(self.path)
+                if len(received) > 1:
+                    release.wait(2.0)
+                body = b"{}"
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        client = digital._KeepAliveHttpClient(f"http://127.0.0.1:{server.server_address[1]}/retune", 0.3)
+        try:
+            self.assertEqual(200, client.request("POST", client.target(), b"{}", {})[0])
+            started = time.monotonic()
+            with self.assertRaises(TimeoutError):
+                client.request("POST", client.target(), b"{}", {})
+            self.assertLess(time.monotonic() - started, 0.6)
+            self.assertEqual(2, len(received))
+        finally:
+            release.set()
+            client.close()
+            server.shutdown()
+            server.server_close()
+
+
+class SdrtrunkAppLogFollowerTests(unittest.TestCase):
+    def test_follower_returns_each_complete_line_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "sdrtrunk_app.log")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("old-1\nold-2\n")
+            follower = digital._LogTailFollower(path)
+            self.assertEqual(["old-1", "old-2"], follower.read_new_lines())
+            self.assertEqual([], follower.read_new_lines())
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("new-1\npart")
+            self.assertEqual(["new-1"], follower.read_new_lines())
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("ial\n")
+            self.assertEqual(["partial"], follower.read_new_lines())
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("trunc\n")
+            self.assertEqual(["trunc"], follower.read_new_lines())
+            os.replace(path, path + ".1")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("rotated-first-line-is-longer\n")
+            self.assertEqual(["rotated-first-line-is-longer"], follower.read_new_lines())
+
+    def test_app_log_lines_are_parsed_once_for_events_and_summaries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "sdrtrunk_app.log")
+            now = time.strftime("%Y%m%d %H%M%S")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(f"{now} INFO control channel not locked\n")
+                f.write(f"{now} ERROR usb error: rtlsdr device is busy\n")
+            with mock.patch.object(digital, "DIGITAL_LOG_PATH", path):
+                adapter = digital.SdrtrunkAdapter()
+            adapter._event_log_mode = "app_log"
+            with mock.patch.object(
+                digital, "_extract_event_from_line", wraps=digital._extract_event_from_line
+            ) as extract, mock.patch.object(adapter, "_decoded_message_log_files", return_value=[]):
+                adapter._refresh_log_cache()
+                summary = adapter._control_channel_summary()
+                busy = adapter._detect_tuner_busy()
+                adapter._last_refresh_monotonic = 0.0
+                adapter._refresh_log_cache()
+            self.assertEqual(2, extract.call_count)
+            self.assertEqual(1, summary["control_lock_fail_count"])
+            self.assertEqual(1, len(busy))
+            self.assertIn("device is busy", adapter._last_warning)
+
+
+    def test_ingest_lag_ignores_history_read_back_at_startup(self):
+        adapter = digital.SdrtrunkAdapter()
+        lag = digital._METRIC_EVENT_INGEST_LAG_SECONDS.labels()
+        before = lag.raw()[1]
+        started_ms = adapter._ingest_started_ms
+        adapter._record_event({"timeMs": started_ms - 300_000, "tgid": "1001", "label": "Backfill"})
+        self.assertEqual(before, lag.raw()[1])
+        adapter._record_event({"timeMs": started_ms + 1, "tgid": "1002", "label": "Live"})
+        self.assertEqual(before + 1, lag.raw()[1])
+        self.assertEqual(2, len(adapter.getRecentEvents()))
+
+
+class EventLogCsvParserTests(unittest.TestCase):
+    def test_compiled_rows_match_per_line_parsing(self):
+        header = "TIMESTAMP,DURATION_MS,PROTOCOL,EVENT,FROM,TO,TIMESLOT,FREQUENCY,DETAILS,EVENT_ID"
+        lines = [
+            '2026-03-01 10:11:12,1200,APCO-25,Group Call,123456,"Dispatch, Ops (1201)",0,851.0125,,1',
+            header,
+            "2026-03-01 10:11:14,800,APCO-25,Encrypted Group Call,654321,Tac 2 (3207),0,851.2000,ENCRYPTED,2",
+            '20260301 101115,300,APCO-25,Group Call,111,"multi',
+            'line (47152)",0,852.1,,3',
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "x_call_events.log")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(header + "\n" + "\n".join(lines) + "\n")
+            adapter = digital.SdrtrunkAdapter()
+            adapter._ensure_event_log_header(path)
+            parser = adapter._event_log_parser(path)
+            self.assertIsNotNone(parser)
+
+            compiled = [
+                (text, digital._fields_to_event(fields, text, 0) if fields is not None else None)
+                for text, fields in parser.rows(lines)
+            ]
+            self.assertEqual(4, len(compiled))
+            self.assertIsNone(compiled[1][1])
+            for text, event in compiled[:3]:
+                self.assertEqual(adapter._parse_event_log_line(text, path, 0), event)
+            self.assertEqual("1201", compiled[0][1]["tgid"])
+            self.assertIsNone(compiled[2][1])
+            self.assertEqual("47152", compiled[3][1]["tgid"])
+
+            row = next(digital.csv.reader([lines[2]]))
+            mapped = {header_key: row[i] for i, header_key in enumerate(parser.header)}
+            self.assertEqual(digital._row_fields(mapped), parser.fields(row))
+
+    def test_fast_row_checks_match_the_regex_forms(self):
+        texts = [
+            "2026-03-01 10:11:12,1200,APCO-25,Group Call,1,P25 Phase 2 Ops (1203),0,851.1,,9",
+            "x,y,DMR TIER III,Group Call,p25phase 1 talk",
+            "Status: CONNECTED to stream",
+            "plain row without tokens",
+            "",
+        ]
+        for text in texts:
+            self.assertEqual(digital._coerce_mode(text), digital._coerce_mode_text(text))
+            self.assertEqual(bool(digital._IGNORE_EVENT_RE.search(text)), digital._ignored_event_text(text))
+        self.assertEqual(
+            [0, 7000, 49000, 50, 1200, 2000, 3000, 350, None, None, 3000],
+            [
+                digital._parse_duration_ms(raw)
+                for raw in ("0", "7", "49", "50", "1200", "2s", "0:03", "350 ms", "", "\u00b2", "\u0663")
+            ],
+        )
+        self.assertEqual((True, False, False), digital._details_flags("CHANNEL GRANT"))
+        self.assertEqual((False, True, True), digital._details_flags("Rejected - encrypted"))
+        self.assertEqual("1201", digital._tgid_from_to_column("Dispatch, Ops (1201)"))
+
 
 class AliasSeedRowsTests(unittest.TestCase):
     def test_read_profile_alias_seed_rows_merges_grouped_and_plain_csv(self):
@@ -0,0 +1,412 @@
+import contextlib
+import importlib.util
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ui import hp_favorites_wizard
+from ui import hp_site_table
+from ui.hpdb_pool import HpdbPool, get_hpdb_pool
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "homepatrol_db.py"
+if "homepatrol_db" not in sys.modules:
+    _spec = importlib.util.spec_from_file_location("homepatrol_db", _SCRIPT)
+    _module = importlib.util.module_from_spec(_spec)
+    # Registered so --jobs worker processes can unpickle the parse function.
+    sys.modules["homepatrol_db"] = _module
+    _spec.loader.exec_module(_module)
+homepatrol_db = sys.modules["homepatrol_db"]
+
+
+_CONFIG = "\n".join([
+    "StateInfo\tStateId=47\tCountryId=1\tTennessee\tTN",
+    "CountyInfo\tCountyId=2263\tStateId=47\tDavidson",
+])
+
+_STATE_HPD = "\n".join([
+    "Conventional\tAgencyId=10\tStateId=47\tMetro Parks\t\tConventional\tParks",
+    "C-Group\tCGroupId=100\tAgencyId=10\tOps\t\t36.16\t-86.78\t15\tCircle",
+    "C-Freq\tCFreqId=1000\tCGroupId=100\tDispatch\t\t155475000\tFM\tTONE=C100.0\t2",
+    "Trunk\tTrunkId=20\tStateId=47\tMetro P25\t\tP25 Standard\tP25",
+    "Site\tSiteId=200\tTrunkId=20\tSimulcast\t\t36.16\t-86.78\t30\tFM\tP25\t12.5k\tCircle",
+    "T-Freq\tTFreqId=1\tSiteId=200\t\t\t851012500\t1",
+    "T-Freq\tTFreqId=2\tSiteId=200\t\t\t851012500\t1",
+    "T-Group\tTGroupId=300\tTrunkId=20\tFire\t\t36.16\t-86.78\t20\tCircle",
+    "TGID\tTid=4000\tTGroupId=300\tFire Dispatch\t\t1001\tTDMA\t3",
+    "TGID\tTid=4001\tTGroupId=300\tFire Tac\t\t1002\tTDMA\t3",
+    "AreaState\tTrunkId=20\tStateId=47",
+    "AreaCounty\tTrunkId=20\tCountyId=2263",
+    "Unknown\tFoo=1",
+    "",
+])
+
+_MULTI_HPD = "\n".join([
+    "Trunk\tTrunkId=21\tStateId=0\tFederal\t\tMotorola\tP25",
+    "TGID\tTid=4001\tTGroupId=300\tFire Tac Renamed\t\t1002\tTDMA\t3",
+    "AreaState\tTrunkId=21\tStateId=47",
+])
+
+
+def _dump(db_path: str) -> dict:
+    conn = sqlite3.connect(db_path)
+    try:
+        out = {}
+        for table in ("states", "counties", *homepatrol_db.HPD_TABLES, "trunk_sites_rtree"):
+            out[table] = conn.execute(f"SELECT * FROM {table} ORDER BY 1").fetchall()
+        out["indexes"] = sorted(
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'")
+        )
+        out["journal_mode"] = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        return out
+    finally:
+        conn.close()
+
+
+class _ImportMixin:
+    def _import(self, root: str, db_path: str, *extra: str) -> str:
+        args = homepatrol_db.build_parser().parse_args(
+            ["--db", db_path, "import", "--hpdb-root", root, *extra]
+        )
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self.assertEqual(0, homepatrol_db.cmd_import(args))
+        return out.getvalue()
+
+
+class HomepatrolImportTests(_ImportMixin, unittest.TestCase):
+    def test_fast_parallel_import_matches_default_import(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = os.path.join(tmp, "hpdb")
+            os.mkdir(root)
+            Path(root, "HPDB.config").write_text(_CONFIG, encoding="utf-8")
+            Path(root, "s_47.hpd").write_text(_STATE_HPD, encoding="utf-8")
+            Path(root, "_MultipleStates.hpd").write_text(_MULTI_HPD, encoding="utf-8")
+
+            default_db = os.path.join(tmp, "default.db")
+            fast_db = os.path.join(tmp, "fast.db")
+            self._import(root, default_db)
+            report = self._import(root, fast_db, "--fast", "--jobs", "2")
+
+            expected = _dump(default_db)
+            self.assertEqual(expected, _dump(fast_db))
+            self.assertEqual(2, len(expected["talkgroups"]))
+            # Files load in name order, so s_47.hpd replaces the _MultipleStates row.
+            self.assertEqual(["Fire Dispatch", "Fire Tac"], [row[3] for row in expected["talkgroups"]])
+            self.assertEqual(1, len(expected["trunk_freqs"]))
+            self.assertEqual(3, len(expected["entity_areas"]))
+            self.assertEqual(6, len(expected["indexes"]))
+            self.assertEqual("wal", expected["journal_mode"])
+            self.assertIn("rows/s", report)
+
+    def test_failed_fast_import_leaves_live_database_untouched(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = os.path.join(tmp, "hpdb")
+            os.mkdir(root)
+            Path(root, "HPDB.config").write_text(_CONFIG, encoding="utf-8")
+            Path(root, "s_47.hpd").write_text(_STATE_HPD, encoding="utf-8")
+            db_path = os.path.join(tmp, "hp.db")
+            self._import(root, db_path)
+            expected = _dump(db_path)
+
+            Path(root, "_MultipleStates.hpd").write_text(_MULTI_HPD, encoding="utf-8")
+            with mock.patch.object(
+                homepatrol_db, "_build_search_index", side_effect=RuntimeError("boom")
+            ):
+                with self.assertRaises(RuntimeError):
+                    self._import(root, db_path, "--fast")
+
+            self.assertEqual(expected, _dump(db_path))
+            conn = sqlite3.connect(db_path)
+            try:
+                self.assertEqual("ok", conn.execute("PRAGMA integrity_check").fetchone()[0])
+            finally:
+                conn.close()
+            self.assertFalse(any(name.startswith("hp.db.import") for name in os.listdir(tmp)))
+
+            self._import(root, db_path, "--fast")
+            self.assertEqual(3, len(_dump(db_path)["entity_areas"]))
+            self.assertFalse(any(name.startswith("hp.db.import") for name in os.listdir(tmp)))
+
+    def test_incremental_import_reloads_only_changed_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = os.path.join(tmp, "hpdb")
+            os.mkdir(root)
+            Path(root, "HPDB.config").write_text(_CONFIG, encoding="utf-8")
+            Path(root, "s_47.hpd").write_text(_STATE_HPD, encoding="utf-8")
+            Path(root, "s_01.hpd").write_text(
+                "Trunk\tTrunkId=30\tStateId=1\tAlabama P25\t\tP25 Standard\tP25\n"
+                "Site\tSiteId=301\tTrunkId=30\tMobile\t\t30.7\t-88.0\t25\tFM\tP25\t12.5k\tCircle\n",
+                encoding="utf-8",
+            )
+            db_path = os.path.join(tmp, "hp.db")
+            self._import(root, db_path)
+            inode = os.stat(db_path).st_ino
+
+            unchanged = self._import(root, db_path, "--incremental")
+            self.assertIn("Changed files: 0, unchanged: 3, removed: 0", unchanged)
+
+            Path(root, "s_47.hpd").write_text(
+                _STATE_HPD.replace("Fire Tac", "Fire Tac 2").replace("TGID\tTid=4000", "X\tTid=4000"),
+                encoding="utf-8",
+            )
+            os.remove(os.path.join(root, "s_01.hpd"))
+            st = os.stat(os.path.join(root, "HPDB.config"))
+            os.utime(os.path.join(root, "HPDB.config"), ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+            report = self._import(root, db_path, "--incremental")
+            self.assertIn("Changed files: 1, unchanged: 1, removed: 1", report)
+            self.assertIn("  changed s_47.hpd", report)
+            self.assertIn("  removed s_01.hpd", report)
+            self.assertEqual(inode, os.stat(db_path).st_ino)
+
+            fresh_path = os.path.join(tmp, "fresh.db")
+            self._import(root, fresh_path)
+            actual = _dump(db_path)
+            expected = _dump(fresh_path)
+            # AUTOINCREMENT ids differ after a delete/re-insert; compare the rest.
+            for table in ("trunk_freqs", "entity_areas"):
+                actual[table] = sorted(row[1:] for row in actual[table])
+                expected[table] = sorted(row[1:] for row in expected[table])
+            self.assertEqual(expected, actual)
+            self.assertEqual([(4001, "Fire Tac 2")], [(row[0], row[3]) for row in actual["talkgroups"]])
+            self.assertEqual([200], [row[0] for row in actual["trunk_sites_rtree"]])
+
+    def test_config_only_incremental_import_rebuilds_catalogs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = os.path.join(tmp, "hpdb")
+            os.mkdir(root)
+            config = Path(root, "HPDB.config")
+            config.write_text(
+                _CONFIG + "\nStateInfo\tStateId=1\tCountryId=1\tAlabama\tAL"
+                "\nCountyInfo\tCountyId=2264\tStateId=47\tMobile",
+                encoding="utf-8",
+            )
+            Path(root, "s_01.hpd").write_text(
+                "Trunk\tTrunkId=30\tStateId=0\tGulf P25\t\tP25 Standard\tP25\n"
+                "AreaCounty\tTrunkId=30\tCountyId=2264\n",
+                encoding="utf-8",
+            )
+            db_path = os.path.join(tmp, "hp.db")
+            self._import(root, db_path)
+
+            def county_states() -> list[int]:
+                conn = sqlite3.connect(db_path)
+                try:
+                    return [
+                        row[0]
+                        for row in conn.execute(
+                            f"SELECT state_id FROM {homepatrol_db.TRUNK_CATALOG_TABLE} "
+                            "WHERE trunk_id = 30 AND scope = 'county' AND county_id = 2264"
+                        )
+                    ]
+                finally:
+                    conn.close()
+
+            self.assertEqual([47], county_states())
+            config.write_text(config.read_text(encoding="utf-8").replace(
+                "CountyId=2264\tStateId=47", "CountyId=2264\tStateId=1",
+            ), encoding="utf-8")
+            report = self._import(root, db_path, "--incremental")
+            self.assertIn("  changed HPDB.config", report)
+            self.assertEqual([1], county_states())
+
+    def test_pool_readers_see_incremental_import(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = os.path.join(tmp, "hpdb")
+            os.mkdir(root)
+            Path(root, "HPDB.config").write_text(_CONFIG, encoding="utf-8")
+            Path(root, "s_47.hpd").write_text(_STATE_HPD, encoding="utf-8")
+            db_path = os.path.join(tmp, "hp.db")
+            self._import(root, db_path)
+            pool = HpdbPool(db_path)
+            try:
+                before = pool.fingerprint()
+                self.assertEqual([200], hp_site_table.load_site_table(pool).site_ids)
+
+                Path(root, "s_01.hpd").write_text(
+                    "Trunk\tTrunkId=30\tStateId=1\tAlabama P25\t\tP25 Standard\tP25\n"
+                    "Site\tSiteId=301\tTrunkId=30\tMobile\t\t30.7\t-88.0\t25\tFM\tP25\t12.5k\tCircle\n",
+                    encoding="utf-8",
+                )
+                self._import(root, db_path, "--incremental")
+
+                self.assertNotEqual(before, pool.fingerprint())
+                self.assertEqual([200, 301], hp_site_table.load_site_table(pool).site_ids)
+            finally:
+                pool.close()
+
+    def test_import_hpd_file_batches_rows_per_table(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            hpd = Path(tmp, "s_47.hpd")
+            hpd.write_text(_STATE_HPD, encoding="utf-8")
+            conn = sqlite3.connect(os.path.join(tmp, "hp.db"))
+            try:
+                homepatrol_db._create_schema(conn, reset=True)
+                counts = homepatrol_db._import_hpd_file(conn, hpd)
+            finally:
+                conn.close()
+            self.assertEqual(
+                {
+                    "conventional_systems": 1,
+                    "conventional_groups": 1,
+                    "conventional_freqs": 1,
+                    "trunk_systems": 1,
+                    "trunk_sites": 1,
+                    "trunk_freqs": 2,
+                    "trunk_groups": 1,
+                    "talkgroups": 2,
+                    "entity_areas": 2,
+                },
+                counts,
+            )
+            batches = homepatrol_db._parse_hpd_batches(str(hpd), batch_rows=1)
+            self.assertEqual(12, len(batches))
+            self.assertEqual(("talkgroups", 1), (batches[8][0], len(batches[8][1])))
+
+
+class HpSearchIndexTests(_ImportMixin, unittest.TestCase):
+    def test_wizard_search_uses_fts_index_with_prefix_terms(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = os.path.join(tmp, "hpdb")
+            os.mkdir(root)
+            Path(root, "HPDB.config").write_text(_CONFIG, encoding="utf-8")
+            Path(root, "s_47.hpd").write_text(_STATE_HPD, encoding="utf-8")
+            db_path = os.path.join(tmp, "hp.db")
+            report = self._import(root, db_path)
+            self.assertIn("hp_search: 5", report)
+
+            wizard = hp_favorites_wizard.HPFavoritesWizard(db_path)
+            try:
+                self.assertEqual([20], [row["id"] for row in wizard.get_digital_systems(47, text_filter="metr")])
+                # Site names are indexed with their system.
+                self.assertEqual([20], [row["id"] for row in wizard.get_digital_systems(47, text_filter="simul")])
+                _name, channels = wizard.get_digital_channels(20, text_filter="fire ta")
+                self.assertEqual([1002], [row["talkgroup"] for row in channels])
+                _name, channels = wizard.get_digital_channels(20, text_filter="100")
+                self.assertEqual([1001, 1002], [row["talkgroup"] for row in channels])
+                _name, channels = wizard.get_analog_channels("AgencyId:10", text_filter="155.475")
+                self.assertEqual(["Dispatch"], [row["alpha_tag"] for row in channels])
+                analog = wizard.get_analog_systems(47, text_filter="park")
+                self.assertEqual(["AgencyId:10"], [row["key"] for row in analog])
+
+                # Blank or punctuation-only filters, and databases without the
+                # index, keep the LIKE path.
+                self.assertIsNone(hp_favorites_wizard.search_filter(wizard._pool, "talkgroup", " - "))
+                _name, channels = wizard.get_digital_channels(20)
+                self.assertEqual([1001, 1002], [row["talkgroup"] for row in channels])
+                with mock.patch("ui.hp_search.has_search_index", return_value=False):
+                    self.assertEqual([], wizard.get_digital_systems(47, text_filter="simul"))
+                    _name, channels = wizard.get_digital_channels(20, text_filter="fire ta")
+                    self.assertEqual([1002], [row["talkgroup"] for row in channels])
+            finally:
+                get_hpdb_pool(db_path).close()
+
+    def test_find_commands_rank_fts_matches(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = os.path.join(tmp, "hpdb")
+            os.mkdir(root)
+            Path(root, "s_47.hpd").write_text(_STATE_HPD, encoding="utf-8")
+            db_path = os.path.join(tmp, "hp.db")
+            self._import(root, db_path)
+
+            def _run(*argv: str) -> list[list[str]]:
+                args = homepatrol_db.build_parser().parse_args(["--db", db_path, *argv])
+                out = io.StringIO()
+                with contextlib.redirect_stdout(out):
+                    self.assertEqual(0, args.func(args))
+                return [line.split("\t") for line in out.getvalue().splitlines()[1:]]
+
+            self.assertEqual(
+                [["trunk", "20", "Metro P25", "", "P25"]],
+                _run("find-system", "metro", "--kind", "trunk"),
+            )
+            self.assertEqual(
+                [["conventional", "AgencyId:10", "Metro Parks", "", "Parks"]],
+                _run("find-system", "park", "--kind", "conventional"),
+            )
+            self.assertEqual(["1002"], [row[2] for row in _run("find-talkgroup", "fire tac")])
+            self.assertEqual(["1001", "1002"], [row[2] for row in _run("find-talkgroup", "metro")])
+
+
+class HpSystemCatalogTests(_ImportMixin, unittest.TestCase):
+    def test_catalog_lookups_match_joined_queries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = os.path.join(tmp, "hpdb")
+            os.mkdir(root)
+            Path(root, "HPDB.config").write_text(
+                _CONFIG + "\n"
+                "CountyInfo\tCountyId=2264\tStateId=47\tRutherford\n"
+                "StateInfo\tStateId=1\tCountryId=1\tAlabama\tAL\n"
+                "CountyInfo\tCountyId=100\tStateId=1\tMobile\n",
+                encoding="utf-8",
+            )
+            Path(root, "s_47.hpd").write_text(
+                _STATE_HPD
+                + "Conventional\tCountyId=2264\tStateId=47\tRutherford County\t\tConventional\tCounty\n"
+                "C-Group\tCGroupId=101\tCountyId=2264\tFire\t\t35.8\t-86.4\t15\tCircle\n"
+                "C-Freq\tCFreqId=1001\tCGroupId=101\tFire Disp\t\t154100000\tFM\t\t3\n",
+                encoding="utf-8",
+            )
+            Path(root, "s_01.hpd").write_text(
+                "Trunk\tTrunkId=30\tStateId=1\tBorder System\t\tP25 Standard\tP25\n"
+                "AreaCounty\tTrunkId=30\tCountyId=2264\n"
+                "AreaCounty\tTrunkId=30\tCountyId=100\n",
+                encoding="utf-8",
+            )
+            Path(root, "_MultipleStates.hpd").write_text(
+                _MULTI_HPD + "\n"
+                "Trunk\tTrunkId=40\tStateId=1\tRegional\t\tMotorola\tP25\n"
+                "AreaCounty\tTrunkId=40\tCountyId=2263\n"
+                "Trunk\tTrunkId=41\tStateId=1\tGulf\t\tMotorola\tP25\n"
+                "AreaCounty\tTrunkId=41\tCountyId=0\n"
+                "Conventional\tAgencyId=50\tStateId=47\tInterop\t\tConventional\tInterop\n",
+                encoding="utf-8",
+            )
+            db_path = os.path.join(tmp, "hp.db")
+            report = self._import(root, db_path)
+            self.assertIn("hp_trunk_catalog:", report)
+
+            wizard = hp_favorites_wizard.HPFavoritesWizard(db_path)
+            pool = wizard._pool
+            columns = pool.columns
+            catalogs = {hp_favorites_wizard.TRUNK_CATALOG_TABLE, hp_favorites_wizard.CONVENTIONAL_CATALOG_TABLE}
+            counts = {"site_count", "talkgroup_count", "group_count", "channel_count"}
+            try:
+                for state_id, county_id in ((47, 0), (47, 2263), (47, 2264), (1, 0), (1, 100)):
+                    for scope in ("county", "statewide", "nationwide"):
+                        for system_type in ("digital", "analog"):
+                            kwargs = dict(state_id=state_id, county_id=county_id, system_type=system_type, scope=scope)
+                            catalog = wizard.get_systems(**kwargs)
+                            with mock.patch.object(
+                                pool, "columns", side_effect=lambda t: frozenset() if t in catalogs else columns(t)
+                            ):
+                                joined = wizard.get_systems(**kwargs)
+                            stripped = [{k: v for k, v in row.items() if k not in counts} for row in catalog]
+                            self.assertEqual(joined, stripped, kwargs)
+
+                metro = wizard.get_digital_systems(47, scope="statewide", text_filter="metro")
+                self.assertEqual([(20, 1, 2)], [(r["id"], r["site_count"], r["talkgroup_count"]) for r in metro])
+                county = wizard.get_analog_systems(47, county_id=2264, scope="county")
+                self.assertEqual([(1, 1)], [(r["group_count"], r["channel_count"]) for r in county])
+                # Trunk 30 reaches Tennessee only through Rutherford County.
+                self.assertEqual(
+                    [30, 21, 20],
+                    [r["id"] for r in wizard.get_digital_systems(47, county_id=2264, scope="statewide")],
+                )
+                self.assertEqual(
+                    [21, 20, 40],
+                    [r["id"] for r in wizard.get_digital_systems(47, county_id=2263, scope="statewide")],
+                )
+                tag = wizard.etag("/api/hp/favorites-wizard/states?country_id=1")
+                self.assertEqual(tag, wizard.etag("/api/hp/favorites-wizard/states?country_id=1"))
+                self.assertNotEqual(tag, wizard.etag("/api/hp/favorites-wizard/states?country_id=2"))
+            finally:
+                pool.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
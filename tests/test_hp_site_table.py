@@ -0,0 +1,175 @@
+import math
+import os
+import random
+import sqlite3
+import tempfile
+import unittest
+
+from ui import hp_site_table
+from ui.hpdb_pool import HpdbPool
+from ui.scan_mode_controller import ScanModeController
+
+
+def _rows(count: int, seed: int = 3) -> list[tuple]:
+    rng = random.Random(seed)
+    out = []
+    for i in range(1, count + 1):
+        source = "_MultipleStates.hpd" if i % 7 == 0 else "tn.hpd"
+        out.append((
+            i,
+            (i % 40) + 1,
+            source,
+            rng.uniform(30.0, 42.0),
+            rng.uniform(-95.0, -80.0),
+            rng.choice((0.0, 10.0, 60.0, 250.0)),
+            f"Site {i}",
+            f"System {(i % 40) + 1}",
+        ))
+    return out
+
+
+class HpSiteTableTests(unittest.TestCase):
+    def test_select_matches_per_row_threshold_rules(self):
+        rows = _rows(400)
+        table = hp_site_table.SiteTable(rows)
+        localized = {7, 14}
+        rng = random.Random(9)
+        for _ in range(30):
+            lat = rng.uniform(31.0, 41.0)
+            lon = rng.uniform(-94.0, -81.0)
+            range_miles = rng.choice((5.0, 40.0, 150.0))
+            for strict in (False, True):
+                for nationwide in (False, True):
+                    expected = []
+                    for idx, (_site, trunk, source, s_lat, s_lon, radius, _n, _s) in enumerate(rows):
+                        multistate = source.lower() == "_multiplestates.hpd"
+                        if multistate and not nationwide:
+                            if trunk not in localized or radius > 75.0:
+                                continue
+                        if ScanModeController._within_location_threshold(
+                            center_lat=lat,
+                            center_lon=lon,
+                            target_lat=s_lat,
+                            target_lon=s_lon,
+                            target_radius=radius,
+                            lat_miles_per_degree=69.0,
+                            lon_miles_per_degree=max(1e-6, 69.0 * abs(math.cos(math.radians(lat)))),
+                            range_miles=range_miles,
+                            strict_location=strict,
+                        ):
+                            expected.append(idx)
+                    actual = table.select(
+                        center_lat=lat,
+                        center_lon=lon,
+                        range_miles=range_miles,
+                        strict_location=strict,
+                        include_nationwide=nationwide,
+                        localized_trunk_ids=localized,
+                        multistate_radius_cap=75.0,
+                    )
+                    self.assertEqual(expected, [idx for idx, _distance in actual])
+
+    def test_rows_without_coordinates_are_skipped_and_indexed_by_system(self):
+        table = hp_site_table.SiteTable([
+            (1, 5, "a.hpd", "36.1", "-86.8", "", "A", "Metro"),
+            (2, 5, "a.hpd", None, "-86.8", 0, "B", "Metro"),
+            (3, 6, "a.hpd", "nan", "-86.8", 0, "C", "Other"),
+            (4, 5, "a.hpd", 36.2, -86.7, 12, "D", "Metro"),
+        ])
+        self.assertEqual(2, len(table))
+        self.assertEqual([1, 4], [table.site_ids[i] for i in table.rows_for_system(5)])
+        self.assertEqual([], table.rows_for_system(6))
+        self.assertEqual([0.0, 12.0], table.radii)
+        self.assertEqual([1], table.rows_for_sites([4, 99]))
+
+    def test_nearest_per_system_ranks_preferred_rows_then_distance(self):
+        table = hp_site_table.SiteTable([
+            (1, 5, "a.hpd", 36.0, -86.0, 0, "A", "Metro"),
+            (2, 5, "a.hpd", 36.5, -86.0, 0, "B", "Metro"),
+            (3, 5, "a.hpd", 37.0, -86.0, 0, "C", "Metro"),
+            (4, 6, "a.hpd", 36.1, -86.0, 0, "D", "Other"),
+        ])
+        matches = list(zip(range(4), table.distances(36.0, -86.0, [0, 1, 2, 3])))
+        ranked = table.nearest_per_system(matches, 2)
+        self.assertEqual([0, 1, 3], [row for row, _distance in ranked])
+        ranked = table.nearest_per_system(matches, 2, preferred_rows={2})
+        self.assertEqual([2, 0, 3], [row for row, _distance in ranked])
+        self.assertEqual([], table.nearest_per_system(matches, 0))
+
+    @unittest.skipUnless(hp_site_table.np is not None, "numpy is not installed")
+    def test_numpy_and_python_paths_agree(self):
+        rows = _rows(400)
+        vectorized = hp_site_table.SiteTable(rows)
+        plain = hp_site_table.SiteTable(rows)
+        plain._arrays = None
+        self.assertTrue(vectorized.vectorized)
+        self.assertFalse(plain.vectorized)
+        rng = random.Random(11)
+        for _ in range(20):
+            lat = rng.uniform(31.0, 41.0)
+            lon = rng.uniform(-94.0, -81.0)
+            range_miles = rng.choice((5.0, 40.0, 150.0))
+            candidates = sorted(rng.sample(range(len(rows)), 120))
+            for strict in (False, True):
+                for nationwide in (False, True):
+                    for candidate_rows in (None, candidates):
+                        kwargs = dict(
+                            center_lat=lat,
+                            center_lon=lon,
+                            range_miles=range_miles,
+                            strict_location=strict,
+                            include_nationwide=nationwide,
+                            localized_trunk_ids={7, 14},
+                            multistate_radius_cap=75.0,
+                            candidate_rows=candidate_rows,
+                        )
+                        expected = plain.select(**kwargs)
+                        actual = vectorized.select(**kwargs)
+                        self.assertEqual([row for row, _d in expected], [row for row, _d in actual])
+                        for (_row, want), (_same, got) in zip(expected, actual):
+                            self.assertAlmostEqual(want, got, places=9)
+            expected_distances = plain.distances(lat, lon, candidates)
+            actual_distances = vectorized.distances(lat, lon, candidates)
+            for want, got in zip(expected_distances, actual_distances):
+                self.assertAlmostEqual(want, got, places=9)
+            matches = list(zip(candidates, expected_distances))
+            preferred = set(candidates[::3])
+            self.assertEqual(
+                plain.nearest_per_system(matches, 2, preferred_rows=preferred),
+                vectorized.nearest_per_system(matches, 2, preferred_rows=preferred),
+            )
+
+    def test_table_is_cached_until_database_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "hp.db")
+            conn = sqlite3.connect(path)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript(
+                """
+                CREATE TABLE trunk_sites (
+                    site_id INTEGER, trunk_id INTEGER, source_file TEXT,
+                    latitude REAL, longitude REAL, radius REAL
+                );
+                INSERT INTO trunk_sites VALUES (1, 1, 'x.hpd', 36.1, -86.8, 5.0);
+                """
+            )
+            conn.commit()
+            pool = HpdbPool(path)
+            try:
+                first = hp_site_table.load_site_table(pool)
+                self.assertIs(first, hp_site_table.load_site_table(pool))
+                self.assertEqual([""], first.system_names)
+
+                conn.execute("INSERT INTO trunk_sites VALUES (2, 1, 'x.hpd', 36.2, -86.9, 5.0)")
+                conn.commit()
+                # No checkpoint: the new row is only in hp.db-wal.
+                second = hp_site_table.load_site_table(pool)
+                self.assertIsNot(first, second)
+                self.assertEqual([1, 2], second.site_ids)
+            finally:
+                conn.close()
+                pool.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
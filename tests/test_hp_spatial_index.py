@@ -0,0 +1,106 @@
+import importlib.util
+import os
+import random
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ui import hp_scan_pool
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "homepatrol_db.py"
+_spec = importlib.util.spec_from_file_location("homepatrol_db", _SCRIPT)
+homepatrol_db = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(homepatrol_db)
+
+
+def _populate(path: str, spatial: bool) -> None:
+    rng = random.Random(11)
+    conn = sqlite3.connect(path)
+    try:
+        homepatrol_db._create_schema(conn, reset=True)
+        for i in range(1, 301):
+            lat = rng.uniform(-70.0, 70.0)
+            lon = rng.uniform(-180.0, 180.0)
+            radius = rng.choice((0.0, 5.0, 40.0, 400.0))
+            conn.execute(
+                "INSERT INTO trunk_systems(trunk_id, source_file, system_name) VALUES (?, 'x.hpd', ?)",
+                (i, f"System {i}"),
+            )
+            conn.execute(
+                "INSERT INTO trunk_sites(site_id, source_file, trunk_id, site_name, latitude, longitude, radius) "
+                "VALUES (?, 'x.hpd', ?, ?, ?, ?, ?)",
+                (i, i, f"Site {i}", lat, lon, radius),
+            )
+            conn.execute(
+                "INSERT INTO trunk_freqs(source_file, site_id, freq_hz) VALUES ('x.hpd', ?, ?)",
+                (i, 851_000_000 + i * 12_500),
+            )
+            conn.execute(
+                "INSERT INTO trunk_groups(tgroup_id, source_file, trunk_id, group_name) VALUES (?, 'x.hpd', ?, 'Law')",
+                (i, i),
+            )
+            conn.execute(
+                "INSERT INTO talkgroups(tid, source_file, tgroup_id, alpha_tag, dec_tgid, service_tag) "
+                "VALUES (?, 'x.hpd', ?, 'Dispatch', ?, 2)",
+                (i, i, str(1000 + i)),
+            )
+            conn.execute(
+                "INSERT INTO conventional_groups(cgroup_id, source_file, parent_key, parent_id, group_name, "
+                "latitude, longitude, radius) VALUES (?, 'x.hpd', 'AgencyId', ?, 'Ops', ?, ?, ?)",
+                (i, i, rng.uniform(-70.0, 70.0), rng.uniform(-180.0, 180.0), radius),
+            )
+            conn.execute(
+                "INSERT INTO conventional_freqs(cfreq_id, source_file, cgroup_id, alpha_tag, freq_hz, service_tag) "
+                "VALUES (?, 'x.hpd', ?, 'Ops', ?, 2)",
+                (i, i, 154_000_000 + i * 7_500),
+            )
+        if spatial:
+            counts = homepatrol_db._build_spatial_index(conn)
+            assert counts == {"trunk_sites_rtree": 300, "conventional_groups_rtree": 300}, counts
+        conn.commit()
+    finally:
+        conn.close()
+
+
+class HpSpatialIndexTests(unittest.TestCase):
+    def test_rtree_prefilter_matches_full_scan(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            plain_path = os.path.join(tmp, "plain.db")
+            spatial_path = os.path.join(tmp, "spatial.db")
+            _populate(plain_path, spatial=False)
+            _populate(spatial_path, spatial=True)
+            plain = hp_scan_pool.ScanPoolBuilder(plain_path)
+            spatial = hp_scan_pool.ScanPoolBuilder(spatial_path)
+
+            rng = random.Random(5)
+            hits = 0
+            for _ in range(40):
+                args = (rng.uniform(-65.0, 65.0), rng.uniform(-180.0, 180.0), rng.choice((25.0, 150.0, 900.0)), [2])
+                for strict in (False, True):
+                    expected = plain.build_full_database_pool(*args, strict_location=strict)
+                    actual = spatial.build_full_database_pool(*args, strict_location=strict)
+                    self.assertEqual(expected, actual)
+                    hits += len(expected["trunked_sites"]) + len(expected["conventional"])
+            self.assertGreater(hits, 0)
+
+    def test_rtree_join_limits_candidate_rows(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "spatial.db")
+            _populate(path, spatial=True)
+            builder = hp_scan_pool.ScanPoolBuilder(path)
+            join, params = hp_scan_pool.spatial_filter_join(builder._pool, "trunk_sites", "ts", 36.1, -86.8, 25.0)
+            self.assertIn("trunk_sites_rtree", join)
+            with builder._pool.read() as conn:
+                candidates = conn.execute(f"SELECT ts.site_id FROM trunk_sites ts {join}", params).fetchall()
+            self.assertLess(len(candidates), 30)
+
+            with mock.patch.object(builder._pool, "has_column", return_value=False):
+                self.assertEqual(("", []), hp_scan_pool.spatial_filter_join(
+                    builder._pool, "trunk_sites", "ts", 36.1, -86.8, 25.0
+                ))
+
+
+if __name__ == "__main__":
+    unittest.main()
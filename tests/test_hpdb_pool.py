@@ -0,0 +1,92 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from ui import hpdb_pool
+from ui import service_types
+
+
+def _make_db(path: str) -> None:
+    with sqlite3.connect(path) as conn:
+        conn.executescript(
+            """
+            CREATE TABLE talkgroups (tid INTEGER PRIMARY KEY, service_tag INTEGER, Dec_TgID TEXT);
+            CREATE TABLE conventional_freqs (cfreq_id INTEGER PRIMARY KEY, service_tag INTEGER);
+            INSERT INTO talkgroups(service_tag, Dec_TgID) VALUES (2, '100'), (3, '200');
+            INSERT INTO conventional_freqs(service_tag) VALUES (15), (2);
+            """
+        )
+    conn.close()
+
+
+class HpdbPoolTests(unittest.TestCase):
+    def test_connections_are_reused_read_only_and_reopened_on_replace(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "hp.db")
+            _make_db(path)
+            pool = hpdb_pool.HpdbPool(path, max_idle=2)
+            try:
+                with pool.read() as conn:
+                    first = conn
+                    self.assertEqual(2, len(conn.execute("SELECT * FROM talkgroups").fetchall()))
+                with pool.read() as conn:
+                    self.assertIs(first, conn)
+                    with self.assertRaises(sqlite3.OperationalError):
+                        conn.execute("DELETE FROM talkgroups")
+                self.assertEqual({"opened": 1, "reused": 1, "idle": 1}, {
+                    k: v for k, v in pool.stats().items() if k != "path"
+                })
+
+                replacement = os.path.join(tmp, "new.db")
+                _make_db(replacement)
+                with sqlite3.connect(replacement) as conn:
+                    conn.execute("INSERT INTO talkgroups(service_tag, Dec_TgID) VALUES (4, '300')")
+                conn.close()
+                os.replace(replacement, path)
+                with pool.read() as conn:
+                    self.assertIsNot(first, conn)
+                    self.assertEqual(3, len(conn.execute("SELECT * FROM talkgroups").fetchall()))
+            finally:
+                pool.close()
+
+    def test_schema_probe_runs_once_per_file_version(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "hp.db")
+            _make_db(path)
+            pool = hpdb_pool.HpdbPool(path)
+            try:
+                self.assertTrue(pool.has_column("talkgroups", "dec_tgid"))
+                self.assertTrue(pool.has_column("TALKGROUPS", "Service_Tag"))
+                self.assertFalse(pool.has_column("talkgroups", "system_id"))
+                self.assertFalse(pool.has_column("missing", "x"))
+                self.assertEqual(1, pool.stats()["opened"])
+                self.assertEqual(0, pool.stats()["reused"])
+            finally:
+                pool.close()
+
+    def test_missing_database_raises_without_creating_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "absent.db")
+            pool = hpdb_pool.HpdbPool(path)
+            with self.assertRaises(sqlite3.OperationalError):
+                with pool.read():
+                    pass
+            self.assertEqual(frozenset(), pool.columns("talkgroups"))
+            self.assertFalse(os.path.exists(path))
+
+    def test_service_types_populate_once_then_read_from_pool(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "hp.db")
+            _make_db(path)
+            rows = service_types.get_all_service_types(db_path=path)
+            fingerprint = hpdb_pool.get_hpdb_pool(path).fingerprint()
+            again = service_types.get_all_service_types(db_path=path)
+            self.assertEqual(rows, again)
+            self.assertEqual(fingerprint, hpdb_pool.get_hpdb_pool(path).fingerprint())
+            self.assertEqual([2, 3, 15], service_types.load_distinct_service_tags(db_path=path))
+            hpdb_pool.get_hpdb_pool(path).close()
+
+
+if __name__ == "__main__":
+    unittest.main()
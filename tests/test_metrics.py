@@ -0,0 +1,68 @@
+import unittest
+
+from ui import metrics
+
+
+class HistogramTests(unittest.TestCase):
+    def test_buckets_are_cumulative_and_quantiles_interpolate(self):
+        hist = metrics.Histogram((10.0, 20.0, 50.0))
+        for value in (5.0, 10.0, 15.0, 15.0, 40.0, 90.0, float("nan")):
+            hist.observe(value)
+        snap = hist.snapshot()
+        self.assertEqual(6, snap["count"])
+        self.assertEqual(175.0, snap["sum"])
+        self.assertEqual(90.0, snap["max"])
+        self.assertEqual([[10.0, 2], [20.0, 4], [50.0, 5], ["+Inf", 6]], snap["buckets"])
+        self.assertGreater(snap["p50"], 10.0)
+        self.assertLessEqual(snap["p50"], 20.0)
+        self.assertGreater(snap["p99"], 50.0)
+
+        hist.reset()
+        self.assertEqual(0, hist.snapshot()["count"])
+        self.assertEqual(0.0, hist.snapshot()["p95"])
+
+
+class RegistryTests(unittest.TestCase):
+    def test_render_emits_openmetrics_families_in_seconds(self):
+        registry = metrics.Registry()
+        lock = registry.histogram(
+            "scanner_test_lock_seconds",
+            "Lock time.",
+            ("system",),
+            buckets=(100.0, 1000.0),
+        )
+        lock.labels(system='Metro "A"').observe(250.0)
+        lock.labels(system='Metro "A"').observe(40.0)
+        switches = registry.counter("scanner_test_switches", "Switches.", ("reason",))
+        switches.labels(reason="idle_timeout").inc()
+        switches.labels(reason="idle_timeout").inc(2)
+
+        self.assertIs(lock, registry.histogram("scanner_test_lock_seconds"))
+        with self.assertRaises(ValueError):
+            registry.counter("scanner_test_lock_seconds")
+        with self.assertRaises(ValueError):
+            switches.inc()
+        with self.assertRaises(TypeError):
+            metrics._Family("scanner_test_bare", "No child type.")
+
+        self.assertEqual(
+            [
+                "# TYPE scanner_test_lock_seconds histogram",
+                "# UNIT scanner_test_lock_seconds seconds",
+                "# HELP scanner_test_lock_seconds Lock time.",
+                'scanner_test_lock_seconds_bucket{system="Metro \\"A\\"",le="0.1"} 1',
+                'scanner_test_lock_seconds_bucket{system="Metro \\"A\\"",le="1.0"} 2',
+                'scanner_test_lock_seconds_bucket{system="Metro \\"A\\"",le="+Inf"} 2',
+                'scanner_test_lock_seconds_count{system="Metro \\"A\\""} 2',
+                'scanner_test_lock_seconds_sum{system="Metro \\"A\\""} 0.29',
+                "# TYPE scanner_test_switches counter",
+                "# HELP scanner_test_switches Switches.",
+                'scanner_test_switches_total{reason="idle_timeout"} 3',
+                "# EOF",
+            ],
+            registry.render().splitlines(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
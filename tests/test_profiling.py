@@ -0,0 +1,78 @@
+import threading
+import time
+import unittest
+
+from ui import profiling
+
+
+class HotPathTimerTests(unittest.TestCase):
+    def setUp(self):
+        self._was_enabled = profiling.timers_enabled()
+        self.addCleanup(profiling.set_timers_enabled, self._was_enabled)
+
+    def test_records_only_while_enabled(self):
+        @profiling.hot_path("test.busy")
+        def busy(n):
+            return sum(range(n))
+
+        profiling.set_timers_enabled(False)
+        profiling.reset_timers()
+        self.assertEqual(sum(range(1000)), busy(1000))
+        self.assertNotIn("test.busy", profiling.timer_stats())
+        self.assertEqual("busy", busy.__name__)
+
+        profiling.set_timers_enabled(True)
+        for _ in range(3):
+            busy(20000)
+        stats = profiling.timer_stats()["test.busy"]
+        self.assertEqual(3, stats["count"])
+        self.assertGreater(stats["wall_ms_max"], 0.0)
+        self.assertGreaterEqual(stats["wall_ms_p95"], stats["wall_ms_p50"])
+        self.assertGreaterEqual(stats["cpu_ms_total"], 0.0)
+
+        profiling.reset_timers()
+        self.assertNotIn("test.busy", profiling.timer_stats())
+
+
+class SampleStacksTests(unittest.TestCase):
+    def test_collapsed_stacks_are_rooted_at_thread_names(self):
+        stop = threading.Event()
+
+        def spin_for_profile():
+            while not stop.is_set():
+                time.sleep(0.001)
+
+        worker = threading.Thread(target=spin_for_profile, name="profile-test-worker", daemon=True)
+        worker.start()
+        try:
+            result = profiling.sample_stacks(0.05, interval=0.005)
+        finally:
+            stop.set()
+            worker.join(1)
+
+        self.assertGreater(result["samples"], 1)
+        worker_stacks = [
+            stack for stack in result["stacks"] if stack.startswith("profile-test-worker;")
+        ]
+        self.assertTrue(worker_stacks)
+        self.assertTrue(any(stack.endswith(":spin_for_profile") for stack in worker_stacks))
+        own = threading.current_thread().name
+        self.assertFalse(any(stack.startswith(f"{own};") for stack in result["stacks"]))
+
+        text = profiling.render_collapsed({"a;b": 2, "a;c": 5})
+        self.assertEqual("a;c 5\na;b 2\n", text)
+
+    def test_concurrent_runs_are_rejected(self):
+        started = threading.Event()
+
+        def hold():
+            started.set()
+            profiling.sample_stacks(0.2, interval=0.01)
+
+        holder = threading.Thread(target=hold, daemon=True)
+        holder.start()
+        started.wait(1)
+        time.sleep(0.02)
+        with self.assertRaises(profiling.ProfilerBusy):
+            profiling.sample_stacks(0.01)
+        holder.join(2)
@@ -0,0 +1,117 @@
+import json
+import unittest
+from unittest import mock
+
+from ui import sse_hub
+
+
+class SseHubTests(unittest.TestCase):
+    def _hub(self, payloads, **kwargs):
+        state = {"calls": 0}
+
+        def builder():
+            state["calls"] += 1
+            return payloads()
+
+        hub = sse_hub.SseHub(builder, interval_sec=1.0, heartbeat_sec=5.0, **kwargs)
+        return hub, state
+
+    def test_one_build_is_shared_by_all_subscribers(self):
+        hub, state = self._hub(lambda: [("status", {"a": 1, "server_time": 1.0})])
+        with mock.patch.object(sse_hub.threading.Thread, "start"):
+            subs = [hub.subscribe() for _ in range(5)]
+        self.assertEqual(hub.tick(), 1)
+        self.assertEqual(state["calls"], 1)
+        chunks = [sub.next_chunk(timeout=0) for sub in subs]
+        self.assertTrue(all(chunk == chunks[0] for chunk in chunks))
+        self.assertIn(b"event: status\n", chunks[0])
+
+    def test_unchanged_snapshot_is_not_pushed_until_heartbeat(self):
+        clock = {"now": 100.0, "server_time": 1.0}
+
+        def payloads():
+            clock["server_time"] += 1
+            return [
+                ("status", {"a": 1, "server_time": clock["server_time"], "digital_preflight": {"x_age_ms": clock["now"]}}),
+                ("hits", {"items": []}),
+            ]
+
+        hub, _ = self._hub(payloads)
+        with mock.patch.object(sse_hub.time, "monotonic", side_effect=lambda: clock["now"]):
+            self.assertEqual(hub.tick(), 2)
+            clock["now"] += 1
+            self.assertEqual(hub.tick(), 0)
+            clock["now"] += 5
+            # Heartbeat re-sends status only.
+            self.assertEqual(hub.tick(), 1)
+
+    def test_new_subscriber_receives_latest_frames(self):
+        hub, _ = self._hub(lambda: [("status", {"a": 1})])
+        hub.tick()
+        with mock.patch.object(sse_hub.threading.Thread, "start"):
+            sub = hub.subscribe()
+        self.assertIn(b'"a": 1', sub.next_chunk(timeout=0))
+
+    def test_slow_subscriber_is_closed(self):
+        sub = sse_hub.SseSubscriber(max_frames=2)
+        sub.push(b"1")
+        sub.push(b"2")
+        sub.push(b"3")
+        self.assertTrue(sub.closed)
+        self.assertIsNone(sub.next_chunk(timeout=0))
+
+
+class SseDeltaChannelTests(unittest.TestCase):
+    def _channel(self, backlog_size=300):
+        channel = sse_hub.SseDeltaChannel("hits", lambda row: row["k"], backlog_size=backlog_size)
+        channel._seq = 100
+        return channel
+
+    @staticmethod
+    def _data(frame):
+        return [json.loads(line[6:]) for line in frame.decode().splitlines() if line.startswith("data: ")]
+
+    def test_only_new_or_changed_rows_are_sent(self):
+        channel = self._channel()
+        first = channel.update({"type": "hits", "items": [{"k": 1, "v": "a"}]})
+        self.assertIn(b"id: 101\n", first)
+        self.assertIsNone(channel.update({"type": "hits", "items": [{"k": 1, "v": "a"}]}))
+        second = channel.update({"type": "hits", "items": [{"k": 2, "v": "b"}, {"k": 1, "v": "c"}]})
+        self.assertIn(b"id: 102\n", second)
+        payload = self._data(second)[0]
+        self.assertTrue(payload["delta"])
+        self.assertEqual(payload["items"], [{"k": 2, "v": "b"}, {"k": 1, "v": "c"}])
+
+    def test_resume_replays_missed_frames(self):
+        channel = self._channel()
+        for i in range(3):
+            channel.update({"items": [{"k": i}]})
+        replay = channel.resume_frames(101)
+        self.assertEqual([row["items"] for row in self._data(replay)], [[{"k": 1}], [{"k": 2}]])
+        self.assertIsNone(channel.resume_frames(103))
+
+    def test_gap_or_unknown_id_sends_full_snapshot(self):
+        channel = self._channel(backlog_size=2)
+        for i in range(4):
+            channel.update({"items": [{"k": j} for j in range(i + 1)]})
+        for last_id in (None, 100, 999):
+            frames = self._data(channel.resume_frames(last_id))
+            self.assertEqual(len(frames), 1)
+            self.assertFalse(frames[0]["delta"])
+            self.assertEqual(len(frames[0]["items"]), 4)
+
+    def test_hub_routes_channel_events_through_deltas(self):
+        channel = self._channel()
+        rows = {"items": [{"k": 1}]}
+        hub = sse_hub.SseHub(lambda: [("hits", dict(rows))], delta_channels=[channel])
+        self.assertEqual(hub.tick(), 1)
+        self.assertEqual(hub.tick(), 0)
+        with mock.patch.object(sse_hub.threading.Thread, "start"):
+            fresh = hub.subscribe()
+            resumed = hub.subscribe(last_event_id=channel.seq)
+        self.assertFalse(self._data(fresh.next_chunk(timeout=0))[0]["delta"])
+        self.assertIsNone(resumed.next_chunk(timeout=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import threading
+import unittest
+from urllib.error import URLError
+
+from ui import stream_fanout
+
+
+class _FakeSource:
+    def __init__(self):
+        self.headers = [("Content-Type", "audio/mpeg")]
+        self.chunks = []
+        self.cond = threading.Condition()
+        self.closed = False
+
+    def feed(self, chunk: bytes):
+        with self.cond:
+            self.chunks.append(chunk)
+            self.cond.notify_all()
+
+    def read(self, size: int) -> bytes:
+        with self.cond:
+            while not self.chunks and not self.closed:
+                self.cond.wait(timeout=5)
+            return self.chunks.pop(0) if self.chunks else b""
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+
+class StreamFanoutTests(unittest.TestCase):
+    def setUp(self):
+        self.opened = []
+
+    def tearDown(self):
+        stream_fanout._BROADCASTERS.clear()
+
+    def _opener(self):
+        source = _FakeSource()
+        self.opened.append(source)
+        return source
+
+    def _attach(self, **kwargs):
+        kwargs.setdefault("linger_sec", 0)
+        return stream_fanout.attach_stream(("GND.mp3", "passthrough"), self._opener, 256, **kwargs)
+
+    def _read_all(self, cursor, count):
+        out = []
+        while len(out) < count:
+            chunks = cursor.read(timeout=2)
+            if chunks is None:
+                break
+            out.extend(chunks)
+        return out
+
+    def test_listeners_share_one_upstream(self):
+        first = self._attach()
+        second = self._attach()
+        self.assertEqual(len(self.opened), 1)
+        self.opened[0].feed(b"a")
+        self.opened[0].feed(b"b")
+        self.assertEqual(self._read_all(first, 2), [b"a", b"b"])
+        self.assertEqual(self._read_all(second, 2), [b"a", b"b"])
+        self.assertEqual(stream_fanout.stream_fanout_stats()[0]["listeners"], 2)
+
+    def test_upstream_is_reaped_after_last_listener(self):
+        first = self._attach()
+        second = self._attach()
+        first.close()
+        self.assertFalse(self.opened[0].closed)
+        second.close()
+        self.assertTrue(self.opened[0].closed)
+        self.assertEqual(stream_fanout.stream_fanout_stats(), [])
+        self._attach()
+        self.assertEqual(len(self.opened), 2)
+
+    def test_lagging_listener_skips_to_ring_start(self):
+        cursor = self._attach(ring_chunks=2)
+        for chunk in (b"1", b"2", b"3", b"4"):
+            self.opened[0].feed(chunk)
+        broadcaster = cursor.broadcaster
+        with broadcaster._cond:
+            while broadcaster._seq < 4:
+                broadcaster._cond.wait(timeout=2)
+        self.assertEqual(cursor.read(timeout=0), [b"3", b"4"])
+        self.assertEqual(cursor.skipped_chunks, 2)
+
+    def test_open_error_reaches_listener_and_is_not_cached(self):
+        def failing():
+            raise URLError("refused")
+
+        with self.assertRaises(URLError):
+            stream_fanout.attach_stream(("GND.mp3", "passthrough"), failing, 256)
+        self._attach()
+        self.assertEqual(len(self.opened), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
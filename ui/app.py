@@ -5,9 +5,10 @@ from http.server import HTTPServer
 from socketserver import ThreadingMixIn
 
 try:
-    from .config import UI_PORT
+    from .config import UI_PORT, UI_SERVER_ENGINE
     from .handlers import Handler
     from .server_workers import start_config_worker, start_icecast_monitor
+    from .scanner import start_analog_journal_followers
     from .favorites_runtime import sync_scan_pool_to_runtime
     from .v3_runtime import bootstrap_runtime
 except ImportError:
@@ -16,9 +17,10 @@ except ImportError:
     repo_root = os.path.dirname(script_dir)
     if repo_root not in sys.path:
         sys.path.insert(0, repo_root)
-    from ui.config import UI_PORT
+    from ui.config import UI_PORT, UI_SERVER_ENGINE
     from ui.handlers import Handler
     from ui.server_workers import start_config_worker, start_icecast_monitor
+    from ui.scanner import start_analog_journal_followers
     from ui.favorites_runtime import sync_scan_pool_to_runtime
     from ui.v3_runtime import bootstrap_runtime
 
@@ -56,7 +58,18 @@ def main():
     except Exception as e:
         logging.warning("Favorites runtime sync failed: %s", e)
     start_config_worker()
+    start_analog_journal_followers()
     start_icecast_monitor()
+    if UI_SERVER_ENGINE == "asyncio":
+        try:
+            from .async_server import serve_asyncio
+        except ImportError:
+            from ui.async_server import serve_asyncio
+        logging.info(f"UI listening on 0.0.0.0:{UI_PORT} (asyncio engine)")
+        serve_asyncio("0.0.0.0", UI_PORT)
+        return
+    if UI_SERVER_ENGINE != "threaded":
+        logging.warning("Unknown UI_SERVER_ENGINE=%r; using threaded", UI_SERVER_ENGINE)
     server = ThreadedHTTPServer(("0.0.0.0", UI_PORT), Handler)
     logging.info(f"UI listening on 0.0.0.0:{UI_PORT}")
     server.serve_forever()
@@ -0,0 +1,252 @@
+"""Asyncio HTTP server engine.
+
+Selected with ``UI_SERVER_ENGINE=asyncio``. Short requests are replayed
+through the regular ``Handler`` on a bounded worker pool, so every route
+behaves exactly as under the threaded server. The long-lived endpoints
+(``/api/stream`` SSE and ``GET /stream`` relays of the shared Icecast
+fan-out) run as coroutines instead, so idle dashboards and listeners do not
+pin an OS thread each.
+"""
+import asyncio
+import io
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from http.client import parse_headers
+from http.server import BaseHTTPRequestHandler
+from typing import Optional
+from urllib.error import HTTPError, URLError
+from urllib.parse import parse_qs, urlparse
+
+try:
+    from .config import UI_ASYNC_WORKER_THREADS
+    from .handlers import (
+        Handler,
+        SSE_HEARTBEAT_SEC,
+        STREAM_PROXY_READ_TIMEOUT_SEC,
+        _SSE_HUB,
+        _attach_shared_stream,
+        _canonical_scan_api_path,
+        _parse_last_event_id,
+        _sanitize_stream_mount,
+        _stream_transcode_enabled,
+    )
+except ImportError:
+    from ui.config import UI_ASYNC_WORKER_THREADS
+    from ui.handlers import (
+        Handler,
+        SSE_HEARTBEAT_SEC,
+        STREAM_PROXY_READ_TIMEOUT_SEC,
+        _SSE_HUB,
+        _attach_shared_stream,
+        _canonical_scan_api_path,
+        _parse_last_event_id,
+        _sanitize_stream_mount,
+        _stream_transcode_enabled,
+    )
+
+
+_MAX_HEADER_BYTES = 64 * 1024
+_REQUEST_HEAD_TIMEOUT_SEC = 30.0
+
+
+def _response_head(code: int, headers: list[tuple[str, str]]) -> bytes:
+    reason = BaseHTTPRequestHandler.responses.get(code, ("",))[0]
+    lines = [
+        f"{Handler.protocol_version} {code} {reason}",
+        f"Server: {Handler.server_version}",
+        f"Date: {formatdate(usegmt=True)}",
+    ]
+    lines.extend(f"{name}: {value}" for name, value in headers)
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1", errors="replace")
+
+
+def _text_response(code: int, text: str) -> bytes:
+    return _response_head(code, [
+        ("Content-Type", "text/plain; charset=utf-8"),
+        ("Cache-Control", "no-store"),
+    ]) + text.encode("utf-8")
+
+
+class _BufferedHandler(Handler):
+    """Run one request through ``Handler`` against in-memory buffers."""
+
+    def __init__(self, raw_request: bytes, client_address):
+        # Deliberately skip BaseRequestHandler.__init__: it would start
+        # serving immediately on a socket we do not have.
+        self.rfile = io.BytesIO(raw_request)
+        self.wfile = io.BytesIO()
+        self.client_address = client_address
+        self.server = None
+        self.request = None
+        self.close_connection = True
+
+    def run(self) -> bytes:
+        try:
+            self.handle_one_request()
+        except Exception:
+            logging.exception("asyncio engine: handler failed for %s", getattr(self, "path", "?"))
+            if not self.wfile.getvalue():
+                return _text_response(500, "Internal Server Error")
+        return self.wfile.getvalue()
+
+
+class AsyncUiServer:
+    """Serve the UI from one event loop."""
+
+    def __init__(self, host: str, port: int, worker_threads: int = UI_ASYNC_WORKER_THREADS):
+        self.host = host
+        self.port = int(port)
+        self._executor = ThreadPoolExecutor(max_workers=worker_threads, thread_name_prefix="ui-async")
+
+    async def serve_forever(self) -> None:
+        server = await asyncio.start_server(
+            self._handle_client,
+            self.host,
+            self.port,
+            limit=_MAX_HEADER_BYTES,
+        )
+        async with server:
+            await server.serve_forever()
+
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader):
+        """Return ``(method, target, headers, raw_request)`` or None."""
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), _REQUEST_HEAD_TIMEOUT_SEC)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError):
+            return None
+        request_line, _, header_block = head.partition(b"\r\n")
+        parts = request_line.decode("latin-1", errors="replace").split()
+        if len(parts) < 2:
+            return None
+        headers = parse_headers(io.BytesIO(header_block))
+        try:
+            length = max(0, int(headers.get("Content-Length", "0") or "0"))
+        except ValueError:
+            length = 0
+        body = await reader.readexactly(length) if length else b""
+        return parts[0].upper(), parts[1], headers, head + body
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await self._read_request(reader)
+            if request is None:
+                return
+            method, target, headers, raw = request
+            u = urlparse(target)
+            q = parse_qs(u.query or "")
+            if method == "GET" and _canonical_scan_api_path(u.path) == "/api/stream":
+                return await self._serve_sse(writer, _parse_last_event_id(headers, q))
+            if method == "GET" and (u.path in ("/stream", "/stream/") or u.path.startswith("/stream/")):
+                mount = u.path[len("/stream/"):] if u.path.startswith("/stream/") else ""
+                transcode = Handler._parse_optional_bool_query(q, "transcode")
+                return await self._proxy_stream(writer, mount, transcode)
+            peer = writer.get_extra_info("peername") or ("", 0)
+            handler = _BufferedHandler(raw, peer[:2])
+            response = await asyncio.get_running_loop().run_in_executor(self._executor, handler.run)
+            writer.write(response)
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+    async def _serve_sse(self, writer: asyncio.StreamWriter, last_event_id: Optional[int]) -> None:
+        loop = asyncio.get_running_loop()
+        wake = asyncio.Event()
+
+        def on_push():
+            try:
+                loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:
+                # Loop already closed during shutdown.
+                pass
+
+        writer.write(_response_head(200, [
+            ("Content-Type", "text/event-stream"),
+            ("Cache-Control", "no-cache"),
+            ("Connection", "keep-alive"),
+            ("Access-Control-Allow-Origin", "*"),
+        ]))
+        sub = _SSE_HUB.subscribe(last_event_id=last_event_id, on_push=on_push)
+        try:
+            await writer.drain()
+            while not sub.closed:
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=SSE_HEARTBEAT_SEC * 2)
+                except asyncio.TimeoutError:
+                    continue
+                wake.clear()
+                chunk = sub.next_chunk(timeout=0)
+                if chunk:
+                    writer.write(chunk)
+                    await writer.drain()
+        finally:
+            _SSE_HUB.unsubscribe(sub)
+
+    async def _proxy_stream(
+        self,
+        writer: asyncio.StreamWriter,
+        mount_name: str,
+        transcode: Optional[bool],
+    ) -> None:
+        mount = _sanitize_stream_mount(mount_name)
+        if not mount:
+            writer.write(_text_response(400, "invalid mount"))
+            return
+        loop = asyncio.get_running_loop()
+        wake = asyncio.Event()
+
+        def on_data():
+            try:
+                loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:
+                pass
+
+        try:
+            # Attaching blocks only until the shared upstream is open.
+            cursor = await loop.run_in_executor(
+                self._executor,
+                lambda: _attach_shared_stream(mount, _stream_transcode_enabled(mount, transcode), on_data),
+            )
+        except FileNotFoundError:
+            writer.write(_text_response(500, "ffmpeg not found"))
+            return
+        except HTTPError as e:
+            writer.write(_text_response(int(e.code or 502), f"upstream error: {e.reason}"))
+            return
+        except (URLError, TimeoutError) as e:
+            writer.write(_text_response(502, f"upstream unavailable: {e}"))
+            return
+        try:
+            writer.write(_response_head(200, list(cursor.headers) + [
+                ("Cache-Control", "no-store"),
+                ("Access-Control-Allow-Origin", "*"),
+                ("Connection", "close"),
+            ]))
+            await writer.drain()
+            while True:
+                chunks = cursor.read(timeout=0)
+                if chunks is None:
+                    break
+                if not chunks:
+                    try:
+                        await asyncio.wait_for(wake.wait(), timeout=STREAM_PROXY_READ_TIMEOUT_SEC)
+                    except asyncio.TimeoutError:
+                        pass
+                    wake.clear()
+                    continue
+                writer.write(b"".join(chunks))
+                await writer.drain()
+        finally:
+            cursor.close()
+
+
+def serve_asyncio(host: str, port: int) -> None:
+    """Run the asyncio engine until interrupted."""
+    asyncio.run(AsyncUiServer(host, port).serve_forever())
@@ -20,6 +20,10 @@ def _env_text_with_set(name: str, default: str) -> tuple[str, bool]:
 
 # Server & Port Configuration
 UI_PORT = int(os.getenv("UI_PORT", "5050"))
+# "threaded" (one thread per connection) or "asyncio" (SSE and stream
+# proxy connections run as coroutines; short requests use a worker pool).
+UI_SERVER_ENGINE = os.getenv("UI_SERVER_ENGINE", "threaded").strip().lower() or "threaded"
+UI_ASYNC_WORKER_THREADS = max(2, int(os.getenv("UI_ASYNC_WORKER_THREADS", "16")))
 
 # Paths
 CONFIG_DIR = os.getenv("CONFIG_DIR", "/usr/local/etc")
@@ -41,6 +45,9 @@ elif os.path.isfile(_REPO_HPDB_PATH):
     HPDB_DB_PATH = _REPO_HPDB_PATH
 else:
     HPDB_DB_PATH = _HPDB_DB_PATH_ENV
+HPDB_POOL_MAX_IDLE = max(0, int(os.getenv("HPDB_POOL_MAX_IDLE", "4")))
+HPDB_MMAP_BYTES = max(0, int(os.getenv("HPDB_MMAP_BYTES", str(64 * 1024 * 1024))))
+HPDB_CACHE_KIB = max(0, int(os.getenv("HPDB_CACHE_KIB", "8192")))
 
 # Last Hit Tracking
 LAST_HIT_AIRBAND_PATH = os.getenv("LAST_HIT_AIRBAND_PATH", "/run/rtl_airband_last_freq_airband.txt")
@@ -382,6 +389,15 @@ RE_ACTIVITY_TS = re.compile(
     r'^(?P<date>\d{4}-\d{2}-\d{2})[ T](?P<time>\d{2}:\d{2}:\d{2})(?:\.\d+)?(?:[+-]\d{2}:?\d{2}|[A-Z]{2,5})?\s+.*Activity on (?P<freq>[0-9]+\.[0-9]+)'
 )
 
+# Analog journal follower (persistent journalctl -f per unit)
+ANALOG_JOURNAL_FOLLOW_ENABLED = os.getenv(
+    "ANALOG_JOURNAL_FOLLOW_ENABLED",
+    "1",
+).strip().lower() in _TRUTHY
+ANALOG_JOURNAL_BACKFILL_LINES = max(0, int(os.getenv("ANALOG_JOURNAL_BACKFILL_LINES", "400")))
+ANALOG_JOURNAL_RING_SIZE = max(50, int(os.getenv("ANALOG_JOURNAL_RING_SIZE", "2000")))
+ANALOG_HIT_INDEX_SIZE = max(50, int(os.getenv("ANALOG_HIT_INDEX_SIZE", "1000")))
+
 # Control & Calibration
 HIT_GAP_RESET_SECONDS = int(os.getenv("HIT_GAP_RESET_SECONDS", "10"))
 AIRBAND_MIN_MHZ = float(os.getenv("AIRBAND_MIN_MHZ", "118.0"))
@@ -395,3 +411,9 @@ GAIN_STEPS = [
 # Action Queueing
 APPLY_DEBOUNCE_SEC = float(os.getenv("APPLY_DEBOUNCE_SEC", "0.2"))
 ACTION_WAIT_TIMEOUT_SEC = max(1.0, float(os.getenv("ACTION_WAIT_TIMEOUT_SEC", "45")))
+
+# Profiling (ui/profiling.py)
+UI_HOT_PATH_TIMERS_ENABLED = os.getenv("UI_HOT_PATH_TIMERS_ENABLED", "").strip().lower() in _TRUTHY
+UI_HOT_PATH_RING_SIZE = max(16, int(os.getenv("UI_HOT_PATH_RING_SIZE", "512")))
+UI_PROFILE_MAX_SEC = max(1.0, float(os.getenv("UI_PROFILE_MAX_SEC", "60")))
+UI_PROFILE_SAMPLE_HZ = max(1.0, min(1000.0, float(os.getenv("UI_PROFILE_SAMPLE_HZ", "100"))))
@@ -3,6 +3,8 @@ from __future__ import annotations
 
 import json
 import csv
+import hashlib
+import http.client
 import math
 import os
 import re
@@ -10,10 +12,11 @@ import shlex
 import subprocess
 import threading
 import time
-import urllib.error
 import urllib.parse
 import urllib.request
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from xml.etree import ElementTree as ET
 
 _XSI_NS = "http://www.w3.org/2001/XMLSchema-instance"
@@ -78,7 +81,15 @@ try:
         DIGITAL_USE_MULTI_FREQ_SOURCE,
     )
     from .systemd import unit_active
-    from .scan_pool_adapter import get_active_scan_pool_snapshot, get_current_scan_mode
+    from .metrics import REGISTRY
+    from .profiling import hot_path
+    from .scan_pool_adapter import (
+        get_active_scan_pool_lookup,
+        get_active_scan_pool_snapshot,
+        get_current_scan_mode,
+        get_scan_pool_version,
+        subscribe_scan_pool_changes,
+    )
 except ImportError:
     from ui.config import (
         AIRBAND_RTL_SERIAL,
@@ -138,7 +149,15 @@ except ImportError:
         DIGITAL_USE_MULTI_FREQ_SOURCE,
     )
     from ui.systemd import unit_active
-    from ui.scan_pool_adapter import get_active_scan_pool_snapshot, get_current_scan_mode
+    from ui.metrics import REGISTRY
+    from ui.profiling import hot_path
+    from ui.scan_pool_adapter import (
+        get_active_scan_pool_lookup,
+        get_active_scan_pool_snapshot,
+        get_current_scan_mode,
+        get_scan_pool_version,
+        subscribe_scan_pool_changes,
+    )
 
 
 _NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._@-]{0,127}$")
@@ -177,6 +196,7 @@ _SUPPRESS_STATUS_WARNING_RE = re.compile(
     r"(mMainGui\" is null|error while broadcasting.*tunerevent)",
     re.I,
 )
+_ERROR_LINE_RE = re.compile(r"(error|exception)", re.I)
 _TUNER_BUSY_RE = re.compile(
     r"(in[- ]use by another application|device is busy|usb_claim_interface error|"
     r"unable to set usb configuration|failed to open rtlsdr device)",
@@ -202,10 +222,25 @@ _DEFAULT_LISTEN_ENABLED = os.getenv(
     "DIGITAL_LISTEN_DEFAULT",
     "0",
 ).strip().lower() in ("1", "true", "yes", "on")
+_LABEL_CACHE_REVALIDATE_SEC = max(0.0, float(os.getenv("DIGITAL_LABEL_CACHE_REVALIDATE_SEC", "5")))
+_LABEL_CACHE_MAX_TGIDS = 8192
+_LABEL_GENERATION = 0
+_LABEL_GENERATION_LOCK = threading.Lock()
 _REJECT_SCAN_MAX_LINES = max(200, int(os.getenv("DIGITAL_REJECT_SCAN_MAX_LINES", "5000")))
 _REJECT_SCAN_MAX_BYTES = max(16384, int(os.getenv("DIGITAL_REJECT_SCAN_MAX_BYTES", "1048576")))
 _REJECT_SCAN_MAX_FILES = max(1, int(os.getenv("DIGITAL_REJECT_SCAN_MAX_FILES", "3")))
 _REJECT_GRANT_RE = re.compile(r"channel start rejected", re.I)
+_ENCRYPTED_DETAILS_RE = re.compile(r"\b(encrypt|encrypted|encryption)\b", re.I)
+# Case-insensitive literal alternations scan slowly; the per-row checks on
+# call-event lines lower the text once and use these case-sensitive forms.
+_IGNORE_EVENT_LOWER_RE = re.compile(_IGNORE_EVENT_RE.pattern)
+# Any text _MODE_RE, _PHASE1_RE or _PHASE2_RE can match contains one of these.
+_MODE_GATE_LOWER_RE = re.compile(r"p25|dmr|nxdn|d-star|tetra|ysf|edacs|ltr")
+_TO_TGID_PAREN_RE = re.compile(r"\((\d+)\)")
+_TO_TGID_DIGITS_RE = re.compile(r"\b(\d{3,})\b")
+_DURATION_NUM_RE = re.compile(r"\d+(?:\.\d+)?")
+_DURATION_MS_UNIT_RE = re.compile(r"\b(ms|msec|millisecond|milliseconds)\b")
+_DURATION_SEC_UNIT_RE = re.compile(r"\b(s|sec|secs|second|seconds)\b")
 _EVENT_HEADER_KEYS = (
     "timestamp",
     "time",
@@ -331,6 +366,9 @@ _DIGITAL_SCHEDULER_PREFLIGHT_CACHE_MS = max(
     int(DIGITAL_SCHEDULER_PREFLIGHT_CACHE_MS or 750),
 )
 _DIGITAL_SCHEDULER_LOCK_MISS_TICKS = max(1, int(DIGITAL_SCHEDULER_LOCK_MISS_TICKS or 3))
+# Longest the scheduler sleeps with no dwell/hang/lock deadline pending; keep
+# it under HEALTH_SCHEDULER_STALE_MS so the snapshot never reads as stale.
+_DIGITAL_SCHEDULER_IDLE_WAKE_SEC = max(0.5, float(os.getenv("DIGITAL_SCHEDULER_IDLE_WAKE_SEC", "2")))
 _DEFAULT_DIGITAL_PERF_PROFILE = "pc_moderate"
 
 
@@ -401,6 +439,8 @@ _DIGITAL_SCHEDULER_ADAPTIVE_LOCK_MAX_MS = max(
     int(os.getenv("DIGITAL_SCHEDULER_ADAPTIVE_LOCK_MAX_MS", "60000")),
 )
 _DIGITAL_PLAYLIST_WRITE_LOCK = threading.Lock()
+# Guards _PLAYLIST_MODELS and every edit of a cached playlist tree.
+_PLAYLIST_MODEL_LOCK = threading.RLock()
 _DIGITAL_STREAM_SOURCE_USER = os.getenv("ICECAST_SOURCE_USER", "source").strip() or "source"
 _DIGITAL_STREAM_SOURCE_PASSWORD = os.getenv("ICECAST_SOURCE_PASSWORD", "062352").strip() or "062352"
 _DIGITAL_STREAM_BITRATE = max(8, int(os.getenv("DIGITAL_STREAM_BITRATE", "32")))
@@ -421,6 +461,49 @@ _DIGITAL_RUNTIME_RETUNE_TIMEOUT_SEC = max(
     0.05,
     float(DIGITAL_RUNTIME_RETUNE_TIMEOUT_MS or 350) / 1000.0,
 )
+_METRIC_RETUNE_SECONDS = REGISTRY.histogram(
+    "scanner_digital_retune_seconds",
+    "Control-channel retune time by method.",
+    ("method",),
+)
+_METRIC_RETUNES = REGISTRY.counter(
+    "scanner_digital_retunes",
+    "Control-channel retunes by method and result.",
+    ("method", "result"),
+)
+_METRIC_RETUNE_HTTP_SECONDS = REGISTRY.histogram(
+    "scanner_digital_runtime_retune_http_seconds",
+    "Round trip of runtime retune HTTP calls to SDRTrunk.",
+)
+_METRIC_PLAYLIST_APPLY_SECONDS = REGISTRY.histogram(
+    "scanner_digital_playlist_apply_seconds",
+    "Profile apply time, including any SDRTrunk playlist rewrite.",
+)
+_METRIC_SCHEDULER_APPLY_SECONDS = REGISTRY.histogram(
+    "scanner_digital_scheduler_apply_seconds",
+    "Scheduler system apply time by the apply path taken.",
+    ("method",),
+)
+_METRIC_SCHEDULER_TICK_SECONDS = REGISTRY.histogram(
+    "scanner_digital_scheduler_tick_seconds",
+    "Wall time of one scheduler tick.",
+)
+_METRIC_SCHEDULER_SWITCHES = REGISTRY.counter(
+    "scanner_digital_scheduler_switches",
+    "Timeslice system switches by reason.",
+    ("reason",),
+)
+_METRIC_LOCK_ACQUIRE_SECONDS = REGISTRY.histogram(
+    "scanner_digital_lock_acquire_seconds",
+    "Time from switching to a system until its control channel locks.",
+    ("system",),
+    buckets=(100.0, 250.0, 500.0, 1000.0, 1500.0, 2000.0, 3000.0, 5000.0, 10000.0, 30000.0),
+)
+_METRIC_EVENT_INGEST_LAG_SECONDS = REGISTRY.histogram(
+    "scanner_digital_event_ingest_lag_seconds",
+    "Delay from an SDRTrunk event timestamp to the event reaching the UI.",
+    buckets=(50.0, 100.0, 250.0, 500.0, 1000.0, 2000.0, 5000.0, 10000.0, 30000.0),
+)
 _DURATION_HMS_RE = re.compile(
     r"^(?:(?P<h>\d+):)?(?P<m>\d{1,2}):(?P<s>\d{1,2}(?:\.\d+)?)$"
 )
@@ -700,6 +783,112 @@ def _write_playlist_tree_atomic(tree: ET.ElementTree, path: str) -> tuple[bool,
     return True, ""
 
 
+def _playlist_fingerprint(path: str) -> tuple[int, int, int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (int(st.st_dev), int(st.st_ino), int(st.st_mtime_ns), int(st.st_size))
+
+
+class _PlaylistModel:
+    """Parsed SDRTrunk playlist kept in memory between rewrites.
+
+    The tree is reused while the file's (device, inode, mtime, size)
+    fingerprint is unchanged, so a scheduler or retune edit costs a few
+    element updates instead of a full parse. Callers snapshot
+    ``sections()`` before editing and hand it to ``save()``, which writes
+    only when the channel, stream or (when asked) alias serialization
+    actually moved. Obtain models through ``_load_playlist_model``.
+    """
+
+    def __init__(self, path: str, tree: ET.ElementTree, fingerprint: tuple[int, int, int, int] | None):
+        self.path = path
+        self.tree = tree
+        self.root = tree.getroot()
+        self.fingerprint = fingerprint
+        self._channel: ET.Element | None = None
+        self._alias_lists: dict[str, list[ET.Element]] | None = None
+
+    @property
+    def mtime_ns(self) -> int:
+        return int(self.fingerprint[2]) if self.fingerprint else 0
+
+    def channel(self) -> ET.Element | None:
+        if self._channel is None:
+            self._channel = self.root.find("channel")
+        return self._channel
+
+    def source_configuration(self) -> ET.Element | None:
+        channel = self.channel()
+        return channel.find("source_configuration") if channel is not None else None
+
+    def alias_lists(self) -> dict[str, list[ET.Element]]:
+        """``alias_list_name -> alias elements``, built once per parse or alias write."""
+        if self._alias_lists is None:
+            index: dict[str, list[ET.Element]] = {}
+            for alias in self.root.findall("alias"):
+                index.setdefault(str(alias.get("list", "")).strip(), []).append(alias)
+            self._alias_lists = index
+        return self._alias_lists
+
+    def sections(self, *, aliases: bool = False) -> dict[str, str]:
+        channel = self.channel()
+        out = {
+            "channel": ET.tostring(channel, encoding="unicode") if channel is not None else "",
+            "streams": "".join(
+                ET.tostring(child, encoding="unicode")
+                for child in self.root
+                if child.tag not in {"alias", "channel"}
+            ),
+        }
+        if aliases:
+            digest = hashlib.sha1()
+            for alias in self.root.findall("alias"):
+                digest.update(ET.tostring(alias))
+            out["aliases"] = digest.hexdigest()
+        return out
+
+    def save(self, before: dict[str, str]) -> tuple[bool, bool, str]:
+        """``(ok, written, error)``; writes only if a section in ``before`` changed."""
+        if "aliases" in before:
+            self._alias_lists = None
+        if self.sections(aliases="aliases" in before) == before:
+            return True, False, ""
+        ok, err = _write_playlist_tree_atomic(self.tree, self.path)
+        if not ok:
+            # The tree now holds edits the file does not; reparse next time.
+            _drop_playlist_model(self.path)
+            return False, False, err
+        self.fingerprint = _playlist_fingerprint(self.path)
+        return True, True, ""
+
+
+_PLAYLIST_MODELS: dict[str, _PlaylistModel] = {}
+
+
+def _drop_playlist_model(path: str) -> None:
+    with _PLAYLIST_MODEL_LOCK:
+        _PLAYLIST_MODELS.pop(str(path or ""), None)
+
+
+def _load_playlist_model(path: str) -> _PlaylistModel:
+    """Cached model for ``path``, reparsed only when the file's fingerprint moved.
+
+    Callers hold ``_PLAYLIST_MODEL_LOCK`` for as long as they use the model.
+    Raises whatever ``ET.parse`` raises.
+    """
+    fingerprint = _playlist_fingerprint(path)
+    model = _PLAYLIST_MODELS.get(path)
+    if model is not None and fingerprint is not None and model.fingerprint == fingerprint:
+        return model
+    _PLAYLIST_MODELS.pop(path, None)
+    model = _PlaylistModel(path, ET.parse(path), fingerprint)
+    if fingerprint is not None:
+        _PLAYLIST_MODELS[path] = model
+    return model
+
+
 def _normalize_alias_stream_binding(alias_id: ET.Element, stream_name: str) -> bool:
     stream = str(stream_name or "").strip()
     if not stream:
@@ -991,6 +1180,84 @@ def _read_tail_lines(path: str, max_bytes: int = 8192, max_lines: int = 120):
     return lines
 
 
+class _LogTailFollower:
+    """Byte-offset reader that returns each complete log line once.
+
+    The first read backfills the last ``backfill_bytes``. Rotation (inode
+    change) and truncation (size below the saved offset) restart from the
+    beginning of the new file. A trailing partial line is held back until
+    its newline arrives.
+    """
+
+    def __init__(self, path: str, backfill_bytes: int = 8192, max_read_bytes: int = 1 << 20):
+        self.path = path
+        self._backfill_bytes = max(0, int(backfill_bytes))
+        self._max_read_bytes = max(self._backfill_bytes, int(max_read_bytes))
+        self._offset: int | None = None
+        self._inode = None
+        self._partial = b""
+        self.mtime: float | None = None
+
+    def read_new_lines(self) -> list[str]:
+        try:
+            st = os.stat(self.path)
+        except Exception:
+            return []
+        self.mtime = st.st_mtime
+        inode = (st.st_dev, st.st_ino)
+        size = int(st.st_size)
+        if self._offset is None:
+            start = max(size - self._backfill_bytes, 0)
+            skip_partial = start > 0
+        elif inode != self._inode or size < self._offset:
+            start = 0
+            skip_partial = False
+            self._partial = b""
+        else:
+            start = self._offset
+            skip_partial = False
+        if start >= size and self._offset is not None and inode == self._inode:
+            return []
+        if (size - start) > self._max_read_bytes:
+            # Far behind (or a huge rotated file): only keep the newest data.
+            start = size - self._max_read_bytes
+            skip_partial = True
+            self._partial = b""
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(start)
+                data = f.read(size - start)
+        except Exception:
+            return []
+        self._inode = inode
+        self._offset = start + len(data)
+        if skip_partial:
+            cut = data.find(b"\n")
+            data = data[cut + 1:] if cut >= 0 else b""
+        data = self._partial + data
+        body, sep, tail = data.rpartition(b"\n")
+        if not sep:
+            self._partial = data
+            return []
+        self._partial = tail
+        return body.decode("utf-8", errors="ignore").splitlines()
+
+
+@lru_cache(maxsize=1024)
+def _local_minute_ms(stamp: str, fmt: str) -> int:
+    dt = datetime.strptime(stamp, fmt)
+    return int(time.mktime(dt.timetuple()) * 1000)
+
+
+def _local_timestamp_ms(stamp: str, fmt: str) -> int:
+    # strptime/mktime dominate log parsing; every supported format ends in
+    # two-digit seconds, so resolve the minute once and add the seconds.
+    seconds = stamp[-2:]
+    if fmt.endswith("%S") and seconds.isdigit():
+        return _local_minute_ms(stamp[:-2], fmt[:-2]) + int(seconds) * 1000
+    return _local_minute_ms(stamp, fmt)
+
+
 def _parse_time_ms(line: str, fallback_ms: int) -> int:
     text = str(line or "").strip()
     # Prefer leading timestamps and avoid matching date strings that appear
@@ -998,22 +1265,19 @@ def _parse_time_ms(line: str, fallback_ms: int) -> int:
     m3 = _TS_COLON_RE.match(text)
     if m3:
         try:
-            dt = datetime.strptime(f"{m3.group('date')} {m3.group('time')}", "%Y:%m:%d %H:%M:%S")
-            return int(time.mktime(dt.timetuple()) * 1000)
+            return _local_timestamp_ms(f"{m3.group('date')} {m3.group('time')}", "%Y:%m:%d %H:%M:%S")
         except Exception:
             return fallback_ms
     m2 = _TS_COMPACT_RE.match(text)
     if m2:
         try:
-            dt = datetime.strptime(f"{m2.group('date')} {m2.group('time')}", "%Y%m%d %H%M%S")
-            return int(time.mktime(dt.timetuple()) * 1000)
+            return _local_timestamp_ms(f"{m2.group('date')} {m2.group('time')}", "%Y%m%d %H%M%S")
         except Exception:
             return fallback_ms
     m = _TS_RE.match(text)
     if m:
         try:
-            dt = datetime.strptime(f"{m.group('date')} {m.group('time')}", "%Y-%m-%d %H:%M:%S")
-            return int(time.mktime(dt.timetuple()) * 1000)
+            return _local_timestamp_ms(f"{m.group('date')} {m.group('time')}", "%Y-%m-%d %H:%M:%S")
         except Exception:
             return fallback_ms
     return fallback_ms
@@ -1041,6 +1305,10 @@ def _parse_duration_ms(value: str) -> int | None:
     raw = str(value or "").strip()
     if not raw:
         return None
+    if raw.isascii() and raw.isdigit():
+        # Bare numeric durations, the common case; same rule as below.
+        num = int(raw)
+        return num * 1000 if num < 50 else num
 
     m_hms = _DURATION_HMS_RE.fullmatch(raw)
     if m_hms:
@@ -1053,7 +1321,7 @@ def _parse_duration_ms(value: str) -> int | None:
             return None
 
     token = raw.lower()
-    m_num = re.search(r"\d+(?:\.\d+)?", token)
+    m_num = _DURATION_NUM_RE.search(token)
     if not m_num:
         return None
     try:
@@ -1063,9 +1331,9 @@ def _parse_duration_ms(value: str) -> int | None:
     if num < 0:
         return None
 
-    if re.search(r"\b(ms|msec|millisecond|milliseconds)\b", token):
+    if _DURATION_MS_UNIT_RE.search(token):
         return int(round(num))
-    if re.search(r"\b(s|sec|secs|second|seconds)\b", token):
+    if _DURATION_SEC_UNIT_RE.search(token):
         return int(round(num * 1000))
 
     # Bare numeric durations in SDRTrunk logs are typically milliseconds.
@@ -1125,6 +1393,24 @@ def _coerce_mode(value: str) -> str:
     return mode or ""
 
 
+def _coerce_mode_text(value: str) -> str:
+    """``_coerce_mode`` for whole log lines, skipping the scan when no mode token can match."""
+    if not value or not _MODE_GATE_LOWER_RE.search(value.lower()):
+        return ""
+    return _coerce_mode(value)
+
+
+def _ignored_event_text(text: str) -> bool:
+    """``_IGNORE_EVENT_RE.search(text)``, for the per-row call-event path."""
+    return bool(_IGNORE_EVENT_LOWER_RE.search(text.lower()))
+
+
+@lru_cache(maxsize=256)
+def _coerce_mode_column(value: str) -> str:
+    # Mode/protocol columns hold a handful of distinct values.
+    return _coerce_mode(value)
+
+
 def _row_value(row: dict, keys: tuple) -> str:
     for key in keys:
         val = row.get(key)
@@ -1230,32 +1516,74 @@ def _normalize_tgid(value: str) -> str:
     return str(dec)
 
 
+_EVENT_FIELD_GROUPS = (
+    ("label", _EVENT_LABEL_KEYS),
+    ("tgid", _EVENT_TGID_KEYS),
+    ("event_id", _EVENT_ID_KEYS),
+    ("kind", _EVENT_KIND_KEYS),
+    ("duration", _EVENT_DURATION_KEYS),
+    ("details", _EVENT_DETAILS_KEYS),
+    ("mode", _EVENT_MODE_KEYS),
+    ("time", _EVENT_TIME_KEYS),
+    ("date", _EVENT_DATE_KEYS),
+    ("time_only", _EVENT_TIME_ONLY_KEYS),
+    ("freq", _EVENT_FREQ_KEYS),
+    ("site", _EVENT_SITE_KEYS),
+    ("to", ("to", "from")),
+)
+
+
+def _row_fields(row: dict) -> dict:
+    return {name: _row_value(row, keys) for name, keys in _EVENT_FIELD_GROUPS}
+
+
 def _row_to_event(row: dict, raw_line: str, fallback_ms: int) -> dict | None:
-    label = _row_value(row, _EVENT_LABEL_KEYS)
-    tgid = _normalize_tgid(_row_value(row, _EVENT_TGID_KEYS))
-    event_id = _row_value(row, _EVENT_ID_KEYS)
-    event_kind = _row_value(row, _EVENT_KIND_KEYS).lower()
-    duration_raw = _row_value(row, _EVENT_DURATION_KEYS)
-    details = _row_value(row, _EVENT_DETAILS_KEYS)
-    mode_val = _row_value(row, _EVENT_MODE_KEYS)
-    time_val = _row_value(row, _EVENT_TIME_KEYS)
-    date_val = _row_value(row, _EVENT_DATE_KEYS)
-    time_only = _row_value(row, _EVENT_TIME_ONLY_KEYS)
-    freq = _row_value(row, _EVENT_FREQ_KEYS)
-    site = _row_value(row, _EVENT_SITE_KEYS)
-    to_val = _row_value(row, ("to", "from"))
+    return _fields_to_event(_row_fields(row), raw_line, fallback_ms)
+
+
+# TO and DETAILS cells repeat across rows (a few talkgroups, a few detail
+# phrases), so their regex checks are cached per distinct value.
+@lru_cache(maxsize=1024)
+def _tgid_from_to_column(to_val: str) -> str:
+    m = _TO_TGID_PAREN_RE.search(to_val)
+    if not m:
+        m = _TO_TGID_DIGITS_RE.search(to_val)
+    return _normalize_tgid(m.group(1)) if m else ""
+
+
+@lru_cache(maxsize=1024)
+def _details_flags(details: str) -> tuple[bool, bool, bool]:
+    """``(channel_grant, encrypted, dropped)`` for a DETAILS cell."""
+    if not details:
+        return False, False, False
+    return (
+        "channel grant" in details.lower(),
+        bool(_ENCRYPTED_DETAILS_RE.search(details)),
+        bool(_DIGITAL_EVENT_DROP_RE.search(details)),
+    )
+
+
+def _fields_to_event(fields: dict, raw_line: str, fallback_ms: int) -> dict | None:
+    label = fields["label"]
+    tgid = _normalize_tgid(fields["tgid"])
+    event_id = fields["event_id"]
+    event_kind = fields["kind"].lower()
+    duration_raw = fields["duration"]
+    details = fields["details"]
+    mode_val = fields["mode"]
+    time_val = fields["time"]
+    date_val = fields["date"]
+    time_only = fields["time_only"]
+    freq = fields["freq"]
+    site = fields["site"]
+    to_val = fields["to"]
     if to_val:
         if not label:
             label = to_val
         if not tgid:
-            m = re.search(r"\((\d+)\)", to_val)
-            if not m:
-                m = re.search(r"\b(\d{3,})\b", to_val)
-            if m:
-                tgid = _normalize_tgid(m.group(1))
-
-    details_l = details.lower() if details else ""
-    is_channel_grant = "channel grant" in details_l
+            tgid = _tgid_from_to_column(to_val)
+
+    is_channel_grant, details_encrypted, details_dropped = _details_flags(details)
     include_grant_debug = _DIGITAL_DEBUG_INCLUDE_GRANTS and is_channel_grant
 
     # Call/event logs include high-volume non-audio control events (register/response/etc).
@@ -1265,13 +1593,13 @@ def _row_to_event(row: dict, raw_line: str, fallback_ms: int) -> dict | None:
     if _DIGITAL_SUPPRESS_ENCRYPTED_EVENTS and not include_grant_debug:
         if event_kind and "encrypted" in event_kind:
             return None
-        if details and re.search(r"\b(encrypt|encrypted|encryption)\b", details, re.I):
+        if details_encrypted:
             return None
     if event_kind and "data call" in event_kind and not include_grant_debug:
         return None
 
     # Drop known non-audible call log rows (rejected/encrypted control updates).
-    if details and _DIGITAL_EVENT_DROP_RE.search(details) and not include_grant_debug:
+    if details_dropped and not include_grant_debug:
         return None
 
     duration_ms = _parse_duration_ms(duration_raw)
@@ -1310,9 +1638,9 @@ def _row_to_event(row: dict, raw_line: str, fallback_ms: int) -> dict | None:
     if not label and not tgid:
         return None
 
-    mode = _coerce_mode(mode_val)
+    mode = _coerce_mode_column(mode_val)
     if not mode:
-        mode = _coerce_mode(raw_line)
+        mode = _coerce_mode_text(raw_line)
 
     event = {
         "type": "digital",
@@ -1337,6 +1665,83 @@ def _row_to_event(row: dict, raw_line: str, fallback_ms: int) -> dict | None:
     return event
 
 
+def _event_fields_encryption_hint(fields: dict) -> tuple[str, bool]:
+    event_id = fields["event_id"]
+    if not event_id:
+        return "", False
+    event_kind = fields["kind"].lower()
+    details = fields["details"]
+    encrypted = False
+    if event_kind and "encrypted" in event_kind:
+        encrypted = True
+    if _details_flags(details)[1]:
+        encrypted = True
+    return event_id, encrypted
+
+
+class _EventLogCsvParser:
+    """Row decoder for one call-event CSV header, compiled once.
+
+    Each event field's candidate columns are resolved to indexes up front,
+    so a row costs one ``csv`` split and a few list lookups instead of
+    per-cell key normalization and dict rebuilding.
+    """
+
+    def __init__(self, header: list[str]):
+        self.header = tuple(header)
+        columns: dict[str, list[int]] = {}
+        for idx, key in enumerate(self.header):
+            # Later duplicate columns win, matching dict assignment order.
+            columns.setdefault(key, []).insert(0, idx)
+        self._fields = tuple(
+            (name, tuple(tuple(columns[key]) for key in keys if key in columns))
+            for name, keys in _EVENT_FIELD_GROUPS
+        )
+
+    def _is_header_row(self, row: list[str]) -> bool:
+        if not self.header or _norm_key(row[0]) != self.header[0]:
+            return False
+        header = self.header
+        return all(
+            _norm_key(x) == (header[i] if i < len(header) else "")
+            for i, x in enumerate(row[: len(header)])
+        )
+
+    def fields(self, row: list[str]) -> dict:
+        """Same values ``_row_fields`` would return for this row."""
+        size = len(row)
+        out = {}
+        for name, chain in self._fields:
+            value = ""
+            for idxs in chain:
+                cell = ""
+                for idx in idxs:
+                    if idx < size:
+                        cell = row[idx]
+                        break
+                if cell:
+                    value = cell.strip()
+                    break
+            out[name] = value
+        return out
+
+    def rows(self, lines: list[str]):
+        """Yield ``(text, fields)`` per record; ``fields`` is None for repeated headers."""
+        texts = [text for text in (line.strip() for line in lines) if text]
+        reader = csv.reader(texts)
+        consumed = 0
+        for row in reader:
+            end = reader.line_num
+            text = texts[consumed] if end == consumed + 1 else "\n".join(texts[consumed:end])
+            consumed = end
+            if not row:
+                continue
+            if self._is_header_row(row):
+                yield text, None
+                continue
+            yield text, self.fields(row)
+
+
 def _extract_event_from_line(line: str, fallback_ms: int) -> dict | None:
     raw = (line or "").strip()
     if not raw:
@@ -1812,6 +2217,13 @@ def read_digital_talkgroups(profile_id: str, max_rows: int = 5000):
     }
 
 
+def invalidate_digital_label_cache() -> None:
+    """Drop cached talkgroup label/listen resolutions after a profile write."""
+    global _LABEL_GENERATION
+    with _LABEL_GENERATION_LOCK:
+        _LABEL_GENERATION += 1
+
+
 def write_digital_listen(profile_id: str, items: list):
     profile_dir, err = _get_profile_dir(profile_id)
     if err:
@@ -1864,9 +2276,317 @@ def write_digital_listen(profile_id: str, items: list):
         os.replace(tmp, listen_path)
     except Exception as e:
         return False, str(e)
+    invalidate_digital_label_cache()
     return True, ""
 
 
+_NO_POOL_TGID_METADATA = ("", "")
+
+
+class _LockPredictor:
+    """Control-channel lock history that steers timeslice rotation.
+
+    One visit runs from a switch onto a system to the switch away. Per
+    system it keeps lock success, time to lock and calls heard per visit;
+    per ``(system, control_hz)`` it keeps lock success and time to lock for
+    the channel the visit started on. The scheduler asks it for the next
+    system (longest-waiting first, weighted by predicted lock and call
+    activity), the starting control channel, the dwell for a busy system
+    and whether a chronically failing system should be passed over.
+    """
+
+    _EWMA_ALPHA = 0.3
+    _MAX_DWELL_FACTOR = 2.0
+    _BACKOFF_AFTER_FAILURES = 2
+    _MAX_SKIPS = 8
+
+    def __init__(self):
+        self._systems: dict[str, dict] = {}
+        self._channels: dict[tuple[str, int], dict] = {}
+        self._visit: dict | None = None
+
+    @staticmethod
+    def _key(system: str) -> str:
+        return str(system or "").strip().lower()
+
+    @classmethod
+    def _ewma(cls, current: float | None, sample: float) -> float:
+        if current is None:
+            return float(sample)
+        return float(current) + cls._EWMA_ALPHA * (float(sample) - float(current))
+
+    def _system_stats(self, system: str) -> dict:
+        key = self._key(system)
+        stats = self._systems.get(key)
+        if stats is None:
+            stats = {
+                "name": str(system or "").strip(),
+                "visits": 0,
+                "locks": 0,
+                "lock_ms": None,
+                "calls_per_visit": None,
+                "consecutive_failures": 0,
+                "skip": 0,
+                "last_visit_ms": 0,
+            }
+            self._systems[key] = stats
+        return stats
+
+    def visit_system(self) -> str:
+        return str((self._visit or {}).get("system") or "")
+
+    def start_visit(self, system: str, control_hz: int, now_ms: int) -> None:
+        self.end_visit(now_ms)
+        self._visit = {
+            "system": str(system or "").strip(),
+            "control_hz": int(control_hz or 0),
+            "started_ms": int(now_ms),
+            "locked_ms": 0,
+            "calls": 0,
+            "last_event_ms": int(now_ms),
+        }
+
+    def observe(self, *, control_time_ms: int = 0, event_times_ms: list[int] | None = None) -> int:
+        """Fold one sample into the current visit; returns time to lock when it first locks.
+
+        ``control_time_ms`` is the newest decoded control message. Only one
+        stamped after the visit started counts as a lock: the decode window
+        still holds the previous system's messages right after a switch.
+        ``event_times_ms`` are the call events buffered so far; each one newer
+        than the last counted adds a call to the visit.
+        """
+        visit = self._visit
+        if visit is None:
+            return 0
+        first_lock_ms = 0
+        control_time_ms = int(control_time_ms or 0)
+        if control_time_ms >= visit["started_ms"] and not visit["locked_ms"]:
+            visit["locked_ms"] = first_lock_ms = max(1, control_time_ms - int(visit["started_ms"]))
+        last_event_ms = visit["last_event_ms"]
+        for event_time_ms in event_times_ms or ():
+            if event_time_ms > last_event_ms:
+                visit["calls"] += 1
+                visit["last_event_ms"] = max(visit["last_event_ms"], int(event_time_ms))
+        return first_lock_ms
+
+    def end_visit(self, now_ms: int) -> None:
+        visit = self._visit
+        self._visit = None
+        if visit is None or not visit["system"]:
+            return
+        locked = bool(visit["locked_ms"])
+        stats = self._system_stats(visit["system"])
+        stats["visits"] += 1
+        stats["last_visit_ms"] = int(now_ms)
+        stats["calls_per_visit"] = self._ewma(stats["calls_per_visit"], visit["calls"])
+        if locked:
+            stats["locks"] += 1
+            stats["lock_ms"] = self._ewma(stats["lock_ms"], visit["locked_ms"])
+            stats["consecutive_failures"] = 0
+            stats["skip"] = 0
+        else:
+            stats["consecutive_failures"] += 1
+            failures = stats["consecutive_failures"] - self._BACKOFF_AFTER_FAILURES
+            if failures >= 0:
+                stats["skip"] = min(self._MAX_SKIPS, 1 << failures)
+        if visit["control_hz"] > 0:
+            key = (self._key(visit["system"]), visit["control_hz"])
+            channel = self._channels.setdefault(key, {"attempts": 0, "locks": 0, "lock_ms": None})
+            channel["attempts"] += 1
+            if locked:
+                channel["locks"] += 1
+                channel["lock_ms"] = self._ewma(channel["lock_ms"], visit["locked_ms"])
+
+    @staticmethod
+    def _lock_rate(locks: int, attempts: int) -> float:
+        # Laplace-smoothed, so one early miss does not condemn a system.
+        return (float(locks) + 1.0) / (float(attempts) + 2.0)
+
+    def order_channels(self, system: str, channels: list[int]) -> list[int]:
+        """``channels`` with the most reliable, fastest-locking first; stable otherwise."""
+        key = self._key(system)
+
+        def _rank(item: tuple[int, int]) -> tuple[float, float, int]:
+            idx, hz = item
+            stats = self._channels.get((key, int(hz or 0)))
+            if not stats:
+                return (-self._lock_rate(0, 0), 0.0, idx)
+            return (
+                -self._lock_rate(stats["locks"], stats["attempts"]),
+                float(stats["lock_ms"] or 0.0),
+                idx,
+            )
+
+        return [hz for _idx, hz in sorted(enumerate(channels), key=_rank)]
+
+    def pick_next(self, systems: list[str], current: str, now_ms: int, *, consume_skips: bool = True) -> str:
+        """Next system to visit after ``current``.
+
+        Systems never visited go first, in rotation order. Otherwise the
+        score is predicted lock rate x (1 + calls per visit) x time since the
+        last visit, so equal histories reduce to plain round robin. Backed-off
+        systems are passed over (each pass uses up one skip unless
+        ``consume_skips`` is false, as when only reporting the choice) unless
+        nothing else is left.
+        """
+        if not systems:
+            return ""
+        if current not in systems:
+            return systems[0]
+        start = systems.index(current) + 1
+        ordered = [systems[(start + i) % len(systems)] for i in range(len(systems) - 1)]
+        if not ordered:
+            return current
+        ready: list[str] = []
+        for name in ordered:
+            stats = self._systems.get(self._key(name))
+            if stats and stats["skip"] > 0:
+                if consume_skips:
+                    stats["skip"] -= 1
+                continue
+            ready.append(name)
+        if not ready:
+            return ordered[0]
+
+        def _score(name: str) -> float:
+            stats = self._systems.get(self._key(name))
+            if not stats or not stats["visits"]:
+                return math.inf
+            rate = self._lock_rate(stats["locks"], stats["visits"])
+            activity = 1.0 + float(stats["calls_per_visit"] or 0.0)
+            waited = max(1, int(now_ms) - int(stats["last_visit_ms"] or 0))
+            return rate * activity * waited
+
+        best = ready[0]
+        best_score = _score(best)
+        for name in ready[1:]:
+            score = _score(name)
+            if score > best_score:
+                best, best_score = name, score
+        return best
+
+    def dwell_ms(self, system: str, base_ms: int) -> int:
+        """``base_ms`` stretched by up to 2x for systems that carry calls."""
+        stats = self._systems.get(self._key(system))
+        calls = float((stats or {}).get("calls_per_visit") or 0.0)
+        factor = min(self._MAX_DWELL_FACTOR, 1.0 + 0.5 * calls)
+        return int(round(int(base_ms) * factor))
+
+    def snapshot(self, systems: list[str], base_dwell_ms: int) -> list[dict]:
+        rows: list[dict] = []
+        for name in systems:
+            key = self._key(name)
+            stats = self._systems.get(key) or {}
+            visits = int(stats.get("visits") or 0)
+            channels = [
+                {
+                    "control_hz": hz,
+                    "attempts": int(entry["attempts"]),
+                    "lock_rate": round(entry["locks"] / entry["attempts"], 3) if entry["attempts"] else 0.0,
+                    "avg_time_to_lock_ms": int(round(entry["lock_ms"] or 0)),
+                }
+                for (system_key, hz), entry in sorted(self._channels.items())
+                if system_key == key
+            ]
+            rows.append(
+                {
+                    "name": str(name or ""),
+                    "visits": visits,
+                    "lock_rate": round(int(stats.get("locks") or 0) / visits, 3) if visits else 0.0,
+                    "avg_time_to_lock_ms": int(round(stats.get("lock_ms") or 0)),
+                    "calls_per_visit": round(float(stats.get("calls_per_visit") or 0.0), 2),
+                    "consecutive_failures": int(stats.get("consecutive_failures") or 0),
+                    "backoff_skips": int(stats.get("skip") or 0),
+                    "dwell_ms": self.dwell_ms(name, base_dwell_ms),
+                    "channels": channels,
+                }
+            )
+        return rows
+
+
+class _KeepAliveHttpClient:
+    """One persistent HTTP/1.1 connection to a fixed endpoint.
+
+    Runtime retunes hit the same local SDRTrunk control endpoint several
+    times a second in fast-switch mode; reusing the TCP connection takes
+    connect/teardown off the switch path. A request on a reused connection
+    that the server had already closed while idle is retried once on a
+    fresh one. Timeouts and other errors are not retried: the retune may
+    already have been applied, and a second wait would double the stall on
+    the switch path. Calls are serialized.
+    """
+
+    # Errors that mean the idle connection was dead before the request got through.
+    _STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+    def __init__(self, url: str, timeout: float):
+        parsed = urllib.parse.urlsplit(url)
+        scheme = (parsed.scheme or "http").lower()
+        if scheme not in ("http", "https") or not parsed.hostname:
+            raise ValueError(f"unsupported runtime retune url: {url}")
+        self.url = url
+        self._scheme = scheme
+        self._host = parsed.hostname
+        self._port = parsed.port
+        self._path = parsed.path or "/"
+        self._query = parsed.query
+        self._timeout = float(timeout)
+        self._lock = threading.Lock()
+        self._conn: http.client.HTTPConnection | None = None
+        self._conn_used = False
+
+    def _connect(self) -> http.client.HTTPConnection:
+        cls = http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+        return cls(self._host, self._port, timeout=self._timeout)
+
+    def _close_locked(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+        self._conn = None
+        self._conn_used = False
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_locked()
+
+    def target(self, query: str = "") -> str:
+        parts = [part for part in (self._query, query) if part]
+        return f"{self._path}?{'&'.join(parts)}" if parts else self._path
+
+    def request(
+        self,
+        method: str,
+        target: str,
+        body: bytes | None,
+        headers: dict[str, str],
+    ) -> tuple[int, str, str]:
+        """``(status, reason, body_text)``; raises on connection errors."""
+        with self._lock:
+            retried = False
+            while True:
+                reused = self._conn is not None and self._conn_used
+                if self._conn is None:
+                    self._conn = self._connect()
+                try:
+                    self._conn.request(method, target, body=body, headers=headers)
+                    resp = self._conn.getresponse()
+                    # Drain the body so the connection can carry the next request.
+                    raw = resp.read()
+                except (http.client.HTTPException, OSError) as exc:
+                    self._close_locked()
+                    if reused and not retried and isinstance(exc, self._STALE_CONNECTION_ERRORS):
+                        retried = True
+                        continue
+                    raise
+                self._conn_used = True
+                if resp.will_close:
+                    self._close_locked()
+                return int(resp.status), str(resp.reason or ""), raw[:4096].decode("utf-8", errors="ignore").strip()
+
+
 class DigitalAdapter:
     """Interface for digital backends."""
     name = "base"
@@ -1910,6 +2630,9 @@ class DigitalAdapter:
     def runtime_metrics(self) -> dict:
         return {}
 
+    def recent_event_times_ms(self) -> list[int]:
+        return []
+
 
 class _BaseDigitalAdapter(DigitalAdapter):
     """Shared in-memory state for adapters."""
@@ -1925,6 +2648,8 @@ class _BaseDigitalAdapter(DigitalAdapter):
         self._recent_events = []
         self._recent_event_keys = set()
         self._recent_limit = 50
+        # Events stamped before this are log history read back on startup.
+        self._ingest_started_ms = int(time.time() * 1000)
 
     def _set_last_error(self, msg: str, time_ms: int = 0):
         self._last_error = (msg or "").strip()
@@ -1964,7 +2689,8 @@ class _BaseDigitalAdapter(DigitalAdapter):
             event = dict(event)
             event["type"] = "digital"
         event_time_ms = int(event.get("timeMs") or 0)
-        if event_time_ms <= 0:
+        stamped = event_time_ms > 0
+        if not stamped:
             event_time_ms = int(time.time() * 1000)
             event = dict(event)
             event["timeMs"] = event_time_ms
@@ -1998,12 +2724,18 @@ class _BaseDigitalAdapter(DigitalAdapter):
         event["_key"] = key
         self._recent_event_keys.add(key)
         self._recent_events.append(event)
+        if stamped and event_time_ms >= self._ingest_started_ms:
+            _METRIC_EVENT_INGEST_LAG_SECONDS.observe(max(0, int(time.time() * 1000) - event_time_ms))
         if len(self._recent_events) > self._recent_limit:
             old = self._recent_events.pop(0)
             old_key = old.get("_key")
             if old_key:
                 self._recent_event_keys.discard(old_key)
 
+    def recent_event_times_ms(self) -> list[int]:
+        """``timeMs`` of each buffered event; the buffer keeps one row per call."""
+        return [int(event.get("timeMs") or 0) for event in list(self._recent_events)]
+
     def getRecentEvents(self, limit: int = 20):
         items = list(self._recent_events)[-max(1, limit):]
         cleaned = []
@@ -2072,13 +2804,20 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
         self._profiles_dir = DIGITAL_PROFILES_DIR
         self._active_link = DIGITAL_ACTIVE_PROFILE_LINK
         self._log_path = DIGITAL_LOG_PATH
-        self._last_log_mtime = None
-        self._last_log_size = None
+        self._app_log = _LogTailFollower(self._log_path)
+        self._app_log_lock = threading.Lock()
+        # Parsed once per line: recent records for error/event scans plus
+        # lock-fail and tuner-busy timestamps for preflight summaries.
+        self._app_log_records: deque = deque(maxlen=120)
+        self._app_log_lock_fail_ms: deque = deque(maxlen=_DIGITAL_CONTROL_TAIL_LINES)
+        self._app_log_busy_hits: deque = deque(maxlen=500)
+        self._app_log_unconsumed: deque = deque(maxlen=120)
         self._event_log_dir = DIGITAL_EVENT_LOG_DIR
         self._event_log_mode = (DIGITAL_EVENT_LOG_MODE or "auto").strip().lower()
         self._event_log_tail_lines = int(DIGITAL_EVENT_LOG_TAIL_LINES or 500)
         self._event_log_offsets = {}
         self._event_log_headers = {}
+        self._event_log_parsers: dict[str, _EventLogCsvParser] = {}
         self._event_log_files_cache: list[str] = []
         self._event_log_files_cache_at = 0.0
         self._event_log_files_cache_ready = False
@@ -2097,6 +2836,8 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
         self._listen_map_profile = ""
         self._listen_map_mtime = None
         self._listen_default = bool(_DEFAULT_LISTEN_ENABLED)
+        self._label_cache_lock = threading.Lock()
+        self._label_cache_state = None
         self._refresh_lock = threading.Lock()
         self._last_refresh_monotonic = 0.0
         self._refresh_min_interval_sec = max(
@@ -2115,6 +2856,8 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
             "profile_digest": "",
             "last_retune_hz": 0,
         }
+        self._runtime_retune_client: _KeepAliveHttpClient | None = None
+        self._runtime_retune_latency = _METRIC_RETUNE_HTTP_SECONDS.labels()
         self._runtime_metrics = {
             "profile_apply_last_duration_ms": 0,
             "profile_apply_last_error": "",
@@ -2155,10 +2898,9 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
                 self._playlist_cache["last_retune_hz"] = int(last_retune_hz or 0)
 
     def _record_profile_apply_metric(self, *, started: float, changed: bool, error: str = "") -> None:
-        self._runtime_metrics["profile_apply_last_duration_ms"] = max(
-            0,
-            int(round((time.monotonic() - started) * 1000)),
-        )
+        elapsed_ms = (time.monotonic() - started) * 1000.0
+        _METRIC_PLAYLIST_APPLY_SECONDS.observe(elapsed_ms)
+        self._runtime_metrics["profile_apply_last_duration_ms"] = max(0, int(round(elapsed_ms)))
         self._runtime_metrics["profile_apply_last_error"] = str(error or "")
         self._runtime_metrics["profile_apply_last_changed"] = bool(changed)
 
@@ -2170,10 +2912,10 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
         changed: bool,
         error: str = "",
     ) -> None:
-        self._runtime_metrics["retune_last_duration_ms"] = max(
-            0,
-            int(round((time.monotonic() - started) * 1000)),
-        )
+        elapsed_ms = (time.monotonic() - started) * 1000.0
+        _METRIC_RETUNE_SECONDS.labels(method=str(method or "")).observe(elapsed_ms)
+        _METRIC_RETUNES.labels(method=str(method or ""), result="error" if error else "ok").inc()
+        self._runtime_metrics["retune_last_duration_ms"] = max(0, int(round(elapsed_ms)))
         self._runtime_metrics["retune_last_method"] = str(method or "")
         self._runtime_metrics["retune_last_error"] = str(error or "")
         self._runtime_metrics["retune_last_changed"] = bool(changed)
@@ -2214,6 +2956,7 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
             err = (result.stderr or result.stdout or "").strip() or err
         return False, err
 
+    @hot_path("digital._refresh_log_cache")
     def _refresh_log_cache(self):
         now_mono = time.monotonic()
         if (
@@ -2235,64 +2978,42 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
 
             mode = self._event_log_mode or "auto"
             mode = mode if mode in ("auto", "event_logs", "app_log") else "auto"
-            lines = []
             fallback_ms = int(time.time() * 1000)
             app_events = []
-
-            try:
-                stat = os.stat(self._log_path)
-                mtime = stat.st_mtime
-                size = stat.st_size
-            except Exception:
-                mtime = None
-                size = None
-            if mtime and size is not None:
-                if self._last_log_mtime != mtime or self._last_log_size != size:
-                    self._last_log_mtime = mtime
-                    self._last_log_size = size
-                    lines = _read_tail_lines(self._log_path)
-                if lines:
-                    fallback_ms = int(mtime * 1000) if mtime else fallback_ms
-                    if mode in ("auto", "app_log"):
-                        for line in lines:
-                            event = _extract_event_from_line(line, fallback_ms)
-                            if event:
-                                mapped = self._map_event_label(event)
-                                if mapped and mapped.get("muted"):
-                                    continue
-                                app_events.append(mapped)
-
-                    # Last error/warning (best-effort) from app log regardless of mode.
-                    last_err = None
-                    last_err_time_ms = 0
-                    last_warn = None
-                    last_warn_time_ms = 0
-                    for line in reversed(lines):
-                        raw = (line or "").strip()
-                        if not raw:
-                            continue
-                        clean = _strip_log_prefix(raw)
-                        if _is_java_stack_line(raw) or _is_java_stack_line(clean):
-                            continue
-                        if not re.search(r"(error|exception)", clean, re.I):
-                            continue
-                        line_time_ms = _parse_time_ms(raw, fallback_ms)
-                        if _is_non_fatal_error(clean):
-                            if not last_warn:
-                                last_warn = clean
-                                last_warn_time_ms = line_time_ms
-                            continue
-                        last_err = clean
-                        last_err_time_ms = line_time_ms
+            new_records = self._take_app_log_records()
+            with self._app_log_lock:
+                recent_records = list(self._app_log_records)
+            if new_records:
+                if mode in ("auto", "app_log"):
+                    for record in new_records:
+                        mapped = record["event"]
+                        if mapped and not mapped.get("muted"):
+                            app_events.append(mapped)
+
+                # Last error/warning (best-effort) from app log regardless of mode.
+                last_err = None
+                last_err_time_ms = 0
+                last_warn = None
+                last_warn_time_ms = 0
+                for record in reversed(recent_records):
+                    severity = record["severity"]
+                    if severity == "warning":
+                        if not last_warn:
+                            last_warn = record["clean"]
+                            last_warn_time_ms = record["time_ms"]
+                        continue
+                    if severity == "error":
+                        last_err = record["clean"]
+                        last_err_time_ms = record["time_ms"]
                         break
-                    if last_err:
-                        self._set_last_error(last_err, last_err_time_ms)
-                    else:
-                        self._clear_error()
-                    if last_warn:
-                        self._set_last_warning(last_warn, last_warn_time_ms)
-                    else:
-                        self._clear_warning()
+                if last_err:
+                    self._set_last_error(last_err, last_err_time_ms)
+                else:
+                    self._clear_error()
+                if last_warn:
+                    self._set_last_warning(last_warn, last_warn_time_ms)
+                else:
+                    self._clear_warning()
 
             event_log_events = []
             if mode in ("auto", "event_logs"):
@@ -2321,18 +3042,14 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
                 self._last_event_time_ms = int(latest.get("timeMs") or fallback_ms)
                 return
 
-            if mode == "app_log" and lines:
+            if mode == "app_log" and new_records and not any(
+                r["event"] and not r["event"].get("muted") for r in recent_records
+            ):
                 # Last event fallback: use last non-empty line only for app_log mode.
-                last_line = ""
-                for line in reversed(lines):
-                    if line.strip():
-                        last_line = line.strip()
-                        break
-                if not last_line:
-                    return
+                last_line = recent_records[-1]["raw"]
                 if not (_EVENT_HINT_RE.search(last_line) or _TGID_RE.search(last_line)):
                     return
-                time_ms = _parse_time_ms(last_line, fallback_ms)
+                time_ms = recent_records[-1]["time_ms"]
                 label, mode_label, _ = _extract_label_mode(last_line)
                 event = {"type": "digital", "label": label, "timeMs": time_ms, "raw": last_line}
                 if mode_label:
@@ -2344,6 +3061,48 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
         finally:
             self._refresh_lock.release()
 
+    def _take_app_log_records(self) -> list[dict]:
+        """Ingest the app log and return records not yet seen by the refresher."""
+        self._ingest_app_log()
+        with self._app_log_lock:
+            records = list(self._app_log_unconsumed)
+            self._app_log_unconsumed.clear()
+        return records
+
+    def _ingest_app_log(self) -> None:
+        """Parse lines appended to the app log since the last call, once each."""
+        with self._app_log_lock:
+            lines = self._app_log.read_new_lines()
+            if not lines:
+                return
+            mtime = self._app_log.mtime
+            fallback_ms = int(mtime * 1000) if mtime else int(time.time() * 1000)
+            for line in lines:
+                raw = (line or "").strip()
+                if not raw:
+                    continue
+                clean = _strip_log_prefix(raw)
+                time_ms = _parse_time_ms(raw, fallback_ms)
+                severity = None
+                if not (_is_java_stack_line(raw) or _is_java_stack_line(clean)) and _ERROR_LINE_RE.search(clean):
+                    severity = "warning" if _is_non_fatal_error(clean) else "error"
+                event = _extract_event_from_line(line, fallback_ms)
+                if event:
+                    event = self._map_event_label(event)
+                record = {
+                    "raw": raw,
+                    "clean": clean,
+                    "time_ms": time_ms,
+                    "severity": severity,
+                    "event": event,
+                }
+                self._app_log_records.append(record)
+                self._app_log_unconsumed.append(record)
+                if _CONTROL_LOCK_FAIL_RE.search(raw):
+                    self._app_log_lock_fail_ms.append(time_ms)
+                if _TUNER_BUSY_RE.search(raw):
+                    self._app_log_busy_hits.append({"line": raw, "timeMs": time_ms})
+
     def _list_event_log_files(self):
         now_mono = time.monotonic()
         if self._event_log_files_cache_ready:
@@ -2561,17 +3320,17 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
             if idx >= len(row):
                 break
             row_norm[key] = row[idx]
-        event_id = _row_value(row_norm, _EVENT_ID_KEYS)
-        if not event_id:
-            return "", False
-        event_kind = _row_value(row_norm, _EVENT_KIND_KEYS).lower()
-        details = _row_value(row_norm, _EVENT_DETAILS_KEYS)
-        encrypted = False
-        if event_kind and "encrypted" in event_kind:
-            encrypted = True
-        if details and re.search(r"\b(encrypt|encrypted|encryption)\b", details, re.I):
-            encrypted = True
-        return event_id, encrypted
+        return _event_fields_encryption_hint(_row_fields(row_norm))
+
+    def _event_log_parser(self, path: str) -> _EventLogCsvParser | None:
+        header = self._event_log_headers.get(path)
+        if not header:
+            return None
+        parser = self._event_log_parsers.get(path)
+        if parser is None or parser.header != tuple(header):
+            parser = _EventLogCsvParser(header)
+            self._event_log_parsers[path] = parser
+        return parser
 
     def _read_event_logs(self):
         events = []
@@ -2589,20 +3348,41 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
                 mtime = None
             fallback_ms = int(mtime * 1000) if mtime else now_ms
             blocked_event_ids: set[str] = set()
-            for line in lines:
-                hinted_event_id, hinted_encrypted = self._event_log_line_encryption_hint(line, path)
-                if (
-                    _DIGITAL_SUPPRESS_ENCRYPTED_EVENTS
-                    and hinted_encrypted
-                    and hinted_event_id
-                ):
-                    blocked_event_ids.add(str(hinted_event_id).strip())
-                event = self._parse_event_log_line(line, path, fallback_ms)
-                if event:
-                    mapped = self._map_event_label(event)
-                    if mapped and mapped.get("muted"):
+            parser = self._event_log_parser(path)
+            if parser is not None:
+                # Header known: one csv pass feeds both the hint and the event.
+                for text, fields in parser.rows(lines):
+                    if fields is None:
                         continue
-                    path_events.append(mapped)
+                    hinted_event_id, hinted_encrypted = _event_fields_encryption_hint(fields)
+                    if _DIGITAL_SUPPRESS_ENCRYPTED_EVENTS and hinted_encrypted and hinted_event_id:
+                        blocked_event_ids.add(str(hinted_event_id).strip())
+                    if _ignored_event_text(text):
+                        continue
+                    if text.startswith("{") and text.endswith("}"):
+                        event = self._parse_event_log_line(text, path, fallback_ms)
+                    else:
+                        event = _fields_to_event(fields, text, fallback_ms)
+                    if event:
+                        mapped = self._map_event_label(event)
+                        if mapped and mapped.get("muted"):
+                            continue
+                        path_events.append(mapped)
+            else:
+                for line in lines:
+                    hinted_event_id, hinted_encrypted = self._event_log_line_encryption_hint(line, path)
+                    if (
+                        _DIGITAL_SUPPRESS_ENCRYPTED_EVENTS
+                        and hinted_encrypted
+                        and hinted_event_id
+                    ):
+                        blocked_event_ids.add(str(hinted_event_id).strip())
+                    event = self._parse_event_log_line(line, path, fallback_ms)
+                    if event:
+                        mapped = self._map_event_label(event)
+                        if mapped and mapped.get("muted"):
+                            continue
+                        path_events.append(mapped)
             if _DIGITAL_SUPPRESS_ENCRYPTED_EVENTS and blocked_event_ids:
                 for item in path_events:
                     event_id = str(item.get("event_id") or "").strip()
@@ -2613,19 +3393,10 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
                 events.extend(path_events)
         return events
 
-    def _read_log_tail(self, max_lines: int | None = None):
-        max_lines = max_lines or self._event_log_tail_lines or 500
-        return _read_tail_lines(self._log_path, max_lines=max_lines)
-
-    def _detect_tuner_busy(self, lines: list) -> list:
-        hits = []
-        now_ms = int(time.time() * 1000)
-        for line in lines or []:
-            if _TUNER_BUSY_RE.search(line or ""):
-                raw = (line or "").strip()
-                ts = _parse_time_ms(raw, now_ms)
-                hits.append({"line": raw, "timeMs": ts})
-        return hits
+    def _detect_tuner_busy(self) -> list:
+        self._ingest_app_log()
+        with self._app_log_lock:
+            return list(self._app_log_busy_hits)
 
     def _decoded_message_log_files(self) -> list[str]:
         now_mono = time.monotonic()
@@ -2714,11 +3485,10 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
         lock_fail_count = 0
         last_lock_fail_ms = 0
 
-        for line in self._read_log_tail(max_lines=_DIGITAL_CONTROL_TAIL_LINES):
-            raw = (line or "").strip()
-            if not raw or not _CONTROL_LOCK_FAIL_RE.search(raw):
-                continue
-            ts = _parse_time_ms(raw, now_ms)
+        self._ingest_app_log()
+        with self._app_log_lock:
+            app_lock_fails = list(self._app_log_lock_fail_ms)
+        for ts in app_lock_fails:
             if ts > (now_ms + 120000):
                 continue
             if (now_ms - ts) > window_ms:
@@ -2801,55 +3571,58 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
                 "playlist_source_error": f"playlist not found: {playlist_path}",
                 "playlist_path": playlist_path,
             }
-        try:
-            tree = ET.parse(playlist_path)
-            root = tree.getroot()
-        except Exception as e:
-            return {
-                "playlist_source_ok": False,
-                "playlist_source_error": f"failed to parse playlist: {e}",
-                "playlist_path": playlist_path,
-            }
-        channel = root.find("channel")
-        if channel is None:
-            return {
-                "playlist_source_ok": False,
-                "playlist_source_error": "playlist has no channel node",
-                "playlist_path": playlist_path,
-            }
-        source_conf = channel.find("source_configuration")
-        if source_conf is None:
+        with _PLAYLIST_MODEL_LOCK:
+            try:
+                model = _load_playlist_model(playlist_path)
+            except Exception as e:
+                return {
+                    "playlist_source_ok": False,
+                    "playlist_source_error": f"failed to parse playlist: {e}",
+                    "playlist_path": playlist_path,
+                }
+            channel = model.channel()
+            if channel is None:
+                return {
+                    "playlist_source_ok": False,
+                    "playlist_source_error": "playlist has no channel node",
+                    "playlist_path": playlist_path,
+                }
+            source_conf = channel.find("source_configuration")
+            if source_conf is None:
+                return {
+                    "playlist_source_ok": False,
+                    "playlist_source_error": "playlist channel has no source_configuration",
+                    "playlist_path": playlist_path,
+                }
+            frequencies: list[int] = []
+            seen: set[int] = set()
+            freq_attr = str(source_conf.get("frequency", "")).strip()
+            if freq_attr.isdigit():
+                hz = int(freq_attr)
+                if hz > 0 and hz not in seen:
+                    frequencies.append(hz)
+                    seen.add(hz)
+            for node in source_conf.findall("frequency"):
+                value = str(node.text or "").strip()
+                if not value.isdigit():
+                    continue
+                hz = int(value)
+                if hz <= 0 or hz in seen:
+                    continue
+                frequencies.append(hz)
+                seen.add(hz)
+            alias_list_name = str(channel.findtext("alias_list_name") or "").strip()
             return {
-                "playlist_source_ok": False,
-                "playlist_source_error": "playlist channel has no source_configuration",
+                "playlist_source_ok": True,
                 "playlist_path": playlist_path,
+                "playlist_source_type": str(source_conf.get("source_type", "")).strip(),
+                "playlist_source_config_type": str(source_conf.get("type", "")).strip(),
+                "playlist_preferred_tuner": str(source_conf.get("preferred_tuner", "")).strip(),
+                "playlist_frequency_count": len(frequencies),
+                "playlist_frequency_hz": frequencies[:64],
+                "playlist_alias_list": alias_list_name,
+                "playlist_alias_count": len(model.alias_lists().get(alias_list_name, ())),
             }
-        frequencies: list[int] = []
-        seen: set[int] = set()
-        freq_attr = str(source_conf.get("frequency", "")).strip()
-        if freq_attr.isdigit():
-            hz = int(freq_attr)
-            if hz > 0 and hz not in seen:
-                frequencies.append(hz)
-                seen.add(hz)
-        for node in source_conf.findall("frequency"):
-            value = str(node.text or "").strip()
-            if not value.isdigit():
-                continue
-            hz = int(value)
-            if hz <= 0 or hz in seen:
-                continue
-            frequencies.append(hz)
-            seen.add(hz)
-        return {
-            "playlist_source_ok": True,
-            "playlist_path": playlist_path,
-            "playlist_source_type": str(source_conf.get("source_type", "")).strip(),
-            "playlist_source_config_type": str(source_conf.get("type", "")).strip(),
-            "playlist_preferred_tuner": str(source_conf.get("preferred_tuner", "")).strip(),
-            "playlist_frequency_count": len(frequencies),
-            "playlist_frequency_hz": frequencies[:64],
-        }
 
     def _listen_filter_summary(self) -> dict:
         profile_dir = self._read_active_profile_dir()
@@ -2894,8 +3667,7 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
         return payload
 
     def preflight(self):
-        lines = self._read_log_tail()
-        busy_hits = self._detect_tuner_busy(lines)
+        busy_hits = self._detect_tuner_busy()
         now_ms = int(time.time() * 1000)
         busy_hits = [
             hit for hit in busy_hits
@@ -2921,7 +3693,9 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
         return payload
 
     def runtime_metrics(self) -> dict:
-        return dict(self._runtime_metrics)
+        metrics = dict(self._runtime_metrics)
+        metrics["retune_http_latency_ms"] = self._runtime_retune_latency.snapshot()
+        return metrics
 
     def start(self):
         ok, err = self._systemctl(["start"])
@@ -3196,135 +3970,115 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
             self._record_profile_apply_metric(started=started, changed=False)
             return True, ""
 
-        try:
-            tree = ET.parse(playlist_path)
-            root = tree.getroot()
-        except Exception as e:
-            self._record_profile_apply_metric(
-                started=started,
-                changed=False,
-                error=f"failed to parse playlist: {e}",
-            )
-            return False, f"failed to parse playlist: {e}"
-
-        channel = root.find("channel")
-        if channel is None:
-            channel = ET.SubElement(
-                root,
-                "channel",
-                {
-                    "system": "DMR" if decoder_mode == "DMR" else "P25",
-                    "name": profile_id,
-                    "enabled": "true",
-                    "order": "1",
-                },
-            )
-
-        channel.set("enabled", "true")
-        channel.set("system", "DMR" if decoder_mode == "DMR" else "P25")
-        channel.set("name", profile_id)
-
-        event_conf = channel.find("event_log_configuration")
-        if event_conf is None:
-            event_conf = ET.SubElement(channel, "event_log_configuration")
-        existing_loggers = {
-            str(logger.text or "").strip()
-            for logger in event_conf.findall("logger")
-        }
-        for logger_name in ("CALL_EVENT", "TRAFFIC_CALL_EVENT", "DECODED_MESSAGE"):
-            if logger_name not in existing_loggers:
-                logger = ET.SubElement(event_conf, "logger")
-                logger.text = logger_name
-
-        source_conf = channel.find("source_configuration")
-        if source_conf is None:
-            source_conf = ET.SubElement(channel, "source_configuration")
-        before_channels = DigitalManager._source_configuration_channels(source_conf)
-        before_source_type = str(source_conf.get("source_type", "")).strip().upper()
-        before_preferred = str(source_conf.get("preferred_tuner", "")).strip()
-        _sync_source_configuration(source_conf, control_channels)
-
-        # Allow profile-local alias list override so sub-profiles can reuse an
-        # existing SDRTrunk alias list without requiring duplicate exports.
-        alias_list_name = profile_id.upper()
-        alias_name_path = os.path.join(profile_dir, "alias_list_name.txt")
-        if os.path.isfile(alias_name_path):
+        with _PLAYLIST_MODEL_LOCK:
             try:
-                with open(alias_name_path, "r", encoding="utf-8", errors="ignore") as f:
-                    for raw in f:
-                        value = str(raw or "").strip()
-                        if value:
-                            alias_list_name = value
-                            break
-            except Exception:
-                alias_list_name = profile_id.upper()
-
-        alias_list = channel.find("alias_list_name")
-        if alias_list is None:
-            alias_list = ET.SubElement(channel, "alias_list_name")
-        alias_list.text = alias_list_name
-        _seed_alias_list_from_profile(root, alias_list_name, profile_dir)
-        _ensure_alias_broadcast_channel(root, alias_list_name)
-
-        _apply_decode_configuration(channel, decoder_mode)
-        if channel.find("record_configuration") is None:
-            ET.SubElement(channel, "record_configuration")
-        stream_changed = _sync_stream_configuration(root)
-
-        after_channels = DigitalManager._source_configuration_channels(source_conf)
-        after_source_type = str(source_conf.get("source_type", "")).strip().upper()
-        after_preferred = str(source_conf.get("preferred_tuner", "")).strip()
-        changed = bool(
-            stream_changed
-            or before_channels != after_channels
-            or before_source_type != after_source_type
-            or before_preferred != after_preferred
-        )
+                model = _load_playlist_model(playlist_path)
+                root = model.root
+            except Exception as e:
+                self._record_profile_apply_metric(
+                    started=started,
+                    changed=False,
+                    error=f"failed to parse playlist: {e}",
+                )
+                return False, f"failed to parse playlist: {e}"
+            before = model.sections(aliases=True)
+
+            channel = model.channel()
+            if channel is None:
+                channel = ET.SubElement(
+                    root,
+                    "channel",
+                    {
+                        "system": "DMR" if decoder_mode == "DMR" else "P25",
+                        "name": profile_id,
+                        "enabled": "true",
+                        "order": "1",
+                    },
+                )
+
+            channel.set("enabled", "true")
+            channel.set("system", "DMR" if decoder_mode == "DMR" else "P25")
+            channel.set("name", profile_id)
 
-        if not changed:
+            event_conf = channel.find("event_log_configuration")
+            if event_conf is None:
+                event_conf = ET.SubElement(channel, "event_log_configuration")
+            existing_loggers = {
+                str(logger.text or "").strip()
+                for logger in event_conf.findall("logger")
+            }
+            for logger_name in ("CALL_EVENT", "TRAFFIC_CALL_EVENT", "DECODED_MESSAGE"):
+                if logger_name not in existing_loggers:
+                    logger = ET.SubElement(event_conf, "logger")
+                    logger.text = logger_name
+
+            source_conf = channel.find("source_configuration")
+            if source_conf is None:
+                source_conf = ET.SubElement(channel, "source_configuration")
+            _sync_source_configuration(source_conf, control_channels)
+
+            # Allow profile-local alias list override so sub-profiles can reuse an
+            # existing SDRTrunk alias list without requiring duplicate exports.
+            alias_list_name = profile_id.upper()
+            alias_name_path = os.path.join(profile_dir, "alias_list_name.txt")
+            if os.path.isfile(alias_name_path):
+                try:
+                    with open(alias_name_path, "r", encoding="utf-8", errors="ignore") as f:
+                        for raw in f:
+                            value = str(raw or "").strip()
+                            if value:
+                                alias_list_name = value
+                                break
+                except Exception:
+                    alias_list_name = profile_id.upper()
+
+            alias_list = channel.find("alias_list_name")
+            if alias_list is None:
+                alias_list = ET.SubElement(channel, "alias_list_name")
+            alias_list.text = alias_list_name
+            _seed_alias_list_from_profile(root, alias_list_name, profile_dir)
+            _ensure_alias_broadcast_channel(root, alias_list_name)
+
+            _apply_decode_configuration(channel, decoder_mode)
+            if channel.find("record_configuration") is None:
+                ET.SubElement(channel, "record_configuration")
+            _sync_stream_configuration(root)
+
+            # Only a real change to the channel, stream or alias sections is
+            # written; an identical tree leaves the file (and SDRTrunk) alone.
+            ok, changed, err = model.save(before)
+            if not ok:
+                self._record_profile_apply_metric(
+                    started=started,
+                    changed=False,
+                    error=f"failed to write playlist: {err}",
+                )
+                return False, f"failed to write playlist: {err}"
             self._playlist_cache_update(
                 path=playlist_path,
-                mtime_ns=playlist_mtime_ns,
+                mtime_ns=model.mtime_ns,
                 profile_digest=desired_digest,
             )
-            self._record_profile_apply_metric(started=started, changed=False)
+            self._record_profile_apply_metric(started=started, changed=changed)
             return True, ""
 
-        ok, err = _write_playlist_tree_atomic(tree, playlist_path)
-        if not ok:
-            self._record_profile_apply_metric(
-                started=started,
-                changed=False,
-                error=f"failed to write playlist: {err}",
-            )
-            return False, f"failed to write playlist: {err}"
-        self._playlist_cache_update(
-            path=playlist_path,
-            mtime_ns=self._playlist_mtime_ns(playlist_path),
-            profile_digest=desired_digest,
-        )
-        self._record_profile_apply_metric(started=started, changed=True)
-        return True, ""
-
     def _playlist_has_control_source(self) -> tuple[bool, str]:
         playlist_path = _safe_realpath(DIGITAL_PLAYLIST_PATH)
         if not playlist_path:
             return False, "digital playlist path not configured"
         if not os.path.isfile(playlist_path):
             return False, f"playlist not found: {playlist_path}"
-        try:
-            tree = ET.parse(playlist_path)
-            root = tree.getroot()
-        except Exception as e:
-            return False, f"failed to parse playlist: {e}"
-
-        channel = root.find("channel")
-        if channel is None:
-            return False, "playlist has no channel node"
-        source_conf = channel.find("source_configuration")
-        if source_conf is None:
-            return False, "playlist channel has no source_configuration"
-        return True, ""
+        with _PLAYLIST_MODEL_LOCK:
+            try:
+                model = _load_playlist_model(playlist_path)
+            except Exception as e:
+                return False, f"failed to parse playlist: {e}"
+
+            if model.channel() is None:
+                return False, "playlist has no channel node"
+            if model.source_configuration() is None:
+                return False, "playlist channel has no source_configuration"
+            return True, ""
 
     def ensure_runtime_seed(self, profile_id: str = "") -> tuple[bool, str, bool]:
         ready, reason = self._playlist_has_control_source()
@@ -3437,104 +4191,105 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
             )
             return True, ""
 
-        try:
-            tree = ET.parse(playlist_path)
-            root = tree.getroot()
-        except Exception as e:
-            self._record_retune_metric(
-                started=started,
-                method="playlist_retune",
-                changed=False,
-                error=f"failed to parse playlist: {e}",
-            )
-            return False, f"failed to parse playlist: {e}"
-
-        channel = root.find("channel")
-        if channel is None:
-            self._record_retune_metric(
-                started=started,
-                method="playlist_retune",
-                changed=False,
-                error="playlist has no channel node",
-            )
-            return False, "playlist has no channel node"
-        source_conf = channel.find("source_configuration")
-        if source_conf is None:
-            self._record_retune_metric(
-                started=started,
-                method="playlist_retune",
-                changed=False,
-                error="playlist channel has no source_configuration",
+        with _PLAYLIST_MODEL_LOCK:
+            try:
+                model = _load_playlist_model(playlist_path)
+            except Exception as e:
+                self._record_retune_metric(
+                    started=started,
+                    method="playlist_retune",
+                    changed=False,
+                    error=f"failed to parse playlist: {e}",
+                )
+                return False, f"failed to parse playlist: {e}"
+
+            channel = model.channel()
+            if channel is None:
+                self._record_retune_metric(
+                    started=started,
+                    method="playlist_retune",
+                    changed=False,
+                    error="playlist has no channel node",
+                )
+                return False, "playlist has no channel node"
+            source_conf = channel.find("source_configuration")
+            if source_conf is None:
+                self._record_retune_metric(
+                    started=started,
+                    method="playlist_retune",
+                    changed=False,
+                    error="playlist channel has no source_configuration",
+                )
+                return False, "playlist channel has no source_configuration"
+            before = model.sections()
+
+            target = str(hz)
+            changed = False
+            source_type = str(source_conf.get("source_type", "")).strip().upper()
+            source_cfg_type = str(source_conf.get("type", "")).strip()
+            frequency_nodes = list(source_conf.findall("frequency"))
+            multi_source = (
+                source_type == "TUNER_MULTIPLE_FREQUENCIES"
+                or source_cfg_type == "sourceConfigTunerMultipleFrequency"
+                or len(frequency_nodes) > 1
             )
-            return False, "playlist channel has no source_configuration"
-
-        target = str(hz)
-        changed = False
-        source_type = str(source_conf.get("source_type", "")).strip().upper()
-        source_cfg_type = str(source_conf.get("type", "")).strip()
-        frequency_nodes = list(source_conf.findall("frequency"))
-        multi_source = (
-            source_type == "TUNER_MULTIPLE_FREQUENCIES"
-            or source_cfg_type == "sourceConfigTunerMultipleFrequency"
-            or len(frequency_nodes) > 1
-        )
 
-        if multi_source:
-            # Multi-frequency tuner sources are modeled as repeated <frequency>
-            # nodes. Writing a scalar "frequency" attribute can break SDRTrunk
-            # deserialization (expects List<Long>), so keep list-only shape.
-            if "frequency" in source_conf.attrib:
-                del source_conf.attrib["frequency"]
-                changed = True
-            if not frequency_nodes:
-                node = ET.SubElement(source_conf, "frequency")
-                node.text = target
-                changed = True
+            if multi_source:
+                # Multi-frequency tuner sources are modeled as repeated <frequency>
+                # nodes. Writing a scalar "frequency" attribute can break SDRTrunk
+                # deserialization (expects List<Long>), so keep list-only shape.
+                if "frequency" in source_conf.attrib:
+                    del source_conf.attrib["frequency"]
+                    changed = True
+                if not frequency_nodes:
+                    node = ET.SubElement(source_conf, "frequency")
+                    node.text = target
+                    changed = True
+                else:
+                    for node in frequency_nodes:
+                        if str(node.text or "").strip() != target:
+                            node.text = target
+                            changed = True
             else:
-                for node in frequency_nodes:
-                    if str(node.text or "").strip() != target:
-                        node.text = target
-                        changed = True
-        else:
-            if str(source_conf.get("frequency", "")).strip() != target:
-                source_conf.set("frequency", target)
-                changed = True
+                if str(source_conf.get("frequency", "")).strip() != target:
+                    source_conf.set("frequency", target)
+                    changed = True
+
+            if not changed:
+                self._playlist_cache_update(
+                    path=playlist_path,
+                    mtime_ns=playlist_mtime_ns,
+                    last_retune_hz=hz,
+                )
+                self._record_retune_metric(
+                    started=started,
+                    method="playlist_retune",
+                    changed=False,
+                )
+                return True, ""
 
-        if not changed:
+            ok, _written, err = model.save(before)
+            if not ok:
+                self._record_retune_metric(
+                    started=started,
+                    method="playlist_retune",
+                    changed=False,
+                    error=f"failed to write playlist: {err}",
+                )
+                return False, f"failed to write playlist: {err}"
             self._playlist_cache_update(
                 path=playlist_path,
-                mtime_ns=playlist_mtime_ns,
+                mtime_ns=model.mtime_ns,
                 last_retune_hz=hz,
             )
             self._record_retune_metric(
                 started=started,
                 method="playlist_retune",
-                changed=False,
+                changed=True,
+                error=runtime_err if runtime_attempted and runtime_err else "",
             )
             return True, ""
 
-        ok, err = _write_playlist_tree_atomic(tree, playlist_path)
-        if not ok:
-            self._record_retune_metric(
-                started=started,
-                method="playlist_retune",
-                changed=False,
-                error=f"failed to write playlist: {err}",
-            )
-            return False, f"failed to write playlist: {err}"
-        self._playlist_cache_update(
-            path=playlist_path,
-            mtime_ns=self._playlist_mtime_ns(playlist_path),
-            last_retune_hz=hz,
-        )
-        self._record_retune_metric(
-            started=started,
-            method="playlist_retune",
-            changed=True,
-            error=runtime_err if runtime_attempted and runtime_err else "",
-        )
-        return True, ""
-
     def _runtime_retune_control_frequency(
         self,
         freq_mhz: float,
@@ -3583,13 +4338,21 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
         if method not in ("POST", "PUT", "PATCH", "GET"):
             return False, f"unsupported runtime retune method: {method}"
 
+        client = self._runtime_retune_client
+        if client is None or client.url != endpoint:
+            if client is not None:
+                client.close()
+            try:
+                client = _KeepAliveHttpClient(endpoint, _DIGITAL_RUNTIME_RETUNE_TIMEOUT_SEC)
+            except ValueError as e:
+                return False, str(e)
+            self._runtime_retune_client = client
+
         data = None
-        url = endpoint
-        headers = {"Accept": "application/json"}
+        target = client.target()
+        headers = {"Accept": "application/json", "Connection": "keep-alive"}
         if method == "GET":
-            query = urllib.parse.urlencode(payload)
-            sep = "&" if "?" in endpoint else "?"
-            url = f"{endpoint}{sep}{query}"
+            target = client.target(urllib.parse.urlencode(payload))
         else:
             data = json.dumps(payload).encode("utf-8")
             headers["Content-Type"] = "application/json"
@@ -3598,17 +4361,16 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
         if token:
             headers["Authorization"] = f"Bearer {token}"
 
-        request = urllib.request.Request(url, data=data, headers=headers, method=method)
+        started = time.monotonic()
         try:
-            with urllib.request.urlopen(request, timeout=_DIGITAL_RUNTIME_RETUNE_TIMEOUT_SEC) as resp:
-                status = int(getattr(resp, "status", 200) or 200)
-                body = (resp.read(4096) or b"").decode("utf-8", errors="ignore").strip()
-        except urllib.error.HTTPError as e:
-            detail = str((e.read(4096) or b"").decode("utf-8", errors="ignore").strip() or e.reason or "")
-            return False, f"runtime retune http {e.code}: {detail}".strip()
+            status, reason, body = client.request(method, target, data, headers)
         except Exception as e:
             return False, f"runtime retune http failed: {e}"
+        finally:
+            self._runtime_retune_latency.observe((time.monotonic() - started) * 1000.0)
 
+        if status >= 400:
+            return False, f"runtime retune http {status}: {body or reason}".strip()
         if status < 200 or status >= 300:
             return False, f"runtime retune http status {status}"
 
@@ -3779,6 +4541,66 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
         self._listen_default = bool(default_listen)
         return self._listen_map
 
+    def _label_resolution_state(self) -> dict:
+        """Talkgroup/listen maps plus per-tgid resolutions for this generation.
+
+        Profile files are only re-stat'ed once per revalidation interval; the
+        tgid cache is dropped when the label generation is bumped or when a
+        reload actually produced different maps.
+        """
+        now = time.monotonic()
+        generation = _LABEL_GENERATION
+        with self._label_cache_lock:
+            state = self._label_cache_state
+            if (
+                state is not None
+                and state["generation"] == generation
+                and now - state["checked_at"] < _LABEL_CACHE_REVALIDATE_SEC
+            ):
+                return state
+            tg_map = self._load_talkgroup_map()
+            tg_group_map = self._tg_group_map if isinstance(self._tg_group_map, dict) else {}
+            listen_map = self._load_listen_map()
+            maps = (tg_map, tg_group_map, listen_map, bool(self._listen_default))
+            if (
+                state is None
+                or state["generation"] != generation
+                or any(new is not old for new, old in zip(maps[:3], state["maps"][:3]))
+                or maps[3] != state["maps"][3]
+            ):
+                state = {"generation": generation, "maps": maps, "tgids": {}, "checked_at": now}
+                self._label_cache_state = state
+            else:
+                state["checked_at"] = now
+            return state
+
+    @staticmethod
+    def _resolve_tgid(state: dict, tgid: str) -> tuple[bool, str, str, str, bool]:
+        """``(known, label, agency, department, listen)`` for ``tgid``."""
+        resolved = state["tgids"].get(tgid)
+        if resolved is not None:
+            return resolved
+        tg_map, tg_group_map, listen_map, listen_default = state["maps"]
+        mapped_label = str(tg_map.get(tgid) or "").strip()
+        mapped_group = str(tg_group_map.get(tgid) or "").strip()
+        label = ""
+        if mapped_label or mapped_group:
+            label = _combine_agency_department_label(mapped_group, mapped_label)
+        listen = listen_map.get(tgid, listen_default) if listen_map else listen_default
+        resolved = (tgid in tg_map, label, mapped_group, mapped_label, bool(listen))
+        if len(state["tgids"]) < _LABEL_CACHE_MAX_TGIDS:
+            state["tgids"][tgid] = resolved
+        return resolved
+
+    @staticmethod
+    def _apply_tgid_label(event: dict, resolved: tuple[bool, str, str, str, bool]) -> None:
+        _known, label, agency, department, _listen = resolved
+        event["label"] = label
+        if agency:
+            event["agency"] = agency
+        if department:
+            event["department"] = department
+
     def _map_event_label(self, event: dict) -> dict:
         if not event:
             return event
@@ -3786,8 +4608,8 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
         label = str(event.get("label") or "").strip()
         raw = str(event.get("raw") or "")
         tgid = str(event.get("tgid") or "").strip()
-        tg_map = self._load_talkgroup_map()
-        tg_group_map = self._tg_group_map if isinstance(self._tg_group_map, dict) else {}
+        state = self._label_resolution_state()
+        tg_map, tg_group_map, _listen_map, listen_default = state["maps"]
         if not tgid:
             if label:
                 tgid = _extract_tgid(label)
@@ -3800,25 +4622,16 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
                 return event
             event = dict(event)
             event["tgid"] = tgid
-            mapped_label = str(tg_map.get(tgid) or "").strip()
-            mapped_group = str(tg_group_map.get(tgid) or "").strip()
-            if mapped_label or mapped_group:
-                event["label"] = _combine_agency_department_label(
-                    mapped_group,
-                    mapped_label,
-                    fallback=str(event.get("label") or "").strip() or f"TG {tgid}",
-                )
-                if mapped_group:
-                    event["agency"] = mapped_group
-                if mapped_label:
-                    event["department"] = mapped_label
+            resolved = self._resolve_tgid(state, tgid)
+            if resolved[1]:
+                self._apply_tgid_label(event, resolved)
             current = str(event.get("label") or "").strip()
             if current == f"({tgid})":
                 current = ""
             if not current:
                 event["label"] = f"TG {tgid}"
             return event
-        if tgid and tg_map and tgid not in tg_map:
+        if tgid and tg_map and not self._resolve_tgid(state, tgid)[0]:
             event = dict(event)
             event["muted"] = True
             event["tgid"] = tgid
@@ -3826,38 +4639,24 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
         if not tg_map and not tg_group_map:
             return event
         if not tgid:
-            if not self._listen_default:
+            if not listen_default:
                 event = dict(event)
                 event["muted"] = True
             return event
-        if tgid:
-            listen_map = self._load_listen_map()
-            listen = listen_map.get(tgid, self._listen_default) if listen_map else self._listen_default
-            if not listen:
-                event = dict(event)
-                event["muted"] = True
-                event["tgid"] = tgid
-                return event
-            event = dict(event)
-            event["tgid"] = tgid
-            mapped_label = str(tg_map.get(tgid) or "").strip()
-            mapped_group = str(tg_group_map.get(tgid) or "").strip()
-            if mapped_label or mapped_group:
-                event["label"] = _combine_agency_department_label(
-                    mapped_group,
-                    mapped_label,
-                    fallback=str(event.get("label") or "").strip() or f"TG {tgid}",
-                )
-                if mapped_group:
-                    event["agency"] = mapped_group
-                if mapped_label:
-                    event["department"] = mapped_label
-            else:
-                current = str(event.get("label") or "").strip()
-                if re.fullmatch(r"\(?\d+\)?", current):
-                    event["label"] = f"TG {tgid}"
-                elif not current:
-                    event["label"] = f"TG {tgid}"
+        resolved = self._resolve_tgid(state, tgid)
+        event = dict(event)
+        event["tgid"] = tgid
+        if not resolved[4]:
+            event["muted"] = True
+            return event
+        if resolved[1]:
+            self._apply_tgid_label(event, resolved)
+        else:
+            current = str(event.get("label") or "").strip()
+            if re.fullmatch(r"\(?\d+\)?", current):
+                event["label"] = f"TG {tgid}"
+            elif not current:
+                event["label"] = f"TG {tgid}"
         return event
 
     def getProfile(self):
@@ -3923,6 +4722,7 @@ class SdrtrunkAdapter(_BaseDigitalAdapter):
         self._tg_map_mtime = None
         self._listen_map_profile = ""
         self._listen_map_mtime = None
+        invalidate_digital_label_cache()
         self._event_log_files_cache = []
         self._event_log_files_cache_at = 0.0
         self._event_log_files_cache_ready = False
@@ -4018,6 +4818,14 @@ class DigitalManager:
         self._scheduler_pool_site_to_system: dict[str, str] = {}
         self._scheduler_pool_talkgroup_labels: dict[str, dict[str, str]] = {}
         self._scheduler_pool_talkgroup_groups: dict[str, dict[str, str]] = {}
+        # ScanPoolSnapshot whose prebuilt tgid indexes back _pool_tgid_metadata.
+        self._scheduler_pool_lookup = None
+        # Pool version the _scheduler_pool_* maps were derived from.
+        self._scheduler_pool_version: int | None = None
+        self._scheduler_pool_systems: list[str] = []
+        self._scheduler_lock_predictor = _LockPredictor()
+        # Control channel the last scheduler apply tuned to (0 when unknown).
+        self._scheduler_visit_control_hz = 0
         self._scheduler_active_system = ""
         self._scheduler_last_switch_time_ms = 0
         self._scheduler_switch_reason = "manual"
@@ -4066,6 +4874,11 @@ class DigitalManager:
         self._super_profile_seed_error = ""
         self._scheduler_lock = threading.Lock()
         self._scheduler_stop = threading.Event()
+        # Set by wake_scheduler(): new event, lock-state or config change.
+        self._scheduler_wake = threading.Event()
+        self._scheduler_next_deadline_ms = 0
+        self._scheduler_sleep_until_ms = 0
+        self._scheduler_wake_reason = ""
         self._apply_scheduler_perf_profile_locked(
             self._scheduler_perf_profile,
             update_tick_interval=False,
@@ -4087,8 +4900,12 @@ class DigitalManager:
             daemon=True,
         )
         self._scheduler_thread.start()
+        subscribe_scan_pool_changes(self._on_scan_pool_changed)
         self._scheduler_tick()
 
+    def _on_scan_pool_changed(self) -> None:
+        self.wake_scheduler("scan_pool")
+
     @staticmethod
     def _build_adapter(backend: str):
         if backend in ("sdrtrunk",):
@@ -4226,45 +5043,13 @@ class DigitalManager:
         return ""
 
     def _pool_tgid_metadata(self, tgid: str, site_id: str = "") -> tuple[str, str]:
-        token = _normalize_tgid(tgid)
-        if not token:
-            return "", ""
-        with self._scheduler_lock:
-            labels_by_system = {
-                str(name or "").strip(): dict(values or {})
-                for name, values in (self._scheduler_pool_talkgroup_labels or {}).items()
-                if str(name or "").strip()
-            }
-            groups_by_system = {
-                str(name or "").strip(): dict(values or {})
-                for name, values in (self._scheduler_pool_talkgroup_groups or {}).items()
-                if str(name or "").strip()
-            }
-            site_to_system = {
-                str(k or "").strip(): str(v or "").strip()
-                for k, v in (self._scheduler_pool_site_to_system or {}).items()
-                if str(k or "").strip() and str(v or "").strip()
-            }
-
-        site_token = str(site_id or "").strip()
-        if site_token and site_token in site_to_system:
-            scoped_system = site_to_system.get(site_token) or ""
-            if scoped_system:
-                department = str((labels_by_system.get(scoped_system) or {}).get(token) or "").strip()
-                agency = str((groups_by_system.get(scoped_system) or {}).get(token) or "").strip()
-                if agency or department:
-                    return agency, department
-
-        system_names = set(labels_by_system.keys()) | set(groups_by_system.keys())
-        candidates: set[tuple[str, str]] = set()
-        for system_name in system_names:
-            department = str((labels_by_system.get(system_name) or {}).get(token) or "").strip()
-            agency = str((groups_by_system.get(system_name) or {}).get(token) or "").strip()
-            if agency or department:
-                candidates.add((agency, department))
-        if len(candidates) == 1:
-            return next(iter(candidates))
-        return "", ""
+        # The lookup is swapped wholesale on pool discovery, so no lock is needed.
+        lookup = self._scheduler_pool_lookup
+        tgid = _normalize_tgid(tgid)
+        if lookup is None or not tgid:
+            return _NO_POOL_TGID_METADATA
+        label, group = lookup.lookup_tgid(tgid, str(site_id or "").strip() or None)
+        return group, label
 
     def _enrich_event_label_for_active_system(self, event: dict) -> dict:
         if not isinstance(event, dict):
@@ -4494,6 +5279,10 @@ class DigitalManager:
         if not isinstance(snapshot, dict):
             snapshot = {}
         with self._scheduler_lock:
+            previous = getattr(self, "_preflight_snapshot", {}) or {}
+            lock_changed = bool(previous) and (
+                bool(previous.get("control_channel_locked")) != bool(snapshot.get("control_channel_locked"))
+            )
             self._preflight_snapshot = dict(snapshot)
             self._preflight_snapshot_at_ms = now_ms
             # Keep legacy scheduler cache fields in sync for backward
@@ -4501,12 +5290,23 @@ class DigitalManager:
             self._scheduler_cached_preflight = dict(snapshot)
             self._scheduler_cached_preflight_at_ms = now_ms
             self._scheduler_last_preflight_cache_age_ms = 0
+        if lock_changed:
+            self.wake_scheduler("lock_change")
         return dict(snapshot)
 
     def _preflight_sampler_loop(self) -> None:
         wait_sec = max(0.25, float(self._preflight_sampler_ms) / 1000.0)
+        last_event_ms = 0
         while not self._preflight_sampler_stop.wait(wait_sec):
             self._sample_preflight_snapshot()
+            try:
+                event_ms = int((self._adapter.getLastEvent() or {}).get("timeMs") or 0)
+            except Exception:
+                event_ms = 0
+            if event_ms > last_event_ms:
+                if last_event_ms > 0:
+                    self.wake_scheduler("event")
+                last_event_ms = event_ms
 
     def _cached_preflight_snapshot(self) -> tuple[dict, int]:
         now_ms = int(time.time() * 1000)
@@ -4665,29 +5465,106 @@ class DigitalManager:
             self._scheduler_perf_profile or _DEFAULT_DIGITAL_PERF_PROFILE
         )
         snapshot["digital_scheduler_effective"] = dict(self._scheduler_effective_settings_locked())
+        snapshot["digital_scheduler_lock_stats"] = self._scheduler_lock_predictor.snapshot(
+            list(self._scheduler_systems),
+            int(self._scheduler_dwell_ms),
+        )
         if self._scheduler_last_apply_error:
             snapshot["digital_scheduler_last_apply_error"] = str(self._scheduler_last_apply_error)
         return snapshot
 
+    def _scheduler_next_deadline_ms_locked(
+        self,
+        *,
+        now_ms: int,
+        mode: str,
+        systems: list[str],
+        event_time_ms: int,
+        metric_ready: bool,
+        control_locked: bool,
+        lock_timeout_ms: int,
+        fast_switch_active: bool,
+        dwell_ms: int | None = None,
+    ) -> int:
+        """Wall-clock ms at which the next switch decision is due, or 0 if none is.
+
+        Only a multi-system timeslice has timed decisions: the end of a hang
+        (pause-on-hit) window, the dwell on a locked system, or the lock
+        timeout on an unlocked one. Fast-switch lock-miss counting needs
+        consecutive samples, so it is polled at the tick interval. Without
+        the preflight sampler nothing pushes lock-state or event changes, so
+        the tick interval also caps every deadline.
+        """
+        if mode != "timeslice_multi_system" or len(systems) < 2 or not self._scheduler_active_system:
+            return 0
+        sample_ms = max(50, int(round(float(self._scheduler_tick_interval_sec_locked()) * 1000)))
+        if (
+            self._scheduler_pause_on_hit
+            and event_time_ms > 0
+            and (now_ms - event_time_ms) <= self._scheduler_hang_ms
+        ):
+            deadline = event_time_ms + int(self._scheduler_hang_ms) + 1
+        elif not control_locked:
+            if fast_switch_active and metric_ready:
+                return now_ms + sample_ms
+            deadline = int(self._scheduler_last_switch_time_ms or 0) + int(lock_timeout_ms)
+        else:
+            if dwell_ms is None:
+                dwell_ms = int(self._scheduler_dwell_ms)
+            deadline = int(self._scheduler_last_switch_time_ms or 0) + int(dwell_ms)
+        if not bool(getattr(self, "_status_snapshot_enabled", False)):
+            deadline = min(deadline, now_ms + sample_ms)
+        return max(now_ms, deadline)
+
+    def _scheduler_wait_sec_locked(self, now_ms: int) -> float:
+        idle_sec = max(float(self._scheduler_tick_interval_sec_locked()), _DIGITAL_SCHEDULER_IDLE_WAKE_SEC)
+        deadline_ms = int(getattr(self, "_scheduler_next_deadline_ms", 0) or 0)
+        if deadline_ms <= 0:
+            return idle_sec
+        return max(0.05, min(idle_sec, (deadline_ms - now_ms) / 1000.0))
+
+    def wake_scheduler(self, reason: str = "") -> None:
+        """Run the scheduler now instead of at its next deadline."""
+        self._scheduler_wake_reason = str(reason or "")
+        wake = getattr(self, "_scheduler_wake", None)
+        if wake is not None:
+            wake.set()
+
     def _scheduler_tick(self):
+        started = time.perf_counter()
         try:
             preflight = self._scheduler_preflight() or {}
             event = self.getLastEvent() or {}
+            event_times_ms = self._recent_event_times_ms()
             with self._scheduler_lock:
-                payload = self._scheduler_payload(event, preflight)
+                payload = self._scheduler_payload(event, preflight, event_times_ms)
                 snapshot = self._scheduler_snapshot_payload_locked(event, preflight, payload)
                 self._scheduler_snapshot = dict(snapshot)
                 self._scheduler_snapshot_at_ms = int(time.time() * 1000)
+                deadline_ms = int(self._scheduler_next_deadline_ms or 0)
+                sleep_until_ms = int(getattr(self, "_scheduler_sleep_until_ms", 0) or 0)
         except Exception:
             return
+        finally:
+            _METRIC_SCHEDULER_TICK_SECONDS.observe((time.perf_counter() - started) * 1000.0)
+        # A tick from a request thread (config or profile change) can move the
+        # deadline earlier than the one the loop is sleeping towards.
+        if 0 < deadline_ms < sleep_until_ms:
+            self.wake_scheduler("deadline")
 
     def _scheduler_loop(self):
-        while True:
+        while not self._scheduler_stop.is_set():
+            now_ms = int(time.time() * 1000)
             with self._scheduler_lock:
-                interval_sec = max(0.05, float(self._scheduler_tick_interval_sec_locked()))
-                self._scheduler_last_tick_interval_ms = int(round(interval_sec * 1000))
-            if self._scheduler_stop.wait(interval_sec):
+                wait_sec = self._scheduler_wait_sec_locked(now_ms)
+                self._scheduler_last_tick_interval_ms = int(round(wait_sec * 1000))
+                self._scheduler_sleep_until_ms = now_ms + int(wait_sec * 1000)
+            self._scheduler_wake.wait(wait_sec)
+            if self._scheduler_stop.is_set():
                 return
+            self._scheduler_wake.clear()
+            with self._scheduler_lock:
+                self._scheduler_sleep_until_ms = 0
             self._scheduler_tick()
 
     def _scheduler_state_payload(self) -> dict:
@@ -5073,7 +5950,11 @@ class DigitalManager:
                 channels.append(hz)
         return channels
 
-    def _discover_scheduler_pool_systems(self, pool_snapshot: dict | None = None) -> list[str]:
+    def _discover_scheduler_pool_systems(
+        self,
+        pool_snapshot: dict | None = None,
+        pool_lookup=None,
+    ) -> list[str]:
         systems: list[str] = []
         seen: set[str] = set()
         self._scheduler_pool_system_channels = {}
@@ -5084,6 +5965,7 @@ class DigitalManager:
         self._scheduler_pool_site_to_system = {}
         self._scheduler_pool_talkgroup_labels = {}
         self._scheduler_pool_talkgroup_groups = {}
+        self._scheduler_pool_lookup = None
         pool = pool_snapshot if isinstance(pool_snapshot, dict) else {}
         if not isinstance(pool, dict):
             return []
@@ -5138,6 +6020,7 @@ class DigitalManager:
                 self._scheduler_pool_talkgroup_labels[name] = talkgroup_labels
             if talkgroup_groups:
                 self._scheduler_pool_talkgroup_groups[name] = talkgroup_groups
+        self._scheduler_pool_lookup = pool_lookup
         return systems
 
     def _discover_profile_local_systems(self, profile_id: str) -> list[str]:
@@ -5277,13 +6160,15 @@ class DigitalManager:
         *,
         force: bool = False,
     ) -> tuple[bool, str, bool]:
-        self._scheduler_last_apply_method = "playlist_apply"
+        # Replaced below by the path that completed the apply.
+        self._scheduler_last_apply_method = "playlist_failed"
         if self._super_profile_mode:
             return False, "scheduler playlist apply disabled in super profile mode", False
         now_ms = int(time.time() * 1000)
         if not force:
             delta = now_ms - int(self._scheduler_last_apply_attempt_ms or 0)
             if delta >= 0 and delta < _DIGITAL_SCHEDULER_APPLY_MIN_INTERVAL_MS:
+                self._scheduler_last_apply_method = "playlist_skipped"
                 return True, "", False
         self._scheduler_last_apply_attempt_ms = now_ms
 
@@ -5303,26 +6188,6 @@ class DigitalManager:
             self._scheduler_last_apply_error_system = system_name
             return False, self._scheduler_last_apply_error, False
 
-        try:
-            tree = ET.parse(playlist_path)
-            root = tree.getroot()
-        except Exception as e:
-            self._scheduler_last_apply_error = f"failed to parse playlist: {e}"
-            self._scheduler_last_apply_error_system = system_name
-            return False, self._scheduler_last_apply_error, False
-
-        channel = root.find("channel")
-        if channel is None:
-            self._scheduler_last_apply_error = "playlist has no channel node"
-            self._scheduler_last_apply_error_system = system_name
-            return False, self._scheduler_last_apply_error, False
-        source_conf = channel.find("source_configuration")
-        if source_conf is None:
-            source_conf = ET.SubElement(channel, "source_configuration")
-
-        before_channels = self._source_configuration_channels(source_conf)
-        before_source_type = str(source_conf.get("source_type", "")).strip().upper()
-        before_preferred = str(source_conf.get("preferred_tuner", "")).strip()
         preferred = _preferred_tuner_target()
         expected_source_type = (
             "TUNER_MULTIPLE_FREQUENCIES"
@@ -5364,62 +6229,60 @@ class DigitalManager:
                 and int(cache.get("mtime_ns") or 0) == int(playlist_mtime_ns or 0)
                 and str(cache.get("profile_digest") or "") == desired_digest
             ):
+                self._scheduler_last_apply_method = "playlist_cached"
                 self._scheduler_last_applied_system = system_name
                 self._scheduler_last_apply_time_ms = now_ms
                 self._scheduler_last_apply_error = ""
                 self._scheduler_last_apply_error_system = ""
                 return True, "", False
 
-        source_unchanged = (
-            before_channels == channels
-            and before_source_type == expected_source_type
-            and before_preferred == preferred
-        )
-        stream_changed = _sync_stream_configuration(root)
-
-        if source_unchanged and not stream_changed:
+        with _PLAYLIST_MODEL_LOCK:
+            try:
+                model = _load_playlist_model(playlist_path)
+            except Exception as e:
+                self._scheduler_last_apply_error = f"failed to parse playlist: {e}"
+                self._scheduler_last_apply_error_system = system_name
+                return False, self._scheduler_last_apply_error, False
+
+            channel = model.channel()
+            if channel is None:
+                self._scheduler_last_apply_error = "playlist has no channel node"
+                self._scheduler_last_apply_error_system = system_name
+                return False, self._scheduler_last_apply_error, False
+            before = model.sections()
+            source_conf = channel.find("source_configuration")
+            if source_conf is None:
+                source_conf = ET.SubElement(channel, "source_configuration")
+
+            source_unchanged = (
+                self._source_configuration_channels(source_conf) == channels
+                and str(source_conf.get("source_type", "")).strip().upper() == expected_source_type
+                and str(source_conf.get("preferred_tuner", "")).strip() == preferred
+            )
+            _sync_stream_configuration(model.root)
+            if not source_unchanged:
+                _sync_source_configuration(source_conf, channels)
+            ok, written, err = model.save(before)
+            if not ok:
+                self._scheduler_last_apply_error = f"failed to write playlist: {err}"
+                self._scheduler_last_apply_error_system = system_name
+                return False, self._scheduler_last_apply_error, False
+            self._scheduler_last_apply_method = "playlist_write" if written else "playlist_unchanged"
             if callable(playlist_cache_update_fn):
                 try:
                     playlist_cache_update_fn(
                         path=playlist_path,
-                        mtime_ns=playlist_mtime_ns,
+                        mtime_ns=model.mtime_ns if written else playlist_mtime_ns,
                         profile_digest=desired_digest,
                     )
                 except Exception:
                     pass
-            self._scheduler_last_applied_system = system_name
-            self._scheduler_last_apply_time_ms = now_ms
-            self._scheduler_last_apply_error = ""
-            self._scheduler_last_apply_error_system = ""
-            return True, "", False
-
-        if not source_unchanged:
-            _sync_source_configuration(source_conf, channels)
-        ok, err = _write_playlist_tree_atomic(tree, playlist_path)
-        if not ok:
-            self._scheduler_last_apply_error = f"failed to write playlist: {err}"
-            self._scheduler_last_apply_error_system = system_name
-            return False, self._scheduler_last_apply_error, False
-        if callable(playlist_cache_update_fn):
-            try:
-                mtime_after = 0
-                if callable(playlist_mtime_fn):
-                    mtime_after = int(playlist_mtime_fn(playlist_path) or 0)
-                else:
-                    mtime_after = int(os.stat(playlist_path).st_mtime_ns)
-                playlist_cache_update_fn(
-                    path=playlist_path,
-                    mtime_ns=mtime_after,
-                    profile_digest=desired_digest,
-                )
-            except Exception:
-                pass
 
         self._scheduler_last_applied_system = system_name
         self._scheduler_last_apply_time_ms = now_ms
         self._scheduler_last_apply_error = ""
         self._scheduler_last_apply_error_system = ""
-        return True, "", True
+        return True, "", written
 
     def _apply_scheduler_retune(
         self,
@@ -5461,6 +6324,7 @@ class DigitalManager:
                 health["last_lock_loss_time_ms"] = now_ms
             return False, self._scheduler_last_apply_error, False
 
+        self._scheduler_visit_control_hz = int(round(control_freq * 1_000_000.0))
         ok, err = self._adapter.retune_control_frequency(control_freq)
         if not ok:
             msg = str(err or f"retune failed for {system_name}")
@@ -5496,7 +6360,10 @@ class DigitalManager:
         channels = self._resolve_scheduler_system_control_channels(profile_id, system_name)
         fallback_reason = ""
         if channels:
+            # Start on the channel that has locked most reliably for this system.
+            channels = self._scheduler_lock_predictor.order_channels(system_name, channels)
             control_hz = int(channels[0] or 0)
+            self._scheduler_visit_control_hz = control_hz
             control_mhz = float(control_hz) / 1_000_000.0 if control_hz > 0 else 0.0
             if math.isfinite(control_mhz) and control_mhz > 0.0:
                 ok, err = self._adapter.retune_control_frequency(control_mhz)
@@ -5536,6 +6403,7 @@ class DigitalManager:
         *,
         force: bool = False,
     ) -> tuple[bool, str, bool]:
+        self._scheduler_visit_control_hz = 0
         fast_ready = (
             self._scheduler_fast_switch_enabled
             and str(self._scheduler_mode or "") == "timeslice_multi_system"
@@ -5570,10 +6438,11 @@ class DigitalManager:
         try:
             return self._apply_scheduler_target(profile_id, system_name, force=force)
         finally:
-            self._scheduler_last_apply_duration_ms = max(
-                0,
-                int(round((time.monotonic() - started) * 1000)),
-            )
+            elapsed_ms = (time.monotonic() - started) * 1000.0
+            _METRIC_SCHEDULER_APPLY_SECONDS.labels(
+                method=str(self._scheduler_last_apply_method or ""),
+            ).observe(elapsed_ms)
+            self._scheduler_last_apply_duration_ms = max(0, int(round(elapsed_ms)))
 
     def getScheduler(self) -> dict:
         now_ms = int(time.time() * 1000)
@@ -5757,14 +6626,22 @@ class DigitalManager:
             self._scheduler_system_health = {}
             self._write_scheduler_state()
 
+        self.wake_scheduler("config")
         snapshot = self.getScheduler()
         return True, "", snapshot
 
     def _discover_scheduler_systems(self, profile_id: str) -> list[str]:
         scan_mode = get_current_scan_mode()
         if scan_mode in {"hp", "expert"}:
-            pool_snapshot = get_active_scan_pool_snapshot(force_refresh=True)
-            pool_systems = self._discover_scheduler_pool_systems(pool_snapshot=pool_snapshot)
+            version = get_scan_pool_version()
+            if version is None or version != self._scheduler_pool_version:
+                pool_snapshot = get_active_scan_pool_snapshot(force_refresh=True)
+                self._scheduler_pool_systems = self._discover_scheduler_pool_systems(
+                    pool_snapshot=pool_snapshot,
+                    pool_lookup=get_active_scan_pool_lookup(),
+                )
+                self._scheduler_pool_version = version
+            pool_systems = list(self._scheduler_pool_systems)
             if not self._scheduler_order:
                 return pool_systems
             rank = {
@@ -5799,6 +6676,9 @@ class DigitalManager:
         self._scheduler_pool_site_to_system = {}
         self._scheduler_pool_talkgroup_labels = {}
         self._scheduler_pool_talkgroup_groups = {}
+        self._scheduler_pool_lookup = None
+        self._scheduler_pool_version = None
+        self._scheduler_pool_systems = []
         systems: list[str] = list(self._discover_profile_local_systems(profile_id))
         seen: set[str] = {str(name).strip().lower() for name in systems if str(name).strip()}
 
@@ -5893,7 +6773,28 @@ class DigitalManager:
         idx = systems.index(current)
         return systems[(idx + 1) % len(systems)]
 
-    def _scheduler_payload(self, event: dict, preflight: dict) -> dict:
+    def _scheduler_next_system_locked(self, mode: str, systems: list[str], active_system: str, now_ms: int) -> str:
+        """System the scheduler would switch to next, for status payloads."""
+        if len(systems) <= 1:
+            return active_system
+        if mode == "timeslice_multi_system":
+            return self._scheduler_lock_predictor.pick_next(
+                systems,
+                active_system,
+                now_ms,
+                consume_skips=False,
+            )
+        return self._next_system(systems, active_system)
+
+    def _recent_event_times_ms(self) -> list[int]:
+        try:
+            times = self._adapter.recent_event_times_ms()
+        except Exception:
+            return []
+        return times if isinstance(times, list) else []
+
+    @hot_path("digital._scheduler_payload")
+    def _scheduler_payload(self, event: dict, preflight: dict, event_times_ms: list[int] | None = None) -> dict:
         now_ms = int(time.time() * 1000)
         profile_id = str(self.getProfile() or "").strip()
         scan_mode = get_current_scan_mode()
@@ -5949,8 +6850,22 @@ class DigitalManager:
         if self._scheduler_pause_on_hit and recent_event:
             self._scheduler_in_call_hold = True
 
+        predictor = self._scheduler_lock_predictor
+        timeslice_active = mode == "timeslice_multi_system" and len(systems) > 1
+        if timeslice_active and predictor.visit_system() == self._scheduler_active_system:
+            control_time_ms = int(preflight.get("control_last_time_ms") or 0)
+            time_to_lock_ms = predictor.observe(
+                control_time_ms=control_time_ms if metric_ready and control_locked else 0,
+                event_times_ms=event_times_ms if event_times_ms is not None else [event_time_ms],
+            )
+            if time_to_lock_ms:
+                _METRIC_LOCK_ACQUIRE_SECONDS.labels(
+                    system=str(self._scheduler_active_system or ""),
+                ).observe(time_to_lock_ms)
+        dwell_ms = predictor.dwell_ms(self._scheduler_active_system, self._scheduler_dwell_ms)
+
         lock_miss_ticks = 0
-        if mode == "timeslice_multi_system" and len(systems) > 1 and self._scheduler_active_system:
+        if timeslice_active and self._scheduler_active_system:
             lock_miss_ticks = self._scheduler_track_lock_miss_locked(
                 active_system=str(self._scheduler_active_system or ""),
                 metric_ready=metric_ready,
@@ -5982,16 +6897,18 @@ class DigitalManager:
                     ):
                         should_switch = True
                         switch_reason = "lock_timeout"
-                elif elapsed_ms >= self._scheduler_dwell_ms:
+                elif elapsed_ms >= dwell_ms:
                     should_switch = True
                     switch_reason = "idle_timeout"
                 if should_switch:
                     previous = str(self._scheduler_active_system or "")
-                    candidate = self._next_system(
+                    candidate = predictor.pick_next(
                         systems,
                         self._scheduler_active_system,
+                        now_ms,
                     )
                     if candidate:
+                        _METRIC_SCHEDULER_SWITCHES.labels(reason=switch_reason).inc()
                         self._scheduler_active_system = candidate
                         self._scheduler_last_switch_time_ms = now_ms
                         self._scheduler_switch_reason = switch_reason
@@ -6040,10 +6957,26 @@ class DigitalManager:
                         active_system = recovery_system
             elif pending_reason:
                 self._scheduler_switch_reason = pending_reason
+            if timeslice_active:
+                predictor.start_visit(active_system, self._scheduler_visit_control_hz, now_ms)
+                dwell_ms = predictor.dwell_ms(active_system, self._scheduler_dwell_ms)
+        if not timeslice_active:
+            predictor.end_visit(now_ms)
 
-        next_system = self._next_system(systems, active_system) if len(systems) > 1 else active_system
+        next_system = self._scheduler_next_system_locked(mode, systems, active_system, now_ms)
         voice_tuner_available = bool(DIGITAL_RTL_SERIAL_SECONDARY and not preflight.get("tuner_busy"))
         effective_settings = self._scheduler_effective_settings_locked()
+        self._scheduler_next_deadline_ms = self._scheduler_next_deadline_ms_locked(
+            now_ms=now_ms,
+            mode=mode,
+            systems=systems,
+            event_time_ms=event_time_ms,
+            metric_ready=metric_ready,
+            control_locked=control_locked,
+            lock_timeout_ms=lock_timeout_ms,
+            fast_switch_active=fast_switch_active,
+            dwell_ms=dwell_ms,
+        )
 
         payload = {
             "digital_scan_mode": configured_mode,
@@ -6076,6 +7009,7 @@ class DigitalManager:
                 now_ms - int(getattr(self, "_scheduler_snapshot_at_ms", 0) or 0),
             ) if int(getattr(self, "_scheduler_snapshot_at_ms", 0) or 0) > 0 else 0,
             "digital_scheduler_lock_miss_ticks": int(lock_miss_ticks),
+            "digital_scheduler_next_deadline_ms": int(self._scheduler_next_deadline_ms or 0),
             "digital_scheduler_perf_profile": str(effective_settings.get("performance_profile") or ""),
             "digital_scheduler_effective": dict(effective_settings),
         }
@@ -6150,7 +7084,7 @@ class DigitalManager:
         mode = str(self._scheduler_mode or "single_system")
         if mode not in {"single_system", "timeslice_multi_system"}:
             mode = "single_system"
-        next_system = self._next_system(systems, active_system) if len(systems) > 1 else active_system
+        next_system = self._scheduler_next_system_locked(mode, systems, active_system, now_ms)
         fast_switch_active = self._scheduler_fast_mode_enabled_locked(mode, systems)
         profile_id = str(self.getProfile() or "").strip()
         lock_timeout_ms = self._scheduler_lock_timeout_ms_locked(
@@ -6237,6 +7171,7 @@ class DigitalManager:
             payload["digital_scheduler_last_apply_error"] = str(self._scheduler_last_apply_error)
         return payload
 
+    @hot_path("digital.status_payload")
     def status_payload(self):
         event = self.getLastEvent() or {}
         label = str(event.get("label") or "")
@@ -6447,6 +7382,7 @@ class DigitalManager:
     def __del__(self):
         try:
             self._scheduler_stop.set()
+            self._scheduler_wake.set()
         except Exception:
             pass
 
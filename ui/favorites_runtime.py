@@ -612,9 +612,10 @@ def sync_scan_pool_to_digital_runtime(force: bool = False) -> dict[str, Any]:
             pass
 
         try:
-            from .digital import get_digital_manager
+            from .digital import get_digital_manager, invalidate_digital_label_cache
         except ImportError:
-            from ui.digital import get_digital_manager
+            from ui.digital import get_digital_manager, invalidate_digital_label_cache
+        invalidate_digital_label_cache()
         manager = get_digital_manager()
         current_profile = str(manager.getProfile() or "").strip()
         should_switch = current_profile != _MANAGED_DIGITAL_ID
@@ -90,6 +90,10 @@ try:
     )
     from .systemd import unit_active, unit_exists, restart_rtl, unit_active_enter_epoch
     from .server_workers import enqueue_action, enqueue_apply
+    from .sse_hub import SseDeltaChannel, SseHub
+    from . import metrics
+    from . import profiling
+    from .stream_fanout import HttpStreamSource, ProcessStreamSource, attach_stream
     from .diagnostic import write_diagnostic_log
     from .spectrum import get_spectrum_bins, spectrum_to_json, start_spectrum
     from .system_stats import get_system_stats
@@ -182,6 +186,10 @@ except ImportError:
     )
     from ui.systemd import unit_active, unit_exists, restart_rtl, unit_active_enter_epoch
     from ui.server_workers import enqueue_action, enqueue_apply
+    from ui.sse_hub import SseDeltaChannel, SseHub
+    from ui import metrics
+    from ui import profiling
+    from ui.stream_fanout import HttpStreamSource, ProcessStreamSource, attach_stream
     from ui.diagnostic import write_diagnostic_log
     from ui.spectrum import get_spectrum_bins, spectrum_to_json, start_spectrum
     from ui.system_stats import get_system_stats
@@ -270,6 +278,10 @@ _HITS_CACHE_TTL_SEC = max(0.1, float(os.getenv("HITS_CACHE_TTL_SEC", "1.0")))
 _UNIT_ACTIVE_CACHE_TTL_SEC = max(0.1, float(os.getenv("UNIT_ACTIVE_CACHE_TTL_SEC", "1.0")))
 _UNIT_EXISTS_CACHE_TTL_SEC = max(2.0, float(os.getenv("UNIT_EXISTS_CACHE_TTL_SEC", "30")))
 HIT_LIST_MAX_AGE_SEC = max(60, int(os.getenv("HIT_LIST_MAX_AGE_SEC", "1800")))
+SSE_TICK_SEC = max(0.25, float(os.getenv("SSE_TICK_SEC", "1.0")))
+SSE_HEARTBEAT_SEC = max(SSE_TICK_SEC, float(os.getenv("SSE_HEARTBEAT_SEC", "5.0")))
+SSE_CLIENT_MAX_QUEUED_FRAMES = max(4, int(os.getenv("SSE_CLIENT_MAX_QUEUED_FRAMES", "64")))
+SSE_HITS_BACKLOG = max(10, int(os.getenv("SSE_HITS_BACKLOG", "300")))
 STREAM_PROXY_READ_TIMEOUT_SEC = max(120.0, float(os.getenv("STREAM_PROXY_READ_TIMEOUT_SEC", "600")))
 HP_STATE_SYNC_WAIT_SEC = max(0.0, float(os.getenv("HP_STATE_SYNC_WAIT_SEC", "3.0")))
 _HP_STATE_SYNC_COND = threading.Condition()
@@ -288,6 +300,8 @@ try:
 except Exception:
     STREAM_PROXY_TRANSCODE_SAMPLE_RATE_HZ = 24000
 STREAM_PROXY_TRANSCODE_SAMPLE_RATE_HZ = max(8000, min(48000, STREAM_PROXY_TRANSCODE_SAMPLE_RATE_HZ))
+STREAM_FANOUT_RING_CHUNKS = max(16, int(os.getenv("STREAM_FANOUT_RING_CHUNKS", "512")))
+STREAM_FANOUT_LINGER_SEC = max(0.0, float(os.getenv("STREAM_FANOUT_LINGER_SEC", "3")))
 LATENCY_TONE_DEFAULT_MOUNT = (
     os.getenv("LATENCY_TONE_DEFAULT_MOUNT", "latency-tone.mp3").strip().lstrip("/") or "latency-tone.mp3"
 )
@@ -1566,6 +1580,7 @@ def _health_worst_state(states: list[str]) -> str:
     return "healthy" if norm in ("healthy", "ok", "good") else norm
 
 
+@profiling.hot_path("handlers._build_health_payload")
 def _build_health_payload(
     *,
     status_payload: dict,
@@ -1814,9 +1829,11 @@ def _clone_hit_items(items: list[dict]) -> list[dict]:
     return [dict(item or {}) for item in (items or [])]
 
 
+@profiling.hot_path("handlers._build_hits_payload")
 def _build_hits_payload(limit: int = 50) -> dict:
     limit = max(1, int(limit or 50))
     scan_limit = max(50, limit)
+    min_ts = time.time() - float(HIT_LIST_MAX_AGE_SEC)
 
     airband_conf = read_active_config_path()
     ground_conf = os.path.realpath(GROUND_CONFIG_PATH)
@@ -1832,7 +1849,7 @@ def _build_hits_payload(limit: int = 50) -> dict:
     airband_labels = _resolve_analog_label_map(airband_conf, profile_airband, profiles_airband)
     ground_labels = _resolve_analog_label_map(ground_conf, profile_ground, profiles_ground)
     items = _annotate_analog_hits(
-        read_hit_list_cached(limit=scan_limit),
+        read_hit_list_cached(limit=scan_limit, since_ts=min_ts),
         airband_labels,
         ground_labels,
     )
@@ -1885,6 +1902,8 @@ def _build_hits_payload(limit: int = 50) -> dict:
         duration_ms = max(0, _safe_int(event.get("durationMs")) or 0)
         time_ms = int(event.get("timeMs") or 0)
         ts = time_ms / 1000.0 if time_ms else time.time()
+        if ts < min_ts:
+            continue
         time_str = time.strftime("%H:%M:%S", time.localtime(ts))
         digital_items.append({
             "time": time_str,
@@ -1904,12 +1923,6 @@ def _build_hits_payload(limit: int = 50) -> dict:
 
     merged = items + digital_items
     merged = _dedupe_hit_rows(merged, window_sec=2.0)
-    now_ts = time.time()
-    min_ts = now_ts - float(HIT_LIST_MAX_AGE_SEC)
-    merged = [
-        item for item in merged
-        if float(item.get("_ts") or 0.0) >= min_ts
-    ]
     merged.sort(key=lambda item: item.get("_ts", 0.0))
     merged = merged[-scan_limit:]
     merged.reverse()
@@ -1949,6 +1962,251 @@ def _get_hits_payload_cached(limit: int = 50) -> dict:
     return {"items": items}
 
 
+def _build_sse_events() -> list[tuple[str, dict]]:
+    """Build one status/spectrum/hits snapshot for the shared SSE hub."""
+    controls_snapshot = _read_effective_analog_controls()
+    airband_gain = controls_snapshot["airband_gain"]
+    airband_snr = controls_snapshot["airband_snr"]
+    airband_dbfs = controls_snapshot["airband_dbfs"]
+    airband_mode = controls_snapshot["airband_mode"]
+    rtl_unit_active = _unit_active_cached(UNITS["rtl"])
+    ground_unit_active = _unit_active_cached(UNITS["ground"])
+    combined_info = combined_device_summary()
+    ground_present = combined_info.get("ground") is not None
+    rtl_active = rtl_unit_active
+    ground_active = rtl_active and ground_present
+    ice_ok = _unit_active_cached(UNITS["icecast"])
+    analog_stream_mount = str(PLAYER_MOUNT or "").strip().lstrip("/")
+    digital_stream_mount = str(DIGITAL_STREAM_MOUNT or "").strip().lstrip("/")
+    if ice_ok:
+        try:
+            status_text = fetch_local_icecast_status()
+            analog_stream_mount = _resolve_analog_stream_mount(status_text)
+            digital_stream_mount = _resolve_digital_stream_mount(status_text)
+        except Exception:
+            analog_stream_mount = str(PLAYER_MOUNT or "").strip().lstrip("/")
+            digital_stream_mount = str(DIGITAL_STREAM_MOUNT or "").strip().lstrip("/")
+    # Keep SSE hits aligned with the full UI hit list so digital
+    # rows are not dropped by top-10 truncation during busy analog traffic.
+    hits_payload = _get_hits_payload_cached(limit=50)
+    hit_items = hits_payload.get("items") or []
+    last_hit = hit_items[0].get("freq") if hit_items else (read_last_hit_airband() or read_last_hit_ground())
+    last_hit_airband_label = ""
+    last_hit_ground_label = ""
+    for item in hit_items:
+        src = str(item.get("source") or "").strip().lower()
+        label = str(item.get("label_full") or item.get("label") or "").strip()
+        if src == "airband" and label and not last_hit_airband_label:
+            last_hit_airband_label = label
+        if src == "ground" and label and not last_hit_ground_label:
+            last_hit_ground_label = label
+        if last_hit_airband_label and last_hit_ground_label:
+            break
+    digital_payload = {
+        "digital_active": False,
+        "digital_profile": "",
+        "digital_last_label": "",
+        "digital_last_time": 0,
+    }
+    try:
+        digital_payload = dict(get_digital_manager().status_payload() or {})
+    except Exception:
+        digital_payload = {
+            "digital_active": False,
+            "digital_profile": "",
+            "digital_last_label": "",
+            "digital_last_time": 0,
+        }
+    mixer_enabled, mixer_active = _digital_mixer_runtime_state()
+    digital_payload["digital_mixer_enabled"] = bool(mixer_enabled)
+    digital_payload["digital_mixer_active"] = bool(mixer_active)
+    status_data = {
+        "type": "status",
+        "rtl_active": rtl_active,
+        "ground_active": ground_active,
+        "icecast_active": ice_ok,
+        "ground_unit_active": ground_unit_active,
+        "combined_config_stale": combined_config_stale(),
+        "gain": float(airband_gain),
+        "squelch": float(airband_snr),
+        "squelch_mode": airband_mode,
+        "squelch_snr": float(airband_snr),
+        "squelch_dbfs": float(airband_dbfs),
+        "last_hit": last_hit,
+        "last_hit_airband_label": _short_label(last_hit_airband_label, max_len=48),
+        "last_hit_ground_label": _short_label(last_hit_ground_label, max_len=48),
+        "stream_mount": analog_stream_mount,
+        "digital_stream_mount": digital_stream_mount,
+        "server_time": time.time(),
+        "hp_avoids": get_scan_mode_controller().get_hp_avoids(),
+        "sb3_connected_status_refresh_sec": int(SB3_CONNECTED_STATUS_REFRESH_SEC),
+        "sb3_connected_system_refresh_sec": int(SB3_CONNECTED_SYSTEM_REFRESH_SEC),
+        "sb3_connected_profiles_refresh_sec": int(SB3_CONNECTED_PROFILES_REFRESH_SEC),
+        "sb3_dedicated_digital_fetch_enabled": bool(SB3_DEDICATED_DIGITAL_FETCH_ENABLED),
+    }
+    status_data.update(digital_payload)
+    spectrum_data = {
+        "type": "spectrum",
+        "bins": [],
+        "timestamp": time.time(),
+        "note": "stats_filepath not supported in rtl_airband v5.1.1"
+    }
+    hits_data = {
+        "type": "hits",
+        "items": hit_items,
+    }
+    return [("status", status_data), ("spectrum", spectrum_data), ("hits", hits_data)]
+
+
+_METRIC_SSE_BUILD_SECONDS = metrics.REGISTRY.histogram(
+    "scanner_ui_sse_build_seconds",
+    "Time to build one status/spectrum/hits snapshot for the SSE hub.",
+)
+_METRIC_STATUS_BUILD_SECONDS = metrics.REGISTRY.histogram(
+    "scanner_ui_status_build_seconds",
+    "Time to build an uncached /api/status payload.",
+)
+_METRIC_STATUS_REQUESTS = metrics.REGISTRY.counter(
+    "scanner_ui_status_requests",
+    "/api/status requests by whether the short-lived cache answered them.",
+    ("cache",),
+)
+
+
+def _build_sse_events_timed() -> list[tuple[str, dict]]:
+    with _METRIC_SSE_BUILD_SECONDS.time():
+        return _build_sse_events()
+
+
+_SSE_HUB = SseHub(
+    _build_sse_events_timed,
+    interval_sec=SSE_TICK_SEC,
+    heartbeat_sec=SSE_HEARTBEAT_SEC,
+    max_client_frames=SSE_CLIENT_MAX_QUEUED_FRAMES,
+    # Hits go out as numbered row deltas so quiet bands cost nothing and
+    # reconnecting clients can replay what they missed.
+    delta_channels=[SseDeltaChannel("hits", _hit_row_key, backlog_size=SSE_HITS_BACKLOG)],
+)
+
+
+def _sanitize_stream_mount(mount_name: str) -> str:
+    """Return a safe Icecast mount name, defaulting to the player mount."""
+    mount = unquote(str(mount_name or "")).strip().lstrip("/")
+    if not mount:
+        mount = str(PLAYER_MOUNT or "").strip().lstrip("/")
+    if not mount:
+        return ""
+    if "/" in mount or "\\" in mount:
+        return ""
+    for ch in mount:
+        if not (ch.isalnum() or ch in "._-"):
+            return ""
+    return mount
+
+
+def _stream_transcode_enabled(mount: str, transcode: bool | None) -> bool:
+    if transcode is None:
+        # Favor pass-through for lower live latency; allow opt-in analog
+        # transcoding for clients that cannot decode low-rate source MP3.
+        return STREAM_PROXY_TRANSCODE_ANALOG_DEFAULT and "digital" not in mount.lower()
+    return bool(transcode)
+
+
+def _stream_transcode_cmd(upstream: str) -> list[str]:
+    """ffmpeg command re-encoding an Icecast mount to stdout."""
+    # Desktop browser compatibility path for low-rate analog streams.
+    # Re-encode to a widely-supported MP3 profile.
+    return [
+        "ffmpeg",
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-fflags",
+        "nobuffer",
+        "-flags",
+        "low_delay",
+        "-probesize",
+        "32768",
+        "-analyzeduration",
+        "0",
+        "-f",
+        "mp3",
+        "-i",
+        upstream,
+        "-vn",
+        "-ac",
+        "1",
+        "-ar",
+        str(STREAM_PROXY_TRANSCODE_SAMPLE_RATE_HZ),
+        "-c:a",
+        "libmp3lame",
+        "-b:a",
+        f"{STREAM_PROXY_TRANSCODE_BITRATE_KBPS}k",
+        "-write_xing",
+        "0",
+        "-flush_packets",
+        "1",
+        "-f",
+        "mp3",
+        "pipe:1",
+    ]
+
+
+# icy-metaint is left out: metadata offsets are per upstream connection and
+# would be wrong for listeners joining a shared stream mid-way.
+_STREAM_PASSTHROUGH_HEADERS = (
+    "icy-name",
+    "icy-genre",
+    "icy-description",
+    "icy-br",
+    "ice-audio-info",
+)
+
+
+def _stream_profile_key(mount: str, transcode_enabled: bool) -> tuple[str, str]:
+    if transcode_enabled:
+        return (
+            mount,
+            f"mp3-{STREAM_PROXY_TRANSCODE_BITRATE_KBPS}k-{STREAM_PROXY_TRANSCODE_SAMPLE_RATE_HZ}hz",
+        )
+    return (mount, "passthrough")
+
+
+def _attach_shared_stream(mount: str, transcode_enabled: bool, on_data=None):
+    """Attach to the one upstream reader/encoder for this mount and profile."""
+    upstream = f"http://127.0.0.1:{ICECAST_PORT}/{mount}"
+    if transcode_enabled:
+        def opener():
+            return ProcessStreamSource(_stream_transcode_cmd(upstream))
+    else:
+        def opener():
+            # Use a long read timeout for low-traffic mounts so mobile clients
+            # do not see frequent stream teardowns during quiet periods.
+            return HttpStreamSource(upstream, STREAM_PROXY_READ_TIMEOUT_SEC, _STREAM_PASSTHROUGH_HEADERS)
+    # Keep proxy chunks small so low-bitrate streams flush frequently
+    # enough for embedded browser players.
+    return attach_stream(
+        _stream_profile_key(mount, transcode_enabled),
+        opener,
+        STREAM_PROXY_CHUNK_BYTES,
+        ring_chunks=STREAM_FANOUT_RING_CHUNKS,
+        linger_sec=STREAM_FANOUT_LINGER_SEC,
+        on_data=on_data,
+    )
+
+
+def _parse_last_event_id(headers, qs: dict[str, list[str]]) -> int | None:
+    """SSE resume id from the Last-Event-ID header or ``last_event_id`` query."""
+    raw = str(headers.get("Last-Event-ID") or "").strip()
+    if not raw:
+        raw = str((qs.get("last_event_id") or [""])[0] or "").strip()
+    try:
+        return int(raw) if raw else None
+    except ValueError:
+        return None
+
+
 class Handler(BaseHTTPRequestHandler):
     """HTTP request handler for the UI."""
 
@@ -1962,6 +2220,26 @@ class Handler(BaseHTTPRequestHandler):
             body = body.encode("utf-8")
         self.wfile.write(body)
 
+    def _send_cached(self, body, etag: str | None, ctype="application/json; charset=utf-8"):
+        """Send a 200 response the browser may keep and revalidate by ETag."""
+        if not etag:
+            return self._send(200, body, ctype)
+        self.send_response(200)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Cache-Control", "private, no-cache")
+        self.send_header("ETag", etag)
+        self.end_headers()
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.wfile.write(body)
+
+    def _send_not_modified(self, etag: str):
+        """Answer a matching If-None-Match without a body."""
+        self.send_response(304)
+        self.send_header("Cache-Control", "private, no-cache")
+        self.send_header("ETag", etag)
+        self.end_headers()
+
     def _send_redirect(self, location: str, code: int = 302):
         """Send a redirect response."""
         self.send_response(code)
@@ -1979,17 +2257,7 @@ class Handler(BaseHTTPRequestHandler):
         self.end_headers()
 
     def _sanitize_mount_name(self, mount_name: str) -> str:
-        mount = unquote(str(mount_name or "")).strip().lstrip("/")
-        if not mount:
-            mount = str(PLAYER_MOUNT or "").strip().lstrip("/")
-        if not mount:
-            return ""
-        if "/" in mount or "\\" in mount:
-            return ""
-        for ch in mount:
-            if not (ch.isalnum() or ch in "._-"):
-                return ""
-        return mount
+        return _sanitize_stream_mount(mount_name)
 
     @staticmethod
     def _parse_optional_bool_query(qs: dict[str, list[str]], key: str) -> bool | None:
@@ -2008,144 +2276,66 @@ class Handler(BaseHTTPRequestHandler):
             if head_only:
                 return self._send_head(400)
             return self._send(400, "invalid mount", "text/plain; charset=utf-8")
-        transcode_enabled = False
         if not head_only:
-            if transcode is None:
-                # Favor pass-through for lower live latency; allow opt-in analog
-                # transcoding for clients that cannot decode low-rate source MP3.
-                transcode_enabled = (
-                    STREAM_PROXY_TRANSCODE_ANALOG_DEFAULT and "digital" not in mount.lower()
-                )
-            else:
-                transcode_enabled = bool(transcode)
+            return self._relay_shared_stream(mount, _stream_transcode_enabled(mount, transcode))
         upstream = f"http://127.0.0.1:{ICECAST_PORT}/{mount}"
-        headers_sent = False
-        if transcode_enabled:
-            proc = None
-            try:
-                # Desktop browser compatibility path for low-rate analog streams.
-                # Re-encode to a widely-supported MP3 profile.
-                cmd = [
-                    "ffmpeg",
-                    "-nostdin",
-                    "-hide_banner",
-                    "-loglevel",
-                    "error",
-                    "-fflags",
-                    "nobuffer",
-                    "-flags",
-                    "low_delay",
-                    "-probesize",
-                    "32768",
-                    "-analyzeduration",
-                    "0",
-                    "-f",
-                    "mp3",
-                    "-i",
-                    upstream,
-                    "-vn",
-                    "-ac",
-                    "1",
-                    "-ar",
-                    str(STREAM_PROXY_TRANSCODE_SAMPLE_RATE_HZ),
-                    "-c:a",
-                    "libmp3lame",
-                    "-b:a",
-                    f"{STREAM_PROXY_TRANSCODE_BITRATE_KBPS}k",
-                    "-write_xing",
-                    "0",
-                    "-flush_packets",
-                    "1",
-                    "-f",
-                    "mp3",
-                    "pipe:1",
-                ]
-                proc = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.DEVNULL,
-                )
-                self.send_response(200)
-                self.send_header("Content-Type", "audio/mpeg")
-                self.send_header("Cache-Control", "no-store")
-                self.send_header("Access-Control-Allow-Origin", "*")
-                self.send_header("Connection", "close")
-                self.end_headers()
-                headers_sent = True
-                if not proc.stdout:
-                    return
-                while True:
-                    chunk = proc.stdout.read(STREAM_PROXY_CHUNK_BYTES)
-                    if not chunk:
-                        break
-                    self.wfile.write(chunk)
-                    self.wfile.flush()
-                return
-            except FileNotFoundError:
-                if headers_sent:
-                    return
-                return self._send(500, "ffmpeg not found", "text/plain; charset=utf-8")
-            except (BrokenPipeError, ConnectionResetError):
-                return
-            finally:
-                if proc and proc.poll() is None:
-                    proc.terminate()
         req = Request(
             upstream,
             headers={
                 "User-Agent": "airband-ui/stream-proxy",
                 "Connection": "close",
             },
-            # Icecast can reject HEAD on mounts; use GET for both and suppress body on HEAD.
+            # Icecast can reject HEAD on mounts; use GET and suppress the body.
             method="GET",
         )
         try:
-            # Use a long read timeout for low-traffic mounts so mobile clients
-            # do not see frequent stream teardowns during quiet periods.
             with urlopen(req, timeout=STREAM_PROXY_READ_TIMEOUT_SEC) as upstream_resp:
                 self.send_response(200)
                 self.send_header("Content-Type", upstream_resp.headers.get("Content-Type") or "audio/mpeg")
                 self.send_header("Cache-Control", "no-store")
                 self.send_header("Access-Control-Allow-Origin", "*")
                 self.send_header("Connection", "close")
-                for header in (
-                    "icy-name",
-                    "icy-genre",
-                    "icy-description",
-                    "icy-br",
-                    "icy-metaint",
-                    "ice-audio-info",
-                ):
+                for header in _STREAM_PASSTHROUGH_HEADERS:
                     value = upstream_resp.headers.get(header)
                     if value:
                         self.send_header(header, value)
                 self.end_headers()
-                headers_sent = True
-                if head_only:
-                    return
-                while True:
-                    # Keep proxy chunks small so low-bitrate streams flush
-                    # frequently enough for embedded browser players.
-                    chunk = upstream_resp.read(STREAM_PROXY_CHUNK_BYTES)
-                    if not chunk:
-                        break
-                    self.wfile.write(chunk)
-                    self.wfile.flush()
         except HTTPError as e:
-            status = int(e.code or 502)
-            if headers_sent:
-                return
-            if head_only:
-                return self._send_head(status)
-            return self._send(status, f"upstream error: {e.reason}", "text/plain; charset=utf-8")
+            return self._send_head(int(e.code or 502))
+        except (URLError, TimeoutError):
+            return self._send_head(502)
+        except (BrokenPipeError, ConnectionResetError):
+            return
+
+    def _relay_shared_stream(self, mount: str, transcode_enabled: bool):
+        """Copy a shared upstream broadcaster to this client."""
+        try:
+            cursor = _attach_shared_stream(mount, transcode_enabled)
+        except FileNotFoundError:
+            return self._send(500, "ffmpeg not found", "text/plain; charset=utf-8")
+        except HTTPError as e:
+            return self._send(int(e.code or 502), f"upstream error: {e.reason}", "text/plain; charset=utf-8")
         except (URLError, TimeoutError) as e:
-            if headers_sent:
-                return
-            if head_only:
-                return self._send_head(502)
             return self._send(502, f"upstream unavailable: {e}", "text/plain; charset=utf-8")
+        try:
+            self.send_response(200)
+            for name, value in cursor.headers:
+                self.send_header(name, value)
+            self.send_header("Cache-Control", "no-store")
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            while True:
+                chunks = cursor.read(timeout=STREAM_PROXY_READ_TIMEOUT_SEC)
+                if chunks is None:
+                    break
+                for chunk in chunks:
+                    self.wfile.write(chunk)
+                self.wfile.flush()
         except (BrokenPipeError, ConnectionResetError):
             return
+        finally:
+            cursor.close()
 
     def do_HEAD(self):
         """Handle HEAD requests."""
@@ -2333,12 +2523,15 @@ class Handler(BaseHTTPRequestHandler):
             text_filter = str((q.get("q") or [""])[0] or "").strip()
             try:
                 wizard = HPFavoritesWizard()
+                etag = wizard.etag(f"{p}?{u.query}")
+                if etag and etag in str(self.headers.get("If-None-Match") or ""):
+                    return self._send_not_modified(etag)
                 if p == "/api/hp/favorites-wizard/countries":
                     payload = {
                         "ok": True,
                         "countries": wizard.get_countries(),
                     }
-                    return self._send(200, json.dumps(payload), "application/json; charset=utf-8")
+                    return self._send_cached(json.dumps(payload), etag)
 
                 if p == "/api/hp/favorites-wizard/states":
                     country_id = _query_int("country_id", default=1, required=False)
@@ -2346,7 +2539,7 @@ class Handler(BaseHTTPRequestHandler):
                         "ok": True,
                         "states": wizard.get_states(country_id=int(country_id or 1)),
                     }
-                    return self._send(200, json.dumps(payload), "application/json; charset=utf-8")
+                    return self._send_cached(json.dumps(payload), etag)
 
                 if p == "/api/hp/favorites-wizard/counties":
                     state_id = _query_int("state_id", required=True)
@@ -2354,7 +2547,7 @@ class Handler(BaseHTTPRequestHandler):
                         "ok": True,
                         "counties": wizard.get_counties(state_id=int(state_id or 0)),
                     }
-                    return self._send(200, json.dumps(payload), "application/json; charset=utf-8")
+                    return self._send_cached(json.dumps(payload), etag)
 
                 if p == "/api/hp/favorites-wizard/systems":
                     state_id = _query_int("state_id", required=True)
@@ -2384,7 +2577,7 @@ class Handler(BaseHTTPRequestHandler):
                             text_filter=text_filter,
                         ),
                     }
-                    return self._send(200, json.dumps(payload), "application/json; charset=utf-8")
+                    return self._send_cached(json.dumps(payload), etag)
 
                 if p == "/api/hp/favorites-wizard/channels":
                     system_type = str((q.get("system_type") or ["digital"])[0] or "").strip().lower()
@@ -2415,7 +2608,7 @@ class Handler(BaseHTTPRequestHandler):
                         "total_channels": len(channels),
                         "truncated": len(channels) > limit,
                     }
-                    return self._send(200, json.dumps(payload), "application/json; charset=utf-8")
+                    return self._send_cached(json.dumps(payload), etag)
 
                 return self._send(
                     404,
@@ -2495,9 +2688,12 @@ class Handler(BaseHTTPRequestHandler):
                 cached_payload = _STATUS_CACHE.get("payload")
                 cached_ts = float(_STATUS_CACHE.get("ts") or 0.0)
             if isinstance(cached_payload, dict) and (now_monotonic - cached_ts) <= _STATUS_CACHE_TTL_SEC:
+                _METRIC_STATUS_REQUESTS.labels(cache="hit").inc()
                 payload = dict(cached_payload)
                 payload["server_time"] = time.time()
                 return self._send(200, json.dumps(payload), "application/json; charset=utf-8")
+            _METRIC_STATUS_REQUESTS.labels(cache="miss").inc()
+            build_started = time.perf_counter()
             conf_path = read_active_config_path()
             ground_conf_path = os.path.realpath(GROUND_CONFIG_PATH)
             combined_conf_path = COMBINED_CONFIG_PATH
@@ -2779,7 +2975,9 @@ class Handler(BaseHTTPRequestHandler):
             with _CACHE_LOCK:
                 _STATUS_CACHE["ts"] = now_monotonic
                 _STATUS_CACHE["payload"] = dict(payload)
-            return self._send(200, json.dumps(payload), "application/json; charset=utf-8")
+            body = json.dumps(payload)
+            _METRIC_STATUS_BUILD_SECONDS.observe((time.perf_counter() - build_started) * 1000.0)
+            return self._send(200, body, "application/json; charset=utf-8")
         if p == "/api/profiles":
             profiles = load_profiles_registry()
             prof_payload, profiles_airband, profiles_ground = split_profiles()
@@ -2918,11 +3116,21 @@ class Handler(BaseHTTPRequestHandler):
         
         if p == "/api/stream":
             # Server-Sent Events stream for real-time updates
-            return self._handle_sse_stream()
+            return self._handle_sse_stream(last_event_id=self._sse_last_event_id(q))
+
+        if p == "/metrics":
+            return self._send(200, metrics.REGISTRY.render(), metrics.CONTENT_TYPE)
+
+        if p == "/api/debug/timers":
+            payload = {"enabled": profiling.timers_enabled(), "timers": profiling.timer_stats()}
+            return self._send(200, json.dumps(payload), "application/json; charset=utf-8")
         
         return self._send(404, "Not found", "text/plain; charset=utf-8")
 
-    def _handle_sse_stream(self):
+    def _sse_last_event_id(self, qs: dict[str, list[str]]) -> int | None:
+        return _parse_last_event_id(self.headers, qs)
+
+    def _handle_sse_stream(self, last_event_id: int | None = None):
         """Handle SSE stream for real-time data."""
         self.send_response(200)
         self.send_header("Content-Type", "text/event-stream")
@@ -2930,106 +3138,18 @@ class Handler(BaseHTTPRequestHandler):
         self.send_header("Connection", "keep-alive")
         self.send_header("Access-Control-Allow-Origin", "*")
         self.end_headers()
+        sub = _SSE_HUB.subscribe(last_event_id=last_event_id)
         try:
-            while True:
-                controls_snapshot = _read_effective_analog_controls()
-                airband_gain = controls_snapshot["airband_gain"]
-                airband_snr = controls_snapshot["airband_snr"]
-                airband_dbfs = controls_snapshot["airband_dbfs"]
-                airband_mode = controls_snapshot["airband_mode"]
-                rtl_unit_active = _unit_active_cached(UNITS["rtl"])
-                ground_unit_active = _unit_active_cached(UNITS["ground"])
-                combined_info = combined_device_summary()
-                ground_present = combined_info.get("ground") is not None
-                rtl_active = rtl_unit_active
-                ground_active = rtl_active and ground_present
-                ice_ok = _unit_active_cached(UNITS["icecast"])
-                analog_stream_mount = str(PLAYER_MOUNT or "").strip().lstrip("/")
-                digital_stream_mount = str(DIGITAL_STREAM_MOUNT or "").strip().lstrip("/")
-                if ice_ok:
-                    try:
-                        status_text = fetch_local_icecast_status()
-                        analog_stream_mount = _resolve_analog_stream_mount(status_text)
-                        digital_stream_mount = _resolve_digital_stream_mount(status_text)
-                    except Exception:
-                        analog_stream_mount = str(PLAYER_MOUNT or "").strip().lstrip("/")
-                        digital_stream_mount = str(DIGITAL_STREAM_MOUNT or "").strip().lstrip("/")
-                # Keep SSE hits aligned with the full UI hit list so digital
-                # rows are not dropped by top-10 truncation during busy analog traffic.
-                hits_payload = _get_hits_payload_cached(limit=50)
-                hit_items = hits_payload.get("items") or []
-                last_hit = hit_items[0].get("freq") if hit_items else (read_last_hit_airband() or read_last_hit_ground())
-                last_hit_airband_label = ""
-                last_hit_ground_label = ""
-                for item in hit_items:
-                    src = str(item.get("source") or "").strip().lower()
-                    label = str(item.get("label_full") or item.get("label") or "").strip()
-                    if src == "airband" and label and not last_hit_airband_label:
-                        last_hit_airband_label = label
-                    if src == "ground" and label and not last_hit_ground_label:
-                        last_hit_ground_label = label
-                    if last_hit_airband_label and last_hit_ground_label:
-                        break
-                digital_payload = {
-                    "digital_active": False,
-                    "digital_profile": "",
-                    "digital_last_label": "",
-                    "digital_last_time": 0,
-                }
-                try:
-                    digital_payload = dict(get_digital_manager().status_payload() or {})
-                except Exception:
-                    digital_payload = {
-                        "digital_active": False,
-                        "digital_profile": "",
-                        "digital_last_label": "",
-                        "digital_last_time": 0,
-                    }
-                mixer_enabled, mixer_active = _digital_mixer_runtime_state()
-                digital_payload["digital_mixer_enabled"] = bool(mixer_enabled)
-                digital_payload["digital_mixer_active"] = bool(mixer_active)
-                status_data = {
-                    "type": "status",
-                    "rtl_active": rtl_active,
-                    "ground_active": ground_active,
-                    "icecast_active": ice_ok,
-                    "ground_unit_active": ground_unit_active,
-                    "combined_config_stale": combined_config_stale(),
-                    "gain": float(airband_gain),
-                    "squelch": float(airband_snr),
-                    "squelch_mode": airband_mode,
-                    "squelch_snr": float(airband_snr),
-                    "squelch_dbfs": float(airband_dbfs),
-                    "last_hit": last_hit,
-                    "last_hit_airband_label": _short_label(last_hit_airband_label, max_len=48),
-                    "last_hit_ground_label": _short_label(last_hit_ground_label, max_len=48),
-                    "stream_mount": analog_stream_mount,
-                    "digital_stream_mount": digital_stream_mount,
-                    "server_time": time.time(),
-                    "hp_avoids": get_scan_mode_controller().get_hp_avoids(),
-                    "sb3_connected_status_refresh_sec": int(SB3_CONNECTED_STATUS_REFRESH_SEC),
-                    "sb3_connected_system_refresh_sec": int(SB3_CONNECTED_SYSTEM_REFRESH_SEC),
-                    "sb3_connected_profiles_refresh_sec": int(SB3_CONNECTED_PROFILES_REFRESH_SEC),
-                    "sb3_dedicated_digital_fetch_enabled": bool(SB3_DEDICATED_DIGITAL_FETCH_ENABLED),
-                }
-                status_data.update(digital_payload)
-                self.wfile.write(f"event: status\ndata: {json.dumps(status_data)}\n\n".encode())
-                spectrum_data = {
-                    "type": "spectrum",
-                    "bins": [],
-                    "timestamp": time.time(),
-                    "note": "stats_filepath not supported in rtl_airband v5.1.1"
-                }
-                self.wfile.write(f"event: spectrum\ndata: {json.dumps(spectrum_data)}\n\n".encode())
-                hits_data = {
-                    "type": "hits",
-                    "items": hit_items,
-                }
-                self.wfile.write(f"event: hits\ndata: {json.dumps(hits_data)}\n\n".encode())
+            while not sub.closed:
+                chunk = sub.next_chunk(timeout=SSE_HEARTBEAT_SEC * 2)
+                if chunk is None:
+                    continue
+                self.wfile.write(chunk)
                 self.wfile.flush()
-                time.sleep(1)
         except (BrokenPipeError, ConnectionResetError):
             pass
+        finally:
+            _SSE_HUB.unsubscribe(sub)
 
     def do_POST(self):
         """Handle POST requests."""
@@ -4167,6 +4287,34 @@ class Handler(BaseHTTPRequestHandler):
             result = enqueue_action(action)
             return self._send(result["status"], json.dumps(result["payload"]), "application/json; charset=utf-8")
 
+        if p == "/api/debug/profile":
+            query = parse_qs(urlparse(self.path).query or "")
+            raw_seconds = (query.get("seconds") or [form.get("seconds", "5")])[0]
+            try:
+                seconds = float(raw_seconds)
+            except (TypeError, ValueError):
+                seconds = -1.0
+            if not seconds > 0:
+                return self._send(400, json.dumps({"ok": False, "error": "seconds must be a positive number"}), "application/json; charset=utf-8")
+            try:
+                result = profiling.sample_stacks(seconds)
+            except profiling.ProfilerBusy as e:
+                return self._send(409, json.dumps({"ok": False, "error": str(e)}), "application/json; charset=utf-8")
+            return self._send(200, profiling.render_collapsed(result["stacks"]), "text/plain; charset=utf-8")
+
+        if p == "/api/debug/timers":
+            try:
+                enabled = parse_bool_value(form["enabled"], field="enabled") if "enabled" in form else None
+                reset = parse_bool_value(form.get("reset", False), field="reset")
+            except ValueError as e:
+                return self._send(400, json.dumps({"ok": False, "error": str(e)}), "application/json; charset=utf-8")
+            if enabled is not None:
+                profiling.set_timers_enabled(enabled)
+            if reset:
+                profiling.reset_timers()
+            payload = {"ok": True, "enabled": profiling.timers_enabled(), "timers": profiling.timer_stats()}
+            return self._send(200, json.dumps(payload), "application/json; charset=utf-8")
+
         if p == "/api/diagnostic":
             try:
                 path = write_diagnostic_log()
@@ -0,0 +1,141 @@
+"""Incremental analog hit-session index.
+
+Each activity line is ingested once: it either extends the open session for
+its unit or closes it (frequency change or ``HIT_GAP_RESET_SECONDS`` gap)
+and opens a new one. Finished sessions are kept per unit in a bounded,
+time-ordered deque so ``since_ts``/``limit`` queries only touch the rows
+they return.
+"""
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from typing import Iterable, Optional
+
+try:
+    from .config import (
+        HIT_GAP_RESET_SECONDS,
+        AIRBAND_MIN_MHZ,
+        AIRBAND_MAX_MHZ,
+        ANALOG_HIT_INDEX_SIZE,
+    )
+except ImportError:
+    from ui.config import (
+        HIT_GAP_RESET_SECONDS,
+        AIRBAND_MIN_MHZ,
+        AIRBAND_MAX_MHZ,
+        ANALOG_HIT_INDEX_SIZE,
+    )
+
+
+def hit_source(freq: str) -> str:
+    """Classify an activity frequency as airband or ground."""
+    try:
+        value = float(freq)
+    except (TypeError, ValueError):
+        return "ground"
+    return "airband" if AIRBAND_MIN_MHZ <= value <= AIRBAND_MAX_MHZ else "ground"
+
+
+def hit_entry(freq: str, start_ts: float, last_ts: float) -> dict:
+    """Render one session as a hit-list row."""
+    try:
+        freq_text = f"{float(freq):.4f}"
+    except ValueError:
+        freq_text = freq
+    return {
+        "time": time.strftime("%H:%M:%S", time.localtime(last_ts)),
+        "freq": freq_text,
+        "duration": int(last_ts - start_ts),
+        "ts": last_ts,
+    }
+
+
+class HitSessionIndex:
+    """Stateful hit-session builder with a bounded per-unit hit history."""
+
+    def __init__(self, gap_sec: float = HIT_GAP_RESET_SECONDS, max_hits: int = ANALOG_HIT_INDEX_SIZE):
+        self._gap_sec = float(gap_sec)
+        self._max_hits = max(1, int(max_hits))
+        self._lock = threading.Lock()
+        # unit -> deque[(last_ts, start_ts, freq)], oldest first
+        self._finished: dict[str, deque] = {}
+        # unit -> [freq, start_ts, last_ts]
+        self._open: dict[str, list] = {}
+        self._cutoffs = {"airband": 0.0, "ground": 0.0}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            return self._version
+
+    def ingest(self, unit: str, ts: float, freq: str) -> None:
+        """Feed one activity line (in per-unit time order)."""
+        ts = float(ts)
+        with self._lock:
+            if ts < self._cutoffs.get(hit_source(freq), 0.0):
+                return
+            current = self._open.get(unit)
+            if current is not None:
+                if freq == current[0] and (ts - current[2]) <= self._gap_sec:
+                    current[2] = ts
+                    self._version += 1
+                    return
+                self._close_locked(unit, current)
+            self._open[unit] = [freq, ts, ts]
+            self._version += 1
+
+    def ingest_many(self, unit: str, lines: Iterable[tuple[float, str]]) -> None:
+        for ts, freq in lines:
+            self.ingest(unit, ts, freq)
+
+    def _close_locked(self, unit: str, session: list) -> None:
+        finished = self._finished.get(unit)
+        if finished is None:
+            finished = deque(maxlen=self._max_hits)
+            self._finished[unit] = finished
+        finished.append((session[2], session[1], session[0]))
+
+    def apply_cutoff(self, source: str, at_ts: float) -> None:
+        """Drop sessions of ``source`` that ended before ``at_ts``."""
+        at_ts = float(at_ts)
+        with self._lock:
+            if at_ts <= self._cutoffs.get(source, 0.0):
+                return
+            self._cutoffs[source] = at_ts
+            for unit, finished in self._finished.items():
+                kept = [row for row in finished if row[0] >= at_ts or hit_source(row[2]) != source]
+                if len(kept) != len(finished):
+                    self._finished[unit] = deque(kept, maxlen=self._max_hits)
+            for unit, current in list(self._open.items()):
+                if hit_source(current[0]) != source:
+                    continue
+                if current[2] < at_ts:
+                    del self._open[unit]
+                elif current[1] < at_ts:
+                    current[1] = at_ts
+            self._version += 1
+
+    def _unit_rows_locked(self, unit: str, since_ts: float, limit: int) -> list[tuple[float, float, str]]:
+        rows = []
+        current = self._open.get(unit)
+        if current is not None and current[2] >= since_ts:
+            rows.append((current[2], current[1], current[0]))
+        for row in reversed(self._finished.get(unit) or ()):
+            if len(rows) >= limit or row[0] < since_ts:
+                break
+            rows.append(row)
+        return rows
+
+    def hits(self, units: Iterable[str], limit: int = 20, since_ts: Optional[float] = None) -> list:
+        """Return up to ``limit`` hit rows across ``units``, newest first."""
+        limit = max(0, int(limit))
+        if limit <= 0:
+            return []
+        floor = float(since_ts) if since_ts is not None else float("-inf")
+        with self._lock:
+            streams = [self._unit_rows_locked(unit, floor, limit) for unit in units]
+        merged = heapq.merge(*streams, key=lambda row: -row[0])
+        return [hit_entry(freq, start_ts, last_ts) for last_ts, start_ts, freq in itertools.islice(merged, limit)]
@@ -1,10 +1,20 @@
-"""Favorites-builder browse queries for HomePatrol DB."""
+"""Favorites-builder browse queries for HomePatrol DB.
+
+Databases imported with the system catalogs (``hp_trunk_catalog`` and
+``hp_conventional_catalog``, built by ``scripts/homepatrol_db.py import``)
+answer the systems step with indexed lookups by scope, state and county;
+older databases fall back to joining the source tables.
+"""
 from __future__ import annotations
 
+import hashlib
 import sqlite3
+from contextlib import AbstractContextManager
 from pathlib import Path
 
 from .config import HPDB_DB_PATH
+from .hp_search import scope_token, search_filter
+from .hpdb_pool import get_hpdb_pool
 
 _DEFAULT_DB_PATH = str(Path(HPDB_DB_PATH).expanduser().resolve())
 _COUNTRY_NAMES = {
@@ -15,6 +25,8 @@ _SCOPE_NATIONWIDE = "nationwide"
 _SCOPE_STATEWIDE = "statewide"
 _SCOPE_COUNTY = "county"
 _VALID_SCOPES = {_SCOPE_NATIONWIDE, _SCOPE_STATEWIDE, _SCOPE_COUNTY}
+TRUNK_CATALOG_TABLE = "hp_trunk_catalog"
+CONVENTIONAL_CATALOG_TABLE = "hp_conventional_catalog"
 
 
 def _hz_to_mhz(value: int) -> float:
@@ -38,11 +50,24 @@ def _normalize_scope(scope: str) -> str:
 class HPFavoritesWizard:
     def __init__(self, db_path: str = _DEFAULT_DB_PATH):
         self.db_path = str(Path(db_path).expanduser().resolve())
+        self._pool = get_hpdb_pool(self.db_path)
+
+    def _connect(self) -> AbstractContextManager[sqlite3.Connection]:
+        return self._pool.read()
+
+    def _name_filter(self, kind: str, ref_column: str, name_column: str, text_filter: str) -> tuple[str, list]:
+        match = search_filter(self._pool, kind, text_filter)
+        if match is not None:
+            return f"{ref_column} IN ({match[0]})", match[1]
+        return f"lower({name_column}) LIKE ?", [f"%{str(text_filter or '').strip().lower()}%"]
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path, timeout=5.0)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def etag(self, request_key: str) -> str | None:
+        """Validator for a browse response; changes whenever the database file does."""
+        fingerprint = self._pool.fingerprint()
+        if fingerprint is None:
+            return None
+        digest = hashlib.sha1(f"{fingerprint}|{request_key}".encode("utf-8")).hexdigest()
+        return f'"{digest[:32]}"'
 
     def get_countries(self) -> list[dict]:
         with self._connect() as conn:
@@ -114,10 +139,79 @@ class HPFavoritesWizard:
         scope: str = _SCOPE_STATEWIDE,
         text_filter: str = "",
     ) -> list[dict]:
-        filter_token = f"%{str(text_filter or '').strip().lower()}%"
         state_id = int(state_id)
         county_id = int(county_id or 0)
         scope_token = _normalize_scope(scope)
+        if self._pool.columns(TRUNK_CATALOG_TABLE):
+            return self._catalog_digital_systems(state_id, county_id, scope_token, text_filter)
+        return self._joined_digital_systems(state_id, county_id, scope_token, text_filter)
+
+    def _catalog_digital_systems(
+        self,
+        state_id: int,
+        county_id: int,
+        scope_token: str,
+        text_filter: str,
+    ) -> list[dict]:
+        name_filter, name_params = self._name_filter(
+            "trunk_system", "trunk_id", "system_name", text_filter
+        )
+        if scope_token == _SCOPE_COUNTY and county_id > 0:
+            where = "scope = ? AND county_id = ?"
+            params: list = [scope_token, county_id]
+        elif scope_token == _SCOPE_COUNTY or county_id <= 0:
+            where = "scope = ? AND county_id = 0 AND state_id = ?"
+            params = [scope_token, state_id]
+        else:
+            # Statewide/nationwide systems narrowed to one county: those tied
+            # to the state itself, plus those covering that county.
+            where = f"""scope = ? AND county_id = 0 AND state_id = ?
+                  AND (
+                      state_link = 1
+                      OR trunk_id IN (
+                          SELECT trunk_id FROM {TRUNK_CATALOG_TABLE}
+                          WHERE scope = 'county' AND county_id = ?
+                      )
+                  )"""
+            params = [scope_token, state_id, county_id]
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT trunk_id, system_name, protocol, site_count, talkgroup_count
+                FROM {TRUNK_CATALOG_TABLE}
+                WHERE {where}
+                  AND {name_filter}
+                ORDER BY system_name COLLATE NOCASE, trunk_id
+                """,
+                (*params, *name_params),
+            ).fetchall()
+        out: list[dict] = []
+        for row in rows:
+            trunk_id = int(row["trunk_id"])
+            out.append(
+                {
+                    "id": trunk_id,
+                    "key": f"TrunkId:{trunk_id}",
+                    "name": str(row["system_name"] or "").strip(),
+                    "protocol": str(row["protocol"] or "").strip(),
+                    "system_type": "digital",
+                    "scope": scope_token,
+                    "site_count": int(row["site_count"] or 0),
+                    "talkgroup_count": int(row["talkgroup_count"] or 0),
+                }
+            )
+        return out
+
+    def _joined_digital_systems(
+        self,
+        state_id: int,
+        county_id: int,
+        scope_token: str,
+        text_filter: str,
+    ) -> list[dict]:
+        name_filter, name_params = self._name_filter(
+            "trunk_system", "ts.trunk_id", "ts.system_name", text_filter
+        )
         with self._connect() as conn:
             state_county_rows = conn.execute(
                 """
@@ -137,7 +231,7 @@ class HPFavoritesWizard:
                     state_county_ids.add(value)
 
             rows = conn.execute(
-                """
+                f"""
                 SELECT DISTINCT
                     ts.trunk_id,
                     ts.system_name,
@@ -150,7 +244,7 @@ class HPFavoritesWizard:
                  AND ea.entity_id = ts.trunk_id
                 LEFT JOIN counties c
                   ON c.county_id = ea.county_id
-                WHERE lower(ts.system_name) LIKE ?
+                WHERE {name_filter}
                   AND (
                       ts.state_id = ?
                       OR ts.state_id = 0
@@ -166,7 +260,7 @@ class HPFavoritesWizard:
                   )
                 ORDER BY ts.system_name COLLATE NOCASE, ts.trunk_id
                 """,
-                (filter_token, state_id, state_id, county_id, county_id, county_id, state_id),
+                (*name_params, state_id, state_id, county_id, county_id, county_id, state_id),
             ).fetchall()
 
             trunk_ids: list[int] = []
@@ -284,13 +378,74 @@ class HPFavoritesWizard:
         scope: str = _SCOPE_STATEWIDE,
         text_filter: str = "",
     ) -> list[dict]:
-        filter_token = f"%{str(text_filter or '').strip().lower()}%"
         state_id = int(state_id)
         county_id = int(county_id or 0)
         scope_token = _normalize_scope(scope)
+        if self._pool.columns(CONVENTIONAL_CATALOG_TABLE):
+            return self._catalog_analog_systems(state_id, county_id, scope_token, text_filter)
+        return self._joined_analog_systems(state_id, county_id, scope_token, text_filter)
+
+    def _catalog_analog_systems(
+        self,
+        state_id: int,
+        county_id: int,
+        scope_token: str,
+        text_filter: str,
+    ) -> list[dict]:
+        name_filter, name_params = self._name_filter(
+            "conventional_system", "system_key", "system_name", text_filter
+        )
+        county_sql = ""
+        params: list = [state_id, scope_token]
+        if scope_token == _SCOPE_COUNTY and county_id > 0:
+            county_sql = "AND county_id = ?"
+            params.append(county_id)
         with self._connect() as conn:
             rows = conn.execute(
-                """
+                f"""
+                SELECT system_key, system_name, category, county_id, group_count, channel_count
+                FROM {CONVENTIONAL_CATALOG_TABLE}
+                WHERE state_id = ?
+                  AND scope = ?
+                  {county_sql}
+                  AND {name_filter}
+                ORDER BY system_name COLLATE NOCASE, system_key
+                """,
+                (*params, *name_params),
+            ).fetchall()
+        out: list[dict] = []
+        for row in rows:
+            system_key = str(row["system_key"] or "").strip()
+            if not system_key:
+                continue
+            out.append(
+                {
+                    "id": system_key,
+                    "key": system_key,
+                    "name": str(row["system_name"] or "").strip(),
+                    "category": str(row["category"] or "").strip(),
+                    "county_id": int(row["county_id"]) if row["county_id"] is not None else None,
+                    "system_type": "analog",
+                    "scope": scope_token,
+                    "group_count": int(row["group_count"] or 0),
+                    "channel_count": int(row["channel_count"] or 0),
+                }
+            )
+        return out
+
+    def _joined_analog_systems(
+        self,
+        state_id: int,
+        county_id: int,
+        scope_token: str,
+        text_filter: str,
+    ) -> list[dict]:
+        name_filter, name_params = self._name_filter(
+            "conventional_system", "system_key", "system_name", text_filter
+        )
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"""
                 SELECT
                     system_key,
                     system_name,
@@ -299,10 +454,10 @@ class HPFavoritesWizard:
                     source_file
                 FROM conventional_systems
                 WHERE state_id = ?
-                  AND lower(system_name) LIKE ?
+                  AND {name_filter}
                 ORDER BY system_name COLLATE NOCASE, system_key
                 """,
-                (state_id, filter_token),
+                (state_id, *name_params),
             ).fetchall()
 
         out: list[dict] = []
@@ -396,7 +551,17 @@ class HPFavoritesWizard:
 
     def get_digital_channels(self, trunk_id: int, text_filter: str = "") -> tuple[str, list[dict]]:
         trunk_id = int(trunk_id)
-        filter_token = f"%{str(text_filter or '').strip().lower()}%"
+        match = search_filter(self._pool, "talkgroup", text_filter, scope_token("trunk", trunk_id))
+        if match is not None:
+            text_sql, text_params = f"t.tid IN ({match[0]})", match[1]
+        else:
+            filter_token = f"%{str(text_filter or '').strip().lower()}%"
+            text_sql = """(
+                      lower(t.alpha_tag) LIKE ?
+                      OR lower(t.dec_tgid) LIKE ?
+                      OR lower(tg.group_name) LIKE ?
+                  )"""
+            text_params = [filter_token, filter_token, filter_token]
         with self._connect() as conn:
             system_row = conn.execute(
                 """
@@ -410,7 +575,7 @@ class HPFavoritesWizard:
                 return "", []
             system_name = str(system_row["system_name"] or "").strip()
             rows = conn.execute(
-                """
+                f"""
                 SELECT
                     t.dec_tgid,
                     t.alpha_tag,
@@ -421,14 +586,10 @@ class HPFavoritesWizard:
                 JOIN trunk_groups tg ON tg.tgroup_id = t.tgroup_id
                 WHERE tg.trunk_id = ?
                   AND t.dec_tgid IS NOT NULL
-                  AND (
-                      lower(t.alpha_tag) LIKE ?
-                      OR lower(t.dec_tgid) LIKE ?
-                      OR lower(tg.group_name) LIKE ?
-                  )
+                  AND {text_sql}
                 ORDER BY CAST(t.dec_tgid AS INTEGER), t.alpha_tag COLLATE NOCASE
                 """,
-                (trunk_id, filter_token, filter_token, filter_token),
+                (trunk_id, *text_params),
             ).fetchall()
         controls = self._digital_control_channels(trunk_id)
         out: list[dict] = []
@@ -478,7 +639,19 @@ class HPFavoritesWizard:
         if not parsed:
             return "", []
         parent_key, parent_id = parsed
-        filter_token = f"%{str(text_filter or '').strip().lower()}%"
+        match = search_filter(
+            self._pool, "conventional_freq", text_filter, scope_token(parent_key, parent_id)
+        )
+        if match is not None:
+            text_sql, text_params = f"cf.cfreq_id IN ({match[0]})", match[1]
+        else:
+            filter_token = f"%{str(text_filter or '').strip().lower()}%"
+            text_sql = """(
+                      lower(cf.alpha_tag) LIKE ?
+                      OR lower(cg.group_name) LIKE ?
+                      OR CAST(cf.freq_hz AS TEXT) LIKE ?
+                  )"""
+            text_params = [filter_token, filter_token, filter_token]
         with self._connect() as conn:
             system_row = conn.execute(
                 """
@@ -492,7 +665,7 @@ class HPFavoritesWizard:
                 return "", []
             system_name = str(system_row["system_name"] or "").strip()
             rows = conn.execute(
-                """
+                f"""
                 SELECT
                     cf.cfreq_id,
                     cf.alpha_tag,
@@ -505,14 +678,10 @@ class HPFavoritesWizard:
                 WHERE cg.parent_key = ?
                   AND cg.parent_id = ?
                   AND cf.freq_hz IS NOT NULL
-                  AND (
-                      lower(cf.alpha_tag) LIKE ?
-                      OR lower(cg.group_name) LIKE ?
-                      OR CAST(cf.freq_hz AS TEXT) LIKE ?
-                  )
+                  AND {text_sql}
                 ORDER BY cg.group_name COLLATE NOCASE, cf.freq_hz, cf.alpha_tag COLLATE NOCASE
                 """,
-                (parent_key, parent_id, filter_token, filter_token, filter_token),
+                (parent_key, parent_id, *text_params),
             ).fetchall()
         out: list[dict] = []
         for row in rows:
@@ -6,6 +6,8 @@ import os
 import sqlite3
 from pathlib import Path
 
+from .hpdb_pool import get_hpdb_pool
+
 
 _EARTH_RADIUS_MILES = 3958.7613
 _HP_TRUNK_SITES_PER_SYSTEM = max(1, int(os.getenv("HP_TRUNK_SITES_PER_SYSTEM", "1")))
@@ -27,6 +29,49 @@ def haversine_miles(lat1, lon1, lat2, lon2) -> float:
     return _EARTH_RADIUS_MILES * c
 
 
+# R*Tree tables written by ``scripts/homepatrol_db.py import``. Boxes live on
+# the unit sphere (x, y, z) and are padded by the chord of each row's radius,
+# so a range query is a superset of the haversine filter at any latitude.
+_SPATIAL_INDEXES = {
+    "trunk_sites": ("trunk_sites_rtree", "site_id"),
+    "conventional_groups": ("conventional_groups_rtree", "cgroup_id"),
+}
+_SPATIAL_EPSILON = 1e-6
+
+
+def _unit_vector(lat: float, lon: float) -> tuple[float, float, float]:
+    latr = math.radians(float(lat))
+    lonr = math.radians(float(lon))
+    return (math.cos(latr) * math.cos(lonr), math.cos(latr) * math.sin(lonr), math.sin(latr))
+
+
+def _chord_for_miles(miles: float) -> float:
+    angle = min(math.pi, max(0.0, float(miles)) / _EARTH_RADIUS_MILES)
+    return 2.0 * math.sin(angle / 2.0)
+
+
+def spatial_filter_join(pool, table: str, alias: str, lat: float, lon: float, range_miles: float) -> tuple[str, list[float]]:
+    """JOIN clause limiting ``alias`` rows of ``table`` to R*Tree candidates near a point.
+
+    Returns ``("", [])`` when the database has no spatial index, in which case
+    callers keep scanning the whole table.
+    """
+    rtree, id_col = _SPATIAL_INDEXES[table]
+    if not pool.has_column(rtree, "min_x"):
+        return "", []
+    pad = _chord_for_miles(range_miles) + _SPATIAL_EPSILON
+    params: list[float] = []
+    for axis in _unit_vector(lat, lon):
+        params.extend((axis - pad, axis + pad))
+    return (
+        f"JOIN {rtree} sx ON sx.{id_col} = {alias}.{id_col}"
+        " AND sx.max_x >= ? AND sx.min_x <= ?"
+        " AND sx.max_y >= ? AND sx.min_y <= ?"
+        " AND sx.max_z >= ? AND sx.min_z <= ?",
+        params,
+    )
+
+
 def _hz_to_mhz(freq_hz: int) -> float:
     return round(float(freq_hz) / 1_000_000.0, 6)
 
@@ -36,76 +81,84 @@ class ScanPoolBuilder:
 
     def __init__(self, db_path: str):
         self.db_path = str(Path(db_path).expanduser().resolve())
+        self._pool = get_hpdb_pool(self.db_path)
         self._indexes_ready = False
         self._multistate_localized_trunk_ids: set[int] | None = None
         self._multistate_localized_agency_ids: set[int] | None = None
         self._bootstrap_indexes()
 
-    @staticmethod
-    def _table_has_column(conn: sqlite3.Connection, table: str, column: str) -> bool:
-        try:
-            rows = conn.execute(f"PRAGMA table_info({table})").fetchall()
-        except Exception:
-            return False
-        for row in rows:
-            if str(row[1]).strip().lower() == str(column).strip().lower():
-                return True
-        return False
-
-    def _ensure_indexes(self, conn: sqlite3.Connection) -> None:
+    def _index_statements(self) -> list[tuple[str, str]]:
+        """``(index_name, CREATE INDEX sql)`` pairs this database's columns support."""
+        has = self._pool.has_column
+        out: list[tuple[str, str]] = []
         # Some requested index keys use "system_id", but this DB stores trunk IDs as "trunk_id".
         # Build compatible equivalents when system_id columns are absent.
-        if self._table_has_column(conn, "trunk_sites", "system_id"):
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_trunk_sites_system_id ON trunk_sites(system_id)"
-            )
-        elif self._table_has_column(conn, "trunk_sites", "trunk_id"):
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_trunk_sites_system_id ON trunk_sites(trunk_id)"
-            )
-
-        if self._table_has_column(conn, "trunk_sites", "latitude") and self._table_has_column(
-            conn, "trunk_sites", "longitude"
-        ):
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_trunk_sites_lat_lon ON trunk_sites(latitude, longitude)"
-            )
-
-        if self._table_has_column(conn, "talkgroups", "system_id"):
-            conn.execute(
+        if has("trunk_sites", "system_id"):
+            out.append((
+                "idx_trunk_sites_system_id",
+                "CREATE INDEX IF NOT EXISTS idx_trunk_sites_system_id ON trunk_sites(system_id)",
+            ))
+        elif has("trunk_sites", "trunk_id"):
+            out.append((
+                "idx_trunk_sites_system_id",
+                "CREATE INDEX IF NOT EXISTS idx_trunk_sites_system_id ON trunk_sites(trunk_id)",
+            ))
+
+        if has("trunk_sites", "latitude") and has("trunk_sites", "longitude"):
+            out.append((
+                "idx_trunk_sites_lat_lon",
+                "CREATE INDEX IF NOT EXISTS idx_trunk_sites_lat_lon ON trunk_sites(latitude, longitude)",
+            ))
+
+        if has("talkgroups", "system_id"):
+            out.append((
+                "idx_talkgroups_system_service",
                 "CREATE INDEX IF NOT EXISTS idx_talkgroups_system_service "
-                "ON talkgroups(system_id, service_tag)"
-            )
-        elif self._table_has_column(conn, "talkgroups", "tgroup_id"):
-            conn.execute(
+                "ON talkgroups(system_id, service_tag)",
+            ))
+        elif has("talkgroups", "tgroup_id"):
+            out.append((
+                "idx_talkgroups_system_service",
                 "CREATE INDEX IF NOT EXISTS idx_talkgroups_system_service "
-                "ON talkgroups(tgroup_id, service_tag)"
-            )
+                "ON talkgroups(tgroup_id, service_tag)",
+            ))
 
-        if self._table_has_column(conn, "conventional_freqs", "service_tag"):
-            conn.execute(
+        if has("conventional_freqs", "service_tag"):
+            out.append((
+                "idx_conventional_freqs_service_tag",
                 "CREATE INDEX IF NOT EXISTS idx_conventional_freqs_service_tag "
-                "ON conventional_freqs(service_tag)"
-            )
+                "ON conventional_freqs(service_tag)",
+            ))
 
-        if self._table_has_column(conn, "conventional_groups", "latitude") and self._table_has_column(
-            conn, "conventional_groups", "longitude"
-        ):
-            conn.execute(
+        if has("conventional_groups", "latitude") and has("conventional_groups", "longitude"):
+            out.append((
+                "idx_conventional_groups_lat_lon",
                 "CREATE INDEX IF NOT EXISTS idx_conventional_groups_lat_lon "
-                "ON conventional_groups(latitude, longitude)"
-            )
+                "ON conventional_groups(latitude, longitude)",
+            ))
+        return out
 
     def _bootstrap_indexes(self) -> None:
         if self._indexes_ready:
             return
-        conn = sqlite3.connect(self.db_path)
-        try:
-            self._ensure_indexes(conn)
-            conn.commit()
-            self._indexes_ready = True
-        finally:
-            conn.close()
+        statements = self._index_statements()
+        if statements:
+            with self._pool.read() as conn:
+                existing = {
+                    str(row[0])
+                    for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+                }
+            missing = [sql for name, sql in statements if name not in existing]
+            if missing:
+                # Only this one-time bootstrap needs a writable connection.
+                conn = sqlite3.connect(self.db_path)
+                try:
+                    for sql in missing:
+                        conn.execute(sql)
+                    conn.commit()
+                finally:
+                    conn.close()
+        self._indexes_ready = True
 
     @staticmethod
     def _normalize_service_tags(service_tags: list[int]) -> list[int]:
@@ -208,118 +261,58 @@ class ScanPoolBuilder:
         if not tags:
             return {"trunked_sites": [], "conventional": []}
 
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.row_factory = sqlite3.Row
-            if not self._indexes_ready:
-                self._ensure_indexes(conn)
-                conn.commit()
-                self._indexes_ready = True
-
+        self._bootstrap_indexes()
+        with self._pool.read() as conn:
             tag_placeholders = ",".join("?" for _ in tags)
 
-            site_rows = conn.execute(
-                """
-                SELECT
-                    ts.site_id,
-                    ts.trunk_id,
-                    ts.source_file,
-                    ts.latitude,
-                    ts.longitude,
-                    ts.radius,
-                    ts.site_name,
-                    sys.system_name
-                FROM trunk_sites ts
-                LEFT JOIN trunk_systems sys ON sys.trunk_id = ts.trunk_id
-                ORDER BY ts.trunk_id, ts.site_id
-                """
-            ).fetchall()
             localized_trunk_ids: set[int] = set()
             localized_agency_ids: set[int] = set()
             if not include_nationwide:
                 localized_trunk_ids, localized_agency_ids = self._load_multistate_scope_overrides(conn)
 
-            selected_sites: list[dict[str, object]] = []
-            selected_by_system: dict[int, set[int]] = {}
-            for row in site_rows:
-                source_file = str(row["source_file"] or "").strip()
-                site_id = self._parse_int(row["site_id"])
-                system_id = self._parse_int(row["trunk_id"])
-                if (
-                    source_file.lower() == "_multiplestates.hpd"
-                    and not include_nationwide
-                    and (system_id is None or system_id not in localized_trunk_ids)
-                ):
-                    continue
-                if site_id is None or system_id is None:
-                    continue
-                site_lat = self._parse_float(row["latitude"])
-                site_lon = self._parse_float(row["longitude"])
-                if site_lat is None or site_lon is None:
-                    continue
-                site_radius = max(0.0, float(self._parse_float(row["radius"]) or 0.0))
+            # Imported lazily: hp_site_table builds on this module's helpers.
+            from .hp_site_table import candidate_site_rows, load_site_table
+
+            sites = load_site_table(self._pool)
+            matches = sites.select(
+                center_lat=center_lat,
+                center_lon=center_lon,
+                range_miles=user_range,
+                strict_location=strict,
+                include_nationwide=include_nationwide,
+                localized_trunk_ids=localized_trunk_ids,
                 # Some _MultipleStates rows are synthetic national/regional
                 # centroids (e.g. 42,-98 with 1000+ mile radius). Treat those
                 # as out-of-scope for local full-db mode unless nationwide is
                 # explicitly enabled.
-                if source_file.lower() == "_multiplestates.hpd" and not include_nationwide:
-                    if site_radius > max(75.0, user_range * 3.0):
-                        continue
-                threshold = user_range if strict else (user_range + site_radius)
-                if abs(site_lat - center_lat) * lat_miles_per_degree > threshold:
-                    continue
-                if abs(site_lon - center_lon) * lon_miles_per_degree > threshold:
-                    continue
-                distance = haversine_miles(center_lat, center_lon, site_lat, site_lon)
-                if distance > threshold:
-                    continue
+                multistate_radius_cap=max(75.0, user_range * 3.0),
+                candidate_rows=candidate_site_rows(self._pool, sites, center_lat, center_lon, user_range),
+            )
+            if _HP_TRUNK_SITES_PER_SYSTEM > 0:
+                matches = sorted(
+                    (
+                        (idx, distance)
+                        for idx, distance in sites.nearest_per_system(matches, _HP_TRUNK_SITES_PER_SYSTEM)
+                        if sites.trunk_ids[idx] > 0 and sites.site_ids[idx] > 0
+                    ),
+                    key=lambda item: (item[1], sites.trunk_ids[item[0]], sites.site_ids[item[0]]),
+                )
+            selected_sites: list[dict[str, object]] = []
+            selected_by_system: dict[int, set[int]] = {}
+            for idx, distance in matches:
+                system_id = sites.trunk_ids[idx]
+                site_id = sites.site_ids[idx]
                 selected_sites.append(
                     {
                         "system_id": int(system_id),
                         "site_id": int(site_id),
-                        "system_name": str(row["system_name"] or "").strip(),
-                        "site_name": str(row["site_name"] or "").strip(),
+                        "system_name": sites.system_names[idx],
+                        "site_name": sites.site_names[idx],
                         "distance_miles": float(distance),
                     }
                 )
                 selected_by_system.setdefault(system_id, set()).add(site_id)
 
-            if _HP_TRUNK_SITES_PER_SYSTEM > 0 and selected_sites:
-                per_system: dict[int, list[dict[str, object]]] = {}
-                for item in selected_sites:
-                    sys_id = int(item.get("system_id") or 0)
-                    if sys_id <= 0:
-                        continue
-                    per_system.setdefault(sys_id, []).append(item)
-
-                trimmed_sites: list[dict[str, object]] = []
-                trimmed_by_system: dict[int, set[int]] = {}
-                for sys_id, rows in per_system.items():
-                    ranked = sorted(
-                        rows,
-                        key=lambda item: (
-                            float(item.get("distance_miles") or 0.0),
-                            int(item.get("site_id") or 0),
-                        ),
-                    )
-                    keep = ranked[:_HP_TRUNK_SITES_PER_SYSTEM]
-                    for item in keep:
-                        site_id = int(item.get("site_id") or 0)
-                        if site_id <= 0:
-                            continue
-                        trimmed_sites.append(item)
-                        trimmed_by_system.setdefault(sys_id, set()).add(site_id)
-
-                selected_sites = sorted(
-                    trimmed_sites,
-                    key=lambda item: (
-                        float(item.get("distance_miles") or 0.0),
-                        int(item.get("system_id") or 0),
-                        int(item.get("site_id") or 0),
-                    ),
-                )
-                selected_by_system = trimmed_by_system
-
             control_channels_by_site: dict[int, list[float]] = {}
             if selected_sites:
                 site_ids = sorted(
@@ -459,6 +452,9 @@ class ScanPoolBuilder:
                     }
                 )
 
+            group_join, group_params = spatial_filter_join(
+                self._pool, "conventional_groups", "cg", center_lat, center_lon, user_range
+            )
             conv_rows = conn.execute(
                 f"""
                 SELECT
@@ -473,11 +469,12 @@ class ScanPoolBuilder:
                     cg.radius
                 FROM conventional_freqs cf
                 JOIN conventional_groups cg ON cg.cgroup_id = cf.cgroup_id
+                {group_join}
                 WHERE cf.service_tag IN ({tag_placeholders})
                   AND cf.freq_hz IS NOT NULL
                 ORDER BY cf.cgroup_id, cf.freq_hz, cf.cfreq_id
                 """,
-                tags,
+                [*group_params, *tags],
             ).fetchall()
 
             conventional_set: set[tuple[float, str, int]] = set()
@@ -533,5 +530,3 @@ class ScanPoolBuilder:
                 "trunked_sites": trunked_sites,
                 "conventional": conventional,
             }
-        finally:
-            conn.close()
@@ -0,0 +1,50 @@
+"""FTS5 text search over the HomePatrol database.
+
+``scripts/homepatrol_db.py import`` builds one ``hp_search`` FTS5 table with a
+row per trunk system, conventional system, talkgroup and conventional
+channel. ``kind`` and ``ref`` (the row's primary key) are stored but not
+indexed. ``scope`` holds a single parent token (``trunk<id>`` for
+talkgroups, ``<parentkey><id>`` for conventional channels), so per-system
+searches stay in the index. ``name`` and ``extra`` hold the searchable text.
+Each search word is matched as a prefix, so "dis" finds "Dispatch". Databases
+imported before the index existed fall back to the callers' ``LIKE`` filters.
+"""
+from __future__ import annotations
+
+import re
+
+SEARCH_TABLE = "hp_search"
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def scope_token(parent_key: str, parent_id) -> str:
+    """Indexed scope value for rows belonging to ``parent_key``/``parent_id``."""
+    return f"{str(parent_key or '').strip().lower()}{int(parent_id)}"
+
+
+def match_expression(text: str, scope: str = "") -> str | None:
+    """FTS5 query matching every word of ``text`` as a prefix, or None if it has no words."""
+    terms = [term.lower() for term in _TERM_RE.findall(str(text or ""))]
+    if not terms:
+        return None
+    words = " ".join(f'"{term}"*' for term in terms)
+    expression = f"{{name extra}} : ({words})"
+    if scope:
+        expression = f'scope : "{scope}" AND {expression}'
+    return expression
+
+
+def has_search_index(pool) -> bool:
+    return bool(pool.columns(SEARCH_TABLE))
+
+
+def search_filter(pool, kind: str, text: str, scope: str = "") -> tuple[str, list] | None:
+    """``(subquery, params)`` selecting matching ``ref`` values, or None to use LIKE."""
+    expression = match_expression(text, scope)
+    if expression is None or not has_search_index(pool):
+        return None
+    return (
+        f"SELECT ref FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH ? AND kind = ?",
+        [expression, str(kind)],
+    )
@@ -0,0 +1,291 @@
+"""In-memory trunk-site table for HomePatrol location filtering.
+
+Scan-pool rebuilds used to pull ``trunk_sites`` rows through SQLite and run
+``haversine_miles`` per row in Python. ``SiteTable`` loads the columns once
+per database version and answers range, scope and nearest-site questions in
+batch. With NumPy installed these are array operations over the whole table.
+Without it, the same rules run in a plain loop over the R*Tree candidates
+(when the database has that index) or over every site.
+"""
+from __future__ import annotations
+
+import math
+import threading
+from typing import Iterable, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from .hp_scan_pool import _EARTH_RADIUS_MILES, haversine_miles, spatial_filter_join
+
+
+_MULTISTATE_SOURCE = "_multiplestates.hpd"
+_LAT_MILES_PER_DEGREE = 69.0
+
+
+def _finite_float(value) -> float | None:
+    try:
+        parsed = float(str(value).strip())
+    except Exception:
+        return None
+    return parsed if math.isfinite(parsed) else None
+
+
+def _int_or_none(value) -> int | None:
+    try:
+        return int(str(value).strip())
+    except Exception:
+        return None
+
+
+class SiteTable:
+    """Column store of trunk sites with usable coordinates."""
+
+    def __init__(self, rows: Iterable[tuple]):
+        self.site_ids: list[int] = []
+        self.trunk_ids: list[int] = []
+        self.lats: list[float] = []
+        self.lons: list[float] = []
+        self.radii: list[float] = []
+        self.multistate: list[bool] = []
+        self.site_names: list[str] = []
+        self.system_names: list[str] = []
+        self._row_by_site: dict[int, int] = {}
+        self._rows_by_system: dict[int, list[int]] = {}
+        for site_id, trunk_id, source_file, lat, lon, radius, site_name, system_name in rows:
+            site = _int_or_none(site_id)
+            trunk = _int_or_none(trunk_id)
+            lat_f = _finite_float(lat)
+            lon_f = _finite_float(lon)
+            if site is None or trunk is None or lat_f is None or lon_f is None:
+                continue
+            idx = len(self.site_ids)
+            self.site_ids.append(site)
+            self.trunk_ids.append(trunk)
+            self.lats.append(lat_f)
+            self.lons.append(lon_f)
+            self.radii.append(max(0.0, _finite_float(radius) or 0.0))
+            self.multistate.append(str(source_file or "").strip().lower() == _MULTISTATE_SOURCE)
+            self.site_names.append(str(site_name or "").strip())
+            self.system_names.append(str(system_name or "").strip())
+            self._row_by_site.setdefault(site, idx)
+            self._rows_by_system.setdefault(trunk, []).append(idx)
+        self._arrays = None
+        if np is not None:
+            self._arrays = {
+                "site": np.asarray(self.site_ids, dtype=np.int64),
+                "trunk": np.asarray(self.trunk_ids, dtype=np.int64),
+                "lat": np.asarray(self.lats, dtype=np.float64),
+                "lon": np.asarray(self.lons, dtype=np.float64),
+                "radius": np.asarray(self.radii, dtype=np.float64),
+                "multistate": np.asarray(self.multistate, dtype=bool),
+            }
+
+    def __len__(self) -> int:
+        return len(self.site_ids)
+
+    @property
+    def vectorized(self) -> bool:
+        return self._arrays is not None
+
+    def rows_for_sites(self, site_ids: Iterable[int]) -> list[int]:
+        lookup = self._row_by_site
+        return sorted(lookup[s] for s in site_ids if s in lookup)
+
+    def rows_for_system(self, trunk_id: int) -> list[int]:
+        return list(self._rows_by_system.get(int(trunk_id), []))
+
+    def distances(self, center_lat: float, center_lon: float, rows: list[int]) -> list[float]:
+        """Great-circle miles from the center to each of ``rows``."""
+        if not rows:
+            return []
+        if self._arrays is None:
+            lats = self.lats
+            lons = self.lons
+            return [haversine_miles(center_lat, center_lon, lats[i], lons[i]) for i in rows]
+        idx = np.asarray(rows, dtype=np.int64)
+        return _np_haversine(center_lat, center_lon, self._arrays["lat"][idx], self._arrays["lon"][idx]).tolist()
+
+    def nearest_per_system(
+        self,
+        matches: list[tuple[int, float]],
+        limit: int,
+        preferred_rows: Optional[set[int]] = None,
+    ) -> list[tuple[int, float]]:
+        """Up to ``limit`` of ``matches`` per trunk, grouped by trunk id.
+
+        Within a trunk, rows in ``preferred_rows`` rank first, then by
+        ``(distance, site_id)``.
+        """
+        if not matches or limit <= 0:
+            return []
+        preferred = preferred_rows or set()
+        if self._arrays is not None:
+            return self._nearest_per_system_np(matches, limit, preferred)
+        trunk_ids = self.trunk_ids
+        site_ids = self.site_ids
+        ranked = sorted(
+            matches,
+            key=lambda item: (trunk_ids[item[0]], item[0] not in preferred, item[1], site_ids[item[0]]),
+        )
+        out: list[tuple[int, float]] = []
+        kept: dict[int, int] = {}
+        for row, distance in ranked:
+            trunk = trunk_ids[row]
+            count = kept.get(trunk, 0)
+            if count < limit:
+                out.append((row, distance))
+                kept[trunk] = count + 1
+        return out
+
+    def _nearest_per_system_np(self, matches, limit, preferred) -> list[tuple[int, float]]:
+        arr = self._arrays
+        idx = np.fromiter((row for row, _distance in matches), dtype=np.int64, count=len(matches))
+        distance = np.fromiter((d for _row, d in matches), dtype=np.float64, count=len(matches))
+        trunk = arr["trunk"][idx]
+        if preferred:
+            outside = ~np.isin(idx, np.fromiter(preferred, dtype=np.int64))
+        else:
+            outside = np.zeros(idx.shape[0], dtype=bool)
+        order = np.lexsort((arr["site"][idx], distance, outside, trunk))
+        trunk_sorted = trunk[order]
+        starts = np.flatnonzero(np.r_[True, trunk_sorted[1:] != trunk_sorted[:-1]])
+        group_start = np.repeat(starts, np.diff(np.r_[starts, order.shape[0]]))
+        keep = order[np.arange(order.shape[0]) - group_start < limit]
+        return list(zip(idx[keep].tolist(), distance[keep].tolist()))
+
+    def select(
+        self,
+        *,
+        center_lat: float,
+        center_lon: float,
+        range_miles: float,
+        strict_location: bool,
+        include_nationwide: bool,
+        localized_trunk_ids: set[int],
+        multistate_radius_cap: Optional[float] = None,
+        candidate_rows: Optional[list[int]] = None,
+    ) -> list[tuple[int, float]]:
+        """``(row, distance)`` for sites inside range, in table order.
+
+        Multistate (``_MultipleStates.hpd``) sites are skipped unless
+        nationwide systems are enabled or their trunk is localized; when
+        ``multistate_radius_cap`` is given, oversized multistate centroids
+        are dropped as well.
+        """
+        user_range = max(0.0, float(range_miles))
+        lon_miles_per_degree = max(1e-6, _LAT_MILES_PER_DEGREE * abs(math.cos(math.radians(center_lat))))
+        if self._arrays is not None:
+            return self._select_np(
+                center_lat, center_lon, user_range, lon_miles_per_degree, bool(strict_location),
+                bool(include_nationwide), localized_trunk_ids, multistate_radius_cap, candidate_rows,
+            )
+        rows = range(len(self.site_ids)) if candidate_rows is None else candidate_rows
+        out: list[tuple[int, float]] = []
+        for i in rows:
+            radius = self.radii[i]
+            if self.multistate[i] and not include_nationwide:
+                if self.trunk_ids[i] not in localized_trunk_ids:
+                    continue
+                if multistate_radius_cap is not None and radius > multistate_radius_cap:
+                    continue
+            threshold = user_range if strict_location else user_range + radius
+            lat = self.lats[i]
+            lon = self.lons[i]
+            if abs(lat - center_lat) * _LAT_MILES_PER_DEGREE > threshold:
+                continue
+            if abs(lon - center_lon) * lon_miles_per_degree > threshold:
+                continue
+            distance = haversine_miles(center_lat, center_lon, lat, lon)
+            if distance > threshold:
+                continue
+            out.append((i, distance))
+        return out
+
+    def _select_np(
+        self,
+        center_lat, center_lon, user_range, lon_miles_per_degree, strict, include_nationwide,
+        localized_trunk_ids, multistate_radius_cap, candidate_rows,
+    ) -> list[tuple[int, float]]:
+        arr = self._arrays
+        if candidate_rows is None:
+            idx = np.arange(len(self.site_ids), dtype=np.int64)
+        else:
+            idx = np.asarray(candidate_rows, dtype=np.int64)
+        lat = arr["lat"][idx]
+        lon = arr["lon"][idx]
+        radius = arr["radius"][idx]
+        keep = np.ones(idx.shape[0], dtype=bool)
+        if not include_nationwide:
+            multistate = arr["multistate"][idx]
+            if localized_trunk_ids:
+                localized = np.isin(arr["trunk"][idx], np.fromiter(localized_trunk_ids, dtype=np.int64))
+            else:
+                localized = np.zeros(idx.shape[0], dtype=bool)
+            keep &= ~(multistate & ~localized)
+            if multistate_radius_cap is not None:
+                keep &= ~(multistate & (radius > multistate_radius_cap))
+        threshold = np.full(idx.shape[0], user_range) if strict else user_range + radius
+        keep &= np.abs(lat - center_lat) * _LAT_MILES_PER_DEGREE <= threshold
+        keep &= np.abs(lon - center_lon) * lon_miles_per_degree <= threshold
+        idx, lat, lon, threshold = idx[keep], lat[keep], lon[keep], threshold[keep]
+        distance = _np_haversine(center_lat, center_lon, lat, lon)
+        inside = distance <= threshold
+        return list(zip(idx[inside].tolist(), distance[inside].tolist()))
+
+
+def _np_haversine(lat1: float, lon1: float, lat2, lon2):
+    lat1r = math.radians(float(lat1))
+    lon1r = math.radians(float(lon1))
+    lat2r = np.radians(lat2)
+    lon2r = np.radians(lon2)
+    a = np.sin((lat2r - lat1r) / 2.0) ** 2 + math.cos(lat1r) * np.cos(lat2r) * np.sin((lon2r - lon1r) / 2.0) ** 2
+    return _EARTH_RADIUS_MILES * 2.0 * np.arcsin(np.sqrt(a))
+
+
+_TABLES: dict[str, tuple[tuple, SiteTable]] = {}
+_TABLES_LOCK = threading.Lock()
+
+
+def load_site_table(pool) -> SiteTable:
+    """Site table for ``pool``'s database, rebuilt when the file changes."""
+    fingerprint = pool.fingerprint()
+    with _TABLES_LOCK:
+        cached = _TABLES.get(pool.db_path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+    site_name = "ts.site_name" if pool.has_column("trunk_sites", "site_name") else "''"
+    if pool.has_column("trunk_systems", "system_name"):
+        system_name = "sys.system_name"
+        system_join = "LEFT JOIN trunk_systems sys ON sys.trunk_id = ts.trunk_id"
+    else:
+        system_name = "''"
+        system_join = ""
+    with pool.read() as conn:
+        rows = conn.execute(
+            f"""
+            SELECT ts.site_id, ts.trunk_id, ts.source_file, ts.latitude, ts.longitude, ts.radius,
+                   {site_name}, {system_name}
+            FROM trunk_sites ts
+            {system_join}
+            ORDER BY ts.trunk_id, ts.site_id
+            """
+        ).fetchall()
+    table = SiteTable(tuple(row) for row in rows)
+    with _TABLES_LOCK:
+        _TABLES[pool.db_path] = (fingerprint, table)
+    return table
+
+
+def candidate_site_rows(pool, table: SiteTable, center_lat: float, center_lon: float, range_miles: float):
+    """R*Tree-prefiltered table rows for the pure-Python path; None means scan all rows."""
+    if table.vectorized:
+        return None
+    join, params = spatial_filter_join(pool, "trunk_sites", "ts", center_lat, center_lon, range_miles)
+    if not join:
+        return None
+    with pool.read() as conn:
+        site_ids = [int(row[0]) for row in conn.execute(f"SELECT ts.site_id FROM trunk_sites ts {join}", params)]
+    return table.rows_for_sites(site_ids)
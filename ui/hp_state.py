@@ -275,6 +275,11 @@ class HPState:
         out_path.parent.mkdir(parents=True, exist_ok=True)
         with out_path.open("w", encoding="utf-8") as handle:
             json.dump(self.to_dict(), handle, indent=2, sort_keys=True)
+        try:
+            from .scan_mode_controller import notify_scan_pool_changed
+        except Exception:
+            return
+        notify_scan_pool_changed()
 
     @classmethod
     def load(
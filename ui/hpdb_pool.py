@@ -0,0 +1,173 @@
+"""Shared read-only SQLite connections for the HomePatrol database.
+
+The wizard, scan-pool builder, scan-mode controller and service-type helpers
+used to open a fresh ``sqlite3.connect`` (and re-run ``PRAGMA table_info``
+probes) on every call. ``HpdbPool`` keeps a small stack of idle read-only
+connections per database file instead. A connection is borrowed by one
+thread at a time, so the threaded server's per-request threads can reuse it
+together with its statement cache. Connections are reopened when the file is
+replaced (new inode), and the schema probe is redone when the file changes.
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+from urllib.parse import quote
+
+from .config import HPDB_CACHE_KIB, HPDB_MMAP_BYTES, HPDB_POOL_MAX_IDLE
+
+
+_STATEMENT_CACHE_SIZE = 256
+
+
+class HpdbPool:
+    """Idle-connection pool and schema probe for one HPDB file."""
+
+    def __init__(
+        self,
+        db_path: str,
+        max_idle: int = HPDB_POOL_MAX_IDLE,
+        mmap_bytes: int = HPDB_MMAP_BYTES,
+        cache_kib: int = HPDB_CACHE_KIB,
+    ):
+        self.db_path = str(Path(db_path).expanduser().resolve())
+        self._max_idle = max(0, int(max_idle))
+        self._mmap_bytes = max(0, int(mmap_bytes))
+        self._cache_kib = max(0, int(cache_kib))
+        self._lock = threading.Lock()
+        self._idle: list[tuple[tuple[int, int], sqlite3.Connection]] = []
+        self._schema_key: tuple | None = None
+        self._schema: dict[str, frozenset[str]] = {}
+        self.opened = 0
+        self.reused = 0
+
+    def fingerprint(self) -> tuple[int, int, int, int, int, int] | None:
+        """Stat key of the database and its ``-wal`` file, or None if the database is missing.
+
+        ``(dev, inode, mtime_ns, size, wal_mtime_ns, wal_size)``, with zeros for
+        a missing ``-wal``. WAL commits stay in the ``-wal`` file until a
+        checkpoint, so the main file's stat alone does not show them.
+        """
+        try:
+            st = os.stat(self.db_path)
+        except OSError:
+            return None
+        try:
+            wal = os.stat(self.db_path + "-wal")
+            wal_key = (wal.st_mtime_ns, wal.st_size)
+        except OSError:
+            wal_key = (0, 0)
+        return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size, *wal_key)
+
+    def _open(self) -> sqlite3.Connection:
+        uri = f"file:{quote(self.db_path)}?mode=ro"
+        conn = sqlite3.connect(
+            uri,
+            uri=True,
+            timeout=5.0,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only = ON")
+        if self._mmap_bytes:
+            conn.execute(f"PRAGMA mmap_size = {self._mmap_bytes}")
+        if self._cache_kib:
+            conn.execute(f"PRAGMA cache_size = -{self._cache_kib}")
+        self.opened += 1
+        return conn
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection (``sqlite3.Row`` rows) for one unit of work."""
+        key = self.fingerprint()
+        if key is None:
+            raise sqlite3.OperationalError(f"unable to open database file: {self.db_path}")
+        identity = key[:2]
+        conn = None
+        stale: list[sqlite3.Connection] = []
+        with self._lock:
+            while self._idle:
+                conn_identity, candidate = self._idle.pop()
+                if conn_identity == identity:
+                    conn = candidate
+                    self.reused += 1
+                    break
+                stale.append(candidate)
+        for old in stale:
+            old.close()
+        if conn is None:
+            conn = self._open()
+        try:
+            yield conn
+        finally:
+            reusable = True
+            if conn.in_transaction:
+                try:
+                    conn.rollback()
+                except sqlite3.Error:
+                    reusable = False
+            if reusable:
+                with self._lock:
+                    if len(self._idle) < self._max_idle:
+                        self._idle.append((identity, conn))
+                        conn = None
+            if conn is not None:
+                conn.close()
+
+    def columns(self, table: str) -> frozenset[str]:
+        """Lower-cased column names of ``table`` (empty if missing), probed once per file change."""
+        key = self.fingerprint()
+        with self._lock:
+            if key is not None and key == self._schema_key:
+                return self._schema.get(str(table).lower(), frozenset())
+        schema: dict[str, frozenset[str]] = {}
+        if key is not None:
+            try:
+                with self.read() as conn:
+                    tables = conn.execute(
+                        "SELECT name FROM sqlite_master WHERE type = 'table'"
+                    ).fetchall()
+                    for row in tables:
+                        name = str(row[0])
+                        cols = conn.execute(f'PRAGMA table_info("{name}")').fetchall()
+                        schema[name.lower()] = frozenset(str(col[1]).strip().lower() for col in cols)
+            except sqlite3.Error:
+                schema = {}
+        with self._lock:
+            self._schema_key = key
+            self._schema = schema
+        return schema.get(str(table).lower(), frozenset())
+
+    def has_column(self, table: str, column: str) -> bool:
+        return str(column).strip().lower() in self.columns(table)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for _identity, conn in idle:
+            conn.close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            idle = len(self._idle)
+        return {"path": self.db_path, "opened": self.opened, "reused": self.reused, "idle": idle}
+
+
+_POOLS: dict[str, HpdbPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_hpdb_pool(db_path: str) -> HpdbPool:
+    """Return the process-wide pool for ``db_path``."""
+    path = str(Path(db_path).expanduser().resolve())
+    with _POOLS_LOCK:
+        pool = _POOLS.get(path)
+        if pool is None:
+            pool = HpdbPool(path)
+            _POOLS[path] = pool
+        return pool
@@ -0,0 +1,301 @@
+"""Long-lived journald followers for analog activity lines.
+
+One ``journalctl -f -o json`` process per unit feeds parsed
+``Activity on <freq>`` lines into an in-memory ring buffer so hit readers
+never have to fork journalctl on the request path.
+"""
+import json
+import subprocess
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+try:
+    from .config import (
+        RE_ACTIVITY,
+        AIRBAND_MIN_MHZ,
+        AIRBAND_MAX_MHZ,
+        ANALOG_JOURNAL_BACKFILL_LINES,
+        ANALOG_JOURNAL_RING_SIZE,
+    )
+except ImportError:
+    from ui.config import (
+        RE_ACTIVITY,
+        AIRBAND_MIN_MHZ,
+        AIRBAND_MAX_MHZ,
+        ANALOG_JOURNAL_BACKFILL_LINES,
+        ANALOG_JOURNAL_RING_SIZE,
+    )
+
+
+_RESTART_BACKOFF_MIN_SEC = 1.0
+_RESTART_BACKOFF_MAX_SEC = 30.0
+
+
+def _record_message(record: dict) -> str:
+    message = record.get("MESSAGE")
+    if isinstance(message, list):
+        # journald emits non-UTF-8 payloads as byte arrays.
+        try:
+            return bytes(int(b) & 0xFF for b in message).decode("utf-8", errors="ignore")
+        except Exception:
+            return ""
+    return str(message or "")
+
+
+def _record_timestamp(record: dict) -> float:
+    try:
+        usec = int(record.get("__REALTIME_TIMESTAMP") or 0)
+    except (TypeError, ValueError):
+        return 0.0
+    # Keep second granularity, matching the short-iso parser used before.
+    return float(usec // 1_000_000)
+
+
+class JournalFollower:
+    """Follow one systemd unit's journal and keep recent activity in memory."""
+
+    def __init__(
+        self,
+        unit: str,
+        ring_size: int = ANALOG_JOURNAL_RING_SIZE,
+        backfill_lines: int = ANALOG_JOURNAL_BACKFILL_LINES,
+    ):
+        self.unit = str(unit or "").strip()
+        self._backfill_lines = max(0, int(backfill_lines))
+        self._lock = threading.Lock()
+        self._activity: deque = deque(maxlen=max(1, int(ring_size)))
+        self._listeners: list[Callable[[str, float, str], None]] = []
+        self._cursor = ""
+        self._ready = False
+        self._version = 0
+        self._last_freq = ""
+        # Journal records ingested so far, activity or not.
+        self._lines_seen = 0
+        # in_airband -> (ts, freq, line number) of the latest hit in that range.
+        self._last_in_range: dict[bool, tuple[float, float, int]] = {}
+        self._proc: Optional[subprocess.Popen] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def ready(self) -> bool:
+        with self._lock:
+            return self._ready
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            return self._version
+
+    def add_listener(self, callback: Callable[[str, float, str], None]) -> None:
+        """Register ``callback(unit, ts, freq)`` for every new activity line."""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"journal-follow-{self.unit}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        proc = self._proc
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.terminate()
+            except Exception:
+                pass
+
+    def activity(self, limit: Optional[int] = None) -> list[tuple[float, str]]:
+        """Return buffered ``(ts, freq)`` activity, oldest first."""
+        with self._lock:
+            items = list(self._activity)
+        if limit is not None and limit >= 0:
+            items = items[-int(limit):] if limit else []
+        return items
+
+    def last_freq(self) -> str:
+        with self._lock:
+            return self._last_freq
+
+    def last_in_range(self, in_airband: bool, scan_lines: Optional[int] = None) -> Optional[float]:
+        """Latest hit in the range, or None if it lies outside the last ``scan_lines`` records.
+
+        ``scan_lines`` mirrors ``journalctl -n``: a hit followed by that many
+        other journal lines is no longer reported.
+        """
+        with self._lock:
+            entry = self._last_in_range.get(bool(in_airband))
+            lines_seen = self._lines_seen
+        if entry is None:
+            return None
+        if scan_lines is not None and lines_seen - entry[2] >= max(0, int(scan_lines)):
+            return None
+        return entry[1]
+
+    def ingest_record(self, record: dict) -> None:
+        """Parse one journal JSON record and update buffers."""
+        cursor = str(record.get("__CURSOR") or "")
+        match = RE_ACTIVITY.search(_record_message(record))
+        if not match:
+            with self._lock:
+                self._lines_seen += 1
+                if cursor:
+                    self._cursor = cursor
+            return
+        freq = match.group(1)
+        ts = _record_timestamp(record) or float(int(time.time()))
+        try:
+            freq_value = float(freq)
+        except ValueError:
+            freq_value = None
+        with self._lock:
+            self._lines_seen += 1
+            if cursor:
+                self._cursor = cursor
+            self._activity.append((ts, freq))
+            self._last_freq = freq
+            if freq_value is not None:
+                key = AIRBAND_MIN_MHZ <= freq_value <= AIRBAND_MAX_MHZ
+                prev = self._last_in_range.get(key)
+                if prev is None or ts >= prev[0]:
+                    self._last_in_range[key] = (ts, freq_value, self._lines_seen)
+            self._version += 1
+            listeners = list(self._listeners)
+        for callback in listeners:
+            try:
+                callback(self.unit, ts, freq)
+            except Exception:
+                pass
+
+    def _ingest_line(self, line: str) -> None:
+        line = (line or "").strip()
+        if not line:
+            return
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            return
+        if isinstance(record, dict):
+            self.ingest_record(record)
+
+    def _backfill(self) -> None:
+        if self._backfill_lines <= 0:
+            return
+        result = subprocess.run(
+            [
+                "journalctl", "-u", self.unit,
+                "-n", str(self._backfill_lines),
+                "-o", "json", "--no-pager",
+            ],
+            check=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        for line in (result.stdout or "").splitlines():
+            self._ingest_line(line)
+
+    def _follow_cmd(self) -> list[str]:
+        cmd = ["journalctl", "-u", self.unit, "-f", "-o", "json", "--no-pager"]
+        with self._lock:
+            cursor = self._cursor
+        if cursor:
+            cmd.extend(["--after-cursor", cursor])
+        else:
+            cmd.extend(["-n", "0"])
+        return cmd
+
+    def _run(self) -> None:
+        try:
+            self._backfill()
+        except FileNotFoundError:
+            # No journalctl on this host; readers keep their fallback path.
+            return
+        except Exception:
+            pass
+        with self._lock:
+            self._ready = True
+        backoff = _RESTART_BACKOFF_MIN_SEC
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self._proc = subprocess.Popen(
+                    self._follow_cmd(),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    bufsize=1,
+                )
+                for line in self._proc.stdout or ():
+                    self._ingest_line(line)
+                    if self._stop.is_set():
+                        break
+            except FileNotFoundError:
+                with self._lock:
+                    self._ready = False
+                return
+            except Exception:
+                pass
+            finally:
+                proc = self._proc
+                self._proc = None
+                if proc is not None and proc.poll() is None:
+                    try:
+                        proc.terminate()
+                        proc.wait(timeout=2)
+                    except Exception:
+                        pass
+            if self._stop.is_set():
+                break
+            if time.monotonic() - started > _RESTART_BACKOFF_MAX_SEC:
+                backoff = _RESTART_BACKOFF_MIN_SEC
+            self._stop.wait(backoff)
+            backoff = min(_RESTART_BACKOFF_MAX_SEC, backoff * 2)
+
+
+_FOLLOWERS: dict[str, JournalFollower] = {}
+_FOLLOWERS_LOCK = threading.Lock()
+
+
+def start_journal_followers(
+    units: list[str],
+    listener: Optional[Callable[[str, float, str], None]] = None,
+) -> list[JournalFollower]:
+    """Start (or reuse) one follower per unit.
+
+    ``listener`` is attached before the first start so it also sees the
+    backfilled lines.
+    """
+    started = []
+    with _FOLLOWERS_LOCK:
+        for unit in units:
+            key = str(unit or "").strip()
+            if not key:
+                continue
+            follower = _FOLLOWERS.get(key)
+            if follower is None:
+                follower = JournalFollower(key)
+                if listener is not None:
+                    follower.add_listener(listener)
+                _FOLLOWERS[key] = follower
+            follower.start()
+            started.append(follower)
+    return started
+
+
+def get_journal_follower(unit: str) -> Optional[JournalFollower]:
+    """Return the follower for a unit once its backfill has completed."""
+    with _FOLLOWERS_LOCK:
+        follower = _FOLLOWERS.get(str(unit or "").strip())
+    if follower is None or not follower.ready:
+        return None
+    return follower
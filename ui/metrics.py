@@ -0,0 +1,303 @@
+"""Fixed-bucket histograms and counters for the UI process.
+
+Hot paths call ``Histogram.observe`` with a duration in milliseconds. That
+is one bisect and a few integer adds under a lock, so it is cheap enough to
+run on every retune. ``snapshot()`` returns cumulative bucket counts
+(Prometheus ``le`` semantics) plus count, sum, max and bucket-interpolated
+p50/p95/p99 for JSON consumers.
+
+``REGISTRY`` holds the process-wide metric families. ``/metrics`` serves
+``REGISTRY.render()`` as OpenMetrics text. Millisecond histograms are
+exported in seconds under ``*_seconds`` names, as scrapers expect.
+"""
+from __future__ import annotations
+
+import abc
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Milliseconds; covers a loopback HTTP call through a slow playlist rewrite.
+DEFAULT_LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0,
+)
+
+
+class Histogram:
+    """Thread-safe histogram with fixed upper bounds and an implicit ``+Inf``."""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS_MS):
+        bounds = sorted({float(b) for b in buckets if math.isfinite(float(b))})
+        if not bounds:
+            raise ValueError("histogram needs at least one finite bucket")
+        self.buckets: tuple[float, ...] = tuple(bounds)
+        self._lock = threading.Lock()
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+
+    def observe(self, value: float) -> None:
+        value = float(value)
+        if not math.isfinite(value):
+            return
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[idx] += 1
+            self._count += 1
+            self._sum += value
+            if value > self._max:
+                self._max = value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the wall time of the ``with`` block, in milliseconds."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe((time.perf_counter() - started) * 1000.0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)
+            self._count = 0
+            self._sum = 0.0
+            self._max = 0.0
+
+    def _quantile(self, counts: list[int], total: int, q: float) -> float:
+        if total <= 0:
+            return 0.0
+        rank = q * total
+        seen = 0
+        lower = 0.0
+        for idx, count in enumerate(counts):
+            upper = self.buckets[idx] if idx < len(self.buckets) else self._max
+            if count and seen + count >= rank:
+                return lower + (upper - lower) * ((rank - seen) / count)
+            seen += count
+            lower = upper
+        return self._max
+
+    def raw(self) -> tuple[list[int], int, float]:
+        """``(per-bucket counts incl. +Inf, count, sum)`` read atomically."""
+        with self._lock:
+            return list(self._counts), self._count, self._sum
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+            total_sum = self._sum
+            peak = self._max
+            p50 = self._quantile(counts, total, 0.50)
+            p95 = self._quantile(counts, total, 0.95)
+            p99 = self._quantile(counts, total, 0.99)
+        cumulative = []
+        running = 0
+        for bound, count in zip(self.buckets, counts):
+            running += count
+            cumulative.append([bound, running])
+        cumulative.append(["+Inf", total])
+        return {
+            "count": total,
+            "sum": round(total_sum, 3),
+            "max": round(peak, 3),
+            "p50": round(p50, 3),
+            "p95": round(p95, 3),
+            "p99": round(p99, 3),
+            "buckets": cumulative,
+        }
+
+
+class Counter:
+    """Monotonic thread-safe counter."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("counters only go up")
+        with self._lock:
+            self._value += float(amount)
+
+    @property
+    def value(self) -> float:
+        with self._lock:
+            return self._value
+
+
+_NAME_OK = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_")
+
+
+def _check_name(name: str) -> str:
+    name = str(name or "")
+    if not name or name[0].isdigit() or not set(name) <= _NAME_OK:
+        raise ValueError(f"invalid metric name: {name!r}")
+    return name
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(pairs: Iterable[tuple[str, str]]) -> str:
+    body = ",".join(f'{key}="{_escape_label(value)}"' for key, value in pairs)
+    return f"{{{body}}}" if body else ""
+
+
+def _format_value(value: float) -> str:
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Family(abc.ABC):
+    """A named metric with one child per label-value tuple."""
+
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Iterable[str] = ()):
+        self.name = _check_name(name)
+        self.help = str(help_text or "")
+        self.labelnames = tuple(_check_name(label) for label in labelnames)
+        self._lock = threading.Lock()
+        self._children: dict[tuple[str, ...], object] = {}
+
+    @abc.abstractmethod
+    def _new_child(self):
+        """A fresh child metric for a new label-value tuple."""
+
+    def labels(self, *values: str, **named: str):
+        if named:
+            values = tuple(named.get(label, "") for label in self.labelnames)
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child()
+                    self._children[key] = child
+        return child
+
+    def children(self) -> list[tuple[tuple[str, ...], object]]:
+        with self._lock:
+            return sorted(self._children.items())
+
+    @abc.abstractmethod
+    def render(self) -> list[str]:
+        """OpenMetrics lines for this family and its children."""
+
+
+class CounterFamily(_Family):
+    kind = "counter"
+
+    def _new_child(self) -> Counter:
+        return Counter()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def render(self) -> list[str]:
+        lines = [f"# TYPE {self.name} counter"]
+        if self.help:
+            lines.append(f"# HELP {self.name} {self.help}")
+        for values, child in self.children():
+            labels = _format_labels(zip(self.labelnames, values))
+            lines.append(f"{self.name}_total{labels} {_format_value(child.value)}")
+        return lines
+
+
+class HistogramFamily(_Family):
+    """Histograms observed in milliseconds and exported in seconds."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS_MS,
+    ):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(buckets)
+
+    def _new_child(self) -> Histogram:
+        return Histogram(self.buckets)
+
+    def observe(self, value_ms: float) -> None:
+        self.labels().observe(value_ms)
+
+    def time(self):
+        return self.labels().time()
+
+    def render(self) -> list[str]:
+        lines = [f"# TYPE {self.name} histogram", f"# UNIT {self.name} seconds"]
+        if self.help:
+            lines.append(f"# HELP {self.name} {self.help}")
+        for values, child in self.children():
+            pairs = list(zip(self.labelnames, values))
+            counts, total, total_sum = child.raw()
+            running = 0
+            for bound, count in zip(child.buckets, counts):
+                running += count
+                labels = _format_labels(pairs + [("le", repr(bound / 1000.0))])
+                lines.append(f"{self.name}_bucket{labels} {running}")
+            lines.append(f"{self.name}_bucket{_format_labels(pairs + [('le', '+Inf')])} {total}")
+            labels = _format_labels(pairs)
+            lines.append(f"{self.name}_count{labels} {total}")
+            lines.append(f"{self.name}_sum{labels} {repr(total_sum / 1000.0)}")
+        return lines
+
+
+class Registry:
+    """Process-wide set of metric families, rendered together for scraping."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._families: dict[str, _Family] = {}
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = cls(name, *args, **kwargs)
+                self._families[name] = family
+            elif not isinstance(family, cls):
+                raise ValueError(f"metric {name} already registered as {family.kind}")
+            return family
+
+    def counter(self, name: str, help_text: str = "", labelnames: Iterable[str] = ()) -> CounterFamily:
+        return self._get_or_create(CounterFamily, name, help_text, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str = "",
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS_MS,
+    ) -> HistogramFamily:
+        return self._get_or_create(HistogramFamily, name, help_text, labelnames, buckets)
+
+    def render(self) -> str:
+        with self._lock:
+            families = [self._families[name] for name in sorted(self._families)]
+        lines: list[str] = []
+        for family in families:
+            lines.extend(family.render())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
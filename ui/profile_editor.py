@@ -21,6 +21,7 @@ try:
         safe_profile_path,
     )
     from .digital import (
+        invalidate_digital_label_cache,
         read_digital_talkgroups,
         validate_digital_profile_id,
         write_digital_listen,
@@ -37,6 +38,7 @@ except ImportError:
         safe_profile_path,
     )
     from ui.digital import (
+        invalidate_digital_label_cache,
         read_digital_talkgroups,
         validate_digital_profile_id,
         write_digital_listen,
@@ -838,6 +840,9 @@ def save_digital_editor_payload(
             except Exception as e:
                 return False, str(e), {}
 
+    if changed:
+        invalidate_digital_label_cache()
+
     if listen_present:
         listen_items = [{"dec": row["dec"], "listen": bool(row["listen"])} for row in tg_rows]
         ok, listen_err = write_digital_listen(profile_id, listen_items)
@@ -0,0 +1,194 @@
+"""Hot-path timers and an on-demand sampling profiler.
+
+``hot_path(name)`` wraps a function so every call records its wall time
+(``perf_counter``) and the calling thread's CPU time (``thread_time``) into a
+per-name ring buffer. While timers are disabled the wrapper costs one global
+read and a call-through. ``timer_stats()`` summarizes the rings for
+``/api/debug/timers``, which shows whether a slow call waited or computed.
+
+``sample_stacks(seconds)`` polls ``sys._current_frames()`` for every thread
+except its own and counts each stack in collapsed form
+(``thread;module:func;module:func count``), the input flamegraph.pl and
+speedscope expect. The thread name is the root frame, so the scheduler,
+preflight sampler, profile loop and HTTP workers stay apart. Only one
+sampling run can be active at a time.
+"""
+from __future__ import annotations
+
+import functools
+import sys
+import threading
+import time
+from collections import Counter, deque
+
+try:
+    from .config import (
+        UI_HOT_PATH_RING_SIZE,
+        UI_HOT_PATH_TIMERS_ENABLED,
+        UI_PROFILE_MAX_SEC,
+        UI_PROFILE_SAMPLE_HZ,
+    )
+except ImportError:
+    from ui.config import (
+        UI_HOT_PATH_RING_SIZE,
+        UI_HOT_PATH_TIMERS_ENABLED,
+        UI_PROFILE_MAX_SEC,
+        UI_PROFILE_SAMPLE_HZ,
+    )
+
+_MAX_STACK_DEPTH = 128
+
+_enabled = bool(UI_HOT_PATH_TIMERS_ENABLED)
+_rings: dict[str, deque] = {}
+_rings_lock = threading.Lock()
+_sampler_lock = threading.Lock()
+
+
+class ProfilerBusy(RuntimeError):
+    """Raised when a sampling run is already in progress."""
+
+
+def timers_enabled() -> bool:
+    return _enabled
+
+
+def set_timers_enabled(enabled: bool) -> None:
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def _ring(name: str) -> deque:
+    ring = _rings.get(name)
+    if ring is None:
+        with _rings_lock:
+            ring = _rings.setdefault(name, deque(maxlen=UI_HOT_PATH_RING_SIZE))
+    return ring
+
+
+def hot_path(name: str | None = None):
+    """Decorator recording ``(wall_ms, cpu_ms)`` per call under ``name``."""
+
+    def decorate(func):
+        label = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            wall_started = time.perf_counter()
+            cpu_started = time.thread_time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _ring(label).append((
+                    (time.perf_counter() - wall_started) * 1000.0,
+                    (time.thread_time() - cpu_started) * 1000.0,
+                ))
+
+        return wrapper
+
+    return decorate
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def timer_stats() -> dict:
+    """Per-name summary of the samples currently in each ring."""
+    with _rings_lock:
+        rings = sorted(_rings.items())
+    stats: dict[str, dict] = {}
+    for name, ring in rings:
+        samples = list(ring)
+        if not samples:
+            continue
+        walls = sorted(sample[0] for sample in samples)
+        cpus = sorted(sample[1] for sample in samples)
+        wall_total = sum(walls)
+        cpu_total = sum(cpus)
+        stats[name] = {
+            "count": len(samples),
+            "wall_ms_p50": round(_percentile(walls, 0.50), 3),
+            "wall_ms_p95": round(_percentile(walls, 0.95), 3),
+            "wall_ms_max": round(walls[-1], 3),
+            "cpu_ms_p50": round(_percentile(cpus, 0.50), 3),
+            "cpu_ms_p95": round(_percentile(cpus, 0.95), 3),
+            "cpu_ms_total": round(cpu_total, 3),
+            "cpu_share": round(cpu_total / wall_total, 3) if wall_total > 0 else 0.0,
+        }
+    return stats
+
+
+def reset_timers() -> None:
+    with _rings_lock:
+        for ring in _rings.values():
+            ring.clear()
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__") or code.co_filename
+    return f"{module}:{code.co_name}".replace(";", ":")
+
+
+def _collapse(frame, thread_name: str) -> str:
+    parts = []
+    while frame is not None and len(parts) < _MAX_STACK_DEPTH:
+        parts.append(_frame_label(frame))
+        frame = frame.f_back
+    parts.append(str(thread_name).replace(";", ":"))
+    parts.reverse()
+    return ";".join(parts)
+
+
+def sample_stacks(seconds: float, interval: float | None = None) -> dict:
+    """Sample every other thread's stack for ``seconds`` (clamped to ``UI_PROFILE_MAX_SEC``).
+
+    Returns ``{"seconds", "interval", "samples", "stacks"}`` where ``stacks``
+    maps each collapsed stack to the number of samples it appeared in.
+    Raises ``ProfilerBusy`` if another run holds the sampler.
+    """
+    seconds = max(0.0, min(float(seconds), UI_PROFILE_MAX_SEC))
+    if interval is None:
+        interval = 1.0 / UI_PROFILE_SAMPLE_HZ
+    interval = max(0.001, float(interval))
+    if not _sampler_lock.acquire(blocking=False):
+        raise ProfilerBusy("a profile is already running")
+    try:
+        own_ident = threading.get_ident()
+        stacks: Counter = Counter()
+        samples = 0
+        deadline = time.monotonic() + seconds
+        while True:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            frames = sys._current_frames()
+            for ident, frame in frames.items():
+                if ident == own_ident:
+                    continue
+                stacks[_collapse(frame, names.get(ident, f"thread-{ident}"))] += 1
+            del frames
+            samples += 1
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+    finally:
+        _sampler_lock.release()
+    return {
+        "seconds": seconds,
+        "interval": interval,
+        "samples": samples,
+        "stacks": dict(stacks),
+    }
+
+
+def render_collapsed(stacks: dict) -> str:
+    """Collapsed-stack text, heaviest stacks first."""
+    lines = [
+        f"{stack} {count}"
+        for stack, count in sorted(stacks.items(), key=lambda item: (-item[1], item[0]))
+    ]
+    return "\n".join(lines) + ("\n" if lines else "")
@@ -1,16 +1,21 @@
 """Scan mode controller for SB3 scan-pool workflows."""
 from __future__ import annotations
 
+import copy
+import hashlib
 import json
 import math
 import os
 import sqlite3
 import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from .config import HPDB_DB_PATH, HP_AVOIDS_PATH
-from .hp_scan_pool import ScanPoolBuilder, haversine_miles
+from .hp_scan_pool import ScanPoolBuilder, haversine_miles, spatial_filter_join
+from .hp_site_table import candidate_site_rows, load_site_table
+from .hpdb_pool import get_hpdb_pool
 from .zip_lookup import resolve_postal_to_lat_lon
 
 
@@ -38,6 +43,9 @@ def _normalize_mode_token(mode: str) -> str:
     return token
 
 
+_NO_TGID_RECORD = ("", "")
+
+
 def _empty_pool() -> dict[str, list]:
     return {
         "trunked_sites": [],
@@ -45,6 +53,75 @@ def _empty_pool() -> dict[str, list]:
     }
 
 
+@dataclass(frozen=True)
+class ScanPoolSnapshot:
+    """A built scan pool with tgid and site lookups derived from it once."""
+
+    key: str
+    pool: dict[str, list]
+    # tgid -> {system_id: (label, group)} across every trunked site in the pool.
+    tgid_index: dict[int, dict[int, tuple[str, str]]] = field(default_factory=dict)
+    site_to_system: dict[int, int] = field(default_factory=dict)
+    # tgid -> (label, group) for talkgroups every system in the pool agrees on.
+    tgid_unique: dict[int, tuple[str, str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_pool(cls, key: str, pool: dict[str, list]) -> "ScanPoolSnapshot":
+        tgid_index: dict[int, dict[int, tuple[str, str]]] = {}
+        site_to_system: dict[int, int] = {}
+        records: dict[tuple[str, str], tuple[str, str]] = {}
+        for row in pool.get("trunked_sites") or []:
+            if not isinstance(row, dict):
+                continue
+            system_id = ScanModeController._parse_int(row.get("system_id")) or 0
+            site_id = ScanModeController._parse_int(row.get("site_id")) or 0
+            if site_id > 0 and system_id > 0:
+                site_to_system.setdefault(site_id, system_id)
+            labels = row.get("talkgroup_labels") if isinstance(row.get("talkgroup_labels"), dict) else {}
+            groups = row.get("talkgroup_groups") if isinstance(row.get("talkgroup_groups"), dict) else {}
+            for raw_tgid in row.get("talkgroups") or []:
+                tgid = ScanModeController._parse_int(raw_tgid)
+                if tgid is None or tgid <= 0:
+                    continue
+                key_text = str(tgid)
+                label = str(labels.get(key_text) or "").strip()
+                group = str(groups.get(key_text) or "").strip()
+                if not (label or group):
+                    continue
+                record = records.setdefault((label, group), (label, group))
+                tgid_index.setdefault(tgid, {}).setdefault(system_id, record)
+        tgid_unique: dict[int, tuple[str, str]] = {}
+        for tgid, entries in tgid_index.items():
+            candidates = set(entries.values())
+            if len(candidates) == 1:
+                tgid_unique[tgid] = next(iter(candidates))
+        return cls(
+            key=key,
+            pool=pool,
+            tgid_index=tgid_index,
+            site_to_system=site_to_system,
+            tgid_unique=tgid_unique,
+        )
+
+    def lookup_tgid(self, tgid, site_id=None) -> tuple[str, str]:
+        """``(label, group)`` for ``tgid``, scoped to ``site_id``'s system when known.
+
+        Without a usable site, a talkgroup is only resolved when every system
+        in the pool agrees on its label and group.
+        """
+        parsed = ScanModeController._parse_int(tgid)
+        if parsed is None:
+            return _NO_TGID_RECORD
+        site = ScanModeController._parse_int(site_id)
+        if site is not None:
+            system_id = self.site_to_system.get(site)
+            if system_id is not None:
+                record = (self.tgid_index.get(parsed) or {}).get(system_id)
+                if record is not None:
+                    return record
+        return self.tgid_unique.get(parsed, _NO_TGID_RECORD)
+
+
 class ScanModeController:
     def __init__(
         self,
@@ -54,11 +131,21 @@ class ScanModeController:
         self.mode = "expert"
         self._db_path = str(Path(db_path).expanduser().resolve())
         self._hp_avoids_path = str(Path(avoids_path).expanduser())
+        self._hpdb = get_hpdb_pool(self._db_path)
         self._hp_builder = ScanPoolBuilder(self._db_path)
         self._hp_avoided_systems: set[str] = set()
         self._multistate_localized_trunk_ids: set[int] | None = None
         self._multistate_localized_conv_system_keys: set[str] | None = None
         self._lock = threading.Lock()
+        self._pool_cache_lock = threading.Lock()
+        self._pool_cache: ScanPoolSnapshot | None = None
+        self._pool_cache_hits = 0
+        self._pool_cache_misses = 0
+        # Bumped whenever a scan-pool input changes; see pool_version().
+        self._pool_version_lock = threading.Lock()
+        self._pool_version = 0
+        self._pool_version_db = self._hpdb.fingerprint()
+        self._pool_version_listeners: list = []
         self._load_hp_avoids_from_disk()
 
     def set_mode(self, mode: str):
@@ -66,7 +153,10 @@ class ScanModeController:
         if next_mode not in _VALID_MODES:
             raise ValueError("mode must be SB3/expert")
         with self._lock:
+            changed = self.mode != next_mode
             self.mode = next_mode
+        if changed:
+            self.bump_pool_version()
 
     def get_mode(self) -> str:
         with self._lock:
@@ -154,6 +244,7 @@ class ScanModeController:
             self._hp_avoided_systems = set(normalized)
 
     def _persist_hp_avoids_locked(self) -> None:
+        self.bump_pool_version()
         path = str(self._hp_avoids_path or "").strip()
         if not path:
             return
@@ -332,57 +423,27 @@ class ScanModeController:
         include_nationwide: bool,
         strict_location: bool = False,
     ) -> tuple[set[int], set[str]]:
-        rows = conn.execute(
-            """
-            SELECT
-                ts.trunk_id,
-                ts.source_file,
-                ts.latitude,
-                ts.longitude,
-                ts.radius,
-                sys.system_name
-            FROM trunk_sites ts
-            LEFT JOIN trunk_systems sys ON sys.trunk_id = ts.trunk_id
-            ORDER BY ts.trunk_id, ts.site_id
-            """
-        ).fetchall()
         localized_trunk_ids: set[int] = set()
         if not include_nationwide:
             localized_trunk_ids, _ = self._load_multistate_scope_overrides(conn)
-        lat_miles_per_degree = 69.0
-        lon_miles_per_degree = max(1e-6, 69.0 * abs(math.cos(math.radians(center_lat))))
+        sites = load_site_table(self._hpdb)
+        matches = sites.select(
+            center_lat=center_lat,
+            center_lon=center_lon,
+            range_miles=range_miles,
+            strict_location=strict_location,
+            include_nationwide=include_nationwide,
+            localized_trunk_ids=localized_trunk_ids,
+            candidate_rows=candidate_site_rows(self._hpdb, sites, center_lat, center_lon, range_miles),
+        )
         nearby_ids: set[int] = set()
         nearby_names: set[str] = set()
-        for row in rows:
-            source_file = str(row["source_file"] or "").strip().lower()
-            trunk_id = self._parse_int(row["trunk_id"])
-            if (
-                source_file == "_multiplestates.hpd"
-                and not include_nationwide
-                and (trunk_id is None or trunk_id not in localized_trunk_ids)
-            ):
-                continue
-            target_lat = self._parse_float(row["latitude"])
-            target_lon = self._parse_float(row["longitude"])
-            target_radius = self._parse_float(row["radius"]) or 0.0
-            if trunk_id is None or trunk_id <= 0:
-                continue
-            if target_lat is None or target_lon is None:
-                continue
-            if not self._within_location_threshold(
-                center_lat=center_lat,
-                center_lon=center_lon,
-                target_lat=target_lat,
-                target_lon=target_lon,
-                target_radius=target_radius,
-                lat_miles_per_degree=lat_miles_per_degree,
-                lon_miles_per_degree=lon_miles_per_degree,
-                range_miles=range_miles,
-                strict_location=strict_location,
-            ):
+        for idx, _distance in matches:
+            trunk_id = sites.trunk_ids[idx]
+            if trunk_id <= 0:
                 continue
             nearby_ids.add(int(trunk_id))
-            system_name = self._normalize_text_token(row["system_name"])
+            system_name = self._normalize_text_token(sites.system_names[idx])
             if system_name:
                 nearby_names.add(system_name)
         return nearby_ids, nearby_names
@@ -397,8 +458,11 @@ class ScanModeController:
         include_nationwide: bool,
         strict_location: bool = False,
     ) -> tuple[set[str], set[str]]:
+        group_join, group_params = spatial_filter_join(
+            self._hpdb, "conventional_groups", "cg", center_lat, center_lon, range_miles
+        )
         rows = conn.execute(
-            """
+            f"""
             SELECT DISTINCT
                 (cg.parent_key || ':' || CAST(cg.parent_id AS TEXT)) AS system_key,
                 cs.system_name,
@@ -407,10 +471,12 @@ class ScanModeController:
                 cg.longitude,
                 cg.radius
             FROM conventional_groups cg
+            {group_join}
             LEFT JOIN conventional_systems cs
               ON cs.system_key = (cg.parent_key || ':' || CAST(cg.parent_id AS TEXT))
             ORDER BY system_key
-            """
+            """,
+            group_params,
         ).fetchall()
         localized_conv_keys: set[str] = set()
         if not include_nationwide:
@@ -475,34 +541,26 @@ class ScanModeController:
         include_nationwide = bool(getattr(state, "nationwide_systems", False))
         strict_location = bool(getattr(state, "strict_location", False))
 
-        conn: sqlite3.Connection | None = None
         try:
-            conn = sqlite3.connect(self._db_path)
-            conn.row_factory = sqlite3.Row
-            nearby_trunk_ids, nearby_trunk_names = self._load_nearby_trunk_systems(
-                conn,
-                center_lat=center_lat,
-                center_lon=center_lon,
-                range_miles=range_miles,
-                include_nationwide=include_nationwide,
-                strict_location=strict_location,
-            )
-            nearby_conv_keys, nearby_conv_names = self._load_nearby_conventional_systems(
-                conn,
-                center_lat=center_lat,
-                center_lon=center_lon,
-                range_miles=range_miles,
-                include_nationwide=include_nationwide,
-                strict_location=strict_location,
-            )
+            with self._hpdb.read() as conn:
+                nearby_trunk_ids, nearby_trunk_names = self._load_nearby_trunk_systems(
+                    conn,
+                    center_lat=center_lat,
+                    center_lon=center_lon,
+                    range_miles=range_miles,
+                    include_nationwide=include_nationwide,
+                    strict_location=strict_location,
+                )
+                nearby_conv_keys, nearby_conv_names = self._load_nearby_conventional_systems(
+                    conn,
+                    center_lat=center_lat,
+                    center_lon=center_lon,
+                    range_miles=range_miles,
+                    include_nationwide=include_nationwide,
+                    strict_location=strict_location,
+                )
         except Exception:
             return filtered_by_service
-        finally:
-            try:
-                if conn is not None:
-                    conn.close()
-            except Exception:
-                pass
 
         filtered_by_location: list[dict] = []
         for row in filtered_by_service:
@@ -583,7 +641,7 @@ class ScanModeController:
         elif str(system_name or "").strip():
             name_token = str(system_name).strip().lower()
             try:
-                with sqlite3.connect(self._db_path) as conn:
+                with self._hpdb.read() as conn:
                     rows = conn.execute(
                         """
                         SELECT trunk_id
@@ -609,7 +667,7 @@ class ScanModeController:
 
         for trunk_id in trunk_ids:
             try:
-                with sqlite3.connect(self._db_path) as conn:
+                with self._hpdb.read() as conn:
                     rows = conn.execute(
                         """
                         SELECT DISTINCT tf.freq_hz
@@ -767,130 +825,86 @@ class ScanModeController:
         if not system_ids:
             return {}
 
-        lat_miles_per_degree = 69.0
-        lon_miles_per_degree = max(1e-6, 69.0 * abs(math.cos(math.radians(center_lat))))
         site_limit = _sites_per_system_limit()
 
         out: dict[int, dict[str, Any]] = {}
-        conn: sqlite3.Connection | None = None
         try:
-            conn = sqlite3.connect(self._db_path)
-            conn.row_factory = sqlite3.Row
-            localized_trunk_ids: set[int] = set()
-            if not include_nationwide:
-                localized_trunk_ids, _ = self._load_multistate_scope_overrides(conn)
-
-            for system_id in system_ids:
-                if system_id <= 0:
-                    continue
-                rows = conn.execute(
-                    """
-                    SELECT
-                        ts.site_id,
-                        ts.source_file,
-                        ts.latitude,
-                        ts.longitude,
-                        ts.radius
-                    FROM trunk_sites ts
-                    WHERE ts.trunk_id = ?
-                    ORDER BY ts.site_id
-                    """,
-                    (int(system_id),),
-                ).fetchall()
-
-                in_range: list[tuple[float, int]] = []
-                all_candidates: list[tuple[float, int]] = []
-                for row in rows:
-                    source_file = str(row["source_file"] or "").strip().lower()
-                    if (
-                        source_file == "_multiplestates.hpd"
-                        and not include_nationwide
-                        and system_id not in localized_trunk_ids
-                    ):
-                        continue
-                    site_id = self._parse_int(row["site_id"])
-                    site_lat = self._parse_float(row["latitude"])
-                    site_lon = self._parse_float(row["longitude"])
-                    if site_id is None or site_id <= 0:
-                        continue
-                    if site_lat is None or site_lon is None:
-                        continue
-                    distance = haversine_miles(center_lat, center_lon, site_lat, site_lon)
-                    all_candidates.append((float(distance), int(site_id)))
-                    target_radius = max(0.0, float(self._parse_float(row["radius"]) or 0.0))
-                    if self._within_location_threshold(
+            sites = load_site_table(self._hpdb)
+            with self._hpdb.read() as conn:
+                localized_trunk_ids: set[int] = set()
+                if not include_nationwide:
+                    localized_trunk_ids, _ = self._load_multistate_scope_overrides(conn)
+
+                rows = [
+                    idx
+                    for system_id in system_ids
+                    if system_id > 0
+                    for idx in sites.rows_for_system(system_id)
+                    if sites.site_ids[idx] > 0
+                    and (
+                        include_nationwide
+                        or system_id in localized_trunk_ids
+                        or not sites.multistate[idx]
+                    )
+                ]
+                in_range = {
+                    idx
+                    for idx, _distance in sites.select(
                         center_lat=center_lat,
                         center_lon=center_lon,
-                        target_lat=site_lat,
-                        target_lon=site_lon,
-                        target_radius=target_radius,
-                        lat_miles_per_degree=lat_miles_per_degree,
-                        lon_miles_per_degree=lon_miles_per_degree,
                         range_miles=range_miles,
                         strict_location=strict_location,
-                    ):
-                        in_range.append((float(distance), int(site_id)))
+                        include_nationwide=include_nationwide,
+                        localized_trunk_ids=localized_trunk_ids,
+                        candidate_rows=rows,
+                    )
+                }
+                # In-range sites first, then the nearest others, up to site_limit per system.
+                keep_by_system: dict[int, list[tuple[float, int]]] = {}
+                for idx, distance in sites.nearest_per_system(
+                    list(zip(rows, sites.distances(center_lat, center_lon, rows))),
+                    site_limit,
+                    preferred_rows=in_range,
+                ):
+                    keep_by_system.setdefault(sites.trunk_ids[idx], []).append(
+                        (float(distance), int(sites.site_ids[idx]))
+                    )
 
-                if not all_candidates:
-                    continue
-                ranked_in = sorted(in_range, key=lambda item: (float(item[0]), int(item[1])))
-                ranked_all = sorted(all_candidates, key=lambda item: (float(item[0]), int(item[1])))
-                keep: list[tuple[float, int]] = []
-                seen_site_ids: set[int] = set()
-                for distance, site_id in ranked_in:
-                    if site_id in seen_site_ids:
+                for system_id in system_ids:
+                    keep = keep_by_system.get(system_id)
+                    if not keep:
+                        continue
+                    keep_site_ids = [int(site_id) for _distance, site_id in keep if int(site_id) > 0]
+                    if not keep_site_ids:
                         continue
-                    keep.append((float(distance), int(site_id)))
-                    seen_site_ids.add(int(site_id))
-                    if len(keep) >= site_limit:
-                        break
-                if len(keep) < site_limit:
-                    for distance, site_id in ranked_all:
-                        if site_id in seen_site_ids:
-                            continue
-                        keep.append((float(distance), int(site_id)))
-                        seen_site_ids.add(int(site_id))
-                        if len(keep) >= site_limit:
-                            break
-                if not keep:
-                    continue
-                keep_site_ids = [int(site_id) for _distance, site_id in keep if int(site_id) > 0]
-                if not keep_site_ids:
-                    continue
 
-                placeholders = ",".join("?" for _ in keep_site_ids)
-                freq_rows = conn.execute(
-                    f"""
-                    SELECT DISTINCT freq_hz
-                    FROM trunk_freqs
-                    WHERE site_id IN ({placeholders})
-                      AND freq_hz IS NOT NULL
-                    ORDER BY freq_hz
-                    """,
-                    keep_site_ids,
-                ).fetchall()
-                controls_mhz: list[float] = []
-                for freq_row in freq_rows:
-                    freq_hz = self._parse_int(freq_row["freq_hz"])
-                    if freq_hz is None or freq_hz <= 0:
+                    placeholders = ",".join("?" for _ in keep_site_ids)
+                    freq_rows = conn.execute(
+                        f"""
+                        SELECT DISTINCT freq_hz
+                        FROM trunk_freqs
+                        WHERE site_id IN ({placeholders})
+                          AND freq_hz IS NOT NULL
+                        ORDER BY freq_hz
+                        """,
+                        keep_site_ids,
+                    ).fetchall()
+                    controls_mhz: list[float] = []
+                    for freq_row in freq_rows:
+                        freq_hz = self._parse_int(freq_row["freq_hz"])
+                        if freq_hz is None or freq_hz <= 0:
+                            continue
+                        controls_mhz.append(round(float(freq_hz) / 1_000_000.0, 6))
+                    controls = self._normalize_control_channels(controls_mhz)
+                    if not controls:
                         continue
-                    controls_mhz.append(round(float(freq_hz) / 1_000_000.0, 6))
-                controls = self._normalize_control_channels(controls_mhz)
-                if not controls:
-                    continue
-                out[int(system_id)] = {
-                    "controls": controls,
-                    "distance_miles": float(keep[0][0]),
-                    "site_ids": [int(item[1]) for item in keep],
-                }
+                    out[int(system_id)] = {
+                        "controls": controls,
+                        "distance_miles": float(keep[0][0]),
+                        "site_ids": [int(item[1]) for item in keep],
+                    }
         except Exception:
             return {}
-        finally:
-            try:
-                if conn is not None:
-                    conn.close()
-            except Exception:
-                pass
         return out
 
     def _trim_favorites_pool_to_nearest_sites(self, pool: dict[str, Any], state) -> dict[str, Any]:
@@ -1063,19 +1077,104 @@ class ScanModeController:
         with self._lock:
             return sorted(self._hp_avoided_systems)
 
-    def get_scan_pool(self):
-        mode = self.get_mode()
-        if mode not in _VALID_MODES:
-            return _empty_pool()
+    def _scan_pool_inputs(self, state) -> dict[str, Any]:
+        """Every value the pool build reads, in a JSON-hashable form."""
+        state_mode = str(state.mode).strip().lower()
+        service_tags = self._resolve_effective_service_tags(state)
+        center = self._resolve_location_center(state)
+        inputs: dict[str, Any] = {
+            "mode": self.get_mode(),
+            "state_mode": state_mode,
+            "service_tags": service_tags,
+            "use_location": bool(getattr(state, "use_location", False)),
+            "center": list(center) if center is not None else None,
+            "range_miles": float(self._parse_float(getattr(state, "range_miles", 0.0)) or 0.0),
+            "strict_location": bool(getattr(state, "strict_location", False)),
+            "nationwide_systems": bool(getattr(state, "nationwide_systems", False)),
+            "avoids": self.get_hp_avoids(),
+            "db": list(self._hpdb.fingerprint() or ()),
+        }
+        if state_mode == "favorites":
+            inputs["favorites"] = self._resolve_active_favorites_entries(state)
+        return inputs
 
+    def get_scan_pool_snapshot(self) -> ScanPoolSnapshot:
+        """Memoized pool plus lookup indexes for the current HP state.
+
+        The pool and its indexes are rebuilt only when one of
+        ``_scan_pool_inputs`` changes. Snapshots are shared between callers;
+        use ``get_scan_pool`` for a pool the caller may modify.
+        """
         try:
             from .hp_state import HPState
         except Exception:
-            return _empty_pool()
+            return _EMPTY_SNAPSHOT
 
         state = HPState.load()
-        state_mode = str(state.mode).strip().lower()
-        service_tags = self._resolve_effective_service_tags(state)
+        inputs = self._scan_pool_inputs(state)
+        key = hashlib.sha1(
+            json.dumps(inputs, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+        ).hexdigest()
+        with self._pool_cache_lock:
+            cached = self._pool_cache
+            if cached is not None and cached.key == key:
+                self._pool_cache_hits += 1
+                return cached
+            self._pool_cache_misses += 1
+            pool = self._build_scan_pool(state, inputs)
+            snapshot = ScanPoolSnapshot.from_pool(key, pool)
+            self._pool_cache = snapshot
+            return snapshot
+
+    def invalidate_scan_pool_cache(self) -> None:
+        with self._pool_cache_lock:
+            self._pool_cache = None
+        self.bump_pool_version()
+
+    def add_pool_version_listener(self, callback) -> None:
+        """Register ``callback()`` to run after every explicit version bump."""
+        with self._pool_version_lock:
+            self._pool_version_listeners.append(callback)
+
+    def bump_pool_version(self) -> int:
+        """Publish that a scan-pool input changed (HP state, avoids, mode)."""
+        with self._pool_version_lock:
+            self._pool_version += 1
+            version = self._pool_version
+            listeners = list(self._pool_version_listeners)
+        for callback in listeners:
+            try:
+                callback()
+            except Exception:
+                continue
+        return version
+
+    def pool_version(self) -> int:
+        """Counter that moves whenever the scan pool may have changed.
+
+        Consumers that derive data from the pool re-read it only when this
+        value differs from the one they last saw. A re-imported HPDB is
+        picked up here from the database file fingerprint, so the check is
+        a single ``stat`` rather than a pool rebuild.
+        """
+        fingerprint = self._hpdb.fingerprint()
+        with self._pool_version_lock:
+            if fingerprint != self._pool_version_db:
+                self._pool_version_db = fingerprint
+                self._pool_version += 1
+            return self._pool_version
+
+    def get_scan_pool(self):
+        # A private copy, so callers editing rows cannot reach the memoized pool.
+        return copy.deepcopy(self.get_scan_pool_snapshot().pool)
+
+    def _build_scan_pool(self, state, inputs: dict[str, Any]) -> dict[str, list]:
+        mode = inputs["mode"]
+        if mode not in _VALID_MODES:
+            return _empty_pool()
+
+        state_mode = inputs["state_mode"]
+        service_tags = list(inputs["service_tags"])
         if not service_tags:
             return _empty_pool()
         if state_mode == "favorites":
@@ -1086,7 +1185,7 @@ class ScanModeController:
         elif state_mode == "full_database":
             if not bool(state.use_location):
                 return _empty_pool()
-            center = self._resolve_location_center(state)
+            center = inputs["center"]
             if center is None:
                 return _empty_pool()
             center_lat, center_lon = center
@@ -1102,8 +1201,7 @@ class ScanModeController:
             pool = self._prefer_nearest_site_per_system(pool)
         else:
             return _empty_pool()
-        with self._lock:
-            avoids = set(self._hp_avoided_systems)
+        avoids = set(inputs["avoids"])
         if not avoids:
             return pool
 
@@ -1180,6 +1278,9 @@ class ScanModeController:
         return pool
 
 
+_EMPTY_SNAPSHOT = ScanPoolSnapshot(key="", pool=_empty_pool())
+
+
 _SCAN_MODE_CONTROLLER: ScanModeController | None = None
 _SCAN_MODE_LOCK = threading.Lock()
 
@@ -1190,3 +1291,10 @@ def get_scan_mode_controller(db_path: str = _DEFAULT_DB_PATH) -> ScanModeControl
         if _SCAN_MODE_CONTROLLER is None:
             _SCAN_MODE_CONTROLLER = ScanModeController(db_path=db_path)
         return _SCAN_MODE_CONTROLLER
+
+
+def notify_scan_pool_changed() -> None:
+    """Bump the shared controller's pool version, if one has been created."""
+    controller = _SCAN_MODE_CONTROLLER
+    if controller is not None:
+        controller.bump_pool_version()
@@ -1,6 +1,7 @@
 """Read-only adapter for scheduler scan-pool retrieval."""
 from __future__ import annotations
 
+import copy
 import threading
 import time
 
@@ -10,6 +11,8 @@ from .scan_mode_controller import get_scan_mode_controller
 _SNAPSHOT_LOCK = threading.Lock()
 _POOL_SNAPSHOT: dict = {"trunked_sites": [], "conventional": []}
 _POOL_SNAPSHOT_TS_MONOTONIC = 0.0
+# ScanPoolSnapshot the current _POOL_SNAPSHOT was read from, for its tgid lookups.
+_POOL_LOOKUP = None
 
 
 def _normalize_mode(mode: str) -> str:
@@ -31,6 +34,7 @@ def get_current_scan_mode() -> str:
 
 
 def _normalize_pool(payload: object) -> dict:
+    # Rows are deep-copied: the controller's memoized pool is shared by every reader.
     if not isinstance(payload, dict):
         return {"trunked_sites": [], "conventional": []}
 
@@ -41,13 +45,13 @@ def _normalize_pool(payload: object) -> dict:
     if isinstance(trunked_raw, list):
         for item in trunked_raw:
             if isinstance(item, dict):
-                trunked_sites.append(dict(item))
+                trunked_sites.append(copy.deepcopy(item))
 
     conventional: list[dict] = []
     if isinstance(conventional_raw, list):
         for item in conventional_raw:
             if isinstance(item, dict):
-                conventional.append(dict(item))
+                conventional.append(copy.deepcopy(item))
 
     return {
         "trunked_sites": trunked_sites,
@@ -58,6 +62,7 @@ def _normalize_pool(payload: object) -> dict:
 def get_active_scan_pool_snapshot(force_refresh: bool = False) -> dict:
     global _POOL_SNAPSHOT
     global _POOL_SNAPSHOT_TS_MONOTONIC
+    global _POOL_LOOKUP
 
     with _SNAPSHOT_LOCK:
         if not force_refresh and _POOL_SNAPSHOT_TS_MONOTONIC > 0:
@@ -65,15 +70,44 @@ def get_active_scan_pool_snapshot(force_refresh: bool = False) -> dict:
 
         try:
             controller = get_scan_mode_controller()
-            payload = controller.get_scan_pool()
+            lookup = controller.get_scan_pool_snapshot()
+            payload = lookup.pool
         except Exception:
+            lookup = None
             payload = {}
 
         _POOL_SNAPSHOT = _normalize_pool(payload)
+        _POOL_LOOKUP = lookup
         _POOL_SNAPSHOT_TS_MONOTONIC = time.monotonic()
         return _normalize_pool(_POOL_SNAPSHOT)
 
 
+def get_active_scan_pool_lookup():
+    """``ScanPoolSnapshot`` behind the last pool snapshot read, or None.
+
+    Its ``lookup_tgid`` indexes are built once per pool by the controller,
+    so consumers resolve talkgroups without deriving their own copy.
+    """
+    with _SNAPSHOT_LOCK:
+        return _POOL_LOOKUP
+
+
+def get_scan_pool_version() -> int | None:
+    """Current scan-pool version, or None when it cannot be read."""
+    try:
+        return get_scan_mode_controller().pool_version()
+    except Exception:
+        return None
+
+
+def subscribe_scan_pool_changes(callback) -> None:
+    """Call ``callback()`` whenever the scan-pool version is bumped."""
+    try:
+        get_scan_mode_controller().add_pool_version_listener(callback)
+    except Exception:
+        return
+
+
 def get_active_scan_pool() -> dict:
     payload = get_active_scan_pool_snapshot(force_refresh=False)
     if not isinstance(payload, dict):
@@ -9,24 +9,30 @@ from typing import Optional
 
 try:
     from .config import (
-        RE_ACTIVITY, RE_ACTIVITY_TS, HIT_GAP_RESET_SECONDS,
+        RE_ACTIVITY, RE_ACTIVITY_TS,
         AIRBAND_MIN_MHZ, AIRBAND_MAX_MHZ, LAST_HIT_AIRBAND_PATH,
         LAST_HIT_GROUND_PATH, ICECAST_HIT_LOG_PATH, ICECAST_HIT_LOG_LIMIT,
-        ICECAST_HIT_MIN_DURATION, UNITS
+        ICECAST_HIT_MIN_DURATION, UNITS, ANALOG_JOURNAL_FOLLOW_ENABLED
     )
     from .systemd import unit_active
+    from .journal_follower import get_journal_follower, start_journal_followers
+    from .hit_sessions import HitSessionIndex
 except ImportError:
     from ui.config import (
-        RE_ACTIVITY, RE_ACTIVITY_TS, HIT_GAP_RESET_SECONDS,
+        RE_ACTIVITY, RE_ACTIVITY_TS,
         AIRBAND_MIN_MHZ, AIRBAND_MAX_MHZ, LAST_HIT_AIRBAND_PATH,
         LAST_HIT_GROUND_PATH, ICECAST_HIT_LOG_PATH, ICECAST_HIT_LOG_LIMIT,
-        ICECAST_HIT_MIN_DURATION, UNITS
+        ICECAST_HIT_MIN_DURATION, UNITS, ANALOG_JOURNAL_FOLLOW_ENABLED
     )
     from ui.systemd import unit_active
+    from ui.journal_follower import get_journal_follower, start_journal_followers
+    from ui.hit_sessions import HitSessionIndex
 
 
 _ANALOG_HIT_CUTOFF_LOCK = threading.Lock()
 _ANALOG_HIT_CUTOFF_TS = {"airband": 0.0, "ground": 0.0}
+# Fed once per activity line by the journal followers.
+_HIT_INDEX = HitSessionIndex()
 
 
 def mark_analog_hit_cutoff(target: str, at_ts: Optional[float] = None) -> None:
@@ -39,6 +45,7 @@ def mark_analog_hit_cutoff(target: str, at_ts: Optional[float] = None) -> None:
         current = float(_ANALOG_HIT_CUTOFF_TS.get(key) or 0.0)
         if ts > current:
             _ANALOG_HIT_CUTOFF_TS[key] = ts
+    _HIT_INDEX.apply_cutoff(key, ts)
     # Force cache miss so callers see post-switch hits immediately.
     read_hit_list_cached._cache = {"value": [], "ts": 0.0}
 
@@ -68,8 +75,18 @@ def read_last_hit_file(path: str) -> str:
     return ""
 
 
+def start_analog_journal_followers() -> None:
+    """Start persistent journal followers for the analog units."""
+    if not ANALOG_JOURNAL_FOLLOW_ENABLED:
+        return
+    start_journal_followers([UNITS["rtl"], UNITS["ground"]], listener=_HIT_INDEX.ingest)
+
+
 def read_last_hit_from_journal_unit(unit: str) -> str:
     """Read the last activity from journalctl for a unit."""
+    follower = get_journal_follower(unit)
+    if follower is not None:
+        return follower.last_freq()
     try:
         result = subprocess.run(
             ["journalctl", "-u", unit, "-n", "200", "-o", "cat", "--no-pager"],
@@ -97,8 +114,8 @@ def parse_activity_timestamp(date_part: str, time_part: str, tz_part: Optional[s
     return datetime.datetime.strptime(f"{date_part} {time_part}", "%Y-%m-%d %H:%M:%S")
 
 
-def read_last_hit_for_range(unit: str, in_airband: bool, scan_lines: int = 400) -> str:
-    """Read the last hit in a specific frequency range."""
+def _read_journal_activity(unit: str, scan_lines: int) -> list[tuple[float, str]]:
+    """Fork journalctl once and return ``(ts, freq)`` activity, oldest first."""
     try:
         result = subprocess.run(
             ["journalctl", "-u", unit, "-n", str(scan_lines), "-o", "short-iso", "--no-pager"],
@@ -108,24 +125,35 @@ def read_last_hit_for_range(unit: str, in_airband: bool, scan_lines: int = 400)
             text=True,
         )
     except Exception:
-        return ""
-
-    latest_ts = None
-    latest_freq = None
+        return []
+    hits = []
     for line in (result.stdout or "").splitlines():
         match = RE_ACTIVITY_TS.search(line)
         if not match:
             continue
-        try:
-            freq_value = float(match.group("freq"))
-        except ValueError:
-            continue
-        if _freq_in_airband(freq_value) != in_airband:
-            continue
         ts = parse_activity_timestamp(match.group("date"), match.group("time"), None)
-        if latest_ts is None or ts > latest_ts:
-            latest_ts = ts
-            latest_freq = freq_value
+        hits.append((ts.timestamp(), match.group("freq")))
+    return hits
+
+
+def read_last_hit_for_range(unit: str, in_airband: bool, scan_lines: int = 400) -> str:
+    """Read the last hit in a specific frequency range."""
+    follower = get_journal_follower(unit)
+    if follower is not None:
+        latest_freq = follower.last_in_range(in_airband, scan_lines)
+    else:
+        latest_ts = None
+        latest_freq = None
+        for ts, freq in _read_journal_activity(unit, scan_lines):
+            try:
+                freq_value = float(freq)
+            except ValueError:
+                continue
+            if _freq_in_airband(freq_value) != in_airband:
+                continue
+            if latest_ts is None or ts > latest_ts:
+                latest_ts = ts
+                latest_freq = freq_value
 
     if latest_freq is None:
         return ""
@@ -192,87 +220,32 @@ def read_last_hit() -> str:
 
 def read_hit_list_for_unit(unit: str, limit: int = 20, scan_lines: int = 200) -> list:
     """Read hit list from a specific unit."""
-    try:
-        result = subprocess.run(
-            ["journalctl", "-u", unit, "-n", str(scan_lines), "-o", "short-iso", "--no-pager"],
-            check=False,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL,
-            text=True,
-        )
-    except Exception:
-        return []
-
+    if get_journal_follower(unit) is not None:
+        return _HIT_INDEX.hits([unit], limit=limit)
+    # Fallback: replay a one-shot journal window through a throwaway index.
     cutoffs = _analog_hit_cutoff_snapshot()
-    hits = []
-    for line in (result.stdout or "").splitlines():
-        match = RE_ACTIVITY_TS.search(line)
-        if not match:
-            continue
-        ts = parse_activity_timestamp(match.group("date"), match.group("time"), None)
-        freq = match.group("freq")
-        try:
-            freq_value = float(freq)
-        except Exception:
-            freq_value = None
-        source = "airband" if (freq_value is not None and _freq_in_airband(freq_value)) else "ground"
-        if ts.timestamp() < float(cutoffs.get(source) or 0.0):
-            continue
-        hits.append((ts, freq))
+    index = HitSessionIndex()
+    for source, cutoff_ts in cutoffs.items():
+        if cutoff_ts > 0:
+            index.apply_cutoff(source, cutoff_ts)
+    index.ingest_many(unit, _read_journal_activity(unit, scan_lines))
+    return index.hits([unit], limit=limit)
 
-    if not hits:
-        return []
 
-    entries = []
-    current_freq = None
-    start_ts = None
-    last_ts = None
-    for ts, freq in hits:
-        if current_freq is None:
-            current_freq = freq
-            start_ts = ts
-            last_ts = ts
-            continue
-        gap = (ts - last_ts).total_seconds() if last_ts else None
-        if freq != current_freq or (gap is not None and gap > HIT_GAP_RESET_SECONDS):
-            duration = int((last_ts - start_ts).total_seconds()) if start_ts else 0
-            try:
-                freq_text = f"{float(current_freq):.4f}"
-            except ValueError:
-                freq_text = current_freq
-            entries.append({
-                "time": last_ts.strftime("%H:%M:%S"),
-                "freq": freq_text,
-                "duration": duration,
-                "ts": last_ts.timestamp(),
-            })
-            current_freq = freq
-            start_ts = ts
-        last_ts = ts
-
-    if current_freq is not None and start_ts is not None and last_ts is not None:
-        duration = int((last_ts - start_ts).total_seconds())
-        try:
-            freq_text = f"{float(current_freq):.4f}"
-        except ValueError:
-            freq_text = current_freq
-        entries.append({
-            "time": last_ts.strftime("%H:%M:%S"),
-            "freq": freq_text,
-            "duration": duration,
-            "ts": last_ts.timestamp(),
-        })
+def _hit_index_live() -> bool:
+    return all(get_journal_follower(unit) is not None for unit in (UNITS["rtl"], UNITS["ground"]))
 
-    entries = entries[-limit:]
-    entries.reverse()
-    return entries
 
-
-def read_hit_list(limit: int = 20, scan_lines: int = 200) -> list:
+def read_hit_list(limit: int = 20, scan_lines: int = 200, since_ts: Optional[float] = None) -> list:
     """Read combined hit list from all units."""
+    units = [UNITS["rtl"], UNITS["ground"]]
+    if _hit_index_live():
+        return _HIT_INDEX.hits(units, limit=limit, since_ts=since_ts)
     entries = []
-    entries.extend(read_hit_list_for_unit(UNITS["rtl"], limit=limit, scan_lines=scan_lines))
-    entries.extend(read_hit_list_for_unit(UNITS["ground"], limit=limit, scan_lines=scan_lines))
+    for unit in units:
+        entries.extend(read_hit_list_for_unit(unit, limit=limit, scan_lines=scan_lines))
+    if since_ts is not None:
+        entries = [item for item in entries if float(item.get("ts") or 0.0) >= since_ts]
     if not entries:
         return []
     entries.sort(key=lambda item: item.get("ts", 0))
@@ -281,14 +254,26 @@ def read_hit_list(limit: int = 20, scan_lines: int = 200) -> list:
     return entries
 
 
-def read_hit_list_cached(limit: int = 20) -> list:
-    """Read hit list with caching."""
+def read_hit_list_cached(limit: int = 20, since_ts: Optional[float] = None) -> list:
+    """Read hit list with caching; ``since_ts`` drops hits that ended before it."""
     now = time.time()
-    cache = getattr(read_hit_list_cached, "_cache", {"value": [], "ts": 0.0})
-    if now - cache["ts"] < 0.5 and len(cache["value"]) >= limit:
-        return cache["value"][:limit]
-    value = read_hit_list(limit=limit)
-    cache = {"value": value, "ts": now}
+    cache = getattr(read_hit_list_cached, "_cache", {"value": [], "ts": 0.0, "version": -1})
+    # With the live index a rebuild is only needed when a line was ingested.
+    version = _HIT_INDEX.version if _hit_index_live() else -1
+    fresh = (now - cache["ts"] < 0.5) or (version >= 0 and cache.get("version") == version)
+    # The cached list answers this call if it was read with at least this
+    # limit and a floor no later than ``since_ts``; filtering it is enough.
+    cached_since = cache.get("since_ts")
+    covers = int(cache.get("limit") or 0) >= limit and (
+        cached_since is None or (since_ts is not None and cached_since <= since_ts)
+    )
+    if fresh and covers:
+        value = cache["value"]
+        if since_ts is not None and cached_since != since_ts:
+            value = [item for item in value if float(item.get("ts") or 0.0) >= since_ts]
+        return value[:limit]
+    value = read_hit_list(limit=limit, since_ts=since_ts)
+    cache = {"value": value, "ts": now, "version": version, "limit": limit, "since_ts": since_ts}
     read_hit_list_cached._cache = cache
     return value
 
@@ -5,6 +5,7 @@ import sqlite3
 from pathlib import Path
 
 from .config import HPDB_DB_PATH
+from .hpdb_pool import get_hpdb_pool
 
 _DEFAULT_DB_PATH = str(Path(HPDB_DB_PATH).expanduser().resolve())
 
@@ -57,6 +58,8 @@ _CATALOG_BY_TAG = {
     service_tag: (name, int(is_custom), int(enabled_by_default))
     for _, name, service_tag, is_custom, enabled_by_default in _HP2_SERVICE_TYPES
 }
+# Database fingerprint at the last catalog upsert, keyed by resolved path.
+_POPULATED: dict[str, tuple] = {}
 
 
 def _connect(db_path: str) -> sqlite3.Connection:
@@ -67,8 +70,7 @@ def _connect(db_path: str) -> sqlite3.Connection:
 
 
 def load_distinct_service_tags(db_path: str = _DEFAULT_DB_PATH) -> list[int]:
-    conn = _connect(db_path)
-    try:
+    with get_hpdb_pool(db_path).read() as conn:
         rows = conn.execute(
             """
             SELECT service_tag
@@ -92,8 +94,6 @@ def load_distinct_service_tags(db_path: str = _DEFAULT_DB_PATH) -> list[int]:
                 continue
             tags.append(value)
         return tags
-    finally:
-        conn.close()
 
 
 def _ensure_service_types_table(conn: sqlite3.Connection) -> None:
@@ -186,11 +186,22 @@ def _sort_key(service_tag: int) -> tuple[int, int]:
     return (1, int(service_tag))
 
 
-def get_all_service_types(db_path: str = _DEFAULT_DB_PATH) -> list[dict]:
+def _ensure_populated_once(db_path: str) -> None:
+    pool = get_hpdb_pool(db_path)
+    if _POPULATED.get(pool.db_path) == pool.fingerprint():
+        return
     conn = _connect(db_path)
     try:
         _ensure_populated(conn)
         conn.commit()
+    finally:
+        conn.close()
+    _POPULATED[pool.db_path] = pool.fingerprint()
+
+
+def get_all_service_types(db_path: str = _DEFAULT_DB_PATH) -> list[dict]:
+    _ensure_populated_once(db_path)
+    with get_hpdb_pool(db_path).read() as conn:
         rows = conn.execute(
             """
             SELECT service_tag, name, enabled_by_default, is_custom
@@ -213,8 +224,6 @@ def get_all_service_types(db_path: str = _DEFAULT_DB_PATH) -> list[dict]:
             )
         out.sort(key=lambda item: _sort_key(int(item["service_tag"])))
         return out
-    finally:
-        conn.close()
 
 
 def get_default_enabled_service_types(db_path: str = _DEFAULT_DB_PATH) -> list[int]:
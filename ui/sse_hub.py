@@ -0,0 +1,256 @@
+"""Shared Server-Sent Events fan-out.
+
+A single producer thread builds each snapshot once, serializes it once and
+hands the same bytes to every subscribed connection. Events are only pushed
+when their content changed; a heartbeat re-sends one event at a fixed
+interval so clients can keep tracking liveness. List-valued events can be
+registered as delta channels: they carry numbered ids, send only new or
+updated rows, and replay from a backlog on ``Last-Event-ID`` reconnects.
+"""
+import json
+import threading
+import time
+from collections import deque
+from typing import Callable, Iterable, Optional
+
+
+def format_sse_frame(event: str, payload: dict, event_id: Optional[int] = None) -> bytes:
+    """Serialize one SSE frame."""
+    head = f"id: {int(event_id)}\n" if event_id is not None else ""
+    return f"{head}event: {event}\ndata: {json.dumps(payload)}\n\n".encode()
+
+
+class SseSubscriber:
+    """Per-connection frame queue; slow clients are dropped, not buffered."""
+
+    def __init__(self, max_frames: int, on_push: Optional[Callable[[], None]] = None):
+        self._cond = threading.Condition()
+        self._frames: deque = deque()
+        self._max_frames = max(1, int(max_frames))
+        # Lets non-threaded consumers (asyncio) wake without blocking a thread.
+        self._on_push = on_push
+        self.closed = False
+
+    def _notify(self) -> None:
+        self._cond.notify()
+        if self._on_push is not None:
+            try:
+                self._on_push()
+            except Exception:
+                pass
+
+    def push(self, frame: bytes) -> None:
+        with self._cond:
+            if self.closed:
+                return
+            if len(self._frames) >= self._max_frames:
+                # Client is not draining; close it so it reconnects cleanly.
+                self.closed = True
+                self._frames.clear()
+            else:
+                self._frames.append(frame)
+            self._notify()
+
+    def next_chunk(self, timeout: float) -> Optional[bytes]:
+        """Return all queued frames joined, or None on timeout/close."""
+        with self._cond:
+            if not self._frames and not self.closed:
+                self._cond.wait(timeout=timeout)
+            if not self._frames:
+                return None
+            chunk = b"".join(self._frames)
+            self._frames.clear()
+            return chunk
+
+    def close(self) -> None:
+        with self._cond:
+            self.closed = True
+            self._notify()
+
+
+class SseDeltaChannel:
+    """Numbered row-delta frames for one list event, with a replay backlog."""
+
+    def __init__(self, event: str, key_fn: Callable[[dict], object], backlog_size: int = 300):
+        self.event = event
+        self._key_fn = key_fn
+        # Seed ids from the wall clock so ids from a previous process are
+        # always older than this process' backlog and force a full resync.
+        self._seq = int(time.time() * 1000)
+        self._backlog: deque = deque(maxlen=max(1, int(backlog_size)))
+        self._rows: dict = {}
+        self._payload: Optional[dict] = None
+        self._snapshot: tuple[int, bytes] = (0, b"")
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    def update(self, payload: dict) -> Optional[bytes]:
+        """Diff ``payload['items']`` against the last build; return a frame or None."""
+        items = list(payload.get("items") or [])
+        rows = {}
+        changed = []
+        for item in items:
+            key = self._key_fn(item)
+            encoded = json.dumps(item, sort_keys=True, default=str)
+            rows[key] = encoded
+            if self._rows.get(key) != encoded:
+                changed.append(item)
+        self._rows = rows
+        self._payload = dict(payload, items=items)
+        if not changed:
+            return None
+        self._seq += 1
+        frame = format_sse_frame(self.event, dict(payload, items=changed, delta=True), event_id=self._seq)
+        self._backlog.append((self._seq, frame))
+        return frame
+
+    def snapshot_frame(self) -> Optional[bytes]:
+        """Full current list, stamped with the latest id."""
+        if self._payload is None:
+            return None
+        if self._snapshot[0] != self._seq:
+            self._snapshot = (
+                self._seq,
+                format_sse_frame(self.event, dict(self._payload, delta=False), event_id=self._seq),
+            )
+        return self._snapshot[1]
+
+    def resume_frames(self, last_event_id: Optional[int]) -> Optional[bytes]:
+        """Frames a reconnecting client missed, or a full snapshot on a gap."""
+        if last_event_id is None or last_event_id > self._seq:
+            return self.snapshot_frame()
+        if last_event_id == self._seq:
+            return None
+        if not self._backlog or last_event_id < self._backlog[0][0] - 1:
+            return self.snapshot_frame()
+        missed = [frame for seq, frame in self._backlog if seq > last_event_id]
+        return b"".join(missed) if missed else None
+
+
+class SseHub:
+    """Run one snapshot producer and broadcast its frames to subscribers."""
+
+    def __init__(
+        self,
+        builder: Callable[[], Iterable[tuple[str, dict]]],
+        interval_sec: float = 1.0,
+        heartbeat_sec: float = 5.0,
+        heartbeat_event: str = "status",
+        volatile_keys: Iterable[str] = ("server_time", "timestamp"),
+        volatile_suffixes: tuple[str, ...] = ("_age_ms",),
+        max_client_frames: int = 64,
+        delta_channels: Iterable[SseDeltaChannel] = (),
+    ):
+        self._builder = builder
+        self._interval_sec = max(0.1, float(interval_sec))
+        self._heartbeat_sec = max(self._interval_sec, float(heartbeat_sec))
+        self._heartbeat_event = heartbeat_event
+        self._volatile_keys = frozenset(volatile_keys)
+        self._volatile_suffixes = tuple(volatile_suffixes)
+        self._max_client_frames = max_client_frames
+        self._delta_channels = {channel.event: channel for channel in delta_channels}
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._subscribers: set[SseSubscriber] = set()
+        self._latest_frames: dict[str, bytes] = {}
+        self._latest_keys: dict[str, str] = {}
+        self._last_push_mono = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self.builds = 0
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def subscribe(
+        self,
+        last_event_id: Optional[int] = None,
+        on_push: Optional[Callable[[], None]] = None,
+    ) -> SseSubscriber:
+        sub = SseSubscriber(self._max_client_frames, on_push=on_push)
+        with self._lock:
+            for frame in self._latest_frames.values():
+                sub.push(frame)
+            for channel in self._delta_channels.values():
+                frame = channel.resume_frames(last_event_id)
+                if frame:
+                    sub.push(frame)
+            self._subscribers.add(sub)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="sse-hub", daemon=True)
+                self._thread.start()
+            elif not self._latest_frames:
+                self._wake.notify_all()
+        return sub
+
+    def unsubscribe(self, sub: SseSubscriber) -> None:
+        sub.close()
+        with self._lock:
+            self._subscribers.discard(sub)
+
+    def _stable(self, value):
+        # Clocks and snapshot ages move every tick; ignore them for change detection.
+        if isinstance(value, dict):
+            return {
+                k: self._stable(v)
+                for k, v in value.items()
+                if k not in self._volatile_keys and not str(k).endswith(self._volatile_suffixes)
+            }
+        if isinstance(value, list):
+            return [self._stable(v) for v in value]
+        return value
+
+    def _change_key(self, payload: dict) -> str:
+        return json.dumps(self._stable(payload), sort_keys=True, default=str)
+
+    def tick(self) -> int:
+        """Build one snapshot and broadcast changed events; returns frames sent."""
+        events = list(self._builder() or [])
+        self.builds += 1
+        now_mono = time.monotonic()
+        outgoing: list[bytes] = []
+        with self._lock:
+            heartbeat_due = (now_mono - self._last_push_mono) >= self._heartbeat_sec
+            for event, payload in events:
+                channel = self._delta_channels.get(event)
+                if channel is not None:
+                    frame = channel.update(payload)
+                    if frame:
+                        outgoing.append(frame)
+                    continue
+                key = self._change_key(payload)
+                if key == self._latest_keys.get(event) and not (
+                    heartbeat_due and event == self._heartbeat_event
+                ):
+                    continue
+                frame = format_sse_frame(event, payload)
+                self._latest_keys[event] = key
+                self._latest_frames[event] = frame
+                outgoing.append(frame)
+                if event == self._heartbeat_event:
+                    self._last_push_mono = now_mono
+            subscribers = list(self._subscribers)
+        if outgoing:
+            chunk = b"".join(outgoing)
+            for sub in subscribers:
+                sub.push(chunk)
+        return len(outgoing)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                self._subscribers = {sub for sub in self._subscribers if not sub.closed}
+                if not self._subscribers:
+                    # Idle: stop producing until the next client connects.
+                    self._thread = None
+                    return
+            started = time.monotonic()
+            try:
+                self.tick()
+            except Exception:
+                pass
+            elapsed = time.monotonic() - started
+            with self._lock:
+                self._wake.wait(timeout=max(0.05, self._interval_sec - elapsed))
@@ -0,0 +1,298 @@
+"""Shared upstream fan-out for proxied audio streams.
+
+One ``StreamBroadcaster`` per (mount, transcode profile) owns the single
+upstream reader (an Icecast connection or an ffmpeg process) and copies its
+chunks into a ring buffer. Each listener reads from the ring through its
+own cursor, so ten browsers on a mount still cost one upstream connection
+and at most one encoder. The broadcaster starts with its first listener
+and is reaped shortly after the last one detaches.
+"""
+import subprocess
+import threading
+from collections import deque
+from itertools import islice
+from typing import Callable, Optional
+from urllib.request import Request, urlopen
+
+
+class HttpStreamSource:
+    """Upstream HTTP response used as a chunk source."""
+
+    def __init__(self, url: str, timeout: float, passthrough_headers: tuple[str, ...] = ()):
+        req = Request(
+            url,
+            headers={
+                "User-Agent": "airband-ui/stream-proxy",
+                "Connection": "close",
+            },
+            method="GET",
+        )
+        self._resp = urlopen(req, timeout=timeout)
+        self.headers = [("Content-Type", self._resp.headers.get("Content-Type") or "audio/mpeg")]
+        for name in passthrough_headers:
+            value = self._resp.headers.get(name)
+            if value:
+                self.headers.append((name, value))
+
+    def read(self, size: int) -> bytes:
+        return self._resp.read(size)
+
+    def close(self) -> None:
+        try:
+            self._resp.close()
+        except Exception:
+            pass
+
+
+class ProcessStreamSource:
+    """stdout of an encoder process used as a chunk source."""
+
+    def __init__(self, cmd: list[str]):
+        self._proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        self.headers = [("Content-Type", "audio/mpeg")]
+
+    def read(self, size: int) -> bytes:
+        if not self._proc.stdout:
+            return b""
+        return self._proc.stdout.read(size)
+
+    def close(self) -> None:
+        if self._proc.poll() is None:
+            try:
+                self._proc.terminate()
+                self._proc.wait(timeout=2)
+            except Exception:
+                pass
+
+
+class StreamCursor:
+    """One listener's read position in a broadcaster ring."""
+
+    def __init__(self, broadcaster: "StreamBroadcaster", seq: int, on_data: Optional[Callable[[], None]]):
+        self.broadcaster = broadcaster
+        self.seq = seq
+        self.on_data = on_data
+        self.skipped_chunks = 0
+
+    @property
+    def headers(self) -> list[tuple[str, str]]:
+        return self.broadcaster.headers
+
+    def read(self, timeout: float) -> Optional[list[bytes]]:
+        return self.broadcaster.read(self, timeout)
+
+    def close(self) -> None:
+        self.broadcaster.detach(self)
+
+
+class StreamBroadcaster:
+    """Run one upstream source and fan its chunks out to attached cursors."""
+
+    def __init__(
+        self,
+        key: tuple[str, str],
+        opener: Callable[[], object],
+        chunk_bytes: int,
+        ring_chunks: int = 512,
+        linger_sec: float = 2.0,
+        on_reap: Optional[Callable[["StreamBroadcaster"], None]] = None,
+    ):
+        self.key = key
+        self._opener = opener
+        self._chunk_bytes = max(1, int(chunk_bytes))
+        self._linger_sec = max(0.0, float(linger_sec))
+        self._on_reap = on_reap
+        self._cond = threading.Condition()
+        self._ring: deque = deque(maxlen=max(1, int(ring_chunks)))
+        self._seq = 0
+        self._cursors: set[StreamCursor] = set()
+        self._source = None
+        self._ready = False
+        self._ended = False
+        self._error: Optional[BaseException] = None
+        self._thread: Optional[threading.Thread] = None
+        self.headers: list[tuple[str, str]] = []
+        self.bytes_in = 0
+
+    @property
+    def listeners(self) -> int:
+        with self._cond:
+            return len(self._cursors)
+
+    @property
+    def ended(self) -> bool:
+        with self._cond:
+            return self._ended
+
+    def attach(self, on_data: Optional[Callable[[], None]] = None) -> Optional[StreamCursor]:
+        """Join at the live edge; raises the upstream open error, if any.
+
+        Returns None if the broadcaster was reaped in the meantime.
+        """
+        with self._cond:
+            if self._ended and self._error is None:
+                return None
+            cursor = StreamCursor(self, self._seq, on_data)
+            self._cursors.add(cursor)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"stream-fanout-{self.key[0]}",
+                    daemon=True,
+                )
+                self._thread.start()
+            while not self._ready and self._error is None:
+                self._cond.wait()
+            if self._error is not None:
+                self._cursors.discard(cursor)
+                raise self._error
+            return cursor
+
+    def detach(self, cursor: StreamCursor) -> None:
+        with self._cond:
+            self._cursors.discard(cursor)
+            idle = not self._cursors
+        if not idle:
+            return
+        if self._linger_sec <= 0:
+            self._reap_if_idle()
+            return
+        # Short linger so a page reload does not restart the encoder.
+        timer = threading.Timer(self._linger_sec, self._reap_if_idle)
+        timer.daemon = True
+        timer.start()
+
+    def _reap_if_idle(self) -> None:
+        with self._cond:
+            if self._cursors or self._ended:
+                return
+            self._ended = True
+            source = self._source
+            self._cond.notify_all()
+        if source is not None:
+            source.close()
+        if self._on_reap is not None:
+            self._on_reap(self)
+
+    def read(self, cursor: StreamCursor, timeout: float) -> Optional[list[bytes]]:
+        """Chunks after ``cursor``; ``[]`` on timeout, None once the stream ended."""
+        with self._cond:
+            if cursor.seq >= self._seq and not self._ended:
+                self._cond.wait(timeout=timeout)
+            if cursor.seq >= self._seq:
+                return None if self._ended else []
+            oldest = self._seq - len(self._ring)
+            if cursor.seq < oldest:
+                # Listener fell behind the ring; skip ahead instead of buffering.
+                cursor.skipped_chunks += oldest - cursor.seq
+                cursor.seq = oldest
+            chunks = list(islice(self._ring, cursor.seq - oldest, None))
+            cursor.seq = self._seq
+            return chunks
+
+    def _run(self) -> None:
+        try:
+            source = self._opener()
+        except BaseException as e:
+            with self._cond:
+                self._error = e
+                self._ended = True
+                self._cond.notify_all()
+            if self._on_reap is not None:
+                self._on_reap(self)
+            return
+        with self._cond:
+            self._source = source
+            self.headers = list(getattr(source, "headers", []) or [])
+            self._ready = True
+            ended = self._ended
+            self._cond.notify_all()
+        if ended:
+            source.close()
+            return
+        try:
+            while True:
+                try:
+                    chunk = source.read(self._chunk_bytes)
+                except Exception:
+                    chunk = b""
+                with self._cond:
+                    if self._ended:
+                        break
+                    if not chunk:
+                        self._ended = True
+                        self._cond.notify_all()
+                        break
+                    self._ring.append(chunk)
+                    self._seq += 1
+                    self.bytes_in += len(chunk)
+                    callbacks = [c.on_data for c in self._cursors if c.on_data is not None]
+                    self._cond.notify_all()
+                for callback in callbacks:
+                    try:
+                        callback()
+                    except Exception:
+                        pass
+        finally:
+            source.close()
+            with self._cond:
+                callbacks = [c.on_data for c in self._cursors if c.on_data is not None]
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception:
+                    pass
+            if self._on_reap is not None:
+                self._on_reap(self)
+
+
+_BROADCASTERS: dict[tuple[str, str], StreamBroadcaster] = {}
+_BROADCASTERS_LOCK = threading.Lock()
+
+
+def _forget(broadcaster: StreamBroadcaster) -> None:
+    with _BROADCASTERS_LOCK:
+        if _BROADCASTERS.get(broadcaster.key) is broadcaster:
+            del _BROADCASTERS[broadcaster.key]
+
+
+def attach_stream(
+    key: tuple[str, str],
+    opener: Callable[[], object],
+    chunk_bytes: int,
+    ring_chunks: int = 512,
+    linger_sec: float = 2.0,
+    on_data: Optional[Callable[[], None]] = None,
+) -> StreamCursor:
+    """Attach a listener to the shared broadcaster for ``key``, starting it if needed."""
+    while True:
+        with _BROADCASTERS_LOCK:
+            broadcaster = _BROADCASTERS.get(key)
+            if broadcaster is None or broadcaster.ended:
+                broadcaster = StreamBroadcaster(
+                    key,
+                    opener,
+                    chunk_bytes,
+                    ring_chunks=ring_chunks,
+                    linger_sec=linger_sec,
+                    on_reap=_forget,
+                )
+                _BROADCASTERS[key] = broadcaster
+        cursor = broadcaster.attach(on_data=on_data)
+        if cursor is not None:
+            return cursor
+
+
+def stream_fanout_stats() -> list[dict]:
+    """Active broadcasters and their listener counts."""
+    with _BROADCASTERS_LOCK:
+        broadcasters = list(_BROADCASTERS.values())
+    return [
+        {
+            "mount": b.key[0],
+            "profile": b.key[1],
+            "listeners": b.listeners,
+            "bytes_in": b.bytes_in,
+        }
+        for b in broadcasters
+    ]